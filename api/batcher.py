@@ -0,0 +1,235 @@
+"""
+동시 추출 요청 마이크로 배칭 모듈
+
+짧은 시간 창 동안 들어온 /extract 요청을 모아 shortcode 기준으로 중복을 제거하고,
+캐시를 한 번에 조회한 뒤 남은 게시물만 동시 실행 수/요청 간격이 제한된 묶음으로 가져온다.
+"""
+
+import asyncio
+import sys
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 상위 디렉토리의 src 모듈을 import하기 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.record import PostRecord
+from src.url_reader import canonicalize_url
+
+
+# (요청 Future, 요청 URL) 목록
+Waiters = List[Tuple["asyncio.Future[PostRecord]", str]]
+
+
+class TTLCache:
+    """만료 시간과 최대 크기가 있는 게시물 캐시 (LRU 방식으로 제거)"""
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 10_000):
+        """
+        초기화
+
+        Args:
+            ttl (float): 항목 유지 시간 (초)
+            max_size (int): 최대 항목 수
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Tuple[float, PostRecord]]" = OrderedDict()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, PostRecord]:
+        """여러 키를 한 번에 조회 (만료된 항목은 제거)
+
+        Args:
+            keys (Iterable[str]): 조회할 shortcode 목록
+
+        Returns:
+            Dict[str, PostRecord]: 캐시에 있는 항목
+        """
+        now = time.monotonic()
+        hits = {}
+        for key in keys:
+            item = self._items.get(key)
+            if item is None:
+                continue
+            expires_at, record = item
+            if expires_at <= now:
+                del self._items[key]
+                continue
+            self._items.move_to_end(key)
+            hits[key] = record
+        return hits
+
+    def set(self, key: str, record: PostRecord) -> None:
+        """항목 저장
+
+        Args:
+            key (str): shortcode
+            record (PostRecord): 게시물 레코드
+        """
+        self._items[key] = (time.monotonic() + self.ttl, record)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+@dataclass
+class BatchStats:
+    """마이크로 배칭 통계"""
+    requests: int = 0
+    batches: int = 0
+    # 같은 배치 또는 진행 중인 조회에 합류한 요청 수
+    deduplicated: int = 0
+    cache_hits: int = 0
+    fetched: int = 0
+
+
+class MicroBatcher:
+    """요청을 짧은 시간 창 단위로 모아 처리하는 배처"""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[PostRecord]],
+        window: float = 0.005,
+        max_batch: int = 64,
+        max_concurrency: int = 8,
+        min_interval: float = 0.0,
+        cache: Optional[TTLCache] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            fetch: URL을 받아 게시물 레코드를 반환하는 비동기 함수
+            window (float): 요청을 모으는 시간 (초)
+            max_batch (int): 시간 창이 끝나기 전이라도 바로 처리할 요청 수
+            max_concurrency (int): 한 번에 실행하는 업스트림 조회 수
+            min_interval (float): 업스트림 조회 시작 간 최소 간격 (초)
+            cache (Optional[TTLCache]): 게시물 캐시 (없으면 캐시하지 않음)
+        """
+        self.fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self.min_interval = min_interval
+        self.cache = cache
+        self.stats = BatchStats()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._pending: Dict[str, Waiters] = {}
+        self._inflight: Dict[str, Waiters] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._groups: "set[asyncio.Task]" = set()
+        self._pace_lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def submit(self, url: str) -> PostRecord:
+        """추출 요청 제출 (같은 시간 창의 요청과 함께 처리된 결과 반환)
+
+        Args:
+            url (str): Instagram 게시물 URL
+
+        Returns:
+            PostRecord: 게시물 레코드 (url은 요청한 URL)
+
+        Raises:
+            ValueError: URL이 유효하지 않은 경우
+            그 밖의 예외: fetch가 발생시킨 예외
+        """
+        canonical = canonicalize_url(url)
+        if canonical is None:
+            raise ValueError("유효하지 않은 Instagram URL입니다.")
+        shortcode = canonical[0]
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[PostRecord]" = loop.create_future()
+        self.stats.requests += 1
+
+        if shortcode in self._inflight:
+            # 이미 조회 중인 게시물이면 그 결과를 함께 받음
+            self.stats.deduplicated += 1
+            self._inflight[shortcode].append((future, url))
+        else:
+            waiters = self._pending.setdefault(shortcode, [])
+            if waiters:
+                self.stats.deduplicated += 1
+            waiters.append((future, url))
+
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """모은 요청 처리 (캐시 일괄 조회 후 나머지는 한 묶음으로 조회)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        self.stats.batches += 1
+
+        hits = self.cache.get_many(batch) if self.cache is not None else {}
+        for shortcode, record in hits.items():
+            self.stats.cache_hits += len(batch[shortcode])
+            self._resolve(batch.pop(shortcode), record)
+
+        if batch:
+            self._inflight.update(batch)
+            task = asyncio.ensure_future(self._fetch_group(list(batch.items())))
+            self._groups.add(task)
+            task.add_done_callback(self._groups.discard)
+
+    async def _pace(self) -> None:
+        """업스트림 조회 시작 간격 유지"""
+        if self.min_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._pace_lock:
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = max(loop.time(), self._next_start) + self.min_interval
+
+    async def _fetch_one(self, shortcode: str, url: str) -> None:
+        """게시물 하나를 조회해 대기 중인 모든 요청에 전달"""
+        try:
+            async with self._slots:
+                await self._pace()
+                self.stats.fetched += 1
+                record = await self.fetch(url)
+        except Exception as e:
+            for future, _ in self._inflight.pop(shortcode, []):
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if self.cache is not None:
+            self.cache.set(shortcode, record)
+        self._resolve(self._inflight.pop(shortcode, []), record)
+
+    async def _fetch_group(self, group: List[Tuple[str, Waiters]]) -> None:
+        """캐시에 없는 게시물들을 제한된 동시 실행 수로 조회"""
+        await asyncio.gather(*(
+            self._fetch_one(shortcode, waiters[0][1]) for shortcode, waiters in group
+        ))
+
+    @staticmethod
+    def _resolve(waiters: Waiters, record: PostRecord) -> None:
+        """대기 중인 요청에 결과 전달 (연결이 끊겨 취소된 요청은 건너뜀)"""
+        for future, url in waiters:
+            if not future.done():
+                future.set_result(record if record.url == url else record.replace(url=url))
+
+    async def aclose(self) -> None:
+        """남은 요청을 처리하고 진행 중인 조회가 끝날 때까지 대기"""
+        self._flush()
+        if self._groups:
+            await asyncio.gather(*self._groups, return_exceptions=True)
@@ -2,22 +2,69 @@
 Instagram 텍스트 추출 FastAPI 애플리케이션
 """
 
+import os
+from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, HTTPException
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
-from .models import ExtractRequest, ExtractResponse, HealthResponse, PostData
-from .services import InstagramService
+from .models import ExtractRequest, ExtractResponse, HealthResponse, SearchResponse, SimilarResponse, StatsResponse
+from .responses import CompressionMiddleware, FastJSONResponse
+from .services import POST_DATA_FIELDS, InstagramService
+from src.record import parse_fields
+from src.url_reader import canonicalize_url
+
+
+# 마이크로 배칭 설정 (EXTRACT_BATCH_WINDOW_MS가 0이면 사용 안 함)
+BATCH_WINDOW_MS = float(os.environ.get("EXTRACT_BATCH_WINDOW_MS", "0"))
+CACHE_TTL = float(os.environ.get("EXTRACT_CACHE_TTL", "300"))
+
+# 추출 결과를 누적할 SQLite 결과 저장소 (비어 있으면 저장 안 함)
+RESULT_STORE_PATH = os.environ.get("RESULT_STORE_PATH") or None
+
+# 업스트림 조회 전에 확인할 결과 로그 (python -m src --archive로 기록, 비어 있으면 확인 안 함)
+ARCHIVE_LOG_PATH = os.environ.get("ARCHIVE_LOG_PATH") or None
+
+# 유사 게시물 TF-IDF 색인 (python -m src similar --update로 생성, 비어 있으면 /similar 사용 안 함)
+SIMILAR_INDEX_PATH = os.environ.get("SIMILAR_INDEX_PATH") or None
+
+# 해시태그 통계 상태 (python -m src stats로 생성, 비어 있으면 /stats 사용 안 함)
+STATS_PATH = os.environ.get("STATS_PATH") or None
+
+# 이 크기(바이트) 이상인 응답만 압축 (Accept-Encoding: br/gzip)
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", "500"))
+
+# Instagram 서비스 인스턴스
+instagram_service = InstagramService(
+    batch_window=BATCH_WINDOW_MS / 1000 if BATCH_WINDOW_MS > 0 else None,
+    cache_ttl=CACHE_TTL,
+    store_path=RESULT_STORE_PATH,
+    archive_path=ARCHIVE_LOG_PATH,
+    similar_index_path=SIMILAR_INDEX_PATH,
+    stats_path=STATS_PATH,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 주기 (종료 시 HTTP 연결 풀 정리)"""
+    yield
+    await instagram_service.aclose()
 
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="Instagram Text Extractor API",
     description="Instagram 게시물 링크에서 텍스트를 추출하는 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# 응답 압축 (긴 캡션/필드 전체 응답을 모바일 클라이언트로 보낼 때 전송량 감소)
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESS_MIN_BYTES)
+
 # CORS 설정 (Flutter 앱에서 접근 가능하도록)
 app.add_middleware(
     CORSMiddleware,
@@ -27,10 +74,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Instagram 서비스 인스턴스
-instagram_service = InstagramService()
-
-
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """헬스체크 엔드포인트"""
@@ -40,61 +83,137 @@ async def health_check():
     )
 
 
+def _extract_response(
+    data: Optional[Dict[str, Any]] = None, error: Optional[str] = None
+) -> FastJSONResponse:
+    """ExtractResponse 형식 응답 (내부에서 만든 데이터이므로 응답 모델 재검증 없이 직렬화)"""
+    return FastJSONResponse({"success": error is None, "data": data, "error": error})
+
+
 @app.post("/extract", response_model=ExtractResponse)
-async def extract_text(request: ExtractRequest):
+async def extract_text(
+    request: ExtractRequest,
+    fields: Optional[str] = Query(
+        None, description="응답에 포함할 필드 (쉼표 구분, 예: title,text,url)"
+    ),
+):
     """
     Instagram URL에서 텍스트 추출
     
     Args:
         request: Instagram URL이 포함된 요청 객체
+        fields: 응답에 포함할 필드 (없으면 전체)
         
     Returns:
         ExtractResponse: 추출 결과 또는 에러 정보
     """
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         # URL을 문자열로 변환 (pydantic HttpUrl -> str)
         url = str(request.url)
-        
-        # 텍스트 추출 실행
-        post_data = await instagram_service.extract_text(url)
-        
-        return ExtractResponse(
-            success=True,
-            data=post_data,
-            error=None
-        )
-        
+
+        # 텍스트 추출 실행 (필드 선택이 없으면 PostData 필드 전체)
+        data = await instagram_service.extract_fields(url, selected_fields or POST_DATA_FIELDS)
+
+        return _extract_response(data=data)
+
     except ValueError as e:
         # URL 유효성 검사 또는 게시물 찾기 실패
-        return ExtractResponse(
-            success=False,
-            data=None,
-            error=f"URL 처리 오류: {str(e)}"
-        )
-        
+        return _extract_response(error=f"URL 처리 오류: {str(e)}")
+
     except PermissionError as e:
         # 비공개 계정 접근 오류
-        return ExtractResponse(
-            success=False,
-            data=None,
-            error=f"접근 권한 오류: {str(e)}"
-        )
-        
+        return _extract_response(error=f"접근 권한 오류: {str(e)}")
+
     except ConnectionError as e:
         # 네트워크 연결 오류
-        return ExtractResponse(
-            success=False,
-            data=None,
-            error=f"네트워크 연결 오류: {str(e)}"
-        )
-        
+        return _extract_response(error=f"네트워크 연결 오류: {str(e)}")
+
     except Exception as e:
         # 기타 예상치 못한 오류
-        return ExtractResponse(
-            success=False,
-            data=None,
-            error=f"예상치 못한 오류: {str(e)}"
-        )
+        return _extract_response(error=f"예상치 못한 오류: {str(e)}")
+
+
+@app.get("/search", response_model=SearchResponse)
+async def search_posts(
+    q: str = Query(..., min_length=1, description='검색어 (공백은 AND, "따옴표"는 구문 검색)'),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    offset: int = Query(0, ge=0, description="건너뛸 결과 수"),
+    username: Optional[str] = Query(None, description="작성자 필터"),
+):
+    """
+    저장된 게시물 캡션 전문 검색 (관련도 순, 스니펫 포함)
+
+    Returns:
+        SearchResponse: 전체 결과 수와 현재 페이지 결과
+    """
+    try:
+        page = await instagram_service.search(q, limit, offset, username)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return FastJSONResponse({
+        "query": page.query,
+        "total": page.total,
+        "limit": page.limit,
+        "offset": page.offset,
+        "has_more": page.has_more,
+        "results": [hit.to_json_dict() for hit in page.hits],
+    })
+
+
+@app.get("/similar", response_model=SimilarResponse)
+async def similar_posts(
+    shortcode: Optional[str] = Query(None, description="기준 게시물 shortcode 또는 URL"),
+    q: Optional[str] = Query(None, min_length=1, description="기준 텍스트 (shortcode가 없을 때)"),
+    k: int = Query(10, ge=1, le=100, description="결과 수"),
+):
+    """
+    캡션이 비슷한 게시물 찾기 (TF-IDF 코사인 유사도 내림차순)
+
+    Returns:
+        SimilarResponse: 유사 게시물 목록
+    """
+    if shortcode is None and q is None:
+        raise HTTPException(status_code=400, detail="shortcode 또는 q가 필요합니다.")
+    if shortcode is not None:
+        canonical = canonicalize_url(shortcode)
+        shortcode = canonical[0] if canonical else shortcode
+
+    try:
+        results = await instagram_service.similar(shortcode, q, k)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=e.args[0])
+
+    return FastJSONResponse({"shortcode": shortcode, "q": q, "results": results})
+
+
+@app.get("/stats", response_model=StatsResponse)
+async def hashtag_stats(
+    k: int = Query(10, ge=1, le=100, description="항목별 결과 수"),
+    username: Optional[str] = Query(None, min_length=1, description="추이를 볼 작성자"),
+    hashtag: Optional[str] = Query(None, min_length=1, description="추이를 볼 해시태그 ('#' 생략 가능)"),
+):
+    """
+    해시태그/멘션 상위 k개, 함께 쓰인 해시태그, 작성자/해시태그별 월 추이
+
+    Returns:
+        StatsResponse: 통계 요약 (빈도는 스케치 추정값, error는 최대 과대 추정량)
+    """
+    try:
+        summary = await instagram_service.stats(k, username, hashtag)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return FastJSONResponse(summary)
 
 
 @app.get("/")
@@ -104,7 +223,10 @@ async def root():
         "message": "Instagram Text Extractor API",
         "version": "1.0.0",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "search": "/search",
+        "similar": "/similar",
+        "stats": "/stats"
     }
 
 
@@ -3,8 +3,8 @@ FastAPI용 Pydantic 모델 정의
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, HttpUrl, Field
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 
 
 class ExtractRequest(BaseModel):
@@ -14,6 +14,9 @@ class ExtractRequest(BaseModel):
 
 class PostData(BaseModel):
     """Instagram 게시물 데이터 모델"""
+    # src.record.PostRecord에서 속성으로 바로 변환 (중간 dict 생성 없음)
+    model_config = ConfigDict(from_attributes=True)
+
     text: str = Field(..., description="추출된 본문 텍스트")
     username: str = Field(..., description="작성자 사용자명")
     likes: int = Field(..., description="좋아요 수")
@@ -30,6 +33,78 @@ class ExtractResponse(BaseModel):
     error: Optional[str] = Field(None, description="에러 메시지")
 
 
+class SearchHitData(BaseModel):
+    """검색 결과 한 건"""
+    shortcode: str = Field(..., description="게시물 shortcode")
+    title: str = Field(..., description="게시물 제목")
+    username: str = Field(..., description="작성자 사용자명")
+    likes: int = Field(..., description="좋아요 수")
+    date: Optional[datetime] = Field(None, description="게시 날짜")
+    url: str = Field(..., description="원본 URL")
+    snippet: str = Field(..., description="검색어 주변 본문 (검색어는 [ ]로 표시)")
+    score: float = Field(..., description="bm25 관련도 점수 (작을수록 관련도 높음)")
+
+
+class SearchResponse(BaseModel):
+    """검색 응답 모델"""
+    query: str = Field(..., description="검색어")
+    total: int = Field(..., description="전체 결과 수")
+    limit: int = Field(..., description="페이지 크기")
+    offset: int = Field(..., description="건너뛴 결과 수")
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+    results: List[SearchHitData] = Field(..., description="현재 페이지 결과")
+
+
+class SimilarHitData(BaseModel):
+    """유사 게시물 한 건 (결과 저장소에 있으면 게시물 정보 포함)"""
+    shortcode: str = Field(..., description="게시물 shortcode")
+    score: float = Field(..., description="코사인 유사도 (0~1, 클수록 비슷함)")
+    title: Optional[str] = Field(None, description="게시물 제목")
+    username: Optional[str] = Field(None, description="작성자 사용자명")
+    url: Optional[str] = Field(None, description="원본 URL")
+
+
+class SimilarResponse(BaseModel):
+    """유사 게시물 응답 모델"""
+    shortcode: Optional[str] = Field(None, description="기준 게시물 shortcode")
+    q: Optional[str] = Field(None, description="기준 텍스트")
+    results: List[SimilarHitData] = Field(..., description="유사도 내림차순 결과")
+
+
+class StatsItem(BaseModel):
+    """통계 항목 (실제 빈도는 count - error 이상 count 이하)"""
+    key: str = Field(..., description="해시태그/멘션/작성자/해시태그 쌍 또는 월(YYYY-MM)")
+    count: int = Field(..., description="추정 빈도")
+    error: int = Field(0, description="최대 과대 추정량")
+
+
+class StatsHashtagTrend(BaseModel):
+    """해시태그 추이"""
+    hashtag: str = Field(..., description="해시태그 (#포함, 소문자)")
+    count: int = Field(..., description="추정 빈도 (실제 빈도 이상)")
+    months: List[StatsItem] = Field(..., description="월별 추정 빈도")
+    pairs: List[StatsItem] = Field(..., description="함께 쓰인 해시태그 쌍")
+
+
+class StatsUserTrend(BaseModel):
+    """작성자 추이"""
+    username: str = Field(..., description="작성자 사용자명 (소문자)")
+    posts: int = Field(..., description="게시물 수 (상위 작성자가 아니면 0)")
+    months: List[StatsItem] = Field(..., description="월별 추정 게시물 수")
+    hashtags: List[StatsItem] = Field(..., description="자주 쓴 해시태그")
+
+
+class StatsResponse(BaseModel):
+    """해시태그/멘션 통계 응답 모델"""
+    posts: int = Field(..., description="집계한 게시물 수")
+    hashtags: List[StatsItem] = Field(..., description="상위 해시태그")
+    mentions: List[StatsItem] = Field(..., description="상위 멘션")
+    pairs: List[StatsItem] = Field(..., description="함께 자주 쓰인 해시태그 쌍")
+    users: List[StatsItem] = Field(..., description="게시물이 많은 작성자")
+    hashtag: Optional[StatsHashtagTrend] = Field(None, description="hashtag 지정 시 해시태그 추이")
+    user: Optional[StatsUserTrend] = Field(None, description="username 지정 시 작성자 추이")
+
+
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델"""
     status: str = Field(..., description="서비스 상태")
@@ -0,0 +1,153 @@
+"""
+API 응답 직렬화/압축 모듈
+
+orjson이 있으면 응답을 orjson으로 직렬화하고(없으면 표준 json), 클라이언트의
+Accept-Encoding에 따라 일정 크기 이상의 응답을 brotli 또는 gzip으로 압축한다.
+"""
+
+import gzip
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (pip install orjson)
+    orjson = None
+
+
+# 압축 대상 Content-Type 접두어
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (orjson이 없으면 공백 없는 표준 json 사용)
+
+    이미 검증된 내부 데이터(PostRecord.to_json_dict 결과 등)를 Pydantic 응답 모델
+    재검증 없이 바로 직렬화할 때 사용한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+
+
+def _brotli_compress() -> Optional[Callable[[bytes], bytes]]:
+    """brotli 압축 함수 (brotli/brotlicffi 패키지가 없으면 None)"""
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            return None
+    # 동적 응답용 빠른 설정 (quality 11은 정적 파일용)
+    return lambda body: brotli.compress(body, quality=4)
+
+
+def _gzip_compress(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더 파싱 (인코딩 -> q 값)"""
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 압축 미들웨어 (br 우선, 그다음 gzip)
+
+    단일 본문 응답만 압축하고, 스트리밍 응답이나 이미 인코딩된 응답은 그대로 전달한다.
+    """
+
+    def __init__(self, app: Any, minimum_size: int = 500):
+        """
+        초기화
+
+        Args:
+            app: 감쌀 ASGI 앱
+            minimum_size (int): 압축할 최소 본문 크기 (바이트, 작은 응답은 압축 이득보다 비용이 큼)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders: List[Tuple[str, Callable[[bytes], bytes]]] = []
+        brotli_compress = _brotli_compress()
+        if brotli_compress is not None:
+            self.encoders.append(("br", brotli_compress))
+        self.encoders.append(("gzip", _gzip_compress))
+
+    def _negotiate(self, scope: Dict[str, Any]) -> Optional[Tuple[str, Callable[[bytes], bytes]]]:
+        """클라이언트가 허용한 인코딩 중 서버 우선순위가 가장 높은 것 선택"""
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        wildcard = accepted.get("*", 0.0)
+        for name, encoder in self.encoders:
+            if accepted.get(name, wildcard) > 0:
+                return name, encoder
+        return None
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._negotiate(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        name, encoder = encoding
+        start_message: Optional[Dict[str, Any]] = None
+        passthrough = False
+
+        async def send_compressed(message: Dict[str, Any]) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                # 본문을 보기 전까지 헤더 전송 보류
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough or start_message is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            content_type = headers.get("content-type", "")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = encoder(body)
+            headers["Content-Encoding"] = name
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
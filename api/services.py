@@ -1,26 +1,308 @@
 """
 Instagram 텍스트 추출 서비스
-기존 InstagramTextExtractor를 FastAPI용으로 래핑
+비동기 추출기(AsyncInstagramTextExtractor)를 FastAPI용으로 래핑
 """
 
+import asyncio
 import sys
 import os
-from typing import Dict, Any
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 # 상위 디렉토리의 src 모듈을 import하기 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.extractor import InstagramTextExtractor
 from .models import PostData
 
+# /extract 응답 data의 기본 필드 (PostData 필드 순서, src.record 필드 이름과 동일)
+POST_DATA_FIELDS = tuple(PostData.model_fields)
+
+if TYPE_CHECKING:
+    from .batcher import MicroBatcher
+    from src.archive import ShortcodeIndex
+    from src.async_extractor import AsyncInstagramTextExtractor
+    from src.record import PostRecord
+    from src.similar import SimilarityIndex
+    from src.stats import HashtagStats
+    from src.store import ResultStore, SearchPage
+
 
 class InstagramService:
     """Instagram 텍스트 추출 서비스 클래스"""
     
-    def __init__(self):
-        """Instagram 텍스트 추출기 초기화"""
-        self.extractor = InstagramTextExtractor()
+    def __init__(
+        self,
+        batch_window: Optional[float] = None,
+        cache_ttl: float = 300.0,
+        max_concurrency: int = 8,
+        min_interval: float = 0.0,
+        store_path: Optional[str] = None,
+        archive_path: Optional[str] = None,
+        similar_index_path: Optional[str] = None,
+        stats_path: Optional[str] = None,
+    ):
+        """서비스 초기화 (추출기는 첫 요청 시 생성)
+
+        Args:
+            batch_window (Optional[float]): 마이크로 배칭 시간 창 (초, None이면 요청마다 바로 조회)
+            cache_ttl (float): 배칭 사용 시 게시물 캐시 유지 시간 (초, 0이면 캐시 안 함)
+            max_concurrency (int): 배칭 사용 시 동시 업스트림 조회 수
+            min_interval (float): 배칭 사용 시 업스트림 조회 시작 간 최소 간격 (초)
+            store_path (Optional[str]): 추출 결과를 누적할 SQLite 결과 저장소 경로 (None이면 저장 안 함)
+            archive_path (Optional[str]): 먼저 확인할 결과 로그(JSONL) 경로 (인덱스는 읽기 전용으로 공유, None이면 확인 안 함)
+            similar_index_path (Optional[str]): 유사 게시물 TF-IDF 색인(.npz) 경로 (None이면 /similar 사용 안 함)
+            stats_path (Optional[str]): 해시태그 통계 상태 파일 경로 (None이면 /stats 사용 안 함)
+        """
+        self.batch_window = batch_window
+        self.cache_ttl = cache_ttl
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._async_extractor: Optional["AsyncInstagramTextExtractor"] = None
+        self._batcher: Optional["MicroBatcher"] = None
+        self.store_path = store_path
+        self._store: Optional["ResultStore"] = None
+        self.archive_path = archive_path
+        self._archive_index: Optional["ShortcodeIndex"] = None
+        self.similar_index_path = similar_index_path
+        self._similar_index: Optional["SimilarityIndex"] = None
+        self._similar_index_mtime: Optional[int] = None
+        self.stats_path = stats_path
+        self._stats: Optional["HashtagStats"] = None
+        self._stats_mtime: Optional[int] = None
+        # 통계 갱신은 스레드에서 실행되므로 동시 요청이 같은 상태를 함께 고치지 않도록 잠금
+        self._stats_lock = threading.Lock()
+
+    @property
+    def async_extractor(self) -> "AsyncInstagramTextExtractor":
+        """비동기 추출기 (요청 간 keep-alive 연결 풀 공유, 첫 사용 시 생성)"""
+        if self._async_extractor is None:
+            from src.async_extractor import AsyncInstagramTextExtractor
+
+            self._async_extractor = AsyncInstagramTextExtractor()
+        return self._async_extractor
+
+    @property
+    def batcher(self) -> "MicroBatcher":
+        """마이크로 배처 (첫 사용 시 생성)"""
+        if self._batcher is None:
+            from .batcher import MicroBatcher, TTLCache
+
+            self._batcher = MicroBatcher(
+                fetch=self.async_extractor.aget_post_text,
+                window=self.batch_window,
+                max_concurrency=self.max_concurrency,
+                min_interval=self.min_interval,
+                cache=TTLCache(self.cache_ttl) if self.cache_ttl > 0 else None,
+            )
+        return self._batcher
+
+    @property
+    def store(self) -> Optional["ResultStore"]:
+        """결과 저장소 (store_path가 있을 때 첫 사용 시 생성)"""
+        if self._store is None and self.store_path:
+            from src.store import ResultStore
+
+            self._store = ResultStore(self.store_path)
+        return self._store
+
+    @property
+    def archive_index(self) -> Optional["ShortcodeIndex"]:
+        """결과 로그 shortcode 인덱스 (archive_path가 있을 때 첫 사용 시 mmap으로 열기)"""
+        if self._archive_index is None and self.archive_path:
+            from src.archive import ShortcodeIndex
+
+            self._archive_index = ShortcodeIndex(self.archive_path)
+        return self._archive_index
+
+    def _archived_record(self, url: str, fields: Optional[Tuple[str, ...]] = None) -> Optional["PostRecord"]:
+        """결과 로그에 보관된 레코드 (mmap 인덱스 조회 + 한 줄 읽기, 없거나 fields 중 빠진 필드가 있으면 None)"""
+        if self.archive_index is None:
+            return None
+        from src.url_reader import canonicalize_url
+
+        canonical = canonicalize_url(url)
+        if canonical is None:
+            return None
+        return self.archive_index.get(canonical[0], fields)
+
+    async def aclose(self) -> None:
+        """진행 중인 배치 및 연결 풀 정리 (앱 종료 시 호출)"""
+        if self._batcher is not None:
+            await self._batcher.aclose()
+            self._batcher = None
+        if self._async_extractor is not None:
+            await self._async_extractor.aclose()
+            self._async_extractor = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        if self._archive_index is not None:
+            self._archive_index.close()
+            self._archive_index = None
     
+    async def _fetch_record(self, url: str, fields: Optional[Tuple[str, ...]] = None) -> "PostRecord":
+        """이벤트 루프를 막지 않는 비동기 추출 (배칭 사용 시 동시 요청을 모아 처리)
+
+        결과 로그의 최신 줄에 fields(None이면 전체)가 모두 있을 때만 그 레코드를 쓴다.
+        """
+        post_record = self._archived_record(url, fields)
+        if post_record is not None:
+            return post_record
+
+        if self.batch_window:
+            post_record = await self.batcher.submit(url)
+        else:
+            post_record = await self.async_extractor.aget_post_text(url)
+
+        if self.store is not None:
+            # SQLite 쓰기는 스레드에서 실행 (이벤트 루프 차단 방지)
+            await asyncio.to_thread(self.store.upsert, post_record)
+        return post_record
+
+    async def extract_fields(self, url: str, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Instagram URL에서 선택한 필드만 추출
+
+        GraphQL 응답 하나에 모든 필드가 들어 있으므로 업스트림 요청은 같고,
+        PostRecord는 이미 정제된 내부 데이터이므로 Pydantic 모델 검증 없이
+        선택한 필드만 JSON 호환 dict로 변환한다.
+
+        Args:
+            url (str): Instagram 게시물 URL
+            fields (Tuple[str, ...]): 포함할 필드 (src.record.parse_fields 결과)
+
+        Returns:
+            Dict[str, Any]: 선택한 필드만 담은 JSON 호환 dict
+
+        Raises:
+            ValueError: URL이 유효하지 않거나 게시물을 찾을 수 없는 경우
+            ConnectionError: 네트워크 연결 문제
+            PermissionError: 접근 권한이 없는 경우 (Private 계정)
+        """
+        post_record = await self._fetch_record(url, fields)
+        return post_record.to_json_dict(fields)
+
+    async def search(
+        self, query: str, limit: int = 20, offset: int = 0, username: Optional[str] = None
+    ) -> "SearchPage":
+        """
+        결과 저장소 전문 검색
+
+        Args:
+            query (str): 검색어
+            limit (int): 페이지 크기
+            offset (int): 건너뛸 결과 수
+            username (Optional[str]): 작성자 필터
+
+        Returns:
+            SearchPage: 전체 결과 수와 현재 페이지 결과
+
+        Raises:
+            RuntimeError: 결과 저장소가 설정되지 않은 경우
+            ValueError: 검색어가 비어 있는 경우
+        """
+        if self.store is None:
+            raise RuntimeError("결과 저장소가 설정되지 않았습니다 (RESULT_STORE_PATH).")
+        return await asyncio.to_thread(self.store.search, query, limit, offset, username)
+
+    def _load_similar_index(self) -> "SimilarityIndex":
+        """유사도 색인 (CLI가 색인 파일을 교체했으면 다시 불러옴)"""
+        if not self.similar_index_path:
+            raise RuntimeError("유사도 색인이 설정되지 않았습니다 (SIMILAR_INDEX_PATH).")
+        try:
+            mtime = os.stat(self.similar_index_path).st_mtime_ns
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"유사도 색인 파일이 없습니다: {self.similar_index_path} (python -m src similar --update)"
+            )
+        if self._similar_index is None or mtime != self._similar_index_mtime:
+            from src.similar import SimilarityIndex
+
+            self._similar_index = SimilarityIndex.load(self.similar_index_path)
+            self._similar_index_mtime = mtime
+        return self._similar_index
+
+    def _similar(self, shortcode: Optional[str], text: Optional[str], k: int) -> List[Dict[str, Any]]:
+        index = self._load_similar_index()
+        if shortcode is not None:
+            if shortcode not in index:
+                raise KeyError(f"색인에 없는 게시물입니다: {shortcode}")
+            hits = index.similar_to(shortcode, k)
+        else:
+            hits = index.query(text or "", k)
+
+        results = []
+        for hit in hits:
+            data: Dict[str, Any] = {"shortcode": hit.shortcode, "score": hit.score}
+            record = self.store.get(hit.shortcode) if self.store is not None else None
+            if record is not None:
+                data.update(record.to_json_dict(("title", "username", "url")))
+            results.append(data)
+        return results
+
+    async def similar(self, shortcode: Optional[str], text: Optional[str], k: int = 10) -> List[Dict[str, Any]]:
+        """
+        캡션이 비슷한 게시물 찾기
+
+        Args:
+            shortcode (Optional[str]): 기준 게시물 shortcode (있으면 text보다 우선)
+            text (Optional[str]): 기준 텍스트
+            k (int): 결과 수
+
+        Returns:
+            List[Dict[str, Any]]: 유사도 내림차순 결과 (결과 저장소에 있으면 제목/작성자/URL 포함)
+
+        Raises:
+            RuntimeError: 색인이 설정되지 않았거나 numpy/scipy가 없는 경우
+            KeyError: 색인에 없는 shortcode인 경우
+        """
+        # 색인 로드와 행렬 곱은 스레드에서 실행 (이벤트 루프 차단 방지)
+        return await asyncio.to_thread(self._similar, shortcode, text, k)
+
+    def _load_stats(self) -> "HashtagStats":
+        """해시태그 통계 (CLI가 상태 파일을 교체했으면 다시 불러오고 저장소의 새 게시물을 이어서 집계)"""
+        # 처음부터 전체 저장소를 훑는 집계는 요청 안에서 하지 않음 (CLI가 만든 상태에서만 이어서 집계)
+        if not self.stats_path:
+            raise RuntimeError("해시태그 통계가 설정되지 않았습니다 (STATS_PATH).")
+        from src.stats import HashtagStats
+
+        try:
+            mtime = os.stat(self.stats_path).st_mtime_ns
+        except FileNotFoundError:
+            raise RuntimeError(f"통계 파일이 없습니다: {self.stats_path} (python -m src stats)")
+        if self._stats is None or mtime != self._stats_mtime:
+            try:
+                self._stats = HashtagStats.load(self.stats_path)
+            except ValueError as e:
+                raise RuntimeError(str(e))
+            self._stats_mtime = mtime
+        if self.store is not None:
+            # 메모리에서만 이어서 집계 (상태 파일은 CLI가 관리)
+            self._stats.update_from_store(self.store)
+        return self._stats
+
+    def _stats_summary(self, k: int, username: Optional[str], hashtag: Optional[str]) -> Dict[str, Any]:
+        with self._stats_lock:
+            return self._load_stats().summary(k, username, hashtag)
+
+    async def stats(self, k: int = 10, username: Optional[str] = None, hashtag: Optional[str] = None) -> Dict[str, Any]:
+        """
+        해시태그/멘션 통계 요약
+
+        Args:
+            k (int): 항목별 결과 수
+            username (Optional[str]): 추이를 볼 작성자
+            hashtag (Optional[str]): 추이/함께 쓰인 해시태그를 볼 해시태그
+
+        Returns:
+            Dict[str, Any]: HashtagStats.summary() 결과
+
+        Raises:
+            RuntimeError: 통계 파일과 결과 저장소가 모두 설정되지 않았거나 상태 파일을 읽을 수 없는 경우
+        """
+        # 상태 로드와 새 게시물 집계는 스레드에서 실행 (이벤트 루프 차단 방지)
+        return await asyncio.to_thread(self._stats_summary, k, username, hashtag)
+
     async def extract_text(self, url: str) -> PostData:
         """
         Instagram URL에서 텍스트 추출
@@ -37,19 +319,10 @@ class InstagramService:
             PermissionError: 접근 권한이 없는 경우 (Private 계정)
         """
         try:
-            # 기존 InstagramTextExtractor 사용
-            post_data = self.extractor.get_post_text(url)
+            post_record = await self._fetch_record(url)
             
-            # Pydantic 모델로 변환
-            return PostData(
-                text=post_data.get("text", ""),
-                username=post_data.get("username", ""),
-                likes=post_data.get("likes", 0),
-                date=post_data.get("date"),
-                media_count=post_data.get("media_count", 1),
-                is_video=post_data.get("is_video", False),
-                url=post_data.get("url", url)
-            )
+            # PostRecord 속성에서 Pydantic 모델로 직접 변환
+            return PostData.model_validate(post_record)
             
         except Exception as e:
             # 에러를 그대로 re-raise하여 상위에서 처리하도록 함
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+/extract 응답 직렬화 비용 및 전송 크기 벤치마크
+
+기존 경로(Pydantic 모델 검증 + 표준 json)와 빠른 경로(PostRecord.to_json_dict +
+FastJSONResponse)의 요청당 직렬화 시간을 비교하고, 응답 본문 크기를
+압축 없음/gzip/brotli로 비교한다.
+
+사용법:
+    PYTHONPATH=. python benchmarks/api_serialization.py [결과 JSON 파일 ...]
+    (파일을 지정하지 않으면 outputs/instagram_batch_combined_*.json 사용)
+"""
+
+import glob
+import json
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+from starlette.responses import JSONResponse
+
+from api.models import ExtractResponse, PostData
+from api.responses import FastJSONResponse, _brotli_compress, _gzip_compress, orjson
+from api.services import POST_DATA_FIELDS
+from src.record import PostRecord
+
+
+def load_records(paths: List[str]) -> List[PostRecord]:
+    """통합 결과 JSON 파일에서 게시물 레코드 읽기"""
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        records.extend(PostRecord.from_mapping(item) for item in data.get("results", []))
+    return records
+
+
+def pydantic_body(record: PostRecord) -> bytes:
+    """기존 경로: 응답 모델 생성/검증 후 표준 json 직렬화"""
+    response = ExtractResponse(success=True, data=PostData.model_validate(record), error=None)
+    # FastAPI가 response_model로 한 번 더 검증하는 단계
+    content = ExtractResponse.model_validate(response).model_dump(mode="json")
+    return JSONResponse(content).body
+
+
+def fast_body(record: PostRecord) -> bytes:
+    """빠른 경로: 내부 레코드를 검증 없이 dict로 변환해 orjson 직렬화"""
+    content = {"success": True, "data": record.to_json_dict(POST_DATA_FIELDS), "error": None}
+    return FastJSONResponse(content).body
+
+
+def time_per_request(serialize: Callable[[PostRecord], bytes], records: List[PostRecord], rounds: int = 20) -> float:
+    """요청당 평균 직렬화 시간 (마이크로초, 라운드별 최솟값 기준)"""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for record in records:
+            serialize(record)
+        samples.append((time.perf_counter() - start) / len(records))
+    return min(samples) * 1_000_000
+
+
+def main() -> None:
+    paths = sys.argv[1:] or sorted(glob.glob("outputs/instagram_batch_combined_*.json"))
+    records = load_records(paths)
+    if not records:
+        print("❌ 벤치마크할 결과 파일이 없습니다.")
+        sys.exit(1)
+
+    print(f"📊 레코드 {len(records)}개 ({len(paths)}개 파일)")
+    print(f"🧰 JSON 인코더: {'orjson' if orjson is not None else '표준 json (orjson 미설치)'}")
+    print("=" * 60)
+
+    baseline = time_per_request(pydantic_body, records)
+    fast = time_per_request(fast_body, records)
+    print("⏱️ 요청당 직렬화 시간")
+    print(f"   기존 (Pydantic 검증 + json): {baseline:8.1f}µs")
+    print(f"   빠른 경로 (검증 없음 + {'orjson' if orjson is not None else 'json'}): {fast:8.1f}µs ({baseline / fast:.1f}배)")
+
+    bodies = [fast_body(record) for record in records]
+    encoders = [("압축 없음", lambda body: body), ("gzip", _gzip_compress)]
+    brotli_compress = _brotli_compress()
+    if brotli_compress is not None:
+        encoders.append(("brotli", brotli_compress))
+
+    raw_sizes = [len(body) for body in bodies]
+    print("\n📦 요청당 응답 크기 (바이트)")
+    for name, encode in encoders:
+        sizes = [len(encode(body)) for body in bodies]
+        ratio = sum(sizes) / sum(raw_sizes)
+        print(
+            f"   {name:8s}: 평균 {statistics.mean(sizes):8.0f}, "
+            f"중앙값 {statistics.median(sizes):8.0f}, 최대 {max(sizes):8d} ({ratio:.0%})"
+        )
+    if brotli_compress is None:
+        print("   brotli   : brotli 패키지 미설치 (pip install brotli)")
+
+
+if __name__ == "__main__":
+    main()
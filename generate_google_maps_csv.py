@@ -2,140 +2,286 @@
 """
 Google My Maps CSV 생성 스크립트
 장소 정보가 담긴 JSON 파일을 Google My Maps에서 가져올 수 있는 CSV 형식으로 변환
+
+입력 파일은 장소 단위로 조금씩 읽고, 이름과 주소가 같은 장소는 임시 SQLite
+데이터베이스(디스크)에서 하나로 합치므로 입력 크기와 관계없이 메모리 사용량이
+일정하다. My Maps는 레이어마다 가져올 수 있는 행 수가 제한되어 있어 레이어 크기
+단위(선택적으로 카테고리별)로 CSV를 나눠 저장한다.
 """
 
-import json
+import argparse
 import csv
-import sys
+import re
+import sqlite3
 from pathlib import Path
 
+from src.importer import iter_json_results
+
+# My Maps 레이어 하나로 가져올 수 있는 최대 행 수
+LAYER_SIZE = 2000
+
+# Google My Maps에서 사용할 CSV 헤더
+HEADERS = [
+    'Name',           # 장소명 (필수)
+    'Address',        # 주소 (필수)
+    'Description',    # 설명
+    'Category',       # 카테고리
+    'Website',        # 웹사이트 URL (좋아요가 가장 많은 게시물)
+    'Likes',          # 좋아요 수 (합친 게시물 합계)
+    'Rating',         # 평점
+    'Price',          # 가격대
+    'Sources',        # 장소를 언급한 게시물 URL (줄바꿈 구분)
+]
+
+_SCHEMA = """
+CREATE TABLE places (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    rating TEXT NOT NULL,
+    price_range TEXT NOT NULL
+);
+CREATE TABLE sources (
+    place_id INTEGER NOT NULL,
+    url TEXT,
+    likes INTEGER NOT NULL,
+    UNIQUE (place_id, url)
+);
+"""
 
-def load_locations_data(json_file_path):
-    """JSON 파일에서 장소 데이터를 로드"""
-    try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get('locations', [])
-    except FileNotFoundError:
-        print(f"파일을 찾을 수 없습니다: {json_file_path}")
-        return []
-    except json.JSONDecodeError as e:
-        print(f"JSON 파싱 오류: {e}")
-        return []
-
-
-def generate_csv(locations, output_file_path):
-    """장소 데이터를 Google My Maps 호환 CSV로 변환"""
-
-    # Google My Maps에서 사용할 CSV 헤더
-    headers = [
-        'Name',           # 장소명 (필수)
-        'Address',        # 주소 (필수)
-        'Description',    # 설명
-        'Category',       # 카테고리
-        'Website',        # 웹사이트 URL
-        'Likes',          # 좋아요 수
-        'Rating',         # 평점
-        'Price'           # 가격대
-    ]
-
-    try:
-        with open(output_file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # 헤더 작성
-            writer.writerow(headers)
-
-            # 각 장소 데이터 작성
-            for location in locations:
-                # 장소명 (한국어 우선, 영어 백업)
-                name = location.get('name', location.get('name_en', ''))
-
-                # 주소
-                address = location.get('address', '')
-
-                # 설명
-                description = location.get('description', '')
-
-                # 카테고리
-                category = location.get('category', '')
-
-                # 웹사이트
-                website = location.get('website', '')
-
-                # 좋아요 수
-                likes = location.get('likes', 0)
+_WHITESPACE = re.compile(r"\s+")
+_UNSAFE_FILENAME = re.compile(r"[^\w-]+")
 
-                # 평점
-                rating = location.get('rating', '')
 
-                # 가격대
-                price_range = location.get('price_range', '')
+def _text(value):
+    """CSV에 쓸 문자열 (None은 빈 문자열)"""
+    return "" if value is None else str(value)
 
-                # CSV 행 작성
-                writer.writerow([
-                    name,
-                    address,
-                    description,
-                    category,
-                    website,
-                    likes,
-                    rating,
-                    price_range
-                ])
 
+def _likes(value):
+    """좋아요 수 정수 변환 (숫자가 아니면 0)"""
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def place_key(name, address):
+    """중복 판정 키 (공백 정리, 대소문자 무시한 이름 + 주소)"""
+    def normalize(value):
+        return _WHITESPACE.sub(" ", value).strip().casefold()
+    return f"{normalize(name)}\x1f{normalize(address)}"
+
+
+def iter_locations(json_file_path):
+    """JSON 파일의 장소를 하나씩 읽기 ({"locations": [...]} 또는 최상위 배열)"""
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        for _, location in iter_json_results(f, array_key='locations'):
+            if isinstance(location, dict):
+                yield location
+
+
+class LocationMerger:
+    """이름과 주소가 같은 장소를 합치는 디스크 기반 임시 저장소"""
+
+    def __init__(self):
+        # 빈 경로는 닫으면 지워지는 임시 파일 데이터베이스 (페이지 캐시를 넘으면 디스크 사용)
+        self.connection = sqlite3.connect("")
+        self.connection.executescript(_SCHEMA)
+        self.read_count = 0
+
+    def close(self):
+        self.connection.close()
+
+    def add(self, location):
+        """장소 추가 (같은 장소가 있으면 출처 게시물만 연결)"""
+        name = _text(location.get('name') or location.get('name_en'))
+        address = _text(location.get('address'))
+        if not name:
+            return False
+        self.read_count += 1
+
+        key = place_key(name, address)
+        self.connection.execute(
+            "INSERT INTO places (key, name, address, description, category, rating, price_range)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)"
+            # 처음 나온 장소의 값을 유지하되 비어 있던 설명/카테고리 등은 채움
+            " ON CONFLICT (key) DO UPDATE SET"
+            " description = CASE WHEN description = '' THEN excluded.description ELSE description END,"
+            " category = CASE WHEN category = '' THEN excluded.category ELSE category END,"
+            " rating = CASE WHEN rating = '' THEN excluded.rating ELSE rating END,"
+            " price_range = CASE WHEN price_range = '' THEN excluded.price_range ELSE price_range END",
+            (
+                key,
+                name,
+                address,
+                _text(location.get('description')),
+                _text(location.get('category')),
+                _text(location.get('rating')),
+                _text(location.get('price_range')),
+            ),
+        )
+        place_id = self.connection.execute("SELECT id FROM places WHERE key = ?", (key,)).fetchone()[0]
+
+        # places 명령 결과처럼 게시물 목록이 있으면 모두 연결, 없으면 website가 출처
+        posts = location.get('posts')
+        if not isinstance(posts, list) or not posts:
+            posts = [{'url': location.get('website'), 'likes': location.get('likes')}]
+        # 같은 게시물이 여러 번 나오면 좋아요는 한 번만 (가장 큰 값) 센다
+        self.connection.executemany(
+            "INSERT INTO sources (place_id, url, likes) VALUES (?, ?, ?)"
+            " ON CONFLICT (place_id, url) DO UPDATE SET likes = MAX(likes, excluded.likes)",
+            [
+                (place_id, post.get('url') or None, _likes(post.get('likes')))
+                for post in posts if isinstance(post, dict)
+            ],
+        )
         return True
 
-    except Exception as e:
-        print(f"CSV 파일 생성 중 오류 발생: {e}")
-        return False
+    def layer_counts(self, by_category=False):
+        """레이어 그룹별 장소 수 ({카테고리 또는 None: 장소 수})"""
+        if not by_category:
+            return {None: self.connection.execute("SELECT COUNT(*) FROM places").fetchone()[0]}
+        rows = self.connection.execute("SELECT category, COUNT(*) FROM places GROUP BY category ORDER BY category")
+        return dict(rows.fetchall())
+
+    def iter_rows(self, by_category=False):
+        """(레이어 그룹, CSV 행) 순서대로 읽기 (그룹 안에서는 처음 나온 순서)"""
+        order = "p.category, p.id" if by_category else "p.id"
+        cursor = self.connection.execute(
+            "SELECT p.category, p.name, p.address, p.description, p.rating, p.price_range,"
+            " (SELECT url FROM sources WHERE place_id = p.id AND url IS NOT NULL"
+            "  ORDER BY likes DESC, rowid LIMIT 1),"
+            " (SELECT SUM(likes) FROM sources WHERE place_id = p.id),"
+            " (SELECT group_concat(url, char(10)) FROM"
+            "  (SELECT url FROM sources WHERE place_id = p.id AND url IS NOT NULL ORDER BY likes DESC, rowid))"
+            f" FROM places AS p ORDER BY {order}"
+        )
+        for category, name, address, description, rating, price_range, website, likes, sources in cursor:
+            row = [name, address, description, category, website or '', likes or 0, rating, price_range, sources or '']
+            yield (category if by_category else None), row
+
+
+def shard_path(output_file_path, group, number, group_shards, used=None):
+    """레이어 CSV 경로 (나눌 필요가 없으면 원래 경로)
+
+    used에 이미 쓴 경로를 넘기면, 파일 이름으로 바꾼 카테고리가 겹칠 때("카페/디저트",
+    "카페 디저트") 덮어쓰지 않도록 "~2", "~3" 접미사를 붙이고 새 경로를 used에 추가한다.
+    """
+    path = Path(output_file_path)
+    suffix = ""
+    if group is not None:
+        suffix += "_" + (_UNSAFE_FILENAME.sub("_", group).strip("_") or "기타")
+    if group_shards > 1:
+        suffix += f"_{number:02d}"
+    extension = path.suffix or '.csv'
+    candidate = str(path.with_name(f"{path.stem}{suffix}{extension}"))
+    if used is not None:
+        duplicate = 1
+        while candidate in used:
+            duplicate += 1
+            candidate = str(path.with_name(f"{path.stem}{suffix}~{duplicate}{extension}"))
+        used.add(candidate)
+    return candidate
+
+
+def write_layers(merger, output_file_path, layer_size=LAYER_SIZE, by_category=False):
+    """합친 장소를 레이어 크기 단위 CSV 파일로 저장 [(경로, 카테고리, 행 수), ...]"""
+    counts = merger.layer_counts(by_category)
+    written = []
+    used_paths = set()
+    writer = None
+    csvfile = None
+    try:
+        for group, row in merger.iter_rows(by_category):
+            # 그룹이 바뀌거나 레이어가 가득 차면 새 파일
+            if csvfile is None or group != written[-1][1] or written[-1][2] >= layer_size:
+                number = written[-1][3] + 1 if csvfile is not None and group == written[-1][1] else 1
+                if csvfile is not None:
+                    csvfile.close()
+                group_shards = -(-counts[group] // layer_size)
+                path = shard_path(output_file_path, group, number, group_shards, used_paths)
+                csvfile = open(path, 'w', newline='', encoding='utf-8')
+                writer = csv.writer(csvfile)
+                writer.writerow(HEADERS)
+                written.append([path, group, 0, number])
+            writer.writerow(row)
+            written[-1][2] += 1
+    finally:
+        if csvfile is not None:
+            csvfile.close()
+    return [(path, group, count) for path, group, count, _ in written]
 
 
 def main():
     """메인 실행 함수"""
-
-    # 입력 파일 및 출력 파일 경로 설정
-    input_file = "mock_locations.json"
-    output_file = "locations_for_google_maps.csv"
-
-    # 명령행 인수가 있으면 사용
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-    if len(sys.argv) > 2:
-        output_file = sys.argv[2]
-
-    print(f"입력 파일: {input_file}")
-    print(f"출력 파일: {output_file}")
-
-    # 장소 데이터 로드
-    locations = load_locations_data(input_file)
-
-    if not locations:
-        print("장소 데이터가 없습니다.")
-        return
-
-    print(f"총 {len(locations)}개의 장소를 발견했습니다.")
-
-    # CSV 생성
-    if generate_csv(locations, output_file):
-        print(f"✅ CSV 파일이 성공적으로 생성되었습니다: {output_file}")
+    parser = argparse.ArgumentParser(description="장소 JSON을 Google My Maps 가져오기용 CSV로 변환합니다.")
+    parser.add_argument("input_file", nargs="?", default="mock_locations.json", help="입력 JSON (기본값: mock_locations.json)")
+    parser.add_argument(
+        "output_file", nargs="?", default="locations_for_google_maps.csv",
+        help="출력 CSV (기본값: locations_for_google_maps.csv, 나눠 저장하면 _01 등의 접미사가 붙음)",
+    )
+    parser.add_argument(
+        "--layer-size", type=int, default=LAYER_SIZE, help=f"CSV 파일 하나의 최대 장소 수 (기본값: {LAYER_SIZE})"
+    )
+    parser.add_argument("--by-category", action="store_true", help="카테고리별로 CSV 파일 나누기")
+    args = parser.parse_args()
+    if args.layer_size < 1:
+        parser.error("--layer-size는 1 이상이어야 합니다.")
+
+    print(f"입력 파일: {args.input_file}")
+    print(f"출력 파일: {args.output_file}")
+
+    merger = LocationMerger()
+    try:
+        try:
+            for location in iter_locations(args.input_file):
+                merger.add(location)
+        except FileNotFoundError:
+            print(f"파일을 찾을 수 없습니다: {args.input_file}")
+            return
+        except ValueError as e:
+            print(f"JSON 파싱 오류: {e}")
+            return
+
+        total = merger.layer_counts()[None]
+        if not total:
+            print("장소 데이터가 없습니다.")
+            return
+        print(f"총 {merger.read_count}개의 장소를 발견했습니다. (중복 합친 뒤 {total}개)")
+
+        # CSV 생성
+        try:
+            layers = write_layers(merger, args.output_file, args.layer_size, args.by_category)
+        except (OSError, sqlite3.Error) as e:
+            print(f"CSV 파일 생성 중 오류 발생: {e}")
+            print("❌ CSV 파일 생성에 실패했습니다.")
+            return
+
+        print(f"✅ CSV 파일 {len(layers)}개가 성공적으로 생성되었습니다:")
+        for path, category, count in layers:
+            label = f" [{category or '카테고리 없음'}]" if args.by_category else ""
+            print(f"  - {path}{label}: {count}개")
         print("\n📋 Google My Maps 업로드 방법:")
         print("1. https://mymaps.google.com 접속")
         print("2. '새 지도 만들기' 클릭")
-        print("3. '가져오기' 클릭")
-        print(f"4. '{output_file}' 파일 업로드")
+        print("3. 레이어마다 '가져오기' 클릭")
+        print("4. 위 CSV 파일을 레이어 하나에 하나씩 업로드")
         print("5. 컬럼 매핑 확인 후 완료")
 
         # 생성된 데이터 미리보기
-        print(f"\n📍 생성된 장소 목록:")
-        for i, location in enumerate(locations, 1):
-            name = location.get('name', location.get('name_en', ''))
-            category = location.get('category', '')
-            print(f"  {i}. {name} ({category})")
-
-    else:
-        print("❌ CSV 파일 생성에 실패했습니다.")
+        print("\n📍 생성된 장소 목록:")
+        for i, (_, row) in enumerate(merger.iter_rows(), 1):
+            if i > 10:
+                print(f"  ... 외 {total - 10}개")
+                break
+            print(f"  {i}. {row[0]} ({row[3]})")
+    finally:
+        merger.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
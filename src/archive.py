@@ -0,0 +1,387 @@
+"""
+추가 전용 결과 로그 및 shortcode 인덱스 모듈
+
+추출 결과를 JSON Lines 로그(outputs/results.jsonl)에 한 줄씩 덧붙이고, shortcode가
+로그의 어느 위치에 있는지를 고정 길이 항목을 정렬한 인덱스 파일(results.jsonl.idx)에
+기록한다. 인덱스는 mmap으로 열어 이진 탐색하므로 여러 CLI/uvicorn 프로세스가 읽기
+전용으로 공유할 수 있고, 갱신은 로그에서 새로 추가된 부분만 읽어 임시 파일에 쓴 뒤
+os.replace로 교체한다 (읽는 쪽은 교체 전 파일을 계속 사용하다가 다음 확인 때 다시 연다).
+"""
+
+import hashlib
+import sys
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from bisect import bisect_left
+from heapq import merge
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .record import PostRecord, to_json_dict
+from .store import shortcode_of
+
+DEFAULT_LOG_PATH = "outputs/results.jsonl"
+INDEX_SUFFIX = ".idx"
+
+# 인덱스 파일 구조: 헤더 | shortcode 해시 배열 (오름차순, u64) | 위치 배열 (로그 내 위치 u64, 줄 길이 u32)
+# 해시를 따로 모아 두면 mmap을 u64 배열로 보고 bisect(C 구현)로 탐색할 수 있다.
+_MAGIC = b"IGSCIDX2"
+# 매직, 항목 수, 인덱스에 반영된 로그 크기 (바이트)
+_HEADER = struct.Struct("<8sQQ")
+_KEY = struct.Struct("<Q")
+_LOCATION = struct.Struct("<QI")
+
+# append()가 쓰는 줄은 shortcode가 항상 첫 키 (전체 JSON을 파싱하지 않고 읽음)
+_SHORTCODE_PREFIX = re.compile(rb'^\{"shortcode":\s*"([A-Za-z0-9_-]+)"')
+
+
+def shortcode_hash(shortcode: str) -> int:
+    """인덱스 정렬 키 (64비트 blake2b)"""
+    return int.from_bytes(hashlib.blake2b(shortcode.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def index_path_for(log_path: str) -> str:
+    """로그 파일의 인덱스 파일 경로"""
+    return log_path + INDEX_SUFFIX
+
+
+class ResultLog:
+    """추가 전용 JSON Lines 결과 로그
+
+    같은 shortcode가 여러 번 기록되면 나중에 기록한 줄이 최신 레코드다.
+    한 줄을 O_APPEND로 한 번에 쓰므로 여러 프로세스가 동시에 덧붙여도 줄이 섞이지 않는다.
+    """
+
+    def __init__(self, path: str = DEFAULT_LOG_PATH):
+        """
+        초기화 (파일은 첫 기록 시 생성)
+
+        Args:
+            path (str): 로그 파일 경로
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._fd: Optional[int] = None
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "ResultLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def append(self, post_data: Mapping, fields: Optional[Tuple[str, ...]] = None, extracted_at: Optional[float] = None) -> Tuple[int, int]:
+        """게시물 레코드 한 줄 추가
+
+        Args:
+            post_data (Mapping): PostRecord 또는 게시물 dict
+            fields (Optional[Tuple[str, ...]]): 기록할 필드 (None이면 전체)
+            extracted_at (Optional[float]): 추출 시각 (Unix 시간, 기본값: 현재 시각)
+
+        Returns:
+            Tuple[int, int]: (로그 내 위치, 줄 길이)
+
+        Raises:
+            ValueError: URL이 Instagram 게시물 URL이 아닌 경우
+        """
+        entry = {
+            "shortcode": shortcode_of(post_data),
+            "extracted_at": datetime.fromtimestamp(extracted_at or time.time()).isoformat(),
+        }
+        entry.update(to_json_dict(post_data, fields))
+        line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self._fd, line)
+        # O_APPEND 쓰기 직후의 파일 위치는 방금 쓴 줄의 끝
+        end = os.lseek(self._fd, 0, os.SEEK_CUR)
+        return end - len(line), len(line)
+
+    def scan(self, start: int = 0) -> Iterator[Tuple[Optional[str], int, int]]:
+        """start 위치부터 완성된 줄을 차례로 읽기 (쓰는 중인 마지막 줄은 제외)
+
+        Args:
+            start (int): 읽기 시작할 위치 (줄의 시작)
+
+        Yields:
+            Tuple[Optional[str], int, int]: (shortcode, 위치, 줄 길이), 형식이 잘못된 줄은 shortcode가 None
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                yield _line_shortcode(line), offset, len(line)
+                offset += len(line)
+
+
+def _line_shortcode(line: bytes) -> Optional[str]:
+    """로그 한 줄의 shortcode (접두어로 찾지 못하면 JSON 전체를 파싱)"""
+    match = _SHORTCODE_PREFIX.match(line)
+    if match:
+        return match.group(1).decode("ascii")
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    shortcode = data.get("shortcode")
+    if isinstance(shortcode, str):
+        return shortcode
+    try:
+        return shortcode_of(data)
+    except ValueError:
+        return None
+
+
+class _PackedKeys(Sequence):
+    """빅엔디언 환경용 해시 배열 (memoryview.cast는 네이티브 바이트 순서만 지원)"""
+
+    def __init__(self, mapped: mmap.mmap, count: int):
+        self.mapped = mapped
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> int:
+        return _KEY.unpack_from(self.mapped, _HEADER.size + i * _KEY.size)[0]
+
+
+class ShortcodeIndex:
+    """결과 로그의 mmap shortcode 인덱스
+
+    인덱스 파일은 shortcode 해시를 정렬한 고정 길이 배열과 같은 순서의 (위치, 길이)
+    배열이므로 조회는 mmap 위 이진 탐색이다. 해시 충돌은 get()에서 로그 줄의
+    shortcode를 비교해 걸러낸다.
+    """
+
+    def __init__(self, log_path: str = DEFAULT_LOG_PATH, index_path: Optional[str] = None, refresh_interval: float = 1.0):
+        """
+        초기화 (인덱스 파일이 없으면 빈 인덱스)
+
+        Args:
+            log_path (str): 결과 로그 경로
+            index_path (Optional[str]): 인덱스 파일 경로 (기본값: 로그 경로 + .idx)
+            refresh_interval (float): 다른 프로세스의 인덱스 교체를 확인하는 최소 간격 (초)
+        """
+        self.log_path = log_path
+        self.index_path = index_path or index_path_for(log_path)
+        self.refresh_interval = refresh_interval
+        # (mmap, 해시 배열, 항목 수): 다른 스레드가 다시 열어도 한 번에 바뀌도록 튜플로 보관
+        self._view: Optional[Tuple[mmap.mmap, Sequence[int], int]] = None
+        self._identity: Optional[Tuple[int, int, int]] = None
+        # 첫 조회/갱신 때 인덱스 파일을 연다 (손상된 인덱스도 update(full=True)로 복구 가능)
+        self._checked = float("-inf")
+        self.indexed_size = 0
+        self._log_fd: Optional[int] = None
+
+    def close(self) -> None:
+        if self._view is not None:
+            mapped, keys, _ = self._view
+            if isinstance(keys, memoryview):
+                keys.release()
+            mapped.close()
+            self._view = None
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def __enter__(self) -> "ShortcodeIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _open(self) -> None:
+        """인덱스 파일을 (다시) mmap으로 열기"""
+        self._checked = time.monotonic()
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            self._view, self._identity, self.indexed_size = None, None, 0
+            return
+
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if identity == self._identity:
+            return
+        corrupted = ValueError(f"손상된 인덱스 파일입니다: {self.index_path} (python -m src index --full로 다시 생성)")
+        if stat.st_size < _HEADER.size:
+            raise corrupted
+        with open(self.index_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, indexed_size = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or len(mapped) != _HEADER.size + count * (_KEY.size + _LOCATION.size):
+            mapped.close()
+            raise corrupted
+
+        if sys.byteorder == "little":
+            keys = memoryview(mapped)[_HEADER.size:_HEADER.size + count * _KEY.size].cast("Q")
+        else:
+            keys = _PackedKeys(mapped, count)
+        # 이전 mmap은 다른 스레드가 읽는 중일 수 있으므로 닫지 않고 참조만 해제
+        self._view, self._identity, self.indexed_size = (mapped, keys, count), identity, indexed_size
+
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._checked >= self.refresh_interval:
+            self._open()
+
+    def __len__(self) -> int:
+        self._maybe_refresh()
+        return self._view[2] if self._view is not None else 0
+
+    def lookup(self, shortcode: str) -> Optional[Tuple[int, int]]:
+        """shortcode의 로그 위치 조회
+
+        Args:
+            shortcode (str): 게시물 shortcode
+
+        Returns:
+            Optional[Tuple[int, int]]: (로그 내 위치, 줄 길이), 없으면 None
+        """
+        self._maybe_refresh()
+        view = self._view
+        if view is None:
+            return None
+
+        mapped, keys, count = view
+        key = shortcode_hash(shortcode)
+        i = bisect_left(keys, key)
+        if i == count or keys[i] != key:
+            return None
+        return _LOCATION.unpack_from(mapped, _HEADER.size + count * _KEY.size + i * _LOCATION.size)
+
+    def __contains__(self, shortcode: str) -> bool:
+        return self.lookup(shortcode) is not None
+
+    def get(self, shortcode: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[PostRecord]:
+        """shortcode의 최신 레코드를 로그에서 읽기
+
+        --simple/--fields 실행은 선택한 필드만 기록하므로, 최신 줄에 필요한 필드가 없으면
+        None을 반환해 호출자가 다시 가져오게 한다 (빠진 필드를 기본값으로 채워 반환하지 않음).
+
+        Args:
+            shortcode (str): 게시물 shortcode
+            fields (Optional[Tuple[str, ...]]): 최신 줄에 있어야 하는 필드 (None이면 전체)
+
+        Returns:
+            Optional[PostRecord]: 레코드 (없거나 필요한 필드가 빠진 경우 None)
+        """
+        location = self.lookup(shortcode)
+        if location is None:
+            return None
+        if self._log_fd is None:
+            self._log_fd = os.open(self.log_path, os.O_RDONLY)
+        offset, length = location
+        data = json.loads(os.pread(self._log_fd, length, offset))
+        if data.get("shortcode") != shortcode:
+            return None
+        record = PostRecord.from_mapping(data)
+        if any(name not in data for name in fields or record):
+            return None
+        return record
+
+    def iter_records(self) -> Iterator[PostRecord]:
+        """인덱스에 있는 게시물마다 최신 레코드를 로그 순서대로 읽기 (마지막 update() 이후 줄은 제외)
+
+        Yields:
+            PostRecord: 게시물 레코드
+        """
+        self._open()
+        # 위치 순으로 읽으면 로그를 앞에서 뒤로 한 번만 훑는다
+        locations = sorted((offset, length) for _, offset, length in self._entries())
+        if not locations:
+            return
+        with open(self.log_path, "rb") as f:
+            for offset, length in locations:
+                f.seek(offset)
+                yield PostRecord.from_mapping(json.loads(f.read(length)))
+
+    def _entries(self) -> Iterable[Tuple[int, int, int]]:
+        """인덱스 항목 (해시, 위치, 길이)을 해시 순으로"""
+        if self._view is None:
+            return ()
+        mapped, keys, count = self._view
+        start = _HEADER.size + count * _KEY.size
+        locations = _LOCATION.iter_unpack(mapped[start:start + count * _LOCATION.size])
+        return ((key, offset, length) for key, (offset, length) in zip(keys, locations))
+
+    def update(self, full: bool = False) -> int:
+        """로그에서 새로 추가된 줄을 인덱스에 반영
+
+        인덱스에 기록된 로그 크기 이후의 줄만 읽고, 기존 항목과 병합해 임시 파일에 쓴 뒤
+        원자적으로 교체한다. 로그가 인덱스보다 작아졌으면(교체/잘림) 처음부터 다시 만든다.
+
+        Args:
+            full (bool): 기존 인덱스를 무시하고 처음부터 다시 만들기
+
+        Returns:
+            int: 새로 반영한 로그 줄 수
+        """
+        if not full:
+            self._open()
+        log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        if full or self.indexed_size > log_size:
+            start, existing = 0, ()
+        else:
+            start, existing = self.indexed_size, self._entries()
+
+        # 같은 shortcode는 나중 줄이 최신
+        latest = {}
+        end = start
+        lines = 0
+        for shortcode, offset, length in ResultLog(self.log_path).scan(start):
+            end = offset + length
+            lines += 1
+            if shortcode is not None:
+                latest[shortcode_hash(shortcode)] = (offset, length)
+        if not lines and not full and self._view is not None:
+            return 0
+
+        added = sorted((key, offset, length) for key, (offset, length) in latest.items())
+        entries: List[Tuple[int, int, int]] = []
+        # merge는 같은 키에서 기존 항목을 먼저 내보내므로 마지막(새 항목)이 남음
+        for entry in merge(existing, added, key=lambda e: e[0]):
+            if entries and entries[-1][0] == entry[0]:
+                entries[-1] = entry
+            else:
+                entries.append(entry)
+
+        self._write(entries, end)
+        return lines
+
+    def _write(self, entries: List[Tuple[int, int, int]], indexed_size: int) -> None:
+        """임시 파일에 인덱스를 쓰고 os.replace로 교체"""
+        directory = os.path.dirname(self.index_path) or "."
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.index_path) + ".")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, len(entries), indexed_size))
+                f.write(struct.pack(f"<{len(entries)}Q", *(key for key, _, _ in entries)))
+                f.write(b"".join(_LOCATION.pack(offset, length) for _, offset, length in entries))
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, self.index_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._open()
@@ -0,0 +1,208 @@
+"""
+비동기 Instagram 게시물 텍스트 추출 모듈
+
+InstagramTextExtractor.get_post_text()와 같은 shortcode 조회(GraphQL doc_id 쿼리)를
+keep-alive 연결 풀을 쓰는 httpx.AsyncClient로 수행한다. 대기는 asyncio.sleep으로
+처리하므로 스레드 없이 이벤트 루프 하나에서 수백 건을 동시에 처리할 수 있다.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .postprocess import parse_json_payload
+from .record import PostRecord
+from .transport import TransportConfig
+from .url_reader import canonicalize_url
+
+
+INSTAGRAM_ORIGIN = "https://www.instagram.com"
+
+GRAPHQL_URL = f"{INSTAGRAM_ORIGIN}/graphql/query"
+
+# 게시물 메타데이터 조회 doc_id (instaloader Post._obtain_metadata와 동일)
+POST_DOC_ID = "27128499623469141"
+
+# instaloader 기본 헤더와 동일한 웹 앱 ID
+IG_APP_ID = "936619743392459"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+# 재시도 대상 HTTP 상태 코드 (요청 제한/일시 차단)
+RATE_LIMIT_STATUS = {403, 429}
+
+
+class RateLimitError(ConnectionError):
+    """Instagram 요청 제한 응답"""
+
+
+class AsyncInstagramTextExtractor:
+    """httpx 기반 비동기 Instagram 게시물 텍스트 추출기"""
+
+    def __init__(
+        self,
+        transport: Optional[TransportConfig] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            transport (Optional[TransportConfig]): 연결 풀/제한 시간/HTTP/2 설정
+                (기본값: 동시 요청 100개 기준)
+            client (Optional[httpx.AsyncClient]): 외부에서 만든 클라이언트 (테스트/공유용)
+        """
+        self.transport = transport or TransportConfig.for_concurrency(100)
+        self._client = client
+        self._csrf_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """연결 풀을 공유하는 비동기 HTTP 클라이언트 (첫 사용 시 생성)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "User-Agent": USER_AGENT,
+                    "Accept-Language": "en-US,en;q=0.8",
+                    "Referer": f"{INSTAGRAM_ORIGIN}/",
+                    "x-ig-app-id": IG_APP_ID,
+                },
+                **self.transport.async_client_kwargs(),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """연결 풀 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncInstagramTextExtractor":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def extract_shortcode(self, url: str) -> str:
+        """URL에서 shortcode 추출
+
+        Args:
+            url (str): Instagram 게시물 URL
+
+        Returns:
+            str: 추출된 shortcode
+
+        Raises:
+            ValueError: 유효하지 않은 URL인 경우
+        """
+        canonical = canonicalize_url(url)
+        if canonical is None:
+            raise ValueError("유효하지 않은 Instagram URL입니다.")
+        return canonical[0]
+
+    async def _csrf_token(self) -> str:
+        """CSRF 토큰 확보 (없으면 메인 페이지를 한 번만 요청해 쿠키를 받음)"""
+        token = self.client.cookies.get("csrftoken")
+        if token:
+            return token
+
+        if self._csrf_lock is None:
+            self._csrf_lock = asyncio.Lock()
+        async with self._csrf_lock:
+            token = self.client.cookies.get("csrftoken")
+            if not token:
+                await self.client.get(f"{INSTAGRAM_ORIGIN}/")
+                token = self.client.cookies.get("csrftoken") or ""
+        return token
+
+    async def _query_post(self, shortcode: str) -> Dict[str, Any]:
+        """GraphQL doc_id 쿼리로 게시물 메타데이터 조회
+
+        Raises:
+            RateLimitError: 요청 제한 응답
+            PermissionError: 로그인 페이지로 이동된 경우
+            ValueError: 게시물이 없는 경우
+            ConnectionError: 그 밖의 HTTP/네트워크 오류
+        """
+        variables = {
+            "shortcode": shortcode,
+            "__relay_internal__pv__PolarisAIGMMediaWebLabelEnabledrelayprovider": False,
+        }
+        try:
+            response = await self.client.post(
+                GRAPHQL_URL,
+                data={
+                    "variables": json.dumps(variables, separators=(",", ":")),
+                    "doc_id": POST_DOC_ID,
+                    "server_timestamps": "true",
+                },
+                headers={"x-csrftoken": await self._csrf_token(), "accept": "*/*"},
+            )
+        except httpx.TransportError as e:
+            raise ConnectionError(f"{type(e).__name__}: {str(e)}")
+
+        if response.is_redirect:
+            if "/accounts/login" in response.headers.get("location", ""):
+                raise PermissionError("비공개 계정입니다. 로그인이 필요합니다.")
+            raise ConnectionError(f"예상치 못한 리디렉션: {response.headers.get('location')}")
+        if response.status_code in RATE_LIMIT_STATUS:
+            raise RateLimitError(f"{response.status_code} {response.reason_phrase} - graphql/query")
+        if response.status_code == 404:
+            raise ValueError("게시물이 삭제되었거나 존재하지 않습니다.")
+        if response.status_code >= 400:
+            raise ConnectionError(f"HTTP {response.status_code} {response.reason_phrase}")
+
+        try:
+            return response.json()
+        except ValueError:
+            raise ConnectionError("JSON이 아닌 응답을 받았습니다.")
+
+    async def aget_post_text(
+        self, url: str, title: str = "미정", max_retries: int = 5, retry_delay: int = 5
+    ) -> PostRecord:
+        """게시물에서 텍스트 및 메타데이터 추출 (get_post_text의 비동기 버전)
+
+        Args:
+            url (str): Instagram 게시물 URL
+            title (str): 게시물 제목 (기본값: "미정")
+            max_retries (int): 최대 재시도 횟수 (기본값: 5)
+            retry_delay (int): 초기 재시도 대기시간 (초, 기본값: 5)
+
+        Returns:
+            PostRecord: 추출된 정보를 담은 레코드
+
+        Raises:
+            ValueError: URL이 유효하지 않거나 게시물을 찾을 수 없는 경우
+            ConnectionError: 네트워크 연결 문제
+            PermissionError: 접근 권한이 없는 경우 (Private 계정)
+        """
+        shortcode = self.extract_shortcode(url)
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self._query_post(shortcode)
+                break
+            except RateLimitError as e:
+                if attempt >= max_retries:
+                    raise ConnectionError(f"네트워크 연결 오류 (재시도 {max_retries}회 실패): {str(e)}")
+                wait_time = retry_delay * (2 ** attempt)  # 점진적 백오프
+                print(f"      ⚠️ Rate limit 감지 ({attempt+1}/{max_retries+1}). {wait_time}초 후 재시도...")
+                await asyncio.sleep(wait_time)
+
+        items = (
+            ((response.get("data") or {}).get("xdt_api__v1__media__shortcode__web_info") or {})
+            .get("items")
+        )
+        if not items:
+            raise ValueError("게시물이 삭제되었거나 존재하지 않습니다.")
+        if items[0].get("code") != shortcode:
+            # instaloader의 PostChangedException과 동일하게 처리
+            raise ValueError("게시물이 삭제되었거나 존재하지 않습니다.")
+
+        return parse_json_payload(title, url, response)
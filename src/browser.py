@@ -0,0 +1,118 @@
+"""
+브라우저 기반 추출 백엔드 공통 모듈
+
+Selenium/Playwright 백엔드가 같은 ExtractResult 계약과 시간 제한 기본값,
+결과 스트림 처리(프로세스 풀 파싱 연결, 입력 순서 복원)를 공유한다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .postprocess import ParallelPostProcessor, ParsedPayload
+from .record import PostRecord
+
+
+# 페이지 로드 제한 시간 (초)
+DEFAULT_PAGE_TIMEOUT = 30.0
+
+# URL 하나에 허용하는 전체 처리 시간 (초) - 넘기면 브라우저 작업을 강제 중단
+DEFAULT_URL_TIMEOUT = 90.0
+
+# 시간 초과/브라우저 중단으로 실패한 URL의 재시도 횟수
+DEFAULT_MAX_REQUEUES = 1
+
+# 브라우저에 사용할 User-Agent 목록
+USER_AGENTS = [
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+]
+
+
+@dataclass
+class ExtractResult:
+    """추출 결과 데이터 클래스"""
+    title: str
+    url: str
+    text: str
+    username: str
+    success: bool
+    error_message: str = ""
+    extraction_time: str = ""
+    likes: int = 0
+    comments: Optional[int] = None
+    date: Optional[datetime] = None
+    # 시간 초과나 브라우저 중단처럼 다시 시도하면 성공할 수 있는 실패인지 여부
+    retryable: bool = False
+    is_video: bool = False
+
+    @classmethod
+    def failure(
+        cls, title: str, url: str, error_message: str, retryable: bool = False
+    ) -> "ExtractResult":
+        """실패 결과 생성"""
+        return cls(
+            title=title,
+            url=url,
+            text="",
+            username="",
+            success=False,
+            error_message=error_message,
+            retryable=retryable
+        )
+
+    def to_record(self) -> PostRecord:
+        """성공한 추출 결과를 공통 게시물 레코드로 변환"""
+        return PostRecord(
+            title=self.title,
+            text=self.text,
+            username=self.username,
+            likes=self.likes,
+            comments=self.comments,
+            date=self.date,
+            media_count=1,
+            is_video=self.is_video,
+            url=self.url,
+        )
+
+    @classmethod
+    def from_parsed(cls, parsed: ParsedPayload) -> "ExtractResult":
+        """프로세스 풀 파싱 결과를 추출 결과로 변환"""
+        record = parsed.record
+        if record is None:
+            return cls.failure(parsed.title, parsed.url, parsed.error_message)
+
+        return cls(
+            title=record.title,
+            url=record.url,
+            text=record.text,
+            username=record.username,
+            success=True,
+            extraction_time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            likes=record.likes,
+            comments=record.comments,
+            date=record.date,
+            is_video=record.is_video
+        )
+
+
+def parse_indexed_results(
+    fetched: Iterator[Tuple[int, Any]], post_processor: ParallelPostProcessor
+) -> Iterator[Tuple[int, ExtractResult]]:
+    """수집된 페이지 소스를 프로세스 풀에서 파싱 (수집 실패는 기다리지 않고 바로 전달)"""
+    for index, outcome in post_processor.process_tagged(fetched):
+        if isinstance(outcome, ParsedPayload):
+            outcome = ExtractResult.from_parsed(outcome)
+        yield index, outcome
+
+
+def reorder_results(indexed: Iterator[Tuple[int, Any]]) -> Iterator[Tuple[int, Any]]:
+    """완료 순서로 들어오는 결과를 입력 순서로 복원"""
+    buffer: Dict[int, Any] = {}
+    next_index = 0
+    for index, result in indexed:
+        buffer[index] = result
+        while next_index in buffer:
+            yield next_index, buffer.pop(next_index)
+            next_index += 1
@@ -0,0 +1,356 @@
+"""
+Instagram 캡션 처리 모듈
+
+공백 정규화, 불필요 문구 제거, 해시태그/멘션/URL/이모지 추출을
+미리 컴파일된 정규식 한 번의 스캔으로 처리한다.
+og:description 메타 태그 캡션의 좋아요/댓글/작성자/날짜 접두어 파싱도 담당한다.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+# 해시태그/멘션 패턴 (기존 extract_hashtags, extract_mentions와 동일)
+HASHTAG_PATTERN = r"#[가-힣\w]+"
+MENTION_PATTERN = r"@\w+"
+URL_PATTERN = r"(?:https?://|www\.)[^\s\"'<>]+"
+
+# 이모지 기본 문자 범위 (피부색/변형 선택자/ZWJ 시퀀스 포함)
+_EMOJI_BASE = (
+    "\U0001F000-\U0001FAFF"  # 마작/카드, 기호, 이모티콘, 교통, 보충 기호 등
+    "\u2600-\u27BF"  # 기타 기호, 딩뱃
+    "\u2B00-\u2BFF"  # 화살표, 별 등
+    "\u2300-\u23FF"  # 시계, 모래시계 등 기술 기호
+)
+EMOJI_PATTERN = (
+    f"[{_EMOJI_BASE}]\uFE0F?[\U0001F3FB-\U0001F3FF]?"
+    f"(?:\u200D[{_EMOJI_BASE}]\uFE0F?[\U0001F3FB-\U0001F3FF]?)*"
+)
+
+# 브라우저 메타 태그 캡션에 섞여 들어오는 Instagram 관련 불필요 문구
+# (긴 문구가 먼저 매칭되도록 정렬)
+BOILERPLATE_PHRASES = (
+    "Instagram에서 이 게시물 보기",
+    "shared a post on Instagram",
+    "Posted by",
+    "followers",
+    "following",
+    "Follow",
+    "likes",
+    "팔로우",
+)
+
+_BOILERPLATE = "(?i:" + "|".join(re.escape(p) for p in BOILERPLATE_PHRASES) + ")"
+
+# 텍스트가 없는 게시물(주로 동영상)에 사용하는 대체 문구
+VIDEO_PLACEHOLDER = "동영상콘텐츠"
+
+
+def _build_pattern(strip_boilerplate: bool) -> "re.Pattern[str]":
+    """엔티티(+불필요 문구) 통합 패턴 컴파일
+
+    Args:
+        strip_boilerplate (bool): 불필요 문구 제거 패턴 포함 여부
+
+    Returns:
+        re.Pattern[str]: 이름 있는 그룹으로 구성된 통합 패턴
+    """
+    alternatives = [
+        f"(?P<url>{URL_PATTERN})",
+        f"(?P<hashtag>{HASHTAG_PATTERN})",
+        f"(?P<mention>{MENTION_PATTERN})",
+        f"(?P<emoji>{EMOJI_PATTERN})",
+    ]
+    if strip_boilerplate:
+        alternatives.append(f"(?P<boilerplate>{_BOILERPLATE})")
+    return re.compile("|".join(alternatives))
+
+
+@dataclass(frozen=True)
+class CaptionResult:
+    """캡션 처리 결과 데이터 클래스"""
+    text: str
+    hashtags: Tuple[str, ...] = ()
+    mentions: Tuple[str, ...] = ()
+    urls: Tuple[str, ...] = ()
+    emojis: Tuple[str, ...] = ()
+
+
+_EMPTY_RESULT = CaptionResult(text="")
+
+
+class CaptionProcessor:
+    """미리 컴파일된 단일 패스 캡션 처리기"""
+
+    def __init__(self, strip_boilerplate: bool = False):
+        """
+        초기화
+
+        Args:
+            strip_boilerplate (bool): Instagram 불필요 문구 제거 여부
+                (브라우저 메타 태그에서 얻은 캡션용)
+        """
+        self.strip_boilerplate = strip_boilerplate
+        self._pattern = _build_pattern(strip_boilerplate)
+        self._boilerplate_pattern = (
+            re.compile(_BOILERPLATE) if strip_boilerplate else None
+        )
+
+    def process(self, text: str) -> CaptionResult:
+        """캡션 정제 및 엔티티 추출
+
+        Args:
+            text (str): 원본 캡션
+
+        Returns:
+            CaptionResult: 정제된 텍스트와 추출된 엔티티
+        """
+        if not text:
+            return _EMPTY_RESULT
+
+        found = {"url": [], "hashtag": [], "mention": [], "emoji": []}
+        segments = []
+        position = 0
+
+        for match in self._pattern.finditer(text):
+            kind = match.lastgroup
+            if kind == "boilerplate":
+                segments.append(text[position:match.start()])
+                position = match.end()
+            else:
+                found[kind].append(match.group())
+
+        if segments:
+            segments.append(text[position:])
+            text = "".join(segments)
+
+        return CaptionResult(
+            text=" ".join(text.split()),
+            hashtags=tuple(found["hashtag"]),
+            mentions=tuple(found["mention"]),
+            urls=tuple(found["url"]),
+            emojis=tuple(found["emoji"]),
+        )
+
+    def clean(self, text: str) -> str:
+        """캡션 정제 (엔티티 추출 없이 텍스트만 반환)
+
+        Args:
+            text (str): 원본 캡션
+
+        Returns:
+            str: 정제된 텍스트
+        """
+        if not text:
+            return ""
+
+        if self._boilerplate_pattern is not None:
+            text = self._boilerplate_pattern.sub("", text)
+        return " ".join(text.split())
+
+    def process_batch(self, captions: Iterable[str]) -> Iterator[CaptionResult]:
+        """여러 캡션을 순차적으로 처리
+
+        Args:
+            captions (Iterable[str]): 캡션 목록 (제너레이터 가능)
+
+        Returns:
+            Iterator[CaptionResult]: 입력 순서대로의 처리 결과
+        """
+        return map(self.process, captions)
+
+    def clean_batch(self, captions: Iterable[str]) -> Iterator[str]:
+        """여러 캡션을 순차적으로 정제
+
+        Args:
+            captions (Iterable[str]): 캡션 목록 (제너레이터 가능)
+
+        Returns:
+            Iterator[str]: 입력 순서대로의 정제된 텍스트
+        """
+        return map(self.clean, captions)
+
+
+# 백엔드 공용 기본 처리기
+default_processor = CaptionProcessor()
+browser_processor = CaptionProcessor(strip_boilerplate=True)
+
+
+def process_caption(text: str) -> CaptionResult:
+    """기본 처리기로 캡션 처리
+
+    Args:
+        text (str): 원본 캡션
+
+    Returns:
+        CaptionResult: 정제된 텍스트와 추출된 엔티티
+    """
+    return default_processor.process(text)
+
+
+def process_captions(captions: Iterable[str]) -> List[CaptionResult]:
+    """기본 처리기로 여러 캡션 일괄 처리
+
+    Args:
+        captions (Iterable[str]): 캡션 목록
+
+    Returns:
+        List[CaptionResult]: 입력 순서대로의 처리 결과
+    """
+    return list(default_processor.process_batch(captions))
+
+
+# og:description 접두어 패턴
+#   영어: '16K likes, 177 comments - nuun.0_ on March 28, 2025: "본문".'
+#   정제된 기존 결과: '16K , 177 comments - nuun.0_ - March 28, 2025: "본문".'
+#   카운트 없음: 'qk0501 - July 21, 2025: "본문".'
+#   한국어: '좋아요 1,234개, 댓글 56개 - nuun.0_님, 2025년 3월 28일: "본문".'
+_COUNT = r"\d[\d.,]*\s*[KMB]?"
+_OG_DESCRIPTION_EN = re.compile(
+    rf"(?:(?P<likes>{_COUNT})\s*(?:likes?)?\s*,\s*)?"
+    rf"(?:(?P<comments>{_COUNT})\s*comments?\s*-\s*)?"
+    r"(?P<username>[A-Za-z0-9._]+)\s+(?:on|-)\s+"
+    r"(?P<month>[A-Z][a-z]+) (?P<day>\d{1,2}), (?P<year>\d{4})\s*:\s*"
+    r'"(?P<text>.*)"\s*\.?\s*$',
+    re.DOTALL,
+)
+_OG_DESCRIPTION_KO = re.compile(
+    rf"(?:좋아요\s*(?P<likes>{_COUNT})개\s*,\s*)?"
+    rf"(?:댓글\s*(?P<comments>{_COUNT})개\s*-\s*)?"
+    r"(?P<username>[A-Za-z0-9._]+)님\s*,?\s*"
+    r"(?P<year>\d{4})년\s*(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일\s*:\s*"
+    r'"(?P<text>.*)"\s*\.?\s*$',
+    re.DOTALL,
+)
+_COUNT_MULTIPLIERS = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+# strptime('%B')는 느리고 로케일에 따라 달라지므로 영어 월 이름을 직접 매핑
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "January", "February", "March", "April", "May", "June", "July",
+            "August", "September", "October", "November", "December",
+        ),
+        1,
+    )
+}
+
+# NFKC 정규화 대상 호환 문자 영역
+# 한글 호환 자모(ㅋ, ㄴ 등)가 조합형 자모로 바뀌거나 ‼️, ℹ️ 같은 이모지가
+# 깨지지 않도록 전체 문자열 대신 이 영역의 문자만 정규화한다.
+_NFKC_TARGETS = re.compile(
+    "["
+    "\u00A0-\u00BF"  # 위첨자 숫자, 분수 등 라틴-1 기호
+    "\u2070-\u209F"  # 위/아래 첨자
+    "\u2150-\u218F"  # 분수, 로마 숫자
+    "\u2460-\u24FF"  # 원 문자 (①)
+    "\u3200-\u33FF"  # 괄호/원 CJK 문자, CJK 호환 문자 (㈜, ㎞)
+    "\uFB00-\uFB4F"  # 합자
+    "\uFE30-\uFE6F"  # CJK 호환 형태, 작은 형태
+    "\uFF00-\uFFEF"  # 전각/반각 문자
+    "\U0001D400-\U0001D7FF"  # 수학용 영숫자 (𝗗𝗔𝗬 𝟭)
+    "\U0001F100-\U0001F16F"  # 괄호/사각 라틴 문자
+    "]+"
+)
+
+
+@dataclass(frozen=True)
+class OgDescription:
+    """og:description 파싱 결과 데이터 클래스"""
+    text: str
+    username: Optional[str] = None
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    date: Optional[datetime] = None
+
+
+def parse_count(value: str) -> Optional[int]:
+    """'16K', '1.2M', '3,283' 형태의 축약 숫자를 정수로 변환
+
+    Args:
+        value (str): 축약 숫자 문자열
+
+    Returns:
+        Optional[int]: 변환된 정수 (변환 실패 시 None)
+    """
+    if not value:
+        return None
+
+    value = value.replace(",", "").replace(" ", "").upper()
+    multiplier = _COUNT_MULTIPLIERS.get(value[-1], 1)
+    if multiplier != 1:
+        value = value[:-1]
+
+    try:
+        return int(round(float(value) * multiplier))
+    except ValueError:
+        return None
+
+
+def _nfkc(match: "re.Match[str]") -> str:
+    return unicodedata.normalize("NFKC", match.group())
+
+
+def normalize_compat(text: str) -> str:
+    """호환 문자 영역만 NFKC 정규화 (전각 ＧＩＮＺＡ -> GINZA, ① -> 1 등)
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    return _NFKC_TARGETS.sub(_nfkc, text)
+
+
+def normalize_caption(text: str) -> str:
+    """호환 문자 NFKC 정규화 후 공백 정리 (수학용 굵은 글씨 𝗗𝗔𝗬 -> DAY 등)
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    if not text:
+        return ""
+
+    return default_processor.clean(normalize_compat(text))
+
+
+def parse_og_description(content: str) -> OgDescription:
+    """og:description 메타 태그 내용을 구조화된 필드로 분리
+
+    Args:
+        content (str): og:description(또는 description) 메타 태그 내용
+
+    Returns:
+        OgDescription: 본문과 좋아요/댓글/작성자/날짜 (접두어가 없으면
+            본문만 채워지고 나머지는 None)
+    """
+    content = (content or "").strip()
+
+    match = _OG_DESCRIPTION_EN.match(content) or _OG_DESCRIPTION_KO.match(content)
+    if not match:
+        return OgDescription(text=normalize_caption(content))
+
+    month = match.group("month")
+    try:
+        date = datetime(
+            int(match.group("year")),
+            _MONTHS[month] if month in _MONTHS else int(month),
+            int(match.group("day")),
+        )
+    except ValueError:
+        date = None
+
+    return OgDescription(
+        text=normalize_caption(match.group("text")),
+        username=match.group("username"),
+        likes=parse_count(match.group("likes")),
+        comments=parse_count(match.group("comments")),
+        date=date,
+    )
@@ -0,0 +1,130 @@
+"""
+ChromeDriver 실행 파일 경로 확인 모듈
+
+드라이버 경로는 프로세스당 한 번만 확인하고 디스크에 캐시한다.
+오프라인 우선으로 명시 경로 -> 환경 변수 -> 디스크 캐시 -> PATH 순서로 찾고,
+모두 없을 때만 webdriver_manager로 다운로드한다.
+"""
+
+import json
+import os
+import shutil
+import threading
+from typing import Optional
+
+
+# 드라이버 경로 환경 변수 (에어갭 환경에서 미리 설치한 드라이버 지정용)
+DRIVER_PATH_ENV = "CHROMEDRIVER_PATH"
+
+# 디스크 캐시 파일 경로
+DEFAULT_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "auto_insta", "chromedriver.json"
+)
+
+_lock = threading.Lock()
+_resolved_path: Optional[str] = None
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    """실행 가능한 파일인지 확인"""
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _read_cache(cache_file: str) -> Optional[str]:
+    """디스크 캐시에서 드라이버 경로 읽기"""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            path = json.load(f).get("driver_path")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+    return path if _is_executable(path) else None
+
+
+def _write_cache(cache_file: str, path: str) -> None:
+    """드라이버 경로를 디스크 캐시에 기록 (실패해도 무시)"""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"driver_path": path}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def resolve_driver_path(
+    driver_path: Optional[str] = None,
+    offline: bool = False,
+    cache_file: str = DEFAULT_CACHE_FILE,
+    refresh: bool = False,
+) -> str:
+    """ChromeDriver 실행 파일 경로 확인 (프로세스 단위 캐시)
+
+    Args:
+        driver_path (Optional[str]): 명시적으로 지정한 드라이버 경로
+        offline (bool): True면 네트워크 다운로드를 시도하지 않음
+        cache_file (str): 디스크 캐시 파일 경로
+        refresh (bool): True면 캐시/PATH를 건너뛰고 webdriver_manager로 다시 받음
+            (설치된 Chrome과 드라이버 버전이 맞지 않을 때)
+
+    Returns:
+        str: ChromeDriver 실행 파일 경로
+
+    Raises:
+        RuntimeError: 드라이버를 찾을 수 없는 경우
+    """
+    global _resolved_path
+
+    if driver_path:
+        if not _is_executable(driver_path):
+            raise RuntimeError(f"ChromeDriver 실행 파일을 찾을 수 없습니다: {driver_path}")
+        return driver_path
+
+    if _resolved_path and not refresh:
+        return _resolved_path
+
+    with _lock:
+        if _resolved_path and not refresh:
+            return _resolved_path
+
+        path = None
+        if not refresh:
+            env_path = os.environ.get(DRIVER_PATH_ENV)
+            candidates = [
+                env_path if _is_executable(env_path) else None,
+                _read_cache(cache_file),
+                shutil.which("chromedriver"),
+            ]
+            path = next((candidate for candidate in candidates if candidate), None)
+
+        if path is None:
+            if offline:
+                raise RuntimeError(
+                    "오프라인 모드에서 ChromeDriver를 찾을 수 없습니다. "
+                    f"{DRIVER_PATH_ENV} 환경 변수나 --driver-path로 경로를 지정하세요."
+                )
+
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            path = ChromeDriverManager().install()
+
+        _write_cache(cache_file, path)
+        _resolved_path = path
+        return path
+
+
+def invalidate_driver_cache(cache_file: str = DEFAULT_CACHE_FILE) -> None:
+    """프로세스/디스크 캐시 무효화 (Chrome 업데이트로 버전이 맞지 않을 때 사용)
+
+    Args:
+        cache_file (str): 디스크 캐시 파일 경로
+    """
+    global _resolved_path
+
+    with _lock:
+        _resolved_path = None
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
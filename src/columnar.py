@@ -0,0 +1,259 @@
+"""
+열 형식(Parquet/Arrow IPC) 내보내기 모듈
+
+게시물 레코드를 분석용 열 형식 파일로 저장한다. 레코드를 열별 목록에 모았다가
+row_group_size개마다 RecordBatch 하나로 변환해 쓰므로, 결과가 들어오는 대로
+스트리밍할 수 있고 메모리에는 행 그룹 하나만 남는다.
+
+- date: 시간대 없는 timestamp(us) (시간대가 있는 값은 UTC로 변환)
+- likes, comments: int64 (comments는 null 가능), media_count: int32, is_video: bool
+- username: 사전 인코딩(dictionary<int32, string>), 나머지 문자열은 string
+
+Parquet은 행 그룹마다 zstd로 압축하고, Arrow IPC 파일은 압축하지 않아 memory map으로
+복사 없이 읽을 수 있다 (username 사전은 배치마다 새로 나온 값만 delta로 기록).
+
+pyarrow는 선택 의존성이다 (pip install pyarrow).
+"""
+
+import os
+import tempfile
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pyarrow
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+# 행 그룹(RecordBatch) 하나의 행 수
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+
+def _require_pyarrow() -> Any:
+    """pyarrow 불러오기
+
+    Raises:
+        RuntimeError: pyarrow가 설치되지 않은 경우
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise RuntimeError(
+            "Parquet/Arrow 내보내기에는 pyarrow가 필요합니다. "
+            "'pip install pyarrow'로 설치하세요."
+        )
+    return pyarrow
+
+
+def columnar_schema(fields: Optional[Tuple[str, ...]] = None) -> "pyarrow.Schema":
+    """레코드 필드의 Arrow 스키마
+
+    Args:
+        fields (Optional[Tuple[str, ...]]): 포함할 필드 (None이면 전체, parse_fields()처럼 레코드 필드 순서)
+
+    Returns:
+        pyarrow.Schema: 열 스키마
+    """
+    pa = _require_pyarrow()
+    # PostRecord 필드 순서
+    types = {
+        "title": pa.string(),
+        "text": pa.string(),
+        "username": pa.dictionary(pa.int32(), pa.string()),
+        "likes": pa.int64(),
+        "comments": pa.int64(),
+        "date": pa.timestamp("us"),
+        "media_count": pa.int32(),
+        "is_video": pa.bool_(),
+        "url": pa.string(),
+    }
+    return pa.schema([(name, types[name]) for name in fields or types])
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    """date 값을 시간대 없는 datetime으로 (ISO 문자열 허용)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class ColumnarWriter:
+    """행 그룹 단위 Parquet/Arrow IPC 파일 작성기
+
+    임시 파일에 쓰다가 close()에서 원래 경로로 교체하므로, 중간에 실패해도 꼬리(footer)가
+    없는 파일이 남지 않는다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        output_format: str = "parquet",
+        fields: Optional[Tuple[str, ...]] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        """
+        초기화 (파일은 바로 생성)
+
+        Args:
+            path (str): 저장할 파일 경로
+            output_format (str): 'parquet' 또는 'arrow' (Arrow IPC 파일)
+            fields (Optional[Tuple[str, ...]]): 저장할 필드 (None이면 전체)
+            row_group_size (int): 행 그룹 하나의 행 수
+
+        Raises:
+            ValueError: 지원하지 않는 형식이거나 행 그룹 크기가 1보다 작은 경우
+            RuntimeError: pyarrow가 설치되지 않은 경우
+        """
+        if output_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"지원하는 열 형식: {', '.join(COLUMNAR_FORMATS)}")
+        if row_group_size < 1:
+            raise ValueError("행 그룹 크기는 1 이상이어야 합니다.")
+        pa = _require_pyarrow()
+        self._pa = pa
+        self.path = path
+        self.output_format = output_format
+        self.row_group_size = row_group_size
+        self.schema = columnar_schema(fields)
+        self.fields = tuple(self.schema.names)
+        self.count = 0
+        self.row_groups = 0
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self.fields}
+        # Arrow IPC 파일은 필드마다 사전이 하나뿐이라 전체 사전을 이어 붙이며 delta로 기록
+        self._usernames: Dict[str, int] = {}
+
+        directory = os.path.dirname(path) or "."
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fd, self._temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".")
+        os.close(fd)
+        if output_format == "parquet":
+            self._writer = pa.parquet.ParquetWriter(self._temp_path, self.schema, compression="zstd")
+        else:
+            options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            self._writer = pa.ipc.new_file(self._temp_path, self.schema, options=options)
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, post_data: Mapping) -> None:
+        """레코드 한 개 추가 (행 그룹이 차면 파일에 기록)
+
+        Args:
+            post_data (Mapping): PostRecord 또는 게시물 dict
+        """
+        columns = self._columns
+        for name in self.fields:
+            value = post_data.get(name)
+            if name == "date":
+                value = _timestamp(value)
+            elif name == "username":
+                value = value or ""
+            columns[name].append(value)
+        self.count += 1
+        if len(columns[self.fields[0]]) >= self.row_group_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Mapping]) -> int:
+        """레코드 여러 개 추가
+
+        Args:
+            records (Iterable[Mapping]): 레코드 목록 (제너레이터 가능)
+
+        Returns:
+            int: 추가한 레코드 수
+        """
+        before = self.count
+        for post_data in records:
+            self.write(post_data)
+        return self.count - before
+
+    def _array(self, name: str, values: List[Any]) -> "pyarrow.Array":
+        pa = self._pa
+        field_type = self.schema.field(name).type
+        if name != "username":
+            return pa.array(values, type=field_type)
+        if self.output_format == "parquet":
+            # Parquet은 행 그룹마다 사전을 따로 만든다
+            return pa.array(values, type=field_type)
+        usernames = self._usernames
+        indices = [usernames.setdefault(value, len(usernames)) for value in values]
+        return pa.DictionaryArray.from_arrays(pa.array(indices, pa.int32()), pa.array(list(usernames), pa.string()))
+
+    def flush(self) -> None:
+        """모아 둔 레코드를 행 그룹 하나로 기록"""
+        columns = self._columns
+        if not columns[self.fields[0]]:
+            return
+        batch = self._pa.record_batch([self._array(name, columns[name]) for name in self.fields], schema=self.schema)
+        if self.output_format == "parquet":
+            self._writer.write_batch(batch, row_group_size=batch.num_rows)
+        else:
+            self._writer.write_batch(batch)
+        self.row_groups += 1
+        for values in columns.values():
+            values.clear()
+
+    def close(self) -> None:
+        """남은 레코드를 기록하고 파일 완성"""
+        if self._writer is None:
+            return
+        try:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+            os.chmod(self._temp_path, 0o644)
+            os.replace(self._temp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """파일을 완성하지 않고 임시 파일 삭제"""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            finally:
+                self._writer = None
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+
+def export_columnar(
+    records: Iterable[Mapping],
+    path: str,
+    output_format: str = "parquet",
+    fields: Optional[Tuple[str, ...]] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """레코드를 Parquet/Arrow IPC 파일로 저장
+
+    Args:
+        records (Iterable[Mapping]): 레코드 목록 (제너레이터 가능)
+        path (str): 저장할 파일 경로
+        output_format (str): 'parquet' 또는 'arrow'
+        fields (Optional[Tuple[str, ...]]): 저장할 필드 (None이면 전체)
+        row_group_size (int): 행 그룹 하나의 행 수
+
+    Returns:
+        int: 저장한 레코드 수
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+        RuntimeError: pyarrow가 설치되지 않은 경우
+    """
+    with ColumnarWriter(path, output_format, fields, row_group_size) as writer:
+        writer.write_many(records)
+    return writer.count
@@ -0,0 +1,619 @@
+"""
+결과 저장소 하위 명령 모듈
+
+python -m src <명령> [옵션] 형태로 실행하는 저장소 관리 명령.
+첫 번째 인수가 등록된 명령 이름이면 main()이 URL 추출 대신 이 모듈로 넘긴다.
+"""
+
+import argparse
+import itertools
+from contextlib import ExitStack
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .archive import DEFAULT_LOG_PATH
+from .record import SIMPLE_FIELDS, PostRecord, parse_fields
+from .store import DEFAULT_STORE_PATH
+
+# 명령 이름 -> 실행 함수 (인수 목록을 받아 종료 코드 반환)
+COMMANDS: Dict[str, Callable[[List[str]], int]] = {}
+
+
+def command(name: str) -> Callable[[Callable[[List[str]], int]], Callable[[List[str]], int]]:
+    """하위 명령 등록 데코레이터"""
+    def register(func: Callable[[List[str]], int]) -> Callable[[List[str]], int]:
+        COMMANDS[name] = func
+        return func
+    return register
+
+
+def run_command(argv: List[str]) -> Optional[int]:
+    """argv[0]이 등록된 명령이면 실행
+
+    Args:
+        argv (List[str]): 프로그램 이름을 제외한 명령줄 인수
+
+    Returns:
+        Optional[int]: 종료 코드 (명령이 아니면 None)
+    """
+    if not argv or argv[0] not in COMMANDS:
+        return None
+    return COMMANDS[argv[0]](argv[1:])
+
+
+def _store_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--store",
+        metavar="FILEPATH",
+        default=DEFAULT_STORE_PATH,
+        help=f"결과 저장소 경로 (기본값: {DEFAULT_STORE_PATH})",
+    )
+
+
+@command("export")
+def export_command(argv: List[str]) -> int:
+    """저장소/결과 로그의 게시물을 JSON/TXT/Parquet/Arrow 통합 파일로 내보내기"""
+    from .columnar import COLUMNAR_FORMATS, DEFAULT_ROW_GROUP_SIZE
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src export",
+        description="결과 저장소(또는 결과 로그)의 게시물을 통합 파일로 내보냅니다.",
+    )
+    _store_argument(parser)
+    parser.add_argument(
+        "--archive",
+        metavar="FILEPATH",
+        nargs="?",
+        const=DEFAULT_LOG_PATH,
+        help=f"저장소 대신 결과 로그의 게시물별 최신 레코드를 로그 순서로 내보내기 (기본값: {DEFAULT_LOG_PATH})",
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["txt", "json", *COLUMNAR_FORMATS],
+        default="json",
+        help="출력 형식 (기본값: json, parquet/arrow는 pyarrow 필요)",
+    )
+    parser.add_argument("--username", help="작성자로 필터링")
+    parser.add_argument("--title", help="제목으로 필터링")
+    parser.add_argument(
+        "--order-by", default="date", help="정렬 기준 (date, likes, username, title, updated_at, 저장소만)"
+    )
+    parser.add_argument("--desc", action="store_true", help="내림차순 정렬")
+    parser.add_argument("--fields", metavar="FIELDS", help="내보낼 필드 (쉼표 구분)")
+    parser.add_argument("--simple", action="store_true", help="title, text, url만 내보내기")
+    parser.add_argument(
+        "--output", "-o",
+        metavar="FILEPATH",
+        help="parquet/arrow 저장 경로 (기본값: outputs/instagram_batch_combined_<시각>.<형식>)",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help=f"parquet/arrow 행 그룹 크기 (기본값: {DEFAULT_ROW_GROUP_SIZE})",
+    )
+    args = parser.parse_args(argv)
+
+    from .archive import ShortcodeIndex
+    from .columnar import export_columnar
+    from .main import combined_file_path, save_combined_results
+    from .store import ResultStore
+
+    def matches(record: PostRecord) -> bool:
+        return (args.username is None or record.username == args.username) and (
+            args.title is None or record.title == args.title
+        )
+
+    try:
+        fields = parse_fields(args.fields) or (SIMPLE_FIELDS if args.simple else None)
+        with ExitStack() as stack:
+            if args.archive:
+                index = stack.enter_context(ShortcodeIndex(args.archive))
+                index.update()
+                records: Iterator[PostRecord] = filter(matches, index.iter_records())
+            else:
+                store = stack.enter_context(ResultStore(args.store))
+                records = store.iter_records(
+                    username=args.username,
+                    title=args.title,
+                    order_by=args.order_by,
+                    descending=args.desc,
+                )
+
+            if args.format in COLUMNAR_FORMATS:
+                # 열 형식은 행 그룹 단위로 스트리밍 (전체 결과를 메모리에 올리지 않음)
+                first = next(records, None)
+                if first is None:
+                    print("⚠️ 내보낼 게시물이 없습니다.")
+                    return 1
+                file_path = args.output or combined_file_path(args.format, args.simple)
+                count = export_columnar(
+                    itertools.chain([first], records), file_path, args.format, fields, args.row_group_size
+                )
+                print(f"📄 {count}개 게시물 내보내기: {file_path}")
+                return 0
+            records = list(records)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"❌ {str(e)}")
+        return 1
+
+    if not records:
+        print("⚠️ 내보낼 게시물이 없습니다.")
+        return 1
+
+    file_path = save_combined_results(records, args.format, args.simple, fields)
+    print(f"📄 {len(records)}개 게시물 내보내기: {file_path}")
+    return 0
+
+
+@command("lookup")
+def lookup_command(argv: List[str]) -> int:
+    """shortcode 또는 URL로 저장된 게시물 조회"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src lookup",
+        description="결과 저장소에 게시물이 있는지 조회합니다.",
+    )
+    _store_argument(parser)
+    parser.add_argument("targets", nargs="+", metavar="SHORTCODE_OR_URL", help="조회할 shortcode 또는 URL")
+    args = parser.parse_args(argv)
+
+    from .store import ResultStore
+    from .url_reader import canonicalize_url
+    from .utils import format_text_output
+
+    missing = 0
+    with ResultStore(args.store) as store:
+        for target in args.targets:
+            canonical = canonicalize_url(target)
+            shortcode = canonical[0] if canonical else target
+            record = store.get(shortcode)
+            if record is None:
+                missing += 1
+                print(f"❌ {shortcode}: 저장된 게시물 없음")
+            else:
+                print(f"✅ {shortcode}")
+                print(format_text_output(record, show_metadata=True))
+    return 1 if missing else 0
+
+
+@command("search")
+def search_command(argv: List[str]) -> int:
+    """저장된 게시물 전문 검색"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src search",
+        description="결과 저장소의 제목/본문/작성자를 검색합니다 (관련도 순).",
+    )
+    _store_argument(parser)
+    parser.add_argument("query", nargs="+", help='검색어 (공백은 AND, "따옴표"는 구문 검색)')
+    parser.add_argument("--limit", "-n", type=int, default=10, help="페이지 크기 (기본값: 10)")
+    parser.add_argument("--page", "-p", type=int, default=1, help="페이지 번호 (기본값: 1)")
+    parser.add_argument("--username", help="작성자로 필터링")
+    args = parser.parse_args(argv)
+
+    from .store import ResultStore
+
+    query = " ".join(args.query)
+    offset = (max(1, args.page) - 1) * args.limit
+    try:
+        with ResultStore(args.store) as store:
+            page = store.search(query, limit=args.limit, offset=offset, username=args.username)
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return 1
+
+    print(f"🔍 '{query}' 검색 결과: {page.total}개 (페이지 {max(1, args.page)})")
+    print("=" * 60)
+    for rank, hit in enumerate(page.hits, offset + 1):
+        record = hit.record
+        print(f"[{rank:02d}] {record.title} (@{record.username})")
+        print(f"    🔗 {record.url}")
+        print(f"    💬 {hit.snippet}")
+    if page.has_more:
+        print(f"\n➡️ 다음 페이지: --page {max(1, args.page) + 1}")
+    return 0 if page.total else 1
+
+
+@command("import")
+def import_command(argv: List[str]) -> int:
+    """outputs/ 결과 파일을 결과 저장소로 가져오기"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src import",
+        description="통합/개별 결과 JSON과 실패 목록을 결과 저장소로 가져옵니다 (새 파일만 처리).",
+    )
+    _store_argument(parser)
+    parser.add_argument(
+        "sources", nargs="*", default=["outputs"], help="가져올 파일 또는 디렉토리 (기본값: outputs)"
+    )
+    parser.add_argument("--force", action="store_true", help="이미 가져온 파일도 다시 가져오기")
+    parser.add_argument(
+        "--retry-file",
+        metavar="FILEPATH",
+        help="아직 성공하지 못한 실패 URL을 제목::URL 형식으로 저장 (--batch-file로 재시도)",
+    )
+    args = parser.parse_args(argv)
+
+    import os
+
+    from .importer import ArchiveImporter
+    from .store import ResultStore
+
+    paths: List[str] = []
+    for source in args.sources:
+        if os.path.isdir(source):
+            paths.extend(ArchiveImporter.discover(source))
+        elif os.path.exists(source):
+            paths.append(source)
+        else:
+            print(f"❌ 파일을 찾을 수 없습니다: {source}")
+            return 1
+
+    with ResultStore(args.store) as store:
+        importer = ArchiveImporter(store)
+        print(f"📂 가져올 파일: {len(paths)}개 → {args.store}")
+        stats = importer.import_paths(paths, force=args.force)
+        if stats.files:
+            store.optimize()
+
+        print(f"✅ 가져온 파일: {stats.files}개 (건너뜀 {stats.skipped_files}개)")
+        print(f"📝 게시물 레코드: {stats.records}개 (잘못된 항목 {stats.invalid_records}개)")
+        print(f"❌ 실패 URL: {stats.failures}개")
+        print(f"🗄️ 저장소 게시물 수: {len(store)}개")
+        for error in stats.errors:
+            print(f"⚠️ {error}")
+
+        if args.retry_file:
+            unresolved = list(store.iter_unresolved_failures())
+            with open(args.retry_file, "w", encoding="utf-8") as f:
+                for title, url, _ in unresolved:
+                    f.write(f"{title}::{url}\n")
+            print(f"🔁 재시도 목록 저장: {args.retry_file} ({len(unresolved)}개)")
+
+    return 1 if stats.errors else 0
+
+
+@command("index")
+def index_command(argv: List[str]) -> int:
+    """결과 로그의 shortcode 인덱스 갱신 및 조회"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src index",
+        description="결과 로그(JSONL)에 새로 추가된 줄을 shortcode 인덱스에 반영합니다.",
+    )
+    parser.add_argument(
+        "--log",
+        metavar="FILEPATH",
+        default=DEFAULT_LOG_PATH,
+        help=f"결과 로그 경로 (기본값: {DEFAULT_LOG_PATH})",
+    )
+    parser.add_argument("--full", action="store_true", help="인덱스를 처음부터 다시 만들기")
+    parser.add_argument("targets", nargs="*", metavar="SHORTCODE_OR_URL", help="갱신 후 조회할 shortcode 또는 URL")
+    args = parser.parse_args(argv)
+
+    from .archive import ShortcodeIndex
+    from .url_reader import canonicalize_url
+
+    try:
+        with ShortcodeIndex(args.log) as index:
+            added = index.update(full=args.full)
+            print(f"📚 {index.index_path}: {added}줄 반영, 게시물 {len(index)}개 (로그 {index.indexed_size:,}바이트)")
+
+            missing = 0
+            for target in args.targets:
+                canonical = canonicalize_url(target)
+                shortcode = canonical[0] if canonical else target
+                location = index.lookup(shortcode)
+                if location is None:
+                    missing += 1
+                    print(f"❌ {shortcode}: 보관된 게시물 없음")
+                else:
+                    print(f"✅ {shortcode}: 위치 {location[0]:,} ({location[1]}바이트)")
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return 1
+    return 1 if missing else 0
+
+
+def _combined_paths(sources: List[str]) -> Optional[List[str]]:
+    """통합 결과 파일/디렉토리 목록을 파일 경로 목록으로 (디렉토리는 시간순, 없는 경로는 None)"""
+    import glob
+    import os
+
+    from .importer import source_timestamp
+
+    paths: List[str] = []
+    for source in sources:
+        if os.path.isdir(source):
+            found = glob.glob(os.path.join(source, "instagram_batch_combined_*.json"))
+            paths.extend(sorted(found, key=lambda path: (source_timestamp(path), path)))
+        elif os.path.exists(source):
+            paths.append(source)
+        else:
+            print(f"❌ 파일을 찾을 수 없습니다: {source}")
+            return None
+    return paths
+
+
+def _iter_combined_posts(paths: List[str]) -> Iterator[PostRecord]:
+    """통합 결과 파일의 게시물을 스트리밍으로 읽기 (레코드로 바꿀 수 없는 항목은 건너뜀)"""
+    from .importer import iter_json_results
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for _, item in iter_json_results(f):
+                try:
+                    yield PostRecord.from_mapping(item)
+                except (TypeError, ValueError):
+                    continue
+
+
+@command("dedup")
+def dedup_command(argv: List[str]) -> int:
+    """통합 결과 파일의 캡션 유사 중복 보고/제거"""
+    from .dedup import DEFAULT_THRESHOLD
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src dedup",
+        description="통합 결과 JSON에서 캡션이 거의 같은 게시물(다시 올린 게시물 등)을 찾습니다.",
+    )
+    parser.add_argument(
+        "sources", nargs="*", default=["outputs"], help="통합 결과 파일 또는 디렉토리 (기본값: outputs)"
+    )
+    parser.add_argument(
+        "--threshold", "-t", type=float, default=DEFAULT_THRESHOLD,
+        help=f"유사 중복으로 볼 추정 Jaccard 유사도 (기본값: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--filter", action="store_true", help="중복을 뺀 게시물을 새 통합 파일로 저장")
+    parser.add_argument(
+        "--format", "-f", choices=["txt", "json"], default="json", help="--filter 출력 형식 (기본값: json)"
+    )
+    parser.add_argument("--simple", action="store_true", help="--filter 출력에 title, text, url만 포함")
+    args = parser.parse_args(argv)
+
+    from .dedup import find_near_duplicates
+
+    paths = _combined_paths(args.sources)
+    if paths is None:
+        return 1
+
+    try:
+        result = find_near_duplicates(_iter_combined_posts(paths), args.threshold)
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return 1
+
+    print(f"📂 통합 파일 {len(paths)}개, 게시물 {len(result.unique) + result.duplicate_count}개 (같은 게시물 {result.same_post}개 제외)")
+    print(f"♻️ 유사 중복: {result.duplicate_count}개 ({len(result.groups)}개 그룹, 기준 {args.threshold})")
+    print("=" * 60)
+    for group in result.groups:
+        representative = group.representative
+        print(f"📌 {representative.get('title')} (@{representative.get('username')}) {representative.get('url')}")
+        for post_data, score in group.duplicates:
+            print(f"    ↳ {score:.2f} {post_data.get('title')} (@{post_data.get('username')}) {post_data.get('url')}")
+
+    if args.filter:
+        from .main import save_combined_results
+
+        if not result.unique:
+            print("⚠️ 저장할 게시물이 없습니다.")
+            return 1
+        file_path = save_combined_results(result.unique, args.format, args.simple)
+        print(f"📄 중복 제외 통합 파일 저장: {file_path} ({len(result.unique)}개)")
+    return 0
+
+
+@command("similar")
+def similar_command(argv: List[str]) -> int:
+    """캡션이 비슷한 게시물 찾기 (TF-IDF 코사인 유사도)"""
+    from .similar import DEFAULT_INDEX_PATH
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src similar",
+        description="결과 저장소 게시물의 TF-IDF 색인으로 캡션이 비슷한 게시물을 찾습니다.",
+    )
+    _store_argument(parser)
+    parser.add_argument("target", nargs="*", help="기준 게시물 shortcode/URL 또는 검색할 텍스트")
+    parser.add_argument(
+        "--index",
+        metavar="FILEPATH",
+        default=DEFAULT_INDEX_PATH,
+        help=f"유사도 색인 경로 (기본값: {DEFAULT_INDEX_PATH})",
+    )
+    parser.add_argument("--top", "-k", type=int, default=10, help="결과 수 (기본값: 10)")
+    parser.add_argument("--update", action="store_true", help="저장소에 새로 추가된 게시물을 색인에 반영")
+    parser.add_argument("--rebuild", action="store_true", help="색인을 처음부터 다시 만들기")
+    args = parser.parse_args(argv)
+
+    import os
+
+    from .similar import SimilarityIndex, update_index
+    from .store import ResultStore
+    from .url_reader import canonicalize_url
+
+    if not args.target and not (args.update or args.rebuild):
+        parser.error("기준 게시물/텍스트 또는 --update/--rebuild가 필요합니다.")
+
+    try:
+        with ResultStore(args.store) as store:
+            exists = os.path.exists(args.index)
+            index = SimilarityIndex.load(args.index) if exists and not args.rebuild else SimilarityIndex()
+            if args.update or args.rebuild or not exists:
+                index, added = update_index(index, store.iter_records, rebuild=args.rebuild)
+                index.save(args.index)
+                print(f"🧮 유사도 색인: {args.index} ({added}개 추가, 게시물 {len(index)}개)")
+            if not args.target:
+                return 0
+
+            target = " ".join(args.target)
+            canonical = canonicalize_url(target)
+            shortcode = canonical[0] if canonical else target
+            if shortcode in index:
+                hits = index.similar_to(shortcode, args.top)
+                label = shortcode
+            else:
+                record = store.get(shortcode)
+                hits = index.query(record.text if record is not None else target, args.top)
+                label = shortcode if record is not None else f"'{target}'"
+
+            print(f"🔗 {label}와 비슷한 게시물: {len(hits)}개")
+            print("=" * 60)
+            for rank, hit in enumerate(hits, 1):
+                record = store.get(hit.shortcode)
+                title = f"{record.title} (@{record.username})" if record is not None else hit.shortcode
+                print(f"[{rank:02d}] {hit.score:.3f} {title}")
+                print(f"    🔗 {record.url if record is not None else hit.shortcode}")
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {str(e)}")
+        return 1
+    return 0 if hits else 1
+
+
+@command("places")
+def places_command(argv: List[str]) -> int:
+    """캡션에서 지명 사전의 장소를 찾아 locations 형식 JSON으로 저장"""
+    from .places import DEFAULT_CACHE_PATH, DEFAULT_GAZETTEER_PATH, DEFAULT_OUTPUT_PATH
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src places",
+        description="게시물 캡션에서 장소명을 찾아 generate_google_maps_csv.py용 locations JSON을 만듭니다.",
+    )
+    parser.add_argument(
+        "sources", nargs="*", default=["outputs"], help="통합 결과 파일 또는 디렉토리 (기본값: outputs)"
+    )
+    parser.add_argument(
+        "--store",
+        metavar="FILEPATH",
+        nargs="?",
+        const=DEFAULT_STORE_PATH,
+        help=f"통합 파일 대신 결과 저장소의 게시물 사용 (기본값: {DEFAULT_STORE_PATH})",
+    )
+    parser.add_argument(
+        "--gazetteer", "-g",
+        metavar="FILEPATH",
+        default=DEFAULT_GAZETTEER_PATH,
+        help=f"지명 사전 JSON (기본값: {DEFAULT_GAZETTEER_PATH})",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILEPATH",
+        default=DEFAULT_CACHE_PATH,
+        help=f"오토마톤 캐시 경로 (기본값: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="오토마톤을 캐시하지 않고 매번 구축")
+    parser.add_argument(
+        "--output", "-o",
+        metavar="FILEPATH",
+        default=DEFAULT_OUTPUT_PATH,
+        help=f"locations JSON 저장 경로 (기본값: {DEFAULT_OUTPUT_PATH})",
+    )
+    parser.add_argument("--top", "-n", type=int, default=20, help="화면에 보여줄 장소 수 (기본값: 20)")
+    args = parser.parse_args(argv)
+
+    import time
+
+    from .places import Gazetteer, extract_locations, save_locations
+    from .store import ResultStore
+
+    try:
+        gazetteer = Gazetteer.load(args.gazetteer, None if args.no_cache else args.cache)
+    except (OSError, ValueError) as e:
+        print(f"❌ 지명 사전을 읽을 수 없습니다: {str(e)}")
+        return 1
+    print(f"🗺️ 지명 사전: {args.gazetteer} (장소 {len(gazetteer.places)}개, 이름/별칭 {gazetteer.pattern_count}개)")
+
+    started = time.perf_counter()
+    if args.store:
+        with ResultStore(args.store) as store:
+            summaries = extract_locations(store.iter_records(), gazetteer)
+        source = args.store
+    else:
+        paths = _combined_paths(args.sources)
+        if paths is None:
+            return 1
+        summaries = extract_locations(_iter_combined_posts(paths), gazetteer)
+        source = f"통합 파일 {len(paths)}개"
+    elapsed = time.perf_counter() - started
+
+    print(f"📍 {source}에서 장소 {len(summaries)}곳 발견 ({elapsed:.2f}초)")
+    print("=" * 60)
+    for rank, summary in enumerate(summaries[:args.top], 1):
+        location = summary.to_location()
+        print(f"[{rank:02d}] {location['name']} ({location['category']}) - 게시물 {location['mentions']}개, 최대 좋아요 {location['likes']:,}")
+        print(f"    💬 {location['description']}")
+        print(f"    🔗 {location['website']}")
+
+    if not summaries:
+        print("⚠️ 저장할 장소가 없습니다.")
+        return 1
+    file_path = save_locations(summaries, args.output)
+    print(f"📄 locations 저장: {file_path} (python generate_google_maps_csv.py {file_path})")
+    return 0
+
+
+@command("stats")
+def stats_command(argv: List[str]) -> int:
+    """해시태그/멘션 상위 k개, 함께 쓰인 해시태그, 작성자별 추이 집계"""
+    from .stats import DEFAULT_STATS_PATH
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src stats",
+        description="결과 저장소의 캡션에서 해시태그/멘션 통계를 스트리밍으로 집계합니다 (새 게시물만 이어서 집계).",
+    )
+    _store_argument(parser)
+    parser.add_argument(
+        "--state",
+        metavar="FILEPATH",
+        default=DEFAULT_STATS_PATH,
+        help=f"통계 상태 파일 경로 (기본값: {DEFAULT_STATS_PATH})",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="상태를 버리고 처음부터 다시 집계")
+    parser.add_argument("--top", "-k", type=int, default=10, help="항목별 결과 수 (기본값: 10)")
+    parser.add_argument("--username", help="월별 게시물 수와 자주 쓴 해시태그를 볼 작성자")
+    parser.add_argument("--hashtag", help="월별 빈도와 함께 쓰인 해시태그를 볼 해시태그")
+    parser.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    import json
+    import time
+
+    from .stats import HashtagStats, load_or_create
+    from .store import ResultStore
+
+    started = time.perf_counter()
+    try:
+        stats = HashtagStats() if args.rebuild else load_or_create(args.state)
+        with ResultStore(args.store) as store:
+            added = stats.update_from_store(store)
+        stats.save(args.state)
+    except (OSError, ValueError) as e:
+        print(f"❌ {str(e)}")
+        return 1
+    elapsed = time.perf_counter() - started
+
+    summary = stats.summary(args.top, args.username, args.hashtag)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return 0
+
+    def show(title: str, items: List[Dict]) -> None:
+        print(f"\n{title}")
+        if not items:
+            print("  (없음)")
+        for rank, item in enumerate(items, 1):
+            error = f" (±{item['error']})" if item.get("error") else ""
+            print(f"  [{rank:02d}] {item['key']}: {item['count']:,}{error}")
+
+    print(f"📊 해시태그 통계: {args.state} (게시물 {stats.posts:,}개, 새로 집계 {added:,}개, {elapsed:.2f}초)")
+    print("=" * 60)
+    show("🏷️ 해시태그", summary["hashtags"])
+    show("💬 멘션", summary["mentions"])
+    show("🔗 함께 쓰인 해시태그", summary["pairs"])
+    show("👤 작성자", summary["users"])
+    if "hashtag" in summary:
+        trend = summary["hashtag"]
+        print(f"\n📈 {trend['hashtag']} (추정 {trend['count']:,}회)")
+        show("  월별", trend["months"])
+        show("  함께 쓰인 해시태그", trend["pairs"])
+    if "user" in summary:
+        trend = summary["user"]
+        print(f"\n📈 @{trend['username']} (게시물 {trend['posts']:,}개)")
+        show("  월별 게시물", trend["months"])
+        show("  자주 쓴 해시태그", trend["hashtags"])
+    return 0
@@ -0,0 +1,298 @@
+"""
+캡션 유사 중복 탐지 모듈
+
+같은 일정을 조금만 고쳐 다시 올린 게시물처럼 캡션이 거의 같은 게시물을 찾는다.
+정제한 캡션의 문자 n-gram 집합을 MinHash 서명으로 줄이고, 서명을 band로 나눈
+LSH 버킷으로 후보만 찾은 뒤 서명 일치율(추정 Jaccard 유사도)로 확인하므로
+게시물 수가 수십만 개여도 조회 비용은 후보 수에만 비례한다.
+
+서명은 순열 수만큼 해시를 반복하는 대신 n-gram마다 해시를 한 번만 계산하는
+one permutation hashing(빈 칸은 오른쪽 칸의 값을 빌려 채움)으로 만든다.
+"""
+
+import hashlib
+import re
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .caption import EMOJI_PATTERN, MENTION_PATTERN, URL_PATTERN, parse_og_description
+from .url_reader import canonicalize_url
+
+# 기본 유사도 기준 (추정 Jaccard 유사도)
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+# 문자 n-gram 길이 (공백/기호를 제거한 텍스트 기준, 한국어는 단어보다 문자 단위가 안정적)
+SHINGLE_SIZE = 4
+
+# 비교에서 제외할 부분 (URL, 멘션, 이모지 다음에 해시태그 기호, 공백/문장 부호)
+_ENTITIES = re.compile(f"{URL_PATTERN}|{MENTION_PATTERN}|{EMOJI_PATTERN}")
+_PUNCTUATION = re.compile(r"[\W_]+")
+
+_HASH_BITS = 64
+
+
+def dedup_text(text: str) -> str:
+    """비교용 캡션 정제 (og:description 접두어 제거, 호환 문자 정규화, 소문자,
+    URL/멘션/이모지/공백/기호 제거)
+
+    Args:
+        text (str): 원본 캡션
+
+    Returns:
+        str: 비교용 텍스트
+    """
+    return _PUNCTUATION.sub("", _ENTITIES.sub("", parse_og_description(text).text.lower()))
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """비교용 텍스트의 문자 n-gram 집합 (size보다 짧으면 텍스트 전체 하나)"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """one permutation hashing 기반 MinHash 서명 생성기"""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = SHINGLE_SIZE):
+        """
+        초기화
+
+        Args:
+            num_perm (int): 서명 길이
+            shingle_size (int): 문자 n-gram 길이
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # 빈 칸을 채울 때 빌려온 값과 원래 값이 겹치지 않도록 거리마다 더하는 값
+        self._offset = (1 << _HASH_BITS) // num_perm + 1
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """캡션의 MinHash 서명
+
+        Args:
+            text (str): 원본 캡션
+
+        Returns:
+            Optional[Tuple[int, ...]]: 서명 (비교할 텍스트가 없으면 None)
+        """
+        grams = shingles(dedup_text(text), self.shingle_size)
+        if not grams:
+            return None
+
+        num_perm = self.num_perm
+        bins: List[Optional[int]] = [None] * num_perm
+        for gram in grams:
+            value = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little")
+            position = value % num_perm
+            value //= num_perm
+            current = bins[position]
+            if current is None or value < current:
+                bins[position] = value
+
+        # 빈 칸은 오른쪽(순환)으로 가장 가까운 칸의 값 + 거리 * offset
+        if None in bins:
+            filled = [i for i, value in enumerate(bins) if value is not None]
+            result = list(bins)
+            for i, value in enumerate(bins):
+                if value is None:
+                    j = bisect_left(filled, i)
+                    source = filled[j] if j < len(filled) else filled[0] + num_perm
+                    result[i] = bins[source % num_perm] + (source - i) * self._offset
+            bins = result
+        return tuple(bins)
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """두 서명의 추정 Jaccard 유사도 (일치하는 칸의 비율)"""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """LSH band 수/band 크기 선택
+
+    후보가 되는 유사도 경계 (1/bands)^(1/rows)가 threshold 이하인 조합 중 rows가 가장
+    큰 것을 고른다 (경계를 기준보다 약간 낮게 두어 놓치는 중복을 줄이고, 후보는 서명으로 확인).
+
+    Args:
+        num_perm (int): 서명 길이
+        threshold (float): 유사도 기준
+
+    Returns:
+        Tuple[int, int]: (band 수, band당 칸 수)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """MinHash LSH 유사 중복 인덱스 (게시물을 하나씩 추가하며 증분 구축)"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM):
+        """
+        초기화
+
+        Args:
+            threshold (float): 유사 중복으로 볼 추정 Jaccard 유사도 (0~1)
+            num_perm (int): 서명 길이
+
+        Raises:
+            ValueError: threshold가 0~1 범위가 아닌 경우
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"유사도 기준은 0보다 크고 1 이하여야 합니다: {threshold}")
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        # 유사도가 같으면 먼저 추가된 게시물이 앞에 오도록 추가 순서 기록
+        self._order: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        rows = self.rows
+        return ((band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands))
+
+    def query(self, text: str) -> List[Tuple[Hashable, float]]:
+        """캡션과 유사한 게시물 찾기
+
+        Args:
+            text (str): 원본 캡션
+
+        Returns:
+            List[Tuple[Hashable, float]]: (키, 추정 유사도), 유사도 내림차순 (같으면 추가 순서)
+        """
+        signature = self.hasher.signature(text)
+        return [] if signature is None else self._query(signature)
+
+    def _query(self, signature: Tuple[int, ...]) -> List[Tuple[Hashable, float]]:
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            score = similarity(signature, self._signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        order = self._order
+        matches.sort(key=lambda match: (-match[1], order[match[0]]))
+        return matches
+
+    def add(self, key: Hashable, text: str) -> List[Tuple[Hashable, float]]:
+        """게시물을 추가하고, 추가하기 전에 있던 유사 게시물 반환
+
+        Args:
+            key (Hashable): 게시물 키 (shortcode 등, 이미 있으면 무시)
+            text (str): 원본 캡션
+
+        Returns:
+            List[Tuple[Hashable, float]]: (키, 추정 유사도), 유사도 내림차순
+        """
+        if key in self._signatures:
+            return []
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return []
+
+        matches = self._query(signature)
+        self._order[key] = len(self._signatures)
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        return matches
+
+
+@dataclass
+class DuplicateGroup:
+    """유사 중복 그룹 (처음 나온 게시물과 그 중복들)"""
+    representative: Mapping
+    # (게시물, 대표와 가장 가까운 게시물과의 추정 유사도)
+    duplicates: List[Tuple[Mapping, float]] = field(default_factory=list)
+
+
+@dataclass
+class DedupResult:
+    """유사 중복 제거 결과"""
+    # 유사 중복을 뺀 게시물 (그룹 대표 포함, 입력 순서)
+    unique: List[Mapping]
+    groups: List[DuplicateGroup]
+    # 같은 shortcode가 이미 나와 건너뛴 게시물 수
+    same_post: int = 0
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(len(group.duplicates) for group in self.groups)
+
+
+def _post_key(post_data: Mapping, position: int) -> Hashable:
+    canonical = canonicalize_url(post_data.get("url") or "")
+    return canonical[0] if canonical else ("position", position)
+
+
+def find_near_duplicates(
+    posts: Iterable[Mapping],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+) -> DedupResult:
+    """게시물 목록에서 캡션이 거의 같은 게시물 묶기
+
+    입력 순서대로 인덱스에 추가하며, 먼저 나온 게시물과 유사하면 그 게시물이 속한
+    그룹의 중복으로 분류한다. 같은 shortcode가 다시 나오면 같은 게시물로 보고 건너뛴다.
+
+    Args:
+        posts (Iterable[Mapping]): PostRecord 또는 게시물 dict 목록 (제너레이터 가능)
+        threshold (float): 유사 중복으로 볼 추정 Jaccard 유사도
+        num_perm (int): 서명 길이
+
+    Returns:
+        DedupResult: 중복을 뺀 게시물 목록과 중복 그룹
+
+    Raises:
+        ValueError: threshold가 0~1 범위가 아닌 경우
+    """
+    index = NearDuplicateIndex(threshold, num_perm)
+    unique: List[Mapping] = []
+    groups: Dict[Hashable, DuplicateGroup] = {}
+    # 게시물 키 -> 속한 그룹의 대표 키
+    representative_of: Dict[Hashable, Hashable] = {}
+    unique_posts: Dict[Hashable, Mapping] = {}
+    seen = set()
+    same_post = 0
+
+    for position, post_data in enumerate(posts):
+        key = _post_key(post_data, position)
+        if key in seen:
+            same_post += 1
+            continue
+        seen.add(key)
+
+        matches = index.add(key, post_data.get("text") or "")
+        if not matches:
+            representative_of[key] = key
+            unique_posts[key] = post_data
+            unique.append(post_data)
+            continue
+
+        closest, score = matches[0]
+        root = representative_of[closest]
+        representative_of[key] = root
+        if root not in groups:
+            groups[root] = DuplicateGroup(representative=unique_posts[root])
+        groups[root].duplicates.append((post_data, score))
+
+    return DedupResult(unique=unique, groups=list(groups.values()), same_post=same_post)
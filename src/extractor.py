@@ -2,18 +2,42 @@
 Instagram 게시물 텍스트 추출 모듈
 """
 
-import re
 import time
-from typing import Dict
-from urllib.parse import urlparse
+from typing import Any, Callable, Dict, Optional, Tuple
 import instaloader
 
+from .caption import default_processor
+from .record import PostRecord
+from .transport import (
+    ConnectionMetrics,
+    TransportConfig,
+    configure_session,
+    share_pool_with_session_copies,
+)
+from .url_reader import canonicalize_url
+
+
+# 레코드 필드별 instaloader Post 속성 조회 (owner_username 등은 추가 요청을 일으킬 수 있음)
+_POST_ATTRIBUTES: Dict[str, Callable[[Any], Any]] = {
+    "text": lambda post: default_processor.clean(post.caption or ""),
+    "username": lambda post: post.owner_username,
+    "likes": lambda post: post.likes,
+    "date": lambda post: post.date,
+    "media_count": lambda post: post.mediacount,
+    "is_video": lambda post: post.is_video,
+}
+
 
 class InstagramTextExtractor:
     """Instagram 게시물에서 텍스트를 추출하는 클래스"""
 
-    def __init__(self):
-        """Instaloader 인스턴스 초기화"""
+    def __init__(self, transport: Optional[TransportConfig] = None):
+        """Instaloader 인스턴스 초기화
+
+        Args:
+            transport (Optional[TransportConfig]): HTTP 연결 풀/제한 시간 설정
+                (기본값: TransportConfig())
+        """
         self.loader = instaloader.Instaloader()
         # User-Agent 설정으로 차단 방지
         user_agent = (
@@ -22,6 +46,19 @@ class InstagramTextExtractor:
             "Chrome/91.0.4472.124 Safari/537.36"
         )
         self.loader.context._session.headers.update({"User-Agent": user_agent})
+        # 연결 풀/keep-alive/전송 단계 재시도 설정 (GraphQL 쿼리용 세션 복사본도 풀 공유)
+        self.transport = configure_session(
+            self.loader.context._session, transport or TransportConfig()
+        )
+        share_pool_with_session_copies(self.loader.context)
+
+    def connection_metrics(self) -> ConnectionMetrics:
+        """HTTP 연결 재사용 통계
+
+        Returns:
+            ConnectionMetrics: 요청 수, 새 연결 수, 재사용 비율
+        """
+        return self.transport.metrics()
 
     def validate_url(self, url: str) -> bool:
         """Instagram URL 유효성 검증
@@ -32,21 +69,8 @@ class InstagramTextExtractor:
         Returns:
             bool: 유효한 Instagram URL인지 여부
         """
-        try:
-            parsed_url = urlparse(url)
-
-            # Instagram 도메인 확인
-            if parsed_url.netloc not in ["www.instagram.com", "instagram.com"]:
-                return False
-
-            # 게시물 경로 패턴 확인 (/p/, /reel/, /tv/)
-            path_pattern = r"^/(p|reel|tv)/([A-Za-z0-9_-]+)/?"
-            if not re.match(path_pattern, parsed_url.path):
-                return False
-
-            return True
-        except Exception:
-            return False
+        # 비동기/브라우저 추출기와 같은 규칙 (/p/, /reel(s)/, /tv/, /<사용자>/p/, m.instagram.com)
+        return canonicalize_url(url) is not None
 
     def extract_shortcode(self, url: str) -> str:
         """URL에서 shortcode 추출
@@ -60,18 +84,19 @@ class InstagramTextExtractor:
         Raises:
             ValueError: 유효하지 않은 URL인 경우
         """
-        if not self.validate_url(url):
+        canonical = canonicalize_url(url)
+        if canonical is None:
             raise ValueError("유효하지 않은 Instagram URL입니다.")
-
-        parsed_url = urlparse(url)
-        path_parts = parsed_url.path.strip("/").split("/")
-
-        if len(path_parts) >= 2:
-            return path_parts[1]
-
-        raise ValueError("URL에서 shortcode를 추출할 수 없습니다.")
-
-    def get_post_text(self, url: str, title: str = "미정", max_retries: int = 5, retry_delay: int = 5) -> Dict[str, any]:
+        return canonical[0]
+
+    def get_post_text(
+        self,
+        url: str,
+        title: str = "미정",
+        max_retries: int = 5,
+        retry_delay: int = 5,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> PostRecord:
         """게시물에서 텍스트 및 메타데이터 추출 (재시도 기능 포함)
 
         Args:
@@ -79,9 +104,11 @@ class InstagramTextExtractor:
             title (str): 게시물 제목 (기본값: "미정")
             max_retries (int): 최대 재시도 횟수 (기본값: 5)
             retry_delay (int): 초기 재시도 대기시간 (초, 기본값: 5)
+            fields (Optional[Tuple[str, ...]]): 조회할 필드 (None이면 전체,
+                선택하지 않은 필드는 조회하지 않고 기본값으로 남김)
 
         Returns:
-            Dict[str, any]: 추출된 정보를 담은 딕셔너리
+            PostRecord: 추출된 정보를 담은 레코드 (dict처럼 조회 가능)
                 - title: 게시물 제목
                 - text: 본문 텍스트
                 - username: 작성자명
@@ -104,19 +131,14 @@ class InstagramTextExtractor:
                 # Instaloader를 사용해 게시물 정보 가져오기
                 post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
 
-                # 텍스트 추출 및 정제
-                caption_text = post.caption or ""
-
-                return {
-                    "title": title,
-                    "text": self._clean_text(caption_text),
-                    "username": post.owner_username,
-                    "likes": post.likes,
-                    "date": post.date,
-                    "media_count": post.mediacount,
-                    "is_video": post.is_video,
-                    "url": url,
+                # 요청한 필드의 속성만 조회 (텍스트는 정제해서 저장)
+                names = _POST_ATTRIBUTES if fields is None else fields
+                values = {
+                    name: _POST_ATTRIBUTES[name](post)
+                    for name in names
+                    if name in _POST_ATTRIBUTES
                 }
+                return PostRecord(title=title, url=url, **values)
 
             except instaloader.exceptions.PostChangedException:
                 raise ValueError("게시물이 삭제되었거나 존재하지 않습니다.")
@@ -181,13 +203,8 @@ class InstagramTextExtractor:
         Returns:
             str: 정제된 텍스트
         """
-        if not text:
-            return ""
-
         # 불필요한 공백 제거
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        return default_processor.clean(text)
 
     def extract_hashtags(self, text: str) -> list:
         """텍스트에서 해시태그 추출
@@ -198,8 +215,7 @@ class InstagramTextExtractor:
         Returns:
             list: 해시태그 리스트
         """
-        hashtag_pattern = r"#[가-힣\w]+"
-        return re.findall(hashtag_pattern, text)
+        return list(default_processor.process(text).hashtags)
 
     def extract_mentions(self, text: str) -> list:
         """텍스트에서 멘션 추출
@@ -210,5 +226,4 @@ class InstagramTextExtractor:
         Returns:
             list: 멘션 리스트
         """
-        mention_pattern = r"@\w+"
-        return re.findall(mention_pattern, text)
+        return list(default_processor.process(text).mentions)
@@ -0,0 +1,332 @@
+"""
+outputs/ 결과 파일 가져오기 모듈
+
+instagram_batch_combined_*.json, batch_*.json, *failed_urls*.txt 파일을 결과 저장소로
+가져온다. JSON은 파일 전체를 읽지 않고 조금씩 읽으며 results 배열의 항목을 하나씩
+디코딩하고, 같은 게시물은 가장 최근에 추출한 레코드만 남긴다. 가져온 파일은
+저장소에 기록되므로 다시 실행하면 새 파일만 처리한다.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from .record import PostRecord
+from .store import ResultStore, shortcode_of
+
+# 가져올 파일 패턴 (outputs/ 기준)
+SOURCE_PATTERNS = (
+    "instagram_batch_combined_*.json",
+    "batch_*.json",
+    "*failed_urls*.txt",
+)
+
+_WHITESPACE = " \t\r\n"
+
+# 파일명 시각: instagram_batch_combined_20250915_100108.json / batch_01_user_1694745600.json
+_STAMP_PATTERN = re.compile(r"_(\d{8}_\d{6})(?:\.|_)")
+_EPOCH_PATTERN = re.compile(r"_(\d{10})\.\w+$")
+
+# 실패 목록 한 줄: "제목::URL  # 오류: 메시지" 또는 "URL  # 오류: 메시지"
+_FAILED_LINE = re.compile(r"^(?:(?P<title>.*?)::)?(?P<url>https?://\S+)\s*(?:#\s*오류:\s*(?P<error>.*))?$")
+
+
+class _JSONStream:
+    """파일을 chunk_size씩 읽으며 JSON 값을 하나씩 디코딩하는 버퍼"""
+
+    def __init__(self, fp: IO[str], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """버퍼에 데이터 추가 (이미 처리한 앞부분은 버림)"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self, skip: str = _WHITESPACE) -> str:
+        """skip 문자를 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"JSON 형식 오류: '{char}'가 필요합니다 (위치 {self.pos})")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나 디코딩 (값이 잘렸으면 더 읽고 다시 시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 숫자처럼 버퍼 끝에서 끝난 값은 뒤에 더 이어질 수 있으므로 다시 읽음
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_results(
+    fp: IO[str], chunk_size: int = 64 * 1024, array_key: str = "results"
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """결과 JSON 파일의 게시물을 하나씩 읽기
+
+    통합 파일({"processed_at": ..., "results": [...]})은 results 배열을 항목 단위로,
+    최상위 배열은 원소 단위로 읽고, 개별 게시물 파일({"url": ...})은 객체 하나로 읽는다.
+
+    Args:
+        fp (IO[str]): 텍스트 모드 파일 객체
+        chunk_size (int): 한 번에 읽을 문자 수
+        array_key (str): 항목 단위로 읽을 최상위 배열 키 (장소 파일은 "locations")
+
+    Yields:
+        Tuple[Dict[str, Any], Dict[str, Any]]: (results 앞까지 읽은 최상위 필드, 게시물 dict)
+
+    Raises:
+        ValueError: JSON 형식이 잘못된 경우
+    """
+    stream = _JSONStream(fp, chunk_size)
+    header: Dict[str, Any] = {}
+
+    first = stream.peek()
+    if first == "[":
+        stream.pos += 1
+        while stream.peek(_WHITESPACE + ",") not in ("]", ""):
+            yield header, stream.value()
+        return
+
+    stream.expect("{")
+    has_results = False
+    while stream.peek(_WHITESPACE + ",") not in ("}", ""):
+        key = stream.value()
+        stream.expect(":")
+        if key == array_key and stream.peek() == "[":
+            has_results = True
+            stream.pos += 1
+            while stream.peek(_WHITESPACE + ",") not in ("]", ""):
+                yield header, stream.value()
+            stream.expect("]")
+        else:
+            header[key] = stream.value()
+
+    if not has_results and "url" in header:
+        # 개별 게시물 파일 (save_to_file 결과)
+        yield {}, header
+
+
+def iter_failed_urls(fp: IO[str]) -> Iterator[Tuple[str, str, str]]:
+    """실패 목록 파일의 항목 읽기
+
+    예전 실패 목록은 줄바꿈이 "\\n" 문자열로 저장되어 있으므로 실제 줄바꿈과
+    "\\n" 문자열을 모두 줄 구분자로 취급한다.
+
+    Args:
+        fp (IO[str]): 텍스트 모드 파일 객체
+
+    Yields:
+        Tuple[str, str, str]: (제목, URL, 오류 메시지)
+    """
+    for physical_line in fp:
+        for line in physical_line.split("\\n"):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            match = _FAILED_LINE.match(line)
+            if match:
+                yield (
+                    (match.group("title") or "미정").strip(),
+                    match.group("url"),
+                    (match.group("error") or "").strip(),
+                )
+
+
+def source_timestamp(path: str, header: Optional[Dict[str, Any]] = None) -> float:
+    """파일의 레코드를 추출한 시각 추정 (processed_at > 파일명 시각 > 수정 시각)
+
+    Args:
+        path (str): 원본 파일 경로
+        header (Optional[Dict[str, Any]]): 파일 최상위 필드
+
+    Returns:
+        float: Unix 시간
+    """
+    processed_at = (header or {}).get("processed_at")
+    if isinstance(processed_at, str):
+        try:
+            return datetime.fromisoformat(processed_at).timestamp()
+        except ValueError:
+            pass
+
+    name = os.path.basename(path)
+    match = _STAMP_PATTERN.search(name)
+    if match:
+        return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").timestamp()
+    match = _EPOCH_PATTERN.search(name)
+    if match:
+        return float(match.group(1))
+    return os.path.getmtime(path)
+
+
+def _sha256(path: str) -> str:
+    """파일 내용 해시 (조금씩 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class ImportStats:
+    """가져오기 통계"""
+    files: int = 0
+    # 이미 가져왔거나 같은 내용의 파일이 있어 건너뛴 파일 수
+    skipped_files: int = 0
+    records: int = 0
+    # 게시물 URL이 없거나 형식이 잘못된 항목 수
+    invalid_records: int = 0
+    failures: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class ArchiveImporter:
+    """결과 파일을 결과 저장소로 가져오는 클래스"""
+
+    def __init__(self, store: ResultStore, batch_size: int = 500, chunk_size: int = 64 * 1024):
+        """
+        초기화
+
+        Args:
+            store (ResultStore): 가져올 결과 저장소
+            batch_size (int): 한 트랜잭션에 저장할 레코드 수
+            chunk_size (int): JSON 파일을 한 번에 읽을 문자 수
+        """
+        self.store = store
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def discover(directory: str = "outputs") -> List[str]:
+        """디렉토리에서 가져올 파일 찾기 (오래된 파일부터)
+
+        Args:
+            directory (str): 결과 파일 디렉토리
+
+        Returns:
+            List[str]: 파일 경로 목록
+        """
+        paths = set()
+        for pattern in SOURCE_PATTERNS:
+            paths.update(glob.glob(os.path.join(directory, pattern)))
+        return sorted(paths, key=lambda path: (source_timestamp(path), path))
+
+    def import_paths(self, paths: List[str], force: bool = False) -> ImportStats:
+        """파일 목록 가져오기
+
+        Args:
+            paths (List[str]): 가져올 파일 경로 목록
+            force (bool): 이미 가져온 파일도 다시 가져오기
+
+        Returns:
+            ImportStats: 가져오기 통계
+        """
+        stats = ImportStats()
+        for path in paths:
+            size = os.path.getsize(path)
+            mtime = os.path.getmtime(path)
+            key = os.path.abspath(path)
+            if not force and self.store.find_ingested(key, size, mtime):
+                stats.skipped_files += 1
+                continue
+
+            sha256 = _sha256(path)
+            duplicate = None if force else self.store.find_ingested(key, size, mtime, sha256)
+            if duplicate is not None:
+                # 이름만 다른 같은 내용의 파일
+                self.store.mark_ingested(key, sha256, size, mtime, 0)
+                stats.skipped_files += 1
+                continue
+
+            try:
+                if path.endswith(".txt"):
+                    count = self._import_failed_urls(path, stats)
+                else:
+                    count = self._import_json(path, stats)
+            except (OSError, ValueError) as e:
+                stats.errors.append(f"{path}: {str(e)}")
+                continue
+
+            self.store.mark_ingested(key, sha256, size, mtime, count)
+            stats.files += 1
+        return stats
+
+    def _import_json(self, path: str, stats: ImportStats) -> int:
+        """결과 JSON 파일 하나 가져오기 (batch_size씩 저장)
+
+        항목에 있는 필드만 갱신하므로 --simple 통합 파일(title, text, url)을 나중에
+        가져와도 이미 저장된 작성자/좋아요/날짜 등은 지워지지 않는다.
+        """
+        count = 0
+        batch: List[PostRecord] = []
+        batch_fields: Optional[Tuple[str, ...]] = None
+        updated_at: Optional[float] = None
+
+        def flush() -> None:
+            nonlocal count
+            if batch:
+                self.store.upsert_many(batch, batch_fields, updated_at=updated_at)
+                count += len(batch)
+                batch.clear()
+
+        with open(path, encoding="utf-8") as f:
+            for header, item in iter_json_results(f, self.chunk_size):
+                if updated_at is None:
+                    updated_at = source_timestamp(path, header)
+                try:
+                    record = PostRecord.from_mapping(item)
+                    shortcode_of(record)
+                except (TypeError, ValueError):
+                    stats.invalid_records += 1
+                    continue
+                fields = tuple(name for name in record if name in item)
+                if fields != batch_fields:
+                    # 필드 구성이 바뀌면 지금까지 모은 레코드를 먼저 저장 (파일 안 순서 유지)
+                    flush()
+                    batch_fields = fields
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    flush()
+            flush()
+
+        stats.records += count
+        return count
+
+    def _import_failed_urls(self, path: str, stats: ImportStats) -> int:
+        """실패 목록 파일 하나 가져오기"""
+        with open(path, encoding="utf-8") as f:
+            count = self.store.record_failures(iter_failed_urls(f), source_timestamp(path))
+        stats.failures += count
+        return count
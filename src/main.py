@@ -7,10 +7,12 @@ import sys
 import argparse
 import time
 import os
-from typing import Optional, List, Tuple
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, List, Tuple, Union
 
-from .extractor import InstagramTextExtractor
-from .selenium_extractor import SeleniumInstagramExtractor
+from .columnar import COLUMNAR_FORMATS
+from .record import SIMPLE_FIELDS, PostRecord, parse_fields, to_json_dict
+from .url_reader import UrlReadStats, canonicalize_url, iter_urls_with_titles
 from .utils import (
     format_text_output,
     save_to_file,
@@ -19,6 +21,33 @@ from .utils import (
     get_user_confirmation,
 )
 
+# 추출 백엔드(instaloader, selenium/webdriver_manager/bs4)는 import 비용이 크므로
+# 실제로 선택된 경우에만 함수 안에서 불러온다. (--help, 단일 URL 실행 속도 개선)
+if TYPE_CHECKING:
+    from .extractor import InstagramTextExtractor
+    from .playwright_extractor import PlaywrightInstagramExtractor
+    from .selenium_extractor import SeleniumInstagramExtractor
+    from .archive import ResultLog, ShortcodeIndex
+    from .columnar import ColumnarWriter
+    from .store import ResultStore
+    from .transport import TransportConfig
+
+_LAZY_BACKENDS = {
+    "InstagramTextExtractor": ".extractor",
+    "SeleniumInstagramExtractor": ".selenium_extractor",
+    "PlaywrightInstagramExtractor": ".playwright_extractor",
+}
+
+
+def __getattr__(name: str):
+    """src.main.InstagramTextExtractor 등 백엔드 클래스의 지연 import (PEP 562)"""
+    if name in _LAZY_BACKENDS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_BACKENDS[name], __package__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def parse_arguments() -> argparse.Namespace:
     """명령줄 인수 파싱"""
@@ -40,8 +69,8 @@ def parse_arguments() -> argparse.Namespace:
         "--save",
         "-s",
         metavar="FORMAT",
-        choices=["txt", "json"],
-        help="결과를 파일로 저장 (txt 또는 json 형식)",
+        choices=["txt", "json", "parquet", "arrow"],
+        help="결과를 파일로 저장 (txt 또는 json 형식, 배치 통합 파일은 parquet/arrow도 가능)",
     )
 
     parser.add_argument(
@@ -56,7 +85,7 @@ def parse_arguments() -> argparse.Namespace:
         "--batch-file",
         "-b",
         metavar="FILEPATH",
-        help="URL 목록이 포함된 파일 경로",
+        help="URL 목록 파일 경로 (제목::URL, JSONL, gzip 지원, '-'는 표준 입력)",
     )
 
     parser.add_argument(
@@ -72,6 +101,15 @@ def parse_arguments() -> argparse.Namespace:
         help="모든 결과를 하나의 통합 파일로 저장",
     )
 
+    parser.add_argument(
+        "--dedup",
+        nargs="?",
+        type=float,
+        const=0.8,
+        metavar="THRESHOLD",
+        help="통합 파일에서 캡션이 거의 같은 게시물 제외 (추정 Jaccard 유사도 기준, 기본값: 0.8)",
+    )
+
     parser.add_argument(
         "--delay",
         "-d",
@@ -86,6 +124,34 @@ def parse_arguments() -> argparse.Namespace:
         help="간단한 출력 모드 (text와 url만 포함)",
     )
 
+    parser.add_argument(
+        "--store",
+        nargs="?",
+        const="outputs/results.db",
+        metavar="FILEPATH",
+        help="배치 결과를 SQLite 결과 저장소에 누적 (shortcode 기준 갱신, 기본 경로: outputs/results.db)",
+    )
+
+    parser.add_argument(
+        "--archive",
+        nargs="?",
+        const="outputs/results.jsonl",
+        metavar="FILEPATH",
+        help="배치 결과를 추가 전용 JSONL 로그에 기록하고 shortcode 인덱스 갱신 (기본 경로: outputs/results.jsonl)",
+    )
+
+    parser.add_argument(
+        "--skip-archived",
+        action="store_true",
+        help="결과 로그(--archive, 생략 시 기본 경로)에 이미 있는 게시물은 조회하지 않음",
+    )
+
+    parser.add_argument(
+        "--fields",
+        metavar="FIELDS",
+        help="조회/저장할 필드 (쉼표 구분, 예: title,text,url). 선택하지 않은 메타데이터는 조회하지 않음",
+    )
+
     parser.add_argument(
         "--with-titles",
         action="store_true",
@@ -106,6 +172,27 @@ def parse_arguments() -> argparse.Namespace:
         help="재시도 시 초기 대기시간 (초, 기본값: 5초)",
     )
 
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=10,
+        help="instaloader HTTP 연결 풀 크기 (동시 요청 수에 맞춤, 기본값: 10)",
+    )
+
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=5.0,
+        help="HTTP 연결 제한 시간 (초, 기본값: 5)",
+    )
+
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=30.0,
+        help="HTTP 응답 읽기 제한 시간 (초, 기본값: 30)",
+    )
+
     parser.add_argument(
         "--use-selenium",
         action="store_true",
@@ -119,6 +206,19 @@ def parse_arguments() -> argparse.Namespace:
         help="Selenium 모드에서 최대 스레드 수 (기본값: 5)",
     )
 
+    parser.add_argument(
+        "--use-playwright",
+        action="store_true",
+        help="Playwright 브라우저 1개에 여러 컨텍스트를 띄워 배치 처리 (playwright 설치 필요)",
+    )
+
+    parser.add_argument(
+        "--browser-contexts",
+        type=int,
+        default=20,
+        help="Playwright 모드에서 동시에 페이지를 로드할 컨텍스트 수 (기본값: 20)",
+    )
+
     parser.add_argument(
         "--headless",
         action="store_true",
@@ -126,6 +226,51 @@ def parse_arguments() -> argparse.Namespace:
         help="Selenium 헤드리스 모드 사용 (기본값: True)",
     )
 
+    parser.add_argument(
+        "--page-timeout",
+        type=float,
+        default=30.0,
+        help="Selenium 페이지 로드 제한 시간 (초, 기본값: 30)",
+    )
+
+    parser.add_argument(
+        "--url-timeout",
+        type=float,
+        default=90.0,
+        help="Selenium URL 하나의 전체 처리 제한 시간 (초, 초과 시 브라우저 강제 종료 후 1회 재시도, 기본값: 90)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Selenium 모드에서 페이지 파싱/정제에 사용할 프로세스 수 (기본값: 0, 스레드에서 처리)",
+    )
+
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="Selenium 배치 결과를 입력 순서대로 처리 (기본값: 완료 순서)",
+    )
+
+    parser.add_argument(
+        "--driver-path",
+        metavar="FILEPATH",
+        help="ChromeDriver 실행 파일 경로 (기본값: 환경 변수/캐시/PATH에서 자동 확인)",
+    )
+
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="ChromeDriver 다운로드를 시도하지 않음 (에어갭 환경용)",
+    )
+
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Selenium 브라우저를 미리 실행하고 URL 간에 재사용",
+    )
+
     return parser.parse_args()
 
 
@@ -142,98 +287,68 @@ def read_urls_from_file(file_path: str) -> List[str]:
         FileNotFoundError: 파일이 존재하지 않는 경우
         ValueError: 파일 형식이 잘못된 경우
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        urls = []
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            # 빈 줄이나 주석(#으로 시작) 제외
-            if line and not line.startswith('#'):
-                if line.startswith('https://') or line.startswith('http://'):
-                    urls.append(line)
-                else:
-                    print(f"⚠️ 라인 {line_num}: 유효하지 않은 URL 형식 - {line}")
-
-        if not urls:
-            raise ValueError("유효한 URL이 없습니다.")
-
-        return urls
-
-    except FileNotFoundError:
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
-    except Exception as e:
-        raise ValueError(f"파일 읽기 오류: {str(e)}")
+    return [url for _, url in read_urls_with_titles_from_file(file_path)]
 
 
 def read_urls_with_titles_from_file(file_path: str) -> List[Tuple[str, str]]:
-    """파일에서 제목과 URL 목록을 읽어오기 (제목::URL 형식)
+    """파일에서 제목과 URL 목록을 읽어오기 (제목::URL, JSONL, gzip, '-' 지원)
 
     Args:
         file_path (str): 제목과 URL 목록 파일 경로
 
     Returns:
-        List[Tuple[str, str]]: (제목, URL) 튜플 목록
+        List[Tuple[str, str]]: 중복이 제거된 (제목, URL) 튜플 목록
 
     Raises:
         FileNotFoundError: 파일이 존재하지 않는 경우
         ValueError: 파일 형식이 잘못된 경우
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        urls_with_titles = []
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            # 빈 줄이나 주석(#으로 시작) 제외
-            if line and not line.startswith('#'):
-                if '::' in line:
-                    # 제목::URL 형식
-                    parts = line.split('::', 1)
-                    if len(parts) == 2:
-                        title = parts[0].strip()
-                        url = parts[1].strip()
-                        if url.startswith('https://') or url.startswith('http://'):
-                            urls_with_titles.append((title, url))
-                        else:
-                            print(f"⚠️ 라인 {line_num}: 유효하지 않은 URL 형식 - {url}")
-                    else:
-                        print(f"⚠️ 라인 {line_num}: 잘못된 형식 - {line}")
-                elif line.startswith('https://') or line.startswith('http://'):
-                    # URL만 있는 경우 (하위 호환성)
-                    urls_with_titles.append(("미정", line))
-                else:
-                    print(f"⚠️ 라인 {line_num}: 유효하지 않은 형식 - {line}")
-
-        if not urls_with_titles:
-            raise ValueError("유효한 URL이 없습니다.")
-
-        return urls_with_titles
-
+        urls_with_titles = list(iter_urls_with_titles(file_path))
     except FileNotFoundError:
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
     except Exception as e:
         raise ValueError(f"파일 읽기 오류: {str(e)}")
 
+    if not urls_with_titles:
+        raise ValueError("파일 읽기 오류: 유효한 URL이 없습니다.")
+
+    return urls_with_titles
+
+
+def combined_file_path(output_format: str, simple_mode: bool = False) -> str:
+    """통합 파일 경로 (outputs/instagram_batch_combined[_simple]_<시각>.<형식>, 디렉토리가 없으면 생성)"""
+    from datetime import datetime
+
+    output_dir = "outputs"
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
 
-def save_combined_results(results: List[dict], output_format: str = 'txt', simple_mode: bool = False) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"instagram_batch_combined{'_simple' if simple_mode else ''}_{timestamp}.{output_format}"
+    return os.path.join(output_dir, filename)
+
+
+def save_combined_results(results: List[PostRecord], output_format: str = 'txt', simple_mode: bool = False, fields: Optional[Tuple[str, ...]] = None) -> str:
     """배치 처리 결과를 통합 파일로 저장
 
     Args:
-        results (List[dict]): 처리 결과 목록
-        output_format (str): 출력 형식 ('txt' 또는 'json')
+        results (List[PostRecord]): 처리 결과 목록
+        output_format (str): 출력 형식 ('txt', 'json', 'parquet', 'arrow')
         simple_mode (bool): 간단한 모드 (text와 url만 포함)
+        fields (Optional[Tuple[str, ...]]): 저장할 필드 (None이면 전체, simple_mode보다 우선)
 
     Returns:
         str: 저장된 파일 경로
     """
     from datetime import datetime
-    from .utils import save_to_file
     import json
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if fields is None and simple_mode:
+        fields = SIMPLE_FIELDS
+
+    def selected(name: str) -> bool:
+        return fields is None or name in fields
 
     if output_format == 'txt':
         # 텍스트 형식으로 통합
@@ -248,9 +363,11 @@ def save_combined_results(results: List[dict], output_format: str = 'txt', simpl
         for i, result in enumerate(results, 1):
             combined_text.append(f"[{i:02d}] {result.get('title', '미정')}")
             combined_text.append(f"🔗 URL: {result['url']}")
-            combined_text.append(f"👤 작성자: @{result.get('username', 'Unknown')}")
-            combined_text.append(f"❤️ 좋아요: {result.get('likes', 0):,}개")
-            if result.get('date'):
+            if selected('username'):
+                combined_text.append(f"👤 작성자: @{result.get('username', 'Unknown')}")
+            if selected('likes'):
+                combined_text.append(f"❤️ 좋아요: {result.get('likes', 0):,}개")
+            if selected('date') and result.get('date'):
                 date_str = result['date'].strftime('%Y년 %m월 %d일 %H:%M')
                 combined_text.append(f"📅 게시일: {date_str}")
             combined_text.append("")
@@ -261,13 +378,7 @@ def save_combined_results(results: List[dict], output_format: str = 'txt', simpl
             combined_text.append("")
 
         # 파일 저장
-        output_dir = "outputs"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        filename = f"instagram_batch_combined{'_simple' if simple_mode else ''}_{timestamp}.txt"
-        file_path = os.path.join(output_dir, filename)
-
+        file_path = combined_file_path('txt', simple_mode)
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write('\n'.join(combined_text))
 
@@ -280,55 +391,100 @@ def save_combined_results(results: List[dict], output_format: str = 'txt', simpl
         }
 
         for result in results:
-            if simple_mode:
-                # 간단한 모드: title, text, url만 포함
-                json_result = {
-                    'title': result.get('title', '미정'),
-                    'text': result.get('text', ''),
-                    'url': result.get('url', '')
-                }
-            else:
-                # 전체 모드: 모든 데이터 포함
-                json_result = result.copy()
-                if 'date' in json_result and json_result['date']:
-                    json_result['date'] = json_result['date'].isoformat()
-            batch_data['results'].append(json_result)
+            # 선택한 필드만 포함 (간단한 모드는 title, text, url)
+            batch_data['results'].append(to_json_dict(result, fields))
 
         # 파일 저장
-        output_dir = "outputs"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        filename = f"instagram_batch_combined{'_simple' if simple_mode else ''}_{timestamp}.json"
-        file_path = os.path.join(output_dir, filename)
-
+        file_path = combined_file_path('json', simple_mode)
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(batch_data, f, ensure_ascii=False, indent=2)
 
+    elif output_format in COLUMNAR_FORMATS:
+        # 열 형식 (행 그룹 단위로 기록, pyarrow 필요)
+        from .columnar import export_columnar
+
+        file_path = combined_file_path(output_format, simple_mode)
+        export_columnar(results, file_path, output_format, fields)
+
     return file_path
 
 
-def process_batch_urls_with_titles(extractor: InstagramTextExtractor, urls_with_titles: List[Tuple[str, str]], args: argparse.Namespace) -> List[dict]:
+def _transport_config(args: argparse.Namespace) -> "TransportConfig":
+    """명령줄 인수로 HTTP 전송 계층 설정 생성"""
+    from .transport import TransportConfig
+
+    return TransportConfig.for_concurrency(
+        getattr(args, "pool_size", 10),
+        connect_timeout=getattr(args, "connect_timeout", 5.0),
+        read_timeout=getattr(args, "read_timeout", 30.0),
+    )
+
+
+def _selected_fields(args: argparse.Namespace) -> Optional[Tuple[str, ...]]:
+    """명령줄 인수로 조회할 필드 결정 (--simple은 title, text, url)
+
+    Raises:
+        ValueError: 알 수 없는 필드가 포함된 경우
+    """
+    fields = parse_fields(getattr(args, "fields", None))
+    if fields is None and getattr(args, "simple", False):
+        return SIMPLE_FIELDS
+    return fields
+
+
+def _skip_archived(urls_with_titles: Iterable[Tuple[str, str]], index: "ShortcodeIndex", stats: Optional[UrlReadStats] = None, fields: Optional[Tuple[str, ...]] = None) -> Iterator[Tuple[str, str]]:
+    """결과 로그에 이미 있는 게시물을 건너뛰기 (인덱스 조회와 줄 하나 읽기뿐이라 요청 전 확인 비용이 거의 없음)
+
+    Args:
+        urls_with_titles: (제목, URL) 튜플 목록 (제너레이터 가능)
+        index: 결과 로그 shortcode 인덱스
+        stats: 건너뛴 URL 수(archived)를 기록할 읽기 통계 (선택)
+        fields: 이번 실행에 필요한 필드 (최신 줄에 빠져 있으면 다시 가져옴, None이면 전체)
+    """
+    for title, url in urls_with_titles:
+        canonical = canonicalize_url(url)
+        if canonical is not None and index.get(canonical[0], fields) is not None:
+            print(f"⏭️ 이미 보관됨: {title} ({url})")
+            if stats is not None:
+                stats.archived += 1
+            continue
+        yield title, url
+
+
+def _progress_label(index: int, total: Optional[int]) -> str:
+    """진행 표시 문자열 (스트리밍 입력처럼 전체 개수를 모르면 순번만 표시)"""
+    if total is None:
+        return f"[{index:02d}]"
+    return f"[{index:02d}/{total:02d}]"
+
+
+def process_batch_urls_with_titles(extractor: "InstagramTextExtractor", urls_with_titles: Iterable[Tuple[str, str]], args: argparse.Namespace, store: Optional["ResultStore"] = None, archive: Optional["ResultLog"] = None, columnar: Optional["ColumnarWriter"] = None) -> List[PostRecord]:
     """배치로 여러 URL과 제목 처리
 
     Args:
         extractor: Instagram 텍스트 추출기
-        urls_with_titles: 처리할 (제목, URL) 튜플 목록
+        urls_with_titles: 처리할 (제목, URL) 튜플 목록 (제너레이터 가능)
         args: 명령줄 인수
+        store: 성공한 결과를 바로 저장할 결과 저장소 (선택)
+        archive: 성공한 결과를 바로 기록할 결과 로그 (선택)
+        columnar: 성공한 결과를 행 그룹 단위로 기록할 Parquet/Arrow 통합 파일 (선택)
 
     Returns:
-        List[dict]: 처리 성공한 결과 목록
+        List[PostRecord]: 처리 성공한 결과 목록
     """
     results = []
     failed_urls = []
-    total_count = len(urls_with_titles)
+    total_count = len(urls_with_titles) if hasattr(urls_with_titles, "__len__") else None
 
-    print(f"🚀 배치 처리 시작: 총 {total_count}개 URL (제목 포함)")
+    if total_count is None:
+        print("🚀 배치 처리 시작: 스트리밍 입력 (제목 포함)")
+    else:
+        print(f"🚀 배치 처리 시작: 총 {total_count}개 URL (제목 포함)")
     print(f"⏱️ URL 간 대기시간: {args.delay}초")
     print("=" * 60)
 
     for i, (title, url) in enumerate(urls_with_titles, 1):
-        print(f"\n[{i:02d}/{total_count:02d}] 처리 중: {title}")
+        print(f"\n{_progress_label(i, total_count)} 처리 중: {title}")
         print(f"    URL: {url}")
 
         try:
@@ -338,8 +494,15 @@ def process_batch_urls_with_titles(extractor: InstagramTextExtractor, urls_with_
                 time.sleep(args.delay)
 
             # 텍스트 추출 (제목 포함, 재시도 설정 적용)
-            post_data = extractor.get_post_text(url, title, args.max_retries, args.retry_delay)
+            post_data = extractor.get_post_text(url, title, args.max_retries, args.retry_delay, _selected_fields(args))
             results.append(post_data)
+            if store is not None:
+                # 결과 저장소에 바로 반영 (중단되어도 처리한 게시물은 남음)
+                store.upsert(post_data, _selected_fields(args))
+            if archive is not None:
+                archive.append(post_data, _selected_fields(args))
+            if columnar is not None:
+                columnar.write(post_data)
 
             # 성공 메시지
             username = post_data.get('username', 'Unknown')
@@ -349,7 +512,7 @@ def process_batch_urls_with_titles(extractor: InstagramTextExtractor, urls_with_
             # 개별 파일 저장 (combined-output이 아닌 경우)
             if args.save and not args.combined_output:
                 filename = f"batch_{i:02d}_{username}_{int(time.time())}.{args.save}"
-                file_path = save_to_file(post_data, filename, args.save)
+                file_path = save_to_file(post_data, filename, args.save, _selected_fields(args))
                 print(f"💾 저장: {file_path}")
 
         except Exception as e:
@@ -387,16 +550,19 @@ def process_batch_urls_with_titles(extractor: InstagramTextExtractor, urls_with_
     return results
 
 
-def process_batch_urls(extractor: InstagramTextExtractor, urls: List[str], args: argparse.Namespace) -> List[dict]:
+def process_batch_urls(extractor: "InstagramTextExtractor", urls: List[str], args: argparse.Namespace, store: Optional["ResultStore"] = None, archive: Optional["ResultLog"] = None, columnar: Optional["ColumnarWriter"] = None) -> List[PostRecord]:
     """배치로 여러 URL 처리
 
     Args:
         extractor: Instagram 텍스트 추출기
         urls: 처리할 URL 목록
         args: 명령줄 인수
+        store: 성공한 결과를 바로 저장할 결과 저장소 (선택)
+        archive: 성공한 결과를 바로 기록할 결과 로그 (선택)
+        columnar: 성공한 결과를 행 그룹 단위로 기록할 Parquet/Arrow 통합 파일 (선택)
 
     Returns:
-        List[dict]: 처리 성공한 결과 목록
+        List[PostRecord]: 처리 성공한 결과 목록
     """
     results = []
     failed_urls = []
@@ -416,8 +582,15 @@ def process_batch_urls(extractor: InstagramTextExtractor, urls: List[str], args:
                 time.sleep(args.delay)
 
             # 텍스트 추출 (재시도 설정 적용)
-            post_data = extractor.get_post_text(url, "미정", args.max_retries, args.retry_delay)
+            post_data = extractor.get_post_text(url, "미정", args.max_retries, args.retry_delay, _selected_fields(args))
             results.append(post_data)
+            if store is not None:
+                # 결과 저장소에 바로 반영 (중단되어도 처리한 게시물은 남음)
+                store.upsert(post_data, _selected_fields(args))
+            if archive is not None:
+                archive.append(post_data, _selected_fields(args))
+            if columnar is not None:
+                columnar.write(post_data)
 
             # 성공 메시지
             username = post_data.get('username', 'Unknown')
@@ -427,7 +600,7 @@ def process_batch_urls(extractor: InstagramTextExtractor, urls: List[str], args:
             # 개별 파일 저장 (combined-output이 아닌 경우)
             if args.save and not args.combined_output:
                 filename = f"batch_{i:02d}_{username}_{int(time.time())}.{args.save}"
-                file_path = save_to_file(post_data, filename, args.save)
+                file_path = save_to_file(post_data, filename, args.save, _selected_fields(args))
                 print(f"💾 저장: {file_path}")
 
         except Exception as e:
@@ -465,50 +638,71 @@ def process_batch_urls(extractor: InstagramTextExtractor, urls: List[str], args:
     return results
 
 
-def process_batch_urls_with_selenium(selenium_extractor: SeleniumInstagramExtractor, urls_with_titles: List[Tuple[str, str]], args: argparse.Namespace) -> List[dict]:
-    """Selenium으로 배치 처리
+def process_batch_urls_with_selenium(selenium_extractor: Union["SeleniumInstagramExtractor", "PlaywrightInstagramExtractor"], urls_with_titles: Iterable[Tuple[str, str]], args: argparse.Namespace, store: Optional["ResultStore"] = None, archive: Optional["ResultLog"] = None, columnar: Optional["ColumnarWriter"] = None) -> List[PostRecord]:
+    """Selenium으로 배치 처리 (결과는 완료되는 대로 하나씩 처리)
     
     Args:
-        selenium_extractor: Selenium 기반 Instagram 텍스트 추출기
-        urls_with_titles: 처리할 (제목, URL) 튜플 목록
+        selenium_extractor: 브라우저 기반 Instagram 텍스트 추출기 (Selenium 또는 Playwright)
+        urls_with_titles: 처리할 (제목, URL) 튜플 목록 (제너레이터 가능)
         args: 명령줄 인수
+        store: 성공한 결과를 바로 저장할 결과 저장소 (선택)
+        archive: 성공한 결과를 바로 기록할 결과 로그 (선택)
+        columnar: 성공한 결과를 행 그룹 단위로 기록할 Parquet/Arrow 통합 파일 (선택)
         
     Returns:
-        List[dict]: 처리 성공한 결과 목록
+        List[PostRecord]: 처리 성공한 결과 목록
     """
-    print(f"🚀 Selenium 배치 처리 시작: 총 {len(urls_with_titles)}개 URL")
-    print(f"🧵 최대 스레드 수: {args.selenium_workers}")
+    total_count = len(urls_with_titles) if hasattr(urls_with_titles, "__len__") else None
+    if total_count is None:
+        print("🚀 Selenium 배치 처리 시작: 스트리밍 입력")
+    else:
+        print(f"🚀 Selenium 배치 처리 시작: 총 {total_count}개 URL")
+    if getattr(args, "use_playwright", False):
+        print(f"🌐 브라우저 컨텍스트 수: {args.browser_contexts}")
+    else:
+        print(f"🧵 최대 스레드 수: {args.selenium_workers}")
     print(f"🎭 헤드리스 모드: {'ON' if args.headless else 'OFF'}")
     print("=" * 60)
     
-    # Selenium 배치 추출 실행
-    selenium_results = selenium_extractor.batch_extract(urls_with_titles)
-    
-    # 결과를 기존 형식으로 변환
     results = []
     failed_urls = []
-    
-    for result in selenium_results:
-        if result.success:
-            # 성공한 경우 기존 형식으로 변환
-            post_data = {
-                'title': result.title,
-                'text': result.text,
-                'username': result.username,
-                'url': result.url,
-                'likes': 0,  # Selenium에서는 좋아요 수를 가져오지 않음
-                'date': None,  # Selenium에서는 날짜를 가져오지 않음
-                'media_count': 1,
-                'is_video': result.text == "동영상콘텐츠"
-            }
-            results.append(post_data)
-        else:
-            # 실패한 경우
-            failed_urls.append({
-                'title': result.title,
-                'url': result.url,
-                'error': result.error_message
-            })
+    ordered = getattr(args, "ordered", False)
+
+    with ExitStack() as stack:
+        # --parse-workers 지정 시 파싱은 프로세스 풀에서 수행
+        post_processor = None
+        parse_workers = getattr(args, "parse_workers", 0)
+        if parse_workers > 1:
+            from .postprocess import ParallelPostProcessor
+
+            print(f"🧮 파싱 프로세스 수: {parse_workers}")
+            post_processor = stack.enter_context(ParallelPostProcessor(workers=parse_workers))
+
+        # 완료되는 대로 결과를 공통 레코드로 변환
+        selenium_results = selenium_extractor.iter_extract(
+            urls_with_titles, ordered=ordered, post_processor=post_processor
+        )
+        for i, result in enumerate(selenium_results, 1):
+            if result.success:
+                # 성공한 경우 공통 레코드로 변환
+                record = result.to_record()
+                results.append(record)
+                if store is not None:
+                    store.upsert(record)
+                if archive is not None:
+                    archive.append(record)
+                if columnar is not None:
+                    columnar.write(record)
+                status = "✅ 성공"
+            else:
+                # 실패한 경우
+                failed_urls.append({
+                    'title': result.title,
+                    'url': result.url,
+                    'error': result.error_message
+                })
+                status = f"❌ 실패: {result.error_message}"
+            print(f"  {_progress_label(i, total_count)} {result.title[:30]}... - {status}")
     
     # 결과 요약
     print("\n" + "=" * 60)
@@ -560,7 +754,7 @@ def get_url_interactively() -> Optional[str]:
 
 
 def process_single_url(
-    extractor: InstagramTextExtractor, url: str, args: argparse.Namespace
+    extractor: "InstagramTextExtractor", url: str, args: argparse.Namespace
 ) -> bool:
     """단일 URL 처리
 
@@ -572,7 +766,7 @@ def process_single_url(
         if not args.quiet:
             print("📥 게시물 정보를 가져오는 중...")
 
-        post_data = extractor.get_post_text(url, "미정", args.max_retries, args.retry_delay)
+        post_data = extractor.get_post_text(url, "미정", args.max_retries, args.retry_delay, _selected_fields(args))
 
         # 콘솔 출력
         if not args.quiet:
@@ -587,7 +781,7 @@ def process_single_url(
             if args.output:
                 filename = f"{args.output}.{args.save}"
 
-            file_path = save_to_file(post_data, filename, args.save)
+            file_path = save_to_file(post_data, filename, args.save, _selected_fields(args))
             if not args.quiet:
                 print_success_message(f"결과를 {file_path}에 저장했습니다.")
 
@@ -609,6 +803,8 @@ def process_single_url(
 
 def interactive_mode():
     """대화형 모드"""
+    from .extractor import InstagramTextExtractor
+
     extractor = InstagramTextExtractor()
 
     while True:
@@ -654,55 +850,176 @@ def interactive_mode():
 
 def main():
     """메인 함수"""
+    # 저장소 관리 명령 (python -m src export ... 등)
+    from .commands import run_command
+
+    exit_code = run_command(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
     args = parse_arguments()
 
+    # 필드 선택 값 검증 (URL마다 실패하지 않도록 미리 확인)
+    try:
+        _selected_fields(args)
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        sys.exit(1)
+    if args.dedup is not None and not 0 < args.dedup <= 1:
+        print(f"❌ 유사도 기준은 0보다 크고 1 이하여야 합니다: {args.dedup}")
+        sys.exit(1)
+
     # 간편 배치 모드 (--batch)
     if args.batch:
-        # 기본값 자동 설정
+        # 기본값 자동 설정 (--save parquet/arrow는 유지)
         args.batch_file = args.batch
         args.metadata = True
-        args.save = 'json'
+        if args.save not in COLUMNAR_FORMATS:
+            args.save = 'json'
         args.combined_output = True
 
         print("🚀 간편 배치 모드 실행")
-        print("✅ 자동 설정: metadata=True, save=json, combined_output=True")
+        print(f"✅ 자동 설정: metadata=True, save={args.save}, combined_output=True")
         print("")
 
+    # 열 형식은 배치 통합 파일로만 저장 (게시물 하나짜리 Parquet/Arrow 파일은 만들지 않음)
+    if args.save in COLUMNAR_FORMATS and not (args.batch_file and args.combined_output):
+        print(f"❌ --save {args.save}는 배치 통합 저장(--batch 또는 --batch-file과 --combined-output)에서만 사용할 수 있습니다.")
+        sys.exit(1)
+
     # 배치 파일 처리 모드
     if args.batch_file:
         try:
-            # 제목과 URL 목록 파일 읽기 (항상 제목 포함 모드 사용)
-            urls_with_titles = read_urls_with_titles_from_file(args.batch_file)
-            print(f"📂 파일에서 {len(urls_with_titles)}개 URL을 읽었습니다: {args.batch_file}")
-
-            # Selenium 모드 사용 여부 확인
-            if args.use_selenium:
-                # Selenium 추출기 생성
-                selenium_extractor = SeleniumInstagramExtractor(
-                    headless=args.headless,
-                    max_workers=args.selenium_workers
-                )
-                print(f"🔧 Selenium WebDriver 모드 사용")
-                
-                # Selenium 배치 처리 실행
-                results = process_batch_urls_with_selenium(selenium_extractor, urls_with_titles, args)
-            else:
-                # 기존 instaloader 방식
-                extractor = InstagramTextExtractor()
-                print(f"🔧 Instaloader 모드 사용")
-                
-                # 기존 배치 처리 실행
-                results = process_batch_urls_with_titles(extractor, urls_with_titles, args)
+            if args.batch_file != "-" and not os.path.exists(args.batch_file):
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {args.batch_file}")
+
+            # 제목과 URL 목록을 한 줄씩 읽기 (항상 제목 포함 모드, shortcode 기준 중복 제거)
+            read_stats = UrlReadStats()
+            urls_with_titles = iter_urls_with_titles(args.batch_file, stats=read_stats)
+            print(f"📂 URL 목록 읽기: {args.batch_file}")
+
+            # 저장소/결과 로그/열 형식 파일은 예외나 Ctrl-C로 중단되어도 닫히도록 ExitStack에 등록
+            # (열 형식 파일은 예외 시 임시 파일을 지우고, 결과 로그 인덱스는 항상 갱신)
+            with ExitStack() as stack:
+                # 결과 저장소 (--store)
+                store = None
+                if args.store:
+                    from .store import ResultStore
+
+                    store = stack.enter_context(ResultStore(args.store))
+                    print(f"🗄️ 결과 저장소: {args.store}")
+
+                # 추가 전용 결과 로그 (--archive)
+                archive = None
+                if args.skip_archived and not args.archive:
+                    args.archive = "outputs/results.jsonl"
+                if args.archive:
+                    from .archive import ResultLog, ShortcodeIndex
+
+                    archive_index = stack.enter_context(ShortcodeIndex(args.archive))
+                    archive_index.update()
+                    print(f"📚 결과 로그: {args.archive} (보관된 게시물 {len(archive_index)}개)")
+
+                    def update_archive_index(index: "ShortcodeIndex" = archive_index) -> None:
+                        added = index.update()
+                        print(f"📚 결과 로그 인덱스 갱신: {added}줄 추가, 게시물 {len(index)}개")
+
+                    # 로그를 닫은 뒤 인덱스를 갱신하고 닫음 (ExitStack은 등록 역순으로 정리)
+                    stack.callback(update_archive_index)
+                    archive = stack.enter_context(ResultLog(args.archive))
+                    if args.skip_archived:
+                        urls_with_titles = _skip_archived(urls_with_titles, archive_index, read_stats, _selected_fields(args))
+
+                # 열 형식 통합 파일 (--save parquet/arrow): 결과가 나오는 대로 행 그룹 단위로 기록
+                # (--dedup은 전체 결과가 필요하므로 처리가 끝난 뒤 한 번에 저장)
+                columnar = None
+                if args.save in COLUMNAR_FORMATS and args.dedup is None:
+                    from .columnar import ColumnarWriter
+
+                    try:
+                        columnar = stack.enter_context(
+                            ColumnarWriter(combined_file_path(args.save, args.simple), args.save, _selected_fields(args))
+                        )
+                    except RuntimeError as e:
+                        raise ValueError(str(e))
+
+                # 브라우저 백엔드 선택
+                if args.use_playwright:
+                    # Playwright 추출기 생성 (브라우저 1개, 다중 컨텍스트)
+                    from .playwright_extractor import PlaywrightInstagramExtractor
+
+                    playwright_extractor = PlaywrightInstagramExtractor(
+                        headless=args.headless,
+                        max_contexts=args.browser_contexts,
+                        page_timeout=args.page_timeout,
+                        url_timeout=args.url_timeout,
+                    )
+                    print("🔧 Playwright 모드 사용")
+
+                    # 결과 처리는 Selenium 배치와 동일 (같은 ExtractResult 계약)
+                    results = process_batch_urls_with_selenium(playwright_extractor, urls_with_titles, args, store, archive, columnar)
+                elif args.use_selenium:
+                    # Selenium 추출기 생성
+                    from .selenium_extractor import SeleniumInstagramExtractor
+
+                    selenium_extractor = SeleniumInstagramExtractor(
+                        headless=args.headless,
+                        max_workers=args.selenium_workers,
+                        driver_path=args.driver_path,
+                        offline=args.offline,
+                        page_timeout=args.page_timeout,
+                        url_timeout=args.url_timeout,
+                    )
+                    print("🔧 Selenium WebDriver 모드 사용")
+
+                    with selenium_extractor:
+                        # 브라우저 사전 실행 (warm start)
+                        if args.warm_start:
+                            launched = selenium_extractor.warm_up(args.selenium_workers)
+                            print(f"🔥 브라우저 {launched}개 사전 실행 완료")
+
+                        # Selenium 배치 처리 실행
+                        results = process_batch_urls_with_selenium(selenium_extractor, urls_with_titles, args, store, archive, columnar)
+                else:
+                    # 기존 instaloader 방식
+                    from .extractor import InstagramTextExtractor
+
+                    extractor = InstagramTextExtractor(_transport_config(args))
+                    print("🔧 Instaloader 모드 사용")
+
+                    # 기존 배치 처리 실행
+                    results = process_batch_urls_with_titles(extractor, urls_with_titles, args, store, archive, columnar)
+                    print(f"🔌 HTTP 연결: {extractor.connection_metrics().summary()}")
+
+                if store is not None:
+                    print(f"🗄️ 저장소 게시물 수: {len(store)}개 (내보내기: python -m src export)")
+
+            if columnar is not None:
+                print(f"📄 통합 결과 저장: {columnar.path} ({columnar.count}개, 행 그룹 {columnar.row_groups}개)")
 
             # 통합 결과 저장
-            if args.combined_output and results:
+            if args.combined_output and results and columnar is None:
+                combined_results = results
+                if args.dedup is not None:
+                    # 다시 올린 게시물 등 캡션이 거의 같은 게시물은 처음 것만 남김
+                    from .dedup import find_near_duplicates
+
+                    dedup = find_near_duplicates(results, args.dedup)
+                    combined_results = dedup.unique
+                    print(f"♻️ 유사 중복 제외: {dedup.duplicate_count}개 ({len(dedup.groups)}개 그룹)")
+
                 output_format = args.save or 'txt'
-                combined_file = save_combined_results(results, output_format, args.simple)
+                combined_file = save_combined_results(
+                    combined_results, output_format, args.simple, _selected_fields(args)
+                )
                 print(f"📄 통합 결과 저장: {combined_file}")
 
-            # 성공률에 따른 종료 코드
-            total_urls = len(urls_with_titles)
-            success_rate = len(results) / total_urls if total_urls else 0
+            if not read_stats.accepted:
+                raise ValueError("유효한 URL이 없습니다.")
+
+            # 성공률에 따른 종료 코드 (이미 보관되어 건너뛴 URL은 제외, 가져올 URL이 없었으면 정상 종료)
+            total_urls = read_stats.accepted - read_stats.archived
+            success_rate = len(results) / total_urls if total_urls else 1
             exit_code = 0 if success_rate >= 0.5 else 1  # 50% 이상 성공시 정상 종료
             sys.exit(exit_code)
 
@@ -717,7 +1034,9 @@ def main():
 
     # 명령줄 모드 (단일 URL)
     else:
-        extractor = InstagramTextExtractor()
+        from .extractor import InstagramTextExtractor
+
+        extractor = InstagramTextExtractor(_transport_config(args))
         success = process_single_url(extractor, args.url, args)
         sys.exit(0 if success else 1)
 
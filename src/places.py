@@ -0,0 +1,431 @@
+"""
+캡션 장소명 추출 모듈
+
+지명 사전(gazetteer)에 있는 장소명과 별칭 수천 개를 Aho-Corasick 오토마톤 하나로
+만들어, 캡션마다 한 번의 선형 탐색으로 모든 장소를 찾는다. 사전 크기와 관계없이
+캡션 길이에만 비례하므로 보관된 게시물 전체를 몇 초 안에 훑을 수 있다.
+
+오토마톤은 사전 파일의 해시와 함께 디스크에 캐시해 두고, 사전이 바뀌었을 때만
+다시 만든다. 추출 결과는 generate_google_maps_csv.py가 읽는 locations 형식
+(mock_locations.json)으로 저장한다.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .caption import normalize_compat
+from .url_reader import canonicalize_url
+
+DEFAULT_GAZETTEER_PATH = "gazetteer.json"
+DEFAULT_CACHE_PATH = "outputs/gazetteer.automaton"
+DEFAULT_OUTPUT_PATH = "outputs/locations.json"
+
+# 장소명으로 쓰기엔 너무 짧은 패턴 (공백 제거 후 글자 수)
+MIN_PATTERN_LENGTH = 2
+# 문맥 스니펫에 포함할 장소명 앞뒤 글자 수
+SNIPPET_CHARS = 40
+
+_CACHE_VERSION = 1
+_WHITESPACE = re.compile(r"\s+")
+# 장소명 중간에 끼어도 무시하는 공백 문자 (normalize_compat이 전각 공백 등은 일반 공백으로 바꿈)
+_SPACES = " \t\n\r\x0b\x0c"
+# 영문 대소문자만 바꾸는 변환표 (lower()가 글자 수를 바꾸는 드문 텍스트용)
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _is_ascii_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _lower(text: str) -> str:
+    """소문자 변환 (원문 위치를 그대로 쓸 수 있도록 글자 수는 유지)"""
+    lowered = text.lower()
+    return lowered if len(lowered) == len(text) else text.translate(_ASCII_LOWER)
+
+
+def normalize_place(text: str) -> str:
+    """장소명 비교용 정규화 (호환 문자 NFKC, 소문자, 공백 제거)
+
+    '시부야 스크램블 교차로'와 '#시부야스크램블교차로', 'ＧＩＮＺＡ'와 'ginza'가 같아진다.
+
+    Args:
+        text (str): 장소명 또는 캡션
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    return _lower(_WHITESPACE.sub("", normalize_compat(text)))
+
+
+class PlaceAutomaton:
+    """Aho-Corasick 다중 패턴 오토마톤
+
+    상태마다 다음 글자 -> 상태 dict, 실패 링크, 그 상태에서 끝나는 패턴 번호
+    (실패 링크로 이어지는 패턴 포함)를 리스트로 가진다. 루트가 아닌 상태는 공백에서
+    제자리에 머무르므로 '시부야 스크램블'과 '시부야스크램블'이 같은 패턴에 걸린다.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        오토마톤 구축
+
+        Args:
+            patterns (Sequence[str]): 정규화된 패턴 목록 (번호는 목록 순서)
+        """
+        self.lengths = [len(pattern) for pattern in patterns]
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for number, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(number)
+
+        # 너비 우선으로 실패 링크를 만들고, 실패 상태의 출력을 합쳐 둔다
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                failure = fail[state]
+                while failure and char not in goto[failure]:
+                    failure = fail[failure]
+                fail[next_state] = goto[failure].get(char, 0)
+                output[next_state].extend(output[fail[next_state]])
+        # 공백에서는 제자리로 (출력이 있는 상태는 같은 출현을 다시 내보내지 않도록
+        # 전이 dict를 공유하고 출력만 없는 복제 상태로)
+        for state in range(1, len(goto)):
+            target = state
+            if output[state]:
+                target = len(goto)
+                goto.append(goto[state])
+                fail.append(fail[state])
+                output.append([])
+            goto[state].update(dict.fromkeys(_SPACES, target))
+
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(numbers) for numbers in output]
+        # 루트에서 출발할 수 있는 글자 (그 외 글자는 정규식으로 한 번에 건너뜀)
+        first = "".join(sorted(goto[0]))
+        self._first = re.compile(f"[{re.escape(first)}]") if first else None
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """텍스트에서 모든 패턴 출현 찾기 (겹치는 출현 포함)
+
+        Args:
+            text (str): 소문자로 바꾼 텍스트 (공백은 그대로 두어도 됨)
+
+        Yields:
+            Tuple[int, int, int]: (시작 위치, 끝 위치(포함하지 않음), 패턴 번호)
+        """
+        if self._first is None:
+            return
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self.lengths
+        search = self._first.search
+        state = 0
+        position = 0
+        length = len(text)
+        while position < length:
+            if not state:
+                match = search(text, position)
+                if match is None:
+                    return
+                position = match.start()
+            char = text[position]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            position += 1
+            for number in output[state]:
+                # 중간 공백을 건너뛰며 패턴 길이만큼 거슬러 올라간 위치가 시작
+                start = position
+                remaining = lengths[number]
+                while remaining:
+                    start -= 1
+                    if text[start] not in _SPACES:
+                        remaining -= 1
+                yield start, position, number
+
+    def save(self, path: str, digest: str) -> None:
+        """오토마톤을 캐시 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path (str): 캐시 파일 경로
+            digest (str): 오토마톤을 만든 사전의 해시
+        """
+        directory = os.path.dirname(path) or "."
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        state = {
+            "version": _CACHE_VERSION,
+            "digest": digest,
+            "lengths": self.lengths,
+            "goto": self._goto,
+            "fail": self._fail,
+            "output": self._output,
+        }
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".automaton")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str, digest: str) -> Optional["PlaceAutomaton"]:
+        """캐시 파일에서 오토마톤 불러오기
+
+        Args:
+            path (str): 캐시 파일 경로
+            digest (str): 현재 사전의 해시
+
+        Returns:
+            Optional[PlaceAutomaton]: 오토마톤 (파일이 없거나, 깨졌거나, 다른 사전으로 만든 경우 None)
+        """
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != _CACHE_VERSION or state.get("digest") != digest:
+            return None
+
+        automaton = cls.__new__(cls)
+        automaton.lengths = state["lengths"]
+        automaton._goto = state["goto"]
+        automaton._fail = state["fail"]
+        automaton._output = state["output"]
+        first = "".join(sorted(automaton._goto[0]))
+        automaton._first = re.compile(f"[{re.escape(first)}]") if first else None
+        return automaton
+
+
+@dataclass
+class PlaceMention:
+    """캡션 속 장소 출현"""
+    # 사전의 장소 번호
+    place: int
+    # 원문(호환 문자를 정규화한 캡션)에서의 위치
+    start: int
+    end: int
+    snippet: str
+
+
+class Gazetteer:
+    """지명 사전과 Aho-Corasick 오토마톤"""
+
+    def __init__(self, places: List[Dict[str, Any]], automaton: Optional[PlaceAutomaton] = None):
+        """
+        초기화
+
+        Args:
+            places (List[Dict[str, Any]]): 장소 목록 (name, name_en, aliases, address, category 등)
+            automaton (Optional[PlaceAutomaton]): 미리 만든 오토마톤 (None이면 새로 구축)
+        """
+        self.places = places
+        # 패턴 번호 -> (장소 번호, 패턴이 영문/숫자로 시작하는지, 끝나는지)
+        self._targets: List[Tuple[int, bool, bool]] = []
+        patterns: List[str] = []
+        seen = set()
+        for number, place in enumerate(places):
+            names = [place.get("name"), place.get("name_en"), *place.get("aliases", ())]
+            for name in names:
+                pattern = normalize_place(name or "")
+                # 여러 장소에 같은 별칭이 있으면 먼저 나온 장소로
+                if len(pattern) < MIN_PATTERN_LENGTH or pattern in seen:
+                    continue
+                seen.add(pattern)
+                patterns.append(pattern)
+                self._targets.append((number, _is_ascii_alnum(pattern[0]), _is_ascii_alnum(pattern[-1])))
+        self.pattern_count = len(patterns)
+        self.automaton = automaton if automaton is not None else PlaceAutomaton(patterns)
+
+    @staticmethod
+    def read(path: str = DEFAULT_GAZETTEER_PATH) -> Tuple[List[Dict[str, Any]], str]:
+        """사전 파일 읽기 ({"places": [...]} 또는 locations 형식의 {"locations": [...]})
+
+        Args:
+            path (str): 사전 JSON 파일 경로
+
+        Returns:
+            Tuple[List[Dict[str, Any]], str]: (장소 목록, 파일 내용의 SHA-256)
+
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+            ValueError: JSON 형식이 잘못된 경우
+        """
+        with open(path, "rb") as f:
+            content = f.read()
+        data = json.loads(content)
+        places = data.get("places", data.get("locations")) if isinstance(data, dict) else data
+        if not isinstance(places, list):
+            raise ValueError(f"장소 목록(places)이 없는 사전입니다: {path}")
+        return [place for place in places if isinstance(place, dict)], hashlib.sha256(content).hexdigest()
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_GAZETTEER_PATH, cache_path: Optional[str] = DEFAULT_CACHE_PATH) -> "Gazetteer":
+        """사전을 읽고 캐시된 오토마톤 불러오기 (없거나 사전이 바뀌었으면 구축 후 캐시)
+
+        Args:
+            path (str): 사전 JSON 파일 경로
+            cache_path (Optional[str]): 오토마톤 캐시 경로 (None이면 캐시하지 않음)
+
+        Returns:
+            Gazetteer: 불러온 사전
+
+        Raises:
+            OSError: 사전 파일을 읽을 수 없는 경우
+            ValueError: 사전 JSON 형식이 잘못된 경우
+        """
+        places, digest = cls.read(path)
+        automaton = PlaceAutomaton.load(cache_path, digest) if cache_path else None
+        gazetteer = cls(places, automaton)
+        if cache_path and automaton is None:
+            gazetteer.automaton.save(cache_path, digest)
+        return gazetteer
+
+    def find(self, text: str, snippet_chars: int = SNIPPET_CHARS) -> List[PlaceMention]:
+        """캡션에서 장소 찾기
+
+        겹치는 출현은 먼저 시작하고 더 긴 것을 남긴다 ('시부야 스크램블 교차로' 안의
+        '시부야'는 따로 세지 않음). 영문/숫자로 된 장소명은 앞뒤가 영문/숫자이면
+        단어 일부로 보고 제외한다 ('region' 안의 'gion' 등).
+
+        Args:
+            text (str): 원본 캡션
+            snippet_chars (int): 스니펫에 포함할 앞뒤 글자 수
+
+        Returns:
+            List[PlaceMention]: 캡션 순서대로의 장소 출현
+        """
+        if not text:
+            return []
+        original = normalize_compat(text)
+        found = sorted(self.automaton.iter_matches(_lower(original)), key=lambda match: (match[0], -match[1]))
+
+        mentions: List[PlaceMention] = []
+        covered = 0
+        for start, end, number in found:
+            if start < covered:
+                continue
+            place, ascii_start, ascii_end = self._targets[number]
+            if ascii_start and start > 0 and _is_ascii_alnum(original[start - 1]):
+                continue
+            if ascii_end and end < len(original) and _is_ascii_alnum(original[end]):
+                continue
+            covered = end
+            mentions.append(PlaceMention(place, start, end, _snippet(original, start, end, snippet_chars)))
+        return mentions
+
+
+def _snippet(text: str, start: int, end: int, chars: int) -> str:
+    left = max(0, start - chars)
+    right = min(len(text), end + chars)
+    snippet = _WHITESPACE.sub(" ", text[left:right]).strip()
+    return ("…" if left else "") + snippet + ("…" if right < len(text) else "")
+
+
+@dataclass
+class PlaceSummary:
+    """장소별 언급 게시물 집계"""
+    place: Dict[str, Any]
+    # (게시물 URL, 좋아요 수, 스니펫), 좋아요 내림차순
+    posts: List[Tuple[str, int, str]] = field(default_factory=list)
+
+    def to_location(self) -> Dict[str, Any]:
+        """locations 형식 항목 (website/likes/description은 좋아요가 가장 많은 게시물 기준)"""
+        url, likes, snippet = self.posts[0]
+        location = {
+            "name": self.place.get("name") or self.place.get("name_en", ""),
+            "name_en": self.place.get("name_en", ""),
+            "address": self.place.get("address", ""),
+            "description": snippet,
+            "category": self.place.get("category", ""),
+            "website": url,
+            "likes": likes,
+        }
+        for key in ("rating", "price_range"):
+            if key in self.place:
+                location[key] = self.place[key]
+        location["mentions"] = len(self.posts)
+        location["posts"] = [{"url": url, "likes": likes, "snippet": snippet} for url, likes, snippet in self.posts]
+        return location
+
+
+def extract_locations(posts: Iterable[Mapping], gazetteer: Gazetteer) -> List[PlaceSummary]:
+    """게시물 캡션에서 장소를 찾아 장소별로 집계
+
+    같은 게시물(shortcode)이 여러 번 나오면 좋아요 수가 가장 큰 것 하나만 센다.
+
+    Args:
+        posts (Iterable[Mapping]): PostRecord 또는 게시물 dict 목록 (제너레이터 가능)
+        gazetteer (Gazetteer): 지명 사전
+
+    Returns:
+        List[PlaceSummary]: 언급 게시물 수, 최대 좋아요 수 내림차순
+    """
+    # 게시물 키 -> 장소 번호 -> (URL, 좋아요, 스니펫)
+    found: Dict[Any, Dict[int, Tuple[str, int, str]]] = {}
+    for position, post_data in enumerate(posts):
+        mentions = gazetteer.find(post_data.get("text") or "")
+        if not mentions:
+            continue
+        url = post_data.get("url") or ""
+        canonical = canonicalize_url(url)
+        key = canonical[0] if canonical else ("position", position)
+        likes = post_data.get("likes") or 0
+        post_places = found.setdefault(key, {})
+        for mention in mentions:
+            previous = post_places.get(mention.place)
+            if previous is None or likes > previous[1]:
+                post_places[mention.place] = (url, likes, mention.snippet)
+
+    summaries: Dict[int, PlaceSummary] = {}
+    for post_places in found.values():
+        for place, post in post_places.items():
+            summary = summaries.get(place)
+            if summary is None:
+                summary = summaries[place] = PlaceSummary(gazetteer.places[place])
+            summary.posts.append(post)
+    for summary in summaries.values():
+        summary.posts.sort(key=lambda post: post[1], reverse=True)
+    return sorted(summaries.values(), key=lambda summary: (len(summary.posts), summary.posts[0][1]), reverse=True)
+
+
+def save_locations(summaries: Iterable[PlaceSummary], path: str = DEFAULT_OUTPUT_PATH) -> str:
+    """장소 집계를 locations 형식 JSON으로 저장
+
+    Args:
+        summaries (Iterable[PlaceSummary]): 장소 집계
+        path (str): 저장할 파일 경로
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"locations": [summary.to_location() for summary in summaries]}, f, ensure_ascii=False, indent=2)
+    return path
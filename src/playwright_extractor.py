@@ -0,0 +1,406 @@
+"""
+Playwright 기반 Instagram 게시물 텍스트 추출 모듈
+
+브라우저 프로세스 하나에 URL마다 가벼운 격리 컨텍스트를 만들어 asyncio로
+동시에 로드한다. Chrome 프로세스를 스레드마다 띄우는 Selenium 백엔드보다
+메모리 사용량이 훨씬 적어 같은 장비에서 더 많은 페이지를 동시에 처리할 수 있다.
+
+playwright는 선택 의존성이다 (pip install playwright && playwright install chromium).
+"""
+
+import asyncio
+import queue
+import random
+import threading
+from collections import deque
+from contextlib import aclosing
+from itertools import chain
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from .browser import (
+    DEFAULT_MAX_REQUEUES,
+    DEFAULT_PAGE_TIMEOUT,
+    DEFAULT_URL_TIMEOUT,
+    USER_AGENTS,
+    ExtractResult,
+    parse_indexed_results,
+    reorder_results,
+)
+from .postprocess import ParallelPostProcessor, RawPayload, parse_payload
+from .url_reader import canonicalize_url
+
+
+# 브라우저 하나에서 동시에 여는 기본 컨텍스트 수
+DEFAULT_BROWSER_CONTEXTS = 20
+
+# 본문 추출에 필요 없어 요청을 차단하는 리소스 종류
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+
+async def _block_heavy_resources(route: Any) -> None:
+    """이미지/동영상/폰트/스타일 요청 차단"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class PlaywrightInstagramExtractor:
+    """Playwright 기반 Instagram 게시물 텍스트 추출기 (브라우저 1개, 다중 컨텍스트)"""
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_contexts: int = DEFAULT_BROWSER_CONTEXTS,
+        page_timeout: float = DEFAULT_PAGE_TIMEOUT,
+        url_timeout: float = DEFAULT_URL_TIMEOUT,
+        max_requeues: int = DEFAULT_MAX_REQUEUES,
+    ):
+        """
+        초기화
+
+        Args:
+            headless (bool): 헤드리스 모드 사용 여부
+            max_contexts (int): 동시에 페이지를 로드하는 브라우저 컨텍스트 수
+            page_timeout (float): 페이지 로드 제한 시간 (초)
+            url_timeout (float): URL 하나의 전체 처리 제한 시간 (초)
+            max_requeues (int): 시간 초과/브라우저 중단 URL을 배치 끝에서 다시 시도하는 횟수
+        """
+        self.headless = headless
+        self.max_contexts = max_contexts
+        self.page_timeout = page_timeout
+        self.url_timeout = url_timeout
+        self.max_requeues = max_requeues
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        # start() 시 playwright의 TimeoutError로 교체
+        self._timeout_error: Type[BaseException] = asyncio.TimeoutError
+
+    async def start(self) -> None:
+        """Playwright 및 브라우저 프로세스 시작
+
+        Raises:
+            RuntimeError: playwright가 설치되지 않은 경우
+        """
+        if self._playwright is not None:
+            return
+
+        try:
+            from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise RuntimeError(
+                "playwright가 설치되지 않았습니다. "
+                "'pip install playwright && playwright install chromium'으로 설치하세요."
+            )
+
+        self._timeout_error = PlaywrightTimeoutError
+        self._launch_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_contexts)
+        self._playwright = await async_playwright().start()
+        await self._ensure_browser()
+
+    async def _ensure_browser(self) -> Any:
+        """실행 중인 브라우저 반환 (중단된 경우 다시 실행)"""
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless,
+                    args=[
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-extensions",
+                    ],
+                )
+            return self._browser
+
+    async def close(self) -> None:
+        """브라우저 및 Playwright 종료"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "PlaywrightInstagramExtractor":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def validate_url(self, url: str) -> bool:
+        """Instagram URL 유효성 검증"""
+        return canonicalize_url(url) is not None
+
+    async def _load_page(self, url: str) -> str:
+        """새 컨텍스트에서 페이지를 로드하고 HTML 반환 (컨텍스트는 항상 닫음)"""
+        browser = await self._ensure_browser()
+        context = await browser.new_context(
+            user_agent=random.choice(USER_AGENTS),
+            java_script_enabled=False,
+        )
+        try:
+            await context.route("**/*", _block_heavy_resources)
+            page = await context.new_page()
+            await page.goto(
+                url, wait_until="domcontentloaded", timeout=self.page_timeout * 1000
+            )
+            return await page.content()
+        finally:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    async def fetch_single_url(self, url: str, title: str = "미정") -> Union[RawPayload, ExtractResult]:
+        """단일 URL의 페이지 소스 수집
+
+        Returns:
+            Union[RawPayload, ExtractResult]: 페이지 소스, 실패 시 실패한 ExtractResult
+        """
+        if not self.validate_url(url):
+            return ExtractResult.failure(title, url, "유효하지 않은 Instagram URL")
+
+        async with self._slots:
+            try:
+                html = await asyncio.wait_for(self._load_page(url), self.url_timeout)
+                return RawPayload(title=title, url=url, kind="html", body=html)
+
+            except asyncio.TimeoutError:
+                message = f"URL 처리 시간 초과 ({self.url_timeout:g}초)"
+                return ExtractResult.failure(title, url, message, retryable=True)
+
+            except Exception as e:
+                if isinstance(e, self._timeout_error):
+                    message = f"페이지 로드 시간 초과 ({self.page_timeout:g}초)"
+                    return ExtractResult.failure(title, url, message, retryable=True)
+                if self._browser is None or not self._browser.is_connected():
+                    # 다음 작업에서 _ensure_browser()가 브라우저를 다시 실행함
+                    return ExtractResult.failure(title, url, f"브라우저 중단: {str(e)}", retryable=True)
+                return ExtractResult.failure(title, url, f"페이지 수집 실패: {str(e)}")
+
+    async def extract_single_url(self, url: str, title: str = "미정") -> ExtractResult:
+        """단일 URL에서 텍스트 추출"""
+        outcome = await self.fetch_single_url(url, title)
+        if isinstance(outcome, ExtractResult):
+            return outcome
+        return ExtractResult.from_parsed(parse_payload(outcome))
+
+    async def _aiter_indexed(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        window: Optional[int] = None,
+        fetch_only: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """작업을 제한된 개수만 실행하며 완료 순서대로 (입력 순번, 결과) 반환
+
+        동시에 실행되는 작업은 max_contexts * 2개로 제한된다 (실제 페이지 로드는
+        max_contexts개). window와 재시도 순서는 SeleniumInstagramExtractor._iter_indexed()와
+        같다 (재시도 URL은 남은 입력 뒤에 실행하되, window에 걸리면 먼저 실행).
+        """
+        task = self.fetch_single_url if fetch_only else self.extract_single_url
+        source = iter(url_data)
+        max_in_flight = self.max_contexts * 2
+        pending: Dict[asyncio.Task, Tuple[int, str, str, int]] = {}
+        requeued: Deque[Tuple[int, str, str, int]] = deque()
+        next_index = 0
+        exhausted = False
+
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    blocked = exhausted
+                    if not blocked and window is not None and (pending or requeued):
+                        frontier = min(entry[0] for entry in chain(pending.values(), requeued))
+                        blocked = next_index - frontier >= window
+                    if not blocked:
+                        try:
+                            title, url = next(source)
+                        except StopIteration:
+                            exhausted = True
+                            continue
+                        pending[asyncio.ensure_future(task(url, title))] = (next_index, title, url, 0)
+                        next_index += 1
+                    elif requeued:
+                        index, title, url, attempt = requeued.popleft()
+                        pending[asyncio.ensure_future(task(url, title))] = (index, title, url, attempt)
+                    else:
+                        break
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index, title, url, attempt = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = ExtractResult.failure(title, url, f"처리 중 예외 발생: {str(e)}")
+
+                    if getattr(result, "retryable", False) and attempt < self.max_requeues:
+                        print(f"  🔁 {title[:30]}... - 재시도 예약: {result.error_message}")
+                        requeued.append((index, title, url, attempt + 1))
+                        continue
+
+                    yield index, result
+        finally:
+            # 반복을 중간에 멈춘 경우 실행 중인 페이지 로드 취소
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aiter_extract(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        ordered: bool = False,
+        reorder_window: Optional[int] = None,
+    ) -> AsyncIterator[ExtractResult]:
+        """
+        여러 URL에서 텍스트를 추출하며 완료되는 대로 결과 반환 (start() 이후 호출)
+
+        Args:
+            url_data: (title, url) 튜플의 iterable
+            ordered (bool): True면 입력 순서대로 결과 반환
+            reorder_window (Optional[int]): 순서 복원 시 앞서 처리할 수 있는 최대 URL 수
+                (기본값: max_contexts * 4)
+
+        Yields:
+            ExtractResult: 추출 결과
+        """
+        window = (reorder_window or self.max_contexts * 4) if ordered else None
+        buffer: Dict[int, ExtractResult] = {}
+        next_index = 0
+
+        async with aclosing(self._aiter_indexed(url_data, window)) as indexed:
+            async for index, result in indexed:
+                if not ordered:
+                    yield result
+                    continue
+                buffer[index] = result
+                while next_index in buffer:
+                    yield buffer.pop(next_index)
+                    next_index += 1
+
+    def iter_extract(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        ordered: bool = False,
+        reorder_window: Optional[int] = None,
+        post_processor: Optional[ParallelPostProcessor] = None,
+    ) -> Iterator[ExtractResult]:
+        """
+        동기 코드용 스트리밍 추출 (별도 스레드의 이벤트 루프에서 브라우저 실행)
+
+        SeleniumInstagramExtractor.iter_extract()와 같은 인터페이스를 제공한다.
+
+        Args:
+            url_data: (title, url) 튜플의 iterable
+            ordered (bool): True면 입력 순서대로 결과 반환
+            reorder_window (Optional[int]): 순서 복원 시 앞서 처리할 수 있는 최대 URL 수
+            post_processor: 지정하면 페이지 소스 파싱을 프로세스 풀에서 수행
+
+        Yields:
+            ExtractResult: 추출 결과
+        """
+        window = (reorder_window or self.max_contexts * 4) if ordered else None
+        outcomes: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_contexts)
+        finished = object()
+        stop = threading.Event()
+
+        async def produce() -> None:
+            loop = asyncio.get_running_loop()
+            async with self:
+                indexed = self._aiter_indexed(url_data, window, fetch_only=post_processor is not None)
+                async with aclosing(indexed):
+                    async for item in indexed:
+                        # 소비자가 느리면 이벤트 루프를 막지 않고 대기
+                        await loop.run_in_executor(None, outcomes.put, item)
+                        if stop.is_set():
+                            return
+
+        def run() -> None:
+            outcome: Any = finished
+            try:
+                asyncio.run(produce())
+            except Exception as e:
+                outcome = e
+            outcomes.put(outcome)
+
+        producer = threading.Thread(target=run, name="playwright-loop", daemon=True)
+        producer.start()
+
+        def received() -> Iterator[Tuple[int, Any]]:
+            while True:
+                item = outcomes.get()
+                if item is finished:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        try:
+            stream = received()
+            if post_processor is not None:
+                stream = parse_indexed_results(stream, post_processor)
+            if ordered:
+                stream = reorder_results(stream)
+
+            for _, result in stream:
+                yield result
+        finally:
+            # 중간에 멈춘 경우 생산 스레드가 큐에서 막히지 않도록 비우면서 종료 대기
+            stop.set()
+            while producer.is_alive():
+                try:
+                    outcomes.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            # 후처리기 입력 스레드가 아직 큐를 기다리고 있으면 끝나도록 종료 표시를 남김
+            while True:
+                try:
+                    outcomes.put_nowait(finished)
+                    break
+                except queue.Full:
+                    try:
+                        outcomes.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def batch_extract(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        post_processor: Optional[ParallelPostProcessor] = None,
+    ) -> List[ExtractResult]:
+        """
+        배치 처리로 여러 URL에서 텍스트 추출 (iter_extract() 결과를 모두 모아 반환)
+
+        Args:
+            url_data: (title, url) 튜플의 iterable
+            post_processor: 지정하면 페이지 소스 파싱을 프로세스 풀에서 수행
+
+        Returns:
+            List[ExtractResult]: 추출 결과 리스트 (완료 순서)
+        """
+        results = []
+        print(f"🚀 배치 처리 시작 (브라우저 컨텍스트 {self.max_contexts}개)")
+
+        for i, result in enumerate(self.iter_extract(url_data, post_processor=post_processor), 1):
+            results.append(result)
+            status = "✅ 성공" if result.success else f"❌ 실패: {result.error_message}"
+            print(f"  [{i}] {result.title[:30]}... - {status}")
+
+        successful = sum(1 for r in results if r.success)
+        print(f"\n📊 배치 처리 완료: 성공 {successful}개, 실패 {len(results) - successful}개")
+
+        return results
@@ -0,0 +1,366 @@
+"""
+수집한 원본 페이로드(HTML/JSON) 후처리 모듈
+
+브라우저/HTTP로 받아온 원본 페이지를 게시물 레코드로 변환한다.
+파싱과 캡션 정제는 CPU 작업이라 스레드 풀에서는 GIL 때문에 직렬화되므로,
+ParallelPostProcessor가 프로세스 풀에 청크 단위로 묶어 보낸다.
+"""
+
+import queue
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .caption import VIDEO_PLACEHOLDER, browser_processor, default_processor, parse_og_description
+from .record import PostRecord
+
+
+UNKNOWN_USERNAME = "알 수 없음"
+
+_OG_TITLE_OWNER = re.compile(r"^\s*(?P<username>[A-Za-z0-9._]+)\s+on Instagram")
+
+
+@dataclass(frozen=True)
+class RawPayload:
+    """수집 단계에서 넘어오는 원본 페이로드"""
+    title: str
+    url: str
+    kind: str  # "html" 또는 "json"
+    body: Union[str, Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ParsedPayload:
+    """페이로드 파싱 결과 (실패 시 record는 None)"""
+    title: str
+    url: str
+    record: Optional[PostRecord] = None
+    error_message: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.record is not None
+
+
+def _meta_contents(html: str) -> Dict[str, str]:
+    """HTML에서 meta 태그의 property/name -> content 매핑 추출"""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # meta 태그만 파싱해 전체 DOM 생성 비용을 줄임
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("meta"))
+    contents = {}
+    for meta in soup.find_all("meta"):
+        key = meta.get("property") or meta.get("name")
+        content = meta.get("content")
+        if key and content and key not in contents:
+            contents[key] = content.strip()
+    return contents
+
+
+def parse_html_payload(title: str, url: str, html: str) -> PostRecord:
+    """게시물 페이지 HTML을 레코드로 변환
+
+    Args:
+        title (str): 게시물 제목
+        url (str): 게시물 URL
+        html (str): 페이지 소스
+
+    Returns:
+        PostRecord: 변환된 레코드
+    """
+    meta = _meta_contents(html)
+    caption = meta.get("og:description") or meta.get("description") or ""
+    og = parse_og_description(caption)
+
+    username = og.username
+    if not username:
+        owner = _OG_TITLE_OWNER.match(meta.get("og:title", ""))
+        username = owner.group("username") if owner else UNKNOWN_USERNAME
+
+    if og.username:
+        # 접두어가 분리된 본문은 실제 캡션이므로 공백 정리만 적용
+        text = og.text
+    else:
+        text = browser_processor.clean(caption)
+    if len(text) < 5:
+        text = VIDEO_PLACEHOLDER
+
+    return PostRecord(
+        title=title,
+        text=text,
+        username=username,
+        likes=og.likes or 0,
+        comments=og.comments,
+        date=og.date,
+        media_count=1,
+        is_video="og:video" in meta or text == VIDEO_PLACEHOLDER,
+        url=url,
+    )
+
+
+def _media_item_to_node(item: Dict[str, Any]) -> Dict[str, Any]:
+    """web_info 응답의 미디어 항목(v1 형식)을 GraphQL 게시물 노드 형식으로 변환"""
+    caption = item.get("caption")
+    caption_text = caption.get("text") if isinstance(caption, dict) else None
+    carousel = item.get("carousel_media") or []
+    return {
+        "shortcode": item.get("code", ""),
+        "edge_media_to_caption": {
+            "edges": [{"node": {"text": caption_text}}] if caption_text is not None else []
+        },
+        "edge_media_preview_like": {"count": item.get("like_count") or 0},
+        "edge_media_to_parent_comment": {"count": item.get("comment_count")},
+        "taken_at_timestamp": item.get("taken_at"),
+        "owner": {"username": (item.get("user") or {}).get("username", "")},
+        "is_video": item.get("media_type") == 2,
+        "edge_sidecar_to_children": {"edges": [{"node": media} for media in carousel]},
+    }
+
+
+def parse_json_payload(title: str, url: str, node: Dict[str, Any]) -> PostRecord:
+    """GraphQL 게시물 노드(shortcode_media)를 레코드로 변환
+
+    Args:
+        title (str): 게시물 제목
+        url (str): 게시물 URL
+        node (Dict[str, Any]): GraphQL 응답의 게시물 노드
+            ({"data": {"xdt_shortcode_media": {...}}} 형태와
+            {"data": {"xdt_api__v1__media__shortcode__web_info": {"items": [...]}}}
+            형태도 허용)
+
+    Returns:
+        PostRecord: 변환된 레코드
+
+    Raises:
+        ValueError: 게시물 노드가 없는 경우
+    """
+    data = node.get("data", node)
+    web_info = data.get("xdt_api__v1__media__shortcode__web_info")
+    if web_info is not None:
+        items = web_info.get("items") or [{}]
+        node = _media_item_to_node(items[0])
+    else:
+        node = data.get("xdt_shortcode_media") or data.get("shortcode_media") or node
+    if not node or not node.get("shortcode"):
+        raise ValueError("게시물이 삭제되었거나 존재하지 않습니다.")
+
+    caption_edges = node.get("edge_media_to_caption", {}).get("edges") or []
+    caption = caption_edges[0]["node"].get("text", "") if caption_edges else ""
+
+    likes = (
+        node.get("edge_media_preview_like", {}).get("count")
+        or node.get("edge_liked_by", {}).get("count")
+        or 0
+    )
+    comments = (
+        node.get("edge_media_to_parent_comment", {}).get("count")
+        or node.get("edge_media_to_comment", {}).get("count")
+    )
+    timestamp = node.get("taken_at_timestamp")
+    children = node.get("edge_sidecar_to_children", {}).get("edges")
+
+    return PostRecord(
+        title=title,
+        text=default_processor.clean(caption),
+        username=node.get("owner", {}).get("username", ""),
+        likes=likes,
+        comments=comments,
+        date=datetime.fromtimestamp(timestamp) if timestamp else None,
+        media_count=len(children) if children else 1,
+        is_video=bool(node.get("is_video")),
+        url=url,
+    )
+
+
+def parse_payload(payload: RawPayload) -> ParsedPayload:
+    """페이로드 종류에 맞게 파싱 (예외를 결과로 변환, 프로세스 풀 작업 함수)
+
+    Args:
+        payload (RawPayload): 원본 페이로드
+
+    Returns:
+        ParsedPayload: 파싱 결과
+    """
+    try:
+        if payload.kind == "html":
+            record = parse_html_payload(payload.title, payload.url, payload.body)
+        elif payload.kind == "json":
+            record = parse_json_payload(payload.title, payload.url, payload.body)
+        else:
+            raise ValueError(f"지원하지 않는 페이로드 형식: {payload.kind}")
+        return ParsedPayload(title=payload.title, url=payload.url, record=record)
+    except Exception as e:
+        return ParsedPayload(
+            title=payload.title,
+            url=payload.url,
+            error_message=f"페이로드 파싱 실패: {str(e)}",
+        )
+
+
+def _parse_chunk(payloads: List[RawPayload]) -> List[ParsedPayload]:
+    """청크 단위 파싱 (IPC 왕복 횟수를 줄이기 위해 여러 건을 한 번에 전달)"""
+    return [parse_payload(payload) for payload in payloads]
+
+
+class _SourceError:
+    """입력 스레드에서 난 예외 (소비하는 쪽에서 다시 발생)"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_END = object()
+
+
+class ParallelPostProcessor:
+    """프로세스 풀 기반 페이로드 후처리기"""
+
+    def __init__(self, workers: int = 0, chunksize: int = 8, flush_interval: float = 0.05):
+        """
+        초기화
+
+        Args:
+            workers (int): 프로세스 수 (0 또는 1이면 현재 프로세스에서 처리)
+            chunksize (int): 한 번의 IPC로 보낼 페이로드 수
+            flush_interval (float): 입력이 이 시간(초) 동안 멈추면 덜 찬 청크도 바로 보냄
+        """
+        self.workers = workers
+        self.chunksize = max(1, chunksize)
+        self.flush_interval = flush_interval
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def process(self, payloads: Iterable[RawPayload]) -> Iterator[ParsedPayload]:
+        """페이로드를 파싱해 입력 순서대로 반환
+
+        입력은 제너레이터여도 되며, 동시에 프로세스 풀에 올라가는 청크 수는
+        workers * 2개로 제한된다. 앞쪽 청크가 끝나는 대로 바로 반환한다.
+
+        Args:
+            payloads (Iterable[RawPayload]): 원본 페이로드
+
+        Yields:
+            ParsedPayload: 파싱 결과
+        """
+        for _, parsed in self.process_tagged((None, payload) for payload in payloads):
+            yield parsed
+
+    def process_tagged(self, items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[Any, Any]]:
+        """(태그, 값) 스트림에서 RawPayload 값만 파싱하고 나머지는 읽는 즉시 그대로 전달
+
+        파싱 결과는 페이로드끼리의 입력 순서를 유지한다. 프로세스 풀을 쓰면 입력은 별도
+        스레드에서 읽으므로, 입력이 멈춰도 덜 찬 청크를 보내고 끝난 결과를 먼저 반환한다.
+
+        Args:
+            items (Iterable[Tuple[Any, Any]]): (태그, RawPayload 또는 다른 값) 목록 (제너레이터 가능)
+
+        Yields:
+            Tuple[Any, Any]: (태그, ParsedPayload 또는 전달된 값)
+        """
+        if self.workers <= 1:
+            for tag, value in items:
+                yield tag, parse_payload(value) if isinstance(value, RawPayload) else value
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        executor = self._executor
+
+        # 입력을 읽는 스레드 (큐가 차면 입력 읽기를 멈춰 메모리에 쌓이는 페이지 수를 제한)
+        received: "queue.Queue[Any]" = queue.Queue(maxsize=self.chunksize * self.workers * 2)
+        stop = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    received.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def feed() -> None:
+            iterator = iter(items)
+            try:
+                for item in iterator:
+                    if not put(item):
+                        return
+            except BaseException as e:
+                put(_SourceError(e))
+            finally:
+                put(_END)
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+
+        feeder = threading.Thread(target=feed, name="postprocess-feeder", daemon=True)
+        feeder.start()
+
+        pending: Deque[Tuple[List[Any], Future]] = deque()
+        tags: List[Any] = []
+        chunk: List[RawPayload] = []
+
+        def submit() -> None:
+            pending.append((list(tags), executor.submit(_parse_chunk, list(chunk))))
+            tags.clear()
+            chunk.clear()
+
+        finished = False
+        try:
+            while True:
+                # 앞쪽 청크가 끝났으면 바로 반환 (입력 순서 유지)
+                while pending and pending[0][1].done():
+                    done_tags, future = pending.popleft()
+                    yield from zip(done_tags, future.result())
+
+                if finished or len(pending) >= self.workers * 2:
+                    if chunk:
+                        submit()
+                    elif pending:
+                        done_tags, future = pending.popleft()
+                        yield from zip(done_tags, future.result())
+                    elif finished:
+                        return
+                    continue
+
+                try:
+                    # 기다릴 결과나 덜 찬 청크가 있으면 짧게 기다리며 확인
+                    item = received.get(timeout=self.flush_interval) if chunk or pending else received.get()
+                except queue.Empty:
+                    # 입력이 멈췄으면 덜 찬 청크라도 먼저 보냄
+                    if chunk:
+                        submit()
+                    continue
+
+                if item is _END:
+                    finished = True
+                elif isinstance(item, _SourceError):
+                    raise item.error
+                else:
+                    tag, value = item
+                    if isinstance(value, RawPayload):
+                        tags.append(tag)
+                        chunk.append(value)
+                        if len(chunk) >= self.chunksize:
+                            submit()
+                    else:
+                        yield tag, value
+        finally:
+            stop.set()
+            for _, future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelPostProcessor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
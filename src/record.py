@@ -0,0 +1,149 @@
+"""
+게시물 레코드 모듈
+
+instaloader, Selenium, API 경로가 공통으로 사용하는 불변 게시물 레코드
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+
+@dataclass(frozen=True, slots=True)
+class PostRecord(Mapping):
+    """불변 게시물 레코드
+
+    __slots__ 기반이라 게시물당 메모리가 작고, 읽기 전용 Mapping 인터페이스를
+    제공하므로 기존 dict 기반 코드(post_data["text"], post_data.get(...))를
+    그대로 사용할 수 있다.
+    """
+    title: str = "미정"
+    text: str = ""
+    username: str = ""
+    likes: int = 0
+    comments: Optional[int] = None
+    date: Optional[datetime] = None
+    media_count: int = 1
+    is_video: bool = False
+    url: str = ""
+
+    @classmethod
+    def from_mapping(cls, data: Mapping) -> "PostRecord":
+        """dict 등 매핑에서 레코드 생성 (알 수 없는 키는 무시)
+
+        Args:
+            data (Mapping): 게시물 데이터
+
+        Returns:
+            PostRecord: 생성된 레코드
+        """
+        if isinstance(data, PostRecord):
+            return data
+
+        values = {name: data[name] for name in _FIELD_NAMES if name in data}
+        date = values.get("date")
+        if isinstance(date, str):
+            values["date"] = datetime.fromisoformat(date)
+        return cls(**values)
+
+    def replace(self, **changes: Any) -> "PostRecord":
+        """일부 필드를 바꾼 새 레코드 반환
+
+        Returns:
+            PostRecord: 변경된 새 레코드
+        """
+        return replace(self, **changes)
+
+    def to_json_dict(self, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 dict로 변환 (date는 ISO 8601 문자열)
+
+        Args:
+            fields (Optional[Tuple[str, ...]]): 포함할 필드 (None이면 전체)
+
+        Returns:
+            Dict[str, Any]: JSON 호환 dict
+        """
+        data = {name: getattr(self, name) for name in fields or _FIELD_NAMES}
+        if data.get("date") is not None:
+            data["date"] = self.date.isoformat()
+        return data
+
+    def to_json(self, **kwargs: Any) -> str:
+        """JSON 문자열로 변환
+
+        Returns:
+            str: JSON 문자열
+        """
+        return json.dumps(self.to_json_dict(), ensure_ascii=False, **kwargs)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELD_NAMES)
+
+    def __len__(self) -> int:
+        return len(_FIELD_NAMES)
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(PostRecord))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+
+# --simple 모드/간단한 클라이언트가 쓰는 필드 (추가 메타데이터 조회 없음)
+SIMPLE_FIELDS = ("title", "text", "url")
+
+
+def parse_fields(spec: Union[None, str, Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """필드 선택 값 파싱 ("title,text,url" 또는 이름 목록)
+
+    Args:
+        spec (Union[None, str, Iterable[str]]): 쉼표로 구분한 문자열 또는 필드 이름 목록
+
+    Returns:
+        Optional[Tuple[str, ...]]: 레코드 필드 순서로 정렬한 필드 (None이면 전체)
+
+    Raises:
+        ValueError: 알 수 없는 필드가 포함된 경우
+    """
+    if spec is None:
+        return None
+    if isinstance(spec, str):
+        spec = spec.split(",")
+
+    requested = {name.strip() for name in spec if name.strip()}
+    if not requested:
+        return None
+    unknown = requested - _FIELD_SET
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 필드: {', '.join(sorted(unknown))} "
+            f"(사용 가능: {', '.join(_FIELD_NAMES)})"
+        )
+    return tuple(name for name in _FIELD_NAMES if name in requested)
+
+
+def to_json_dict(post_data: Mapping, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """레코드 또는 dict를 JSON 직렬화 가능한 dict로 변환
+
+    Args:
+        post_data (Mapping): PostRecord 또는 게시물 dict
+        fields (Optional[Tuple[str, ...]]): 포함할 필드 (None이면 전체)
+
+    Returns:
+        Dict[str, Any]: JSON 호환 dict (date는 ISO 8601 문자열)
+    """
+    if isinstance(post_data, PostRecord):
+        return post_data.to_json_dict(fields)
+
+    if fields is None:
+        json_data = dict(post_data)
+    else:
+        json_data = {name: post_data.get(name) for name in fields}
+    date = json_data.get("date")
+    if date and hasattr(date, "isoformat"):
+        json_data["date"] = date.isoformat()
+    return json_data
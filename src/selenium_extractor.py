@@ -2,14 +2,20 @@
 Selenium 기반 Instagram 게시물 텍스트 추출 모듈
 """
 
-import re
+import os
 import time
+import signal
+import queue
 import random
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from datetime import datetime
+import asyncio
+import threading
+from collections import deque
+from contextlib import closing, contextmanager
+from itertools import chain
+from typing import (
+    Any, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -19,44 +25,68 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
+    SessionNotCreatedException,
     WebDriverException,
     StaleElementReferenceException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
 
+from .chromedriver import invalidate_driver_cache, resolve_driver_path
+from .browser import (
+    DEFAULT_MAX_REQUEUES,
+    DEFAULT_PAGE_TIMEOUT,
+    DEFAULT_URL_TIMEOUT,
+    USER_AGENTS,
+    ExtractResult,
+    parse_indexed_results,
+    reorder_results,
+)
+from .postprocess import ParallelPostProcessor, RawPayload, parse_payload
+from .url_reader import canonicalize_url
 
-@dataclass
-class ExtractResult:
-    """추출 결과 데이터 클래스"""
-    title: str
-    url: str
-    text: str
-    username: str
-    success: bool
-    error_message: str = ""
-    extraction_time: str = ""
+# og 메타 태그가 나타날 때까지 기다리는 최대 시간 (초)
+OG_META_WAIT = 5
 
 
 class SeleniumInstagramExtractor:
     """Selenium 기반 Instagram 게시물 텍스트 추출기"""
     
-    def __init__(self, headless: bool = True, max_workers: int = 5):
+    def __init__(
+        self,
+        headless: bool = True,
+        max_workers: int = 5,
+        driver_path: Optional[str] = None,
+        offline: bool = False,
+        reuse_drivers: bool = False,
+        page_timeout: float = DEFAULT_PAGE_TIMEOUT,
+        url_timeout: float = DEFAULT_URL_TIMEOUT,
+        max_requeues: int = DEFAULT_MAX_REQUEUES,
+    ):
         """
         초기화
         
         Args:
             headless (bool): 헤드리스 모드 사용 여부
             max_workers (int): 최대 스레드 수
+            driver_path (Optional[str]): ChromeDriver 실행 파일 경로 (없으면 자동 확인)
+            offline (bool): ChromeDriver 다운로드를 시도하지 않음 (에어갭 환경용)
+            reuse_drivers (bool): URL 처리 후 브라우저를 종료하지 않고 재사용
+                (warm_up() 호출 시 자동으로 활성화)
+            page_timeout (float): 페이지 로드 제한 시간 (초)
+            url_timeout (float): URL 하나의 전체 처리 제한 시간 (초, 넘기면 브라우저 강제 종료)
+            max_requeues (int): 시간 초과/브라우저 중단 URL을 배치 끝에서 다시 시도하는 횟수
         """
         self.headless = headless
         self.max_workers = max_workers
-        self.user_agents = [
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
+        self.driver_path = driver_path
+        self.offline = offline
+        self.reuse_drivers = reuse_drivers
+        self.page_timeout = page_timeout
+        self.url_timeout = url_timeout
+        self.max_requeues = max_requeues
+        # 재사용 대기 중인 브라우저 풀
+        self._idle_drivers: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self.user_agents = list(USER_AGENTS)
         
     def _create_driver(self) -> webdriver.Chrome:
         """Chrome WebDriver 인스턴스 생성"""
@@ -81,261 +111,434 @@ class SeleniumInstagramExtractor:
             user_agent = random.choice(self.user_agents)
             options.add_argument(f"--user-agent={user_agent}")
             
-            # ChromeDriver 서비스 설정
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+            # ChromeDriver 서비스 설정 (드라이버 경로는 프로세스당 한 번만 확인)
+            driver_path = resolve_driver_path(self.driver_path, offline=self.offline)
+            try:
+                driver = webdriver.Chrome(service=self._service(driver_path), options=options)
+            except SessionNotCreatedException:
+                # 캐시된 드라이버가 업데이트된 Chrome과 맞지 않는 경우 한 번만 다시 받음
+                if self.driver_path or self.offline:
+                    raise
+                invalidate_driver_cache()
+                driver_path = resolve_driver_path(refresh=True)
+                driver = webdriver.Chrome(service=self._service(driver_path), options=options)
             
             # 스크립트 감지 방지
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            # 암묵적 대기 설정
+            # 암묵적 대기 및 페이지 로드 제한 시간 설정
             driver.implicitly_wait(10)
+            driver.set_page_load_timeout(self.page_timeout)
             
             return driver
             
         except Exception as e:
             raise RuntimeError(f"ChromeDriver 생성 실패: {str(e)}")
     
-    def validate_url(self, url: str) -> bool:
-        """Instagram URL 유효성 검증"""
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """풀에서 대기 중인 브라우저를 꺼내거나 새로 생성 (중단된 브라우저는 교체)"""
+        while True:
+            try:
+                driver = self._idle_drivers.get_nowait()
+            except queue.Empty:
+                return self._create_driver()
+
+            if self._is_driver_alive(driver):
+                return driver
+            self._release_driver(driver, healthy=False)
+
+    @staticmethod
+    def _driver_process(driver: webdriver.Chrome) -> Any:
+        """ChromeDriver 서비스 프로세스 (없으면 None)"""
+        return getattr(getattr(driver, "service", None), "process", None)
+
+    def _is_driver_alive(self, driver: webdriver.Chrome) -> bool:
+        """드라이버 프로세스와 브라우저 세션이 응답하는지 확인"""
+        process = self._driver_process(driver)
+        if process is not None and process.poll() is not None:
+            return False
+
         try:
-            parsed_url = urlparse(url)
-            
-            if parsed_url.netloc not in ["www.instagram.com", "instagram.com"]:
-                return False
-                
-            path_pattern = r"^/(p|reel|tv)/([A-Za-z0-9_-]+)/?"
-            if not re.match(path_pattern, parsed_url.path):
-                return False
-                
+            driver.window_handles
             return True
-        except Exception:
+        except WebDriverException:
             return False
-    
-    def _extract_text_from_page(self, driver: webdriver.Chrome, url: str) -> Dict[str, str]:
-        """페이지에서 텍스트 및 메타데이터 추출"""
+
+    @staticmethod
+    def _service(driver_path: str) -> Service:
+        """ChromeDriver 서비스 (POSIX에서는 Chrome 자식 프로세스까지 한 번에 종료할 수 있도록 새 세션으로 실행)"""
+        popen_kw = {"start_new_session": True} if hasattr(os, "killpg") else {}
+        return Service(driver_path, popen_kw=popen_kw)
+
+    def _kill_driver(self, driver: webdriver.Chrome) -> None:
+        """멈춘 드라이버 프로세스 강제 종료 (대기 중인 WebDriver 호출이 즉시 실패함)
+
+        ChromeDriver가 자기 프로세스 그룹을 이끌면 그룹 전체를 종료해 Chrome 프로세스가
+        고아로 남지 않게 한다.
+        """
+        process = self._driver_process(driver)
+        if process is None or process.poll() is not None:
+            return
         try:
-            # 페이지 로드
-            driver.get(url)
-            
-            # 페이지 로딩 대기 (최대 15초)
-            wait = WebDriverWait(driver, 15)
-            
-            # 여러 가능한 셀렉터 시도
-            caption_selectors = [
-                "meta[property='og:description']",
-                "meta[name='description']",
-                "[data-testid='post-caption']", 
-                "article h1",
-                ".x1lliihq.x1plvlek.xryxfnj.x1n2onr6.x193iq5w.xeuugli.x1fj9vlw.x13faqbe.x1vvkbs.x1s928wv.xhkezso.x1gmr53x.x1cpjm7i.x1fgarty.x1943h6x.x1i0vuye.xvs91rp.xo1l8bm.x5n08af.x10wh9bi.x1wdrske.x8viiok.x18hxmgj",
-                "span._aacl._aaco._aacu._aacx._aad7._aade",
-                "div._a9zs"
-            ]
-            
-            username = "알 수 없음"
-            caption_text = ""
+            if hasattr(os, "killpg") and os.getpgid(process.pid) == process.pid:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass
+
+    @contextmanager
+    def _watchdog(self, driver: webdriver.Chrome) -> Iterator[threading.Event]:
+        """URL 처리 시간이 url_timeout을 넘기면 드라이버를 강제 종료하는 감시 타이머"""
+        expired = threading.Event()
+
+        def on_timeout():
+            expired.set()
+            self._kill_driver(driver)
+
+        timer = threading.Timer(self.url_timeout, on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield expired
+        finally:
+            timer.cancel()
+
+    def _run_with_driver(
+        self, url: str, title: str, operation: Callable[[webdriver.Chrome], Any]
+    ) -> Any:
+        """풀의 브라우저로 작업 실행 (시간 제한 및 브라우저 중단 감지 포함)
+
+        Args:
+            url (str): 게시물 URL
+            title (str): 게시물 제목
+            operation: 브라우저를 받아 결과를 반환하는 함수
+
+        Returns:
+            Any: operation의 반환값, 실패 시 ExtractResult
+        """
+        if not self.validate_url(url):
+            return ExtractResult.failure(title, url, "유효하지 않은 Instagram URL")
+
+        driver = None
+        expired = None
+        healthy = False
+        try:
+            driver = self._acquire_driver()
+
+            # 랜덤 대기 (1-3초)
+            time.sleep(random.uniform(1, 3))
+
+            with self._watchdog(driver) as expired:
+                outcome = operation(driver)
+            healthy = not expired.is_set()
+            return outcome
+
+        except Exception as e:
+            if expired is not None and expired.is_set():
+                message = f"URL 처리 시간 초과 ({self.url_timeout:g}초, 브라우저 강제 종료)"
+                retryable = True
+            elif isinstance(e, TimeoutException):
+                message = f"페이지 로드 시간 초과 ({self.page_timeout:g}초)"
+                retryable = True
+            elif driver is not None and not self._is_driver_alive(driver):
+                message = f"브라우저 중단: {str(e)}"
+                retryable = True
+            else:
+                message = str(e)
+                retryable = False
+            return ExtractResult.failure(title, url, message, retryable)
+
+        finally:
+            # 실패한 브라우저는 종료하고 다음 작업에서 새로 생성
+            if driver is not None:
+                self._release_driver(driver, healthy)
+
+    def _release_driver(self, driver: webdriver.Chrome, healthy: bool = True) -> None:
+        """브라우저 반환 (재사용 모드면 풀에 보관, 아니면 종료)"""
+        if self.reuse_drivers and healthy:
+            self._idle_drivers.put(driver)
+            return
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        브라우저를 미리 실행해 풀에 보관 (첫 URL의 콜드 스타트 제거)
+        
+        Args:
+            count (Optional[int]): 미리 실행할 브라우저 수 (기본값: max_workers)
             
-            # 사용자명 추출
+        Returns:
+            int: 실행에 성공한 브라우저 수
+        """
+        self.reuse_drivers = True
+        count = count or self.max_workers
+
+        # 드라이버 경로를 먼저 확인해 병렬 생성 시 중복 다운로드 방지
+        resolve_driver_path(self.driver_path, offline=self.offline)
+
+        launched = 0
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(self._create_driver) for _ in range(count)]
+            for future in as_completed(futures):
+                try:
+                    self._idle_drivers.put(future.result())
+                    launched += 1
+                except Exception as e:
+                    print(f"⚠️ 브라우저 사전 실행 실패: {str(e)}")
+
+        return launched
+
+    def close(self) -> None:
+        """풀에 보관 중인 브라우저 모두 종료"""
+        while True:
             try:
-                username_selectors = [
-                    "a[href*='/'][role='link'] span",
-                    "header a span",
-                    ".x1lliihq.x1plvlek.xryxfnj.x1n2onr6.x193iq5w.xeuugli.x1fj9vlw.x13faqbe.x1vvkbs.xtrsf7v.x1s928wv.xhkezso.x1gmr53x.x1cpjm7i.x1fgarty.x1943h6x.x1i0vuye.xvs91rp.x1rod4b6.xo1l8bm.x10wh9bi.x1wdrske.x8viiok.x18hxmgj"
-                ]
-                
-                for selector in username_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            text = element.text.strip()
-                            if text and not text.startswith('@') and len(text) > 0:
-                                username = text
-                                break
-                        if username != "알 수 없음":
-                            break
-                    except:
-                        continue
-                        
+                driver = self._idle_drivers.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
             except Exception:
                 pass
-            
-            # 캡션 텍스트 추출
-            for selector in caption_selectors:
-                try:
-                    if selector.startswith("meta"):
-                        # 메타 태그에서 추출
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        content = element.get_attribute("content")
-                        if content and len(content.strip()) > 10:
-                            caption_text = content.strip()
-                            break
-                    else:
-                        # 일반 요소에서 추출
-                        element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                        text = element.text.strip()
-                        if text and len(text) > 10:
-                            caption_text = text
-                            break
-                except:
-                    continue
-            
-            # BeautifulSoup로 추가 파싱 시도
-            if not caption_text:
-                try:
-                    soup = BeautifulSoup(driver.page_source, 'html.parser')
-                    
-                    # og:description 메타 태그
-                    meta_desc = soup.find('meta', property='og:description')
-                    if meta_desc and meta_desc.get('content'):
-                        caption_text = meta_desc['content'].strip()
-                    
-                    # 일반 description 메타 태그
-                    if not caption_text:
-                        meta_desc = soup.find('meta', attrs={'name': 'description'})
-                        if meta_desc and meta_desc.get('content'):
-                            caption_text = meta_desc['content'].strip()
-                            
-                except Exception:
-                    pass
-            
-            # 텍스트가 없으면 비디오 컨텐츠로 처리
-            if not caption_text or len(caption_text.strip()) < 5:
-                caption_text = "동영상콘텐츠"
-            
-            return {
-                "username": username,
-                "text": self._clean_text(caption_text)
-            }
-            
+
+    def __enter__(self) -> "SeleniumInstagramExtractor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def validate_url(self, url: str) -> bool:
+        """Instagram URL 유효성 검증"""
+        return canonicalize_url(url) is not None
+
+    def _load_page_source(self, driver: webdriver.Chrome, url: str) -> str:
+        """페이지를 로드하고 HTML 반환 (og 메타 태그가 나타날 때까지 잠시 대기)"""
+        # 페이지 로드 (시간 초과/브라우저 중단은 호출자가 처리하도록 그대로 전달)
+        driver.get(url)
+        try:
+            WebDriverWait(driver, OG_META_WAIT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "meta[property='og:description']"))
+            )
         except TimeoutException:
-            return {"username": "알 수 없음", "text": "동영상콘텐츠"}
-        except Exception as e:
-            raise RuntimeError(f"텍스트 추출 실패: {str(e)}")
+            # 메타 태그가 없는 페이지도 그대로 파싱 (비디오/비공개 게시물 등)
+            pass
+        return driver.page_source
+
+    def extract_single_url(self, url: str, title: str = "미정") -> ExtractResult:
+        """단일 URL에서 텍스트 추출 (프로세스 풀 경로와 같은 parse_payload()로 파싱)"""
+        def extract(driver: webdriver.Chrome) -> ExtractResult:
+            payload = RawPayload(title=title, url=url, kind="html", body=self._load_page_source(driver, url))
+            return ExtractResult.from_parsed(parse_payload(payload))
+
+        return self._run_with_driver(url, title, extract)
     
-    def _clean_text(self, text: str) -> str:
-        """텍스트 정제"""
-        if not text:
-            return "동영상콘텐츠"
-            
-        # 불필요한 공백 및 특수문자 정제
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
+    def fetch_single_url(self, url: str, title: str = "미정") -> Union[RawPayload, ExtractResult]:
+        """단일 URL의 페이지 소스만 수집 (파싱은 프로세스 풀에서 수행)
         
-        # Instagram 관련 불필요한 텍스트 제거
-        unwanted_patterns = [
-            r'Instagram에서 이 게시물 보기',
-            r'shared a post on Instagram',
-            r'팔로우',
-            r'likes',
-            r'followers',
-            r'following',
-            r'Follow',
-            r'Posted by'
-        ]
+        Returns:
+            Union[RawPayload, ExtractResult]: 페이지 소스, 실패 시 실패한 ExtractResult
+        """
+        def fetch(driver: webdriver.Chrome) -> RawPayload:
+            return RawPayload(title=title, url=url, kind="html", body=self._load_page_source(driver, url))
+
+        return self._run_with_driver(url, title, fetch)
+
+    def _iter_indexed(
+        self,
+        executor: ThreadPoolExecutor,
+        task: Callable[[str, str], Any],
+        url_data: Iterable[Tuple[str, str]],
+        window: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """작업을 제한된 개수만 제출하며 완료 순서대로 (입력 순번, 결과) 반환
         
-        for pattern in unwanted_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        동시에 제출되는 작업은 max_workers * 2개로 제한되어 입력을 지연 소비한다.
+        window를 지정하면 아직 완료되지 않은 가장 앞선 순번과의 차이가 window를
+        넘지 않도록 제출을 멈춘다 (순서 복원 버퍼 크기 제한).
+        시간 초과나 브라우저 중단으로 실패한 URL은 배치 끝에 다시 넣어 max_requeues번까지
+        재시도한다 (window에 걸리면 남은 입력보다 먼저 재시도).
+        """
+        source = iter(url_data)
+        max_in_flight = self.max_workers * 2
+        pending: Dict[Any, Tuple[int, str, str, int]] = {}
+        requeued: Deque[Tuple[int, str, str, int]] = deque()
+        next_index = 0
+        exhausted = False
+
+        while True:
+            while len(pending) < max_in_flight:
+                blocked = exhausted
+                if not blocked and window is not None and (pending or requeued):
+                    frontier = min(entry[0] for entry in chain(pending.values(), requeued))
+                    blocked = next_index - frontier >= window
+                if not blocked:
+                    try:
+                        title, url = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        continue
+                    pending[executor.submit(task, url, title)] = (next_index, title, url, 0)
+                    next_index += 1
+                elif requeued:
+                    index, title, url, attempt = requeued.popleft()
+                    pending[executor.submit(task, url, title)] = (index, title, url, attempt)
+                else:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, title, url, attempt = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ExtractResult.failure(title, url, f"처리 중 예외 발생: {str(e)}")
+
+                if getattr(result, "retryable", False) and attempt < self.max_requeues:
+                    print(f"  🔁 {title[:30]}... - 재시도 예약: {result.error_message}")
+                    requeued.append((index, title, url, attempt + 1))
+                    continue
+
+                yield index, result
+
+    def iter_extract(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        ordered: bool = False,
+        reorder_window: Optional[int] = None,
+        post_processor: Optional[ParallelPostProcessor] = None,
+    ) -> Iterator[ExtractResult]:
+        """
+        여러 URL에서 텍스트를 추출하며 완료되는 대로 결과 반환
         
-        text = text.strip()
+        입력은 제너레이터여도 되며 필요한 만큼만 읽는다. 반복을 중간에 멈추면
+        아직 시작하지 않은 작업은 취소된다.
         
-        if len(text) < 5:
-            return "동영상콘텐츠"
+        Args:
+            url_data: (title, url) 튜플의 iterable
+            ordered (bool): True면 입력 순서대로 결과 반환
+            reorder_window (Optional[int]): 순서 복원 시 앞서 처리할 수 있는 최대 URL 수
+                (기본값: max_workers * 4)
+            post_processor: 지정하면 스레드는 페이지 소스만 수집하고
+                파싱/정제는 프로세스 풀에서 수행
             
-        return text
-    
-    def extract_single_url(self, url: str, title: str = "미정") -> ExtractResult:
-        """단일 URL에서 텍스트 추출"""
-        driver = None
+        Yields:
+            ExtractResult: 추출 결과
+        """
+        window = (reorder_window or self.max_workers * 4) if ordered else None
+        task = self.fetch_single_url if post_processor is not None else self.extract_single_url
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
         try:
-            if not self.validate_url(url):
-                return ExtractResult(
-                    title=title,
-                    url=url,
-                    text="",
-                    username="",
-                    success=False,
-                    error_message="유효하지 않은 Instagram URL"
-                )
-            
-            driver = self._create_driver()
-            
-            # 랜덤 대기 (1-3초)
-            time.sleep(random.uniform(1, 3))
-            
-            result = self._extract_text_from_page(driver, url)
-            
-            return ExtractResult(
-                title=title,
-                url=url,
-                text=result["text"],
-                username=result["username"],
-                success=True,
-                extraction_time=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            )
+            indexed = self._iter_indexed(executor, task, url_data, window)
+            if post_processor is not None:
+                indexed = parse_indexed_results(indexed, post_processor)
+            if ordered:
+                indexed = reorder_results(indexed)
+
+            for _, result in indexed:
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aiter_extract(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        ordered: bool = False,
+        reorder_window: Optional[int] = None,
+        post_processor: Optional[ParallelPostProcessor] = None,
+    ) -> AsyncIterator[ExtractResult]:
+        """
+        iter_extract()의 비동기 버전 (이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+        
+        Args:
+            url_data: (title, url) 튜플의 iterable
+            ordered (bool): True면 입력 순서대로 결과 반환
+            reorder_window (Optional[int]): 순서 복원 시 앞서 처리할 수 있는 최대 URL 수
+            post_processor: 프로세스 풀 후처리기
             
-        except Exception as e:
-            return ExtractResult(
-                title=title,
-                url=url,
-                text="",
-                username="",
-                success=False,
-                error_message=str(e)
-            )
+        Yields:
+            ExtractResult: 추출 결과
+        """
+        loop = asyncio.get_running_loop()
+        # 소비자가 느리면 생산 스레드가 대기하도록 큐 크기 제한
+        results: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self.max_workers)
+        finished = object()
+        stop = threading.Event()
+
+        def produce() -> None:
+            outcome: Any = finished
+            try:
+                stream = self.iter_extract(url_data, ordered, reorder_window, post_processor)
+                with closing(stream):
+                    for result in stream:
+                        asyncio.run_coroutine_threadsafe(results.put(result), loop).result()
+                        if stop.is_set():
+                            return
+            except Exception as e:
+                outcome = e
+            asyncio.run_coroutine_threadsafe(results.put(outcome), loop).result()
+
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await results.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
         finally:
-            if driver:
+            # 중간에 멈춘 경우 생산 스레드가 큐에서 막히지 않도록 비우면서 종료 대기
+            stop.set()
+            while not producer.done():
                 try:
-                    driver.quit()
-                except:
-                    pass
-    
-    def batch_extract(self, url_data: List[tuple]) -> List[ExtractResult]:
+                    results.get_nowait()
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0.05)
+
+    def batch_extract(
+        self,
+        url_data: Iterable[Tuple[str, str]],
+        post_processor: Optional[ParallelPostProcessor] = None,
+    ) -> List[ExtractResult]:
         """
-        배치 처리로 여러 URL에서 텍스트 추출
+        배치 처리로 여러 URL에서 텍스트 추출 (iter_extract() 결과를 모두 모아 반환)
         
         Args:
-            url_data: (title, url) 튜플의 리스트
+            url_data: (title, url) 튜플의 iterable
+            post_processor: 지정하면 스레드는 페이지 소스만 수집하고
+                파싱/정제는 프로세스 풀에서 수행
             
         Returns:
-            List[ExtractResult]: 추출 결과 리스트
+            List[ExtractResult]: 추출 결과 리스트 (완료 순서)
         """
         results = []
-        
-        print(f"🚀 {len(url_data)}개 URL 배치 처리 시작 (최대 {self.max_workers}개 스레드)")
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 작업 제출
-            future_to_data = {
-                executor.submit(self.extract_single_url, url, title): (title, url)
-                for title, url in url_data
-            }
-            
-            # 완료된 작업 처리
-            for i, future in enumerate(as_completed(future_to_data), 1):
-                title, url = future_to_data[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    status = "✅ 성공" if result.success else f"❌ 실패: {result.error_message}"
-                    print(f"  [{i}/{len(url_data)}] {title[:30]}... - {status}")
-                    
-                except Exception as e:
-                    # 예외 발생 시 실패 결과 생성
-                    result = ExtractResult(
-                        title=title,
-                        url=url,
-                        text="",
-                        username="",
-                        success=False,
-                        error_message=f"처리 중 예외 발생: {str(e)}"
-                    )
-                    results.append(result)
-                    print(f"  [{i}/{len(url_data)}] {title[:30]}... - ❌ 예외: {str(e)}")
+        total = len(url_data) if hasattr(url_data, "__len__") else None
+        total_label = f"/{total}" if total is not None else ""
+
+        if post_processor is not None:
+            print(
+                f"🚀 배치 처리 시작 "
+                f"(수집 {self.max_workers}개 스레드, 파싱 {post_processor.workers}개 프로세스)"
+            )
+        else:
+            print(f"🚀 배치 처리 시작 (최대 {self.max_workers}개 스레드)")
+
+        for i, result in enumerate(self.iter_extract(url_data, post_processor=post_processor), 1):
+            results.append(result)
+            status = "✅ 성공" if result.success else f"❌ 실패: {result.error_message}"
+            print(f"  [{i}{total_label}] {result.title[:30]}... - {status}")
         
         # 성공/실패 통계 출력
         successful = sum(1 for r in results if r.success)
         failed = len(results) - successful
         print(f"\n📊 배치 처리 완료: 성공 {successful}개, 실패 {failed}개")
         
-        return results
\ No newline at end of file
+        return results
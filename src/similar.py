@@ -0,0 +1,361 @@
+"""
+캡션 TF-IDF 유사 게시물 검색 모듈
+
+보관된 게시물 캡션을 희소 TF-IDF 행렬로 만들어 "이 게시물과 비슷한 게시물"을
+코사인 유사도 순으로 찾는다. 단어와 한글/한자/가나 문자 2-gram을 특성 해싱으로
+고정 크기 열에 배치하므로 어휘 사전 없이 문서를 계속 추가할 수 있다.
+
+색인은 행 정규화한 TF-IDF 행렬(CSR)과 IDF, 문서 빈도를 압축한 .npz 파일 하나에 저장하므로
+불러올 때 토큰화나 가중치 계산 없이 배열만 읽는다. 조회는 희소 행렬-벡터 곱 한 번이다.
+문서마다 가중치가 큰 MAX_TERMS_PER_DOCUMENT개 특성만 남기고 값은 float16으로 저장해
+색인 크기를 문서당 수백 바이트로 제한한다.
+
+numpy/scipy는 선택 의존성이다 (pip install numpy scipy).
+"""
+
+import os
+import re
+import tempfile
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .caption import EMOJI_PATTERN, MENTION_PATTERN, URL_PATTERN, parse_og_description
+
+if TYPE_CHECKING:
+    import numpy
+    import scipy.sparse
+
+DEFAULT_INDEX_PATH = "outputs/similar.npz"
+
+# 특성 해싱 열 수 (충돌은 드물고, 문서 빈도 배열은 4MB)
+N_FEATURES = 1 << 20
+# 문서 하나에 남기는 최대 특성 수 (가중치가 큰 순, 긴 캡션도 색인 크기가 일정)
+MAX_TERMS_PER_DOCUMENT = 64
+# 2: 값을 float16으로 압축 저장 (1도 읽을 수 있음)
+_FORMAT_VERSION = 2
+_READABLE_VERSIONS = (1, 2)
+
+_ENTITIES = re.compile(f"{URL_PATTERN}|{MENTION_PATTERN}|{EMOJI_PATTERN}")
+_WORD = re.compile(r"\w+")
+# 띄어쓰기만으로 나누기 어려운 문자 (조사가 붙은 한국어 단어, 띄어 쓰지 않는 일본어/중국어)
+_CJK_RUN = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힣]{2,}")
+
+
+def _require_numpy() -> Tuple[Any, Any]:
+    """numpy, scipy.sparse 불러오기
+
+    Raises:
+        RuntimeError: numpy/scipy가 설치되지 않은 경우
+    """
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        raise RuntimeError(
+            "유사 게시물 검색에는 numpy와 scipy가 필요합니다. "
+            "'pip install numpy scipy'로 설치하세요."
+        )
+    return np, sparse
+
+
+def caption_tokens(text: str) -> List[str]:
+    """캡션 토큰 (og:description 접두어/URL/멘션/이모지를 뺀 단어 + 한글·한자·가나 2-gram)
+
+    Args:
+        text (str): 원본 캡션
+
+    Returns:
+        List[str]: 토큰 목록 (중복 포함)
+    """
+    text = _ENTITIES.sub(" ", parse_og_description(text or "").text.lower())
+    tokens = [word for word in _WORD.findall(text) if len(word) > 1 and not word.isdigit()]
+    for run in _CJK_RUN.findall(text):
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _feature(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+
+@dataclass(frozen=True)
+class SimilarHit:
+    """유사 게시물 검색 결과"""
+    shortcode: str
+    score: float
+
+
+class SimilarityIndex:
+    """캡션 TF-IDF 유사도 색인 (문서를 계속 추가할 수 있음)
+
+    IDF는 처음 만들 때(또는 refit 때)의 문서 빈도로 고정하고, 이후 추가하는 문서는
+    같은 IDF로 가중치를 매겨 행만 덧붙인다. 문서 수가 고정 시점의 REFIT_RATIO배를
+    넘으면 stale이 True가 되며, 원본 캡션으로 다시 만들면 된다.
+    """
+
+    # 이 배수만큼 문서가 늘면 IDF를 다시 계산하도록 권장
+    REFIT_RATIO = 2.0
+
+    def __init__(self):
+        """빈 색인 생성
+
+        Raises:
+            RuntimeError: numpy/scipy가 설치되지 않은 경우
+        """
+        np, sparse = _require_numpy()
+        self._np = np
+        self._sparse = sparse
+        self.keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # 행 정규화한 TF-IDF 행렬 (문서 x N_FEATURES)
+        self._matrix = sparse.csr_matrix((0, N_FEATURES), dtype=np.float32)
+        self._document_frequency = np.zeros(N_FEATURES, dtype=np.int32)
+        self._idf: Optional["numpy.ndarray"] = None
+        # IDF를 고정한 시점의 문서 수
+        self.fitted_documents = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, shortcode: str) -> bool:
+        return shortcode in self._rows
+
+    @property
+    def stale(self) -> bool:
+        """IDF를 고정한 뒤 문서가 REFIT_RATIO배 이상 늘었는지 여부"""
+        return self.fitted_documents > 0 and len(self.keys) >= self.REFIT_RATIO * self.fitted_documents
+
+    def vectorize(self, texts: Sequence[str]) -> "scipy.sparse.csr_matrix":
+        """여러 캡션을 한 번에 단어 수 행렬로 변환
+
+        Args:
+            texts (Sequence[str]): 캡션 목록
+
+        Returns:
+            sparse.csr_matrix: (캡션 수 x N_FEATURES) 단어 수 행렬
+        """
+        np = self._np
+        indptr = [0]
+        indices: List[int] = []
+        for text in texts:
+            indices.extend(map(_feature, caption_tokens(text)))
+            indptr.append(len(indices))
+        matrix = self._sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(texts), N_FEATURES),
+        )
+        # 같은 특성의 항목을 합쳐 단어 수로 만듦
+        matrix.sum_duplicates()
+        return matrix
+
+    def _weigh(self, counts: "scipy.sparse.csr_matrix") -> "scipy.sparse.csr_matrix":
+        """단어 수 행렬 -> 행 정규화한 (1 + log tf) * idf 행렬"""
+        np = self._np
+        weighted = counts.copy()
+        weighted.data = (1 + np.log(weighted.data)) * self._idf[weighted.indices]
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return self._sparse.diags(1 / norms).dot(weighted).tocsr().astype(np.float32)
+
+    def _prune(self, weighted: "scipy.sparse.csr_matrix") -> "scipy.sparse.csr_matrix":
+        """행마다 가중치가 큰 MAX_TERMS_PER_DOCUMENT개 특성만 남겨 다시 정규화 (값은 float16 정밀도로 맞춤)
+
+        저장 파일과 같은 값을 메모리에도 쓰므로, 불러온 색인과 방금 만든 색인의 결과가 같다.
+        """
+        np = self._np
+        lengths = np.diff(weighted.indptr)
+        long_rows = np.flatnonzero(lengths > MAX_TERMS_PER_DOCUMENT)
+        if len(long_rows):
+            for row in long_rows:
+                start, end = weighted.indptr[row], weighted.indptr[row + 1]
+                values = weighted.data[start:end]
+                drop = np.argpartition(values, len(values) - MAX_TERMS_PER_DOCUMENT)[:len(values) - MAX_TERMS_PER_DOCUMENT]
+                values[drop] = 0
+            weighted.eliminate_zeros()
+            norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+            norms[norms == 0] = 1
+            weighted = self._sparse.diags(1 / norms).dot(weighted).tocsr().astype(np.float32)
+        weighted.data = weighted.data.astype(np.float16).astype(np.float32)
+        return weighted
+
+    def add(self, documents: Iterable[Tuple[str, str]]) -> int:
+        """문서 추가 (이미 있는 shortcode는 건너뜀, 빈 색인이면 추가한 문서로 IDF 고정)
+
+        Args:
+            documents (Iterable[Tuple[str, str]]): (shortcode, 캡션) 목록
+
+        Returns:
+            int: 추가한 문서 수
+        """
+        np = self._np
+        keys: List[str] = []
+        texts: List[str] = []
+        seen = set(self._rows)
+        for shortcode, text in documents:
+            if shortcode in seen:
+                continue
+            seen.add(shortcode)
+            keys.append(shortcode)
+            texts.append(text)
+        if not keys:
+            return 0
+
+        counts = self.vectorize(texts)
+        self._document_frequency += np.bincount(counts.indices, minlength=N_FEATURES).astype(np.int32)
+        for shortcode in keys:
+            self._rows[shortcode] = len(self.keys)
+            self.keys.append(shortcode)
+        if self._idf is None:
+            self._idf = (np.log((1 + len(self.keys)) / (1 + self._document_frequency)) + 1).astype(np.float32)
+            self.fitted_documents = len(self.keys)
+        self._matrix = self._sparse.vstack([self._matrix, self._prune(self._weigh(counts))], format="csr")
+        return len(keys)
+
+    def _top_k(self, query: "scipy.sparse.csr_matrix", k: int, exclude: Optional[int] = None) -> List[SimilarHit]:
+        """질의 벡터와 코사인 유사도가 높은 k개 (행렬-벡터 곱 한 번 + argpartition)"""
+        np = self._np
+        if k <= 0 or not self.keys:
+            return []
+        vector = np.zeros(N_FEATURES, dtype=np.float32)
+        vector[query.indices] = query.data
+        scores = self._matrix @ vector
+        if exclude is not None:
+            scores[exclude] = -1
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [SimilarHit(self.keys[i], float(scores[i])) for i in top if scores[i] > 0]
+
+    def similar_to(self, shortcode: str, k: int = 10) -> List[SimilarHit]:
+        """색인된 게시물과 비슷한 게시물 (자기 자신 제외)
+
+        Args:
+            shortcode (str): 기준 게시물 shortcode
+            k (int): 최대 결과 수
+
+        Returns:
+            List[SimilarHit]: 코사인 유사도 내림차순 결과
+
+        Raises:
+            KeyError: 색인에 없는 shortcode인 경우
+        """
+        row = self._rows[shortcode]
+        return self._top_k(self._matrix[row], k, exclude=row)
+
+    def query(self, text: str, k: int = 10) -> List[SimilarHit]:
+        """캡션(임의 텍스트)과 비슷한 게시물
+
+        Args:
+            text (str): 기준 텍스트
+            k (int): 최대 결과 수
+
+        Returns:
+            List[SimilarHit]: 코사인 유사도 내림차순 결과
+        """
+        if self._idf is None:
+            return []
+        return self._top_k(self._weigh(self.vectorize([text])), k)
+
+    def save(self, path: str = DEFAULT_INDEX_PATH) -> None:
+        """색인을 압축한 .npz 파일로 저장 (임시 파일에 쓴 뒤 교체, 값은 float16)
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        np = self._np
+        directory = os.path.dirname(path) or "."
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        matrix = self._matrix
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    version=np.int32(_FORMAT_VERSION),
+                    keys=np.asarray(self.keys, dtype=str),
+                    indptr=matrix.indptr.astype(np.int64),
+                    indices=matrix.indices.astype(np.int32),
+                    data=matrix.data.astype(np.float16),
+                    idf=self._idf if self._idf is not None else np.zeros(0, dtype=np.float32),
+                    document_frequency=self._document_frequency,
+                    fitted_documents=np.int64(self.fitted_documents),
+                )
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_INDEX_PATH) -> "SimilarityIndex":
+        """저장한 색인 불러오기 (토큰화/가중치 계산 없이 배열만 읽음)
+
+        Args:
+            path (str): .npz 파일 경로
+
+        Returns:
+            SimilarityIndex: 불러온 색인
+
+        Raises:
+            RuntimeError: numpy/scipy가 설치되지 않은 경우
+            ValueError: 형식 버전이 다른 경우
+        """
+        index = cls()
+        with index._np.load(path) as data:
+            if int(data["version"]) not in _READABLE_VERSIONS:
+                raise ValueError(f"지원하지 않는 색인 형식입니다: {path} (--rebuild로 다시 생성하세요)")
+            index.keys = data["keys"].tolist()
+            index._matrix = index._sparse.csr_matrix(
+                (data["data"].astype(index._np.float32), data["indices"], data["indptr"]),
+                shape=(len(index.keys), N_FEATURES),
+            )
+            index._idf = data["idf"] if len(data["idf"]) else None
+            index._document_frequency = data["document_frequency"]
+            index.fitted_documents = int(data["fitted_documents"])
+        index._rows = {shortcode: row for row, shortcode in enumerate(index.keys)}
+        return index
+
+
+def load_or_create(path: str = DEFAULT_INDEX_PATH) -> SimilarityIndex:
+    """색인 파일이 있으면 불러오고 없으면 빈 색인 생성"""
+    if os.path.exists(path):
+        return SimilarityIndex.load(path)
+    return SimilarityIndex()
+
+
+def documents_from(records: Iterable[Mapping]) -> Iterable[Tuple[str, str]]:
+    """레코드 목록을 (shortcode, 캡션) 목록으로 변환 (게시물 URL이 아닌 레코드는 건너뜀)"""
+    from .store import shortcode_of
+
+    for post_data in records:
+        try:
+            yield shortcode_of(post_data), post_data.get("text") or ""
+        except ValueError:
+            continue
+
+
+def update_index(index: SimilarityIndex, records: Callable[[], Iterable[Mapping]], rebuild: bool = False) -> Tuple[SimilarityIndex, int]:
+    """레코드 중 색인에 없는 게시물 추가 (IDF가 오래됐거나 rebuild면 처음부터 다시 만듦)
+
+    증분 추가는 레코드를 읽으면서 색인에 없는 게시물만 모으고, 다시 만들 때만
+    레코드를 처음부터 한 번 더 읽는다.
+
+    Args:
+        index (SimilarityIndex): 기존 색인
+        records (Callable[[], Iterable[Mapping]]): 색인할 레코드를 처음부터 읽는 함수 (결과 저장소의 iter_records 등)
+        rebuild (bool): 기존 색인을 버리고 다시 만들기
+
+    Returns:
+        Tuple[SimilarityIndex, int]: (갱신한 색인, 추가한 문서 수)
+    """
+    if not rebuild:
+        added = [document for document in documents_from(records()) if document[0] not in index]
+        if not (index.fitted_documents and len(index) + len(added) >= index.REFIT_RATIO * index.fitted_documents):
+            return index, index.add(added)
+    # 이미 색인된 문서도 다시 넣어 현재 문서 빈도로 IDF 계산
+    index = SimilarityIndex()
+    return index, index.add(documents_from(records()))
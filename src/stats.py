@@ -0,0 +1,515 @@
+"""
+해시태그/멘션 스트리밍 통계 모듈
+
+보관된 게시물을 한 번씩만 훑으며 해시태그·멘션 상위 k개, 함께 쓰인 해시태그 쌍,
+작성자별/월별 추이를 집계한다. 정확한 카운터 대신 고정 크기 구조를 쓰므로 캡션이
+수백만 개여도 메모리 사용량이 일정하다.
+
+- Count-Min Sketch: 임의 키의 빈도를 과대 추정만 하는 고정 크기 카운터 배열 (보수적 갱신)
+- Space-Saving: 용량만큼의 키만 추적하며 상위 빈도 키(heavy hitter)와 오차 한계를 유지
+- Bloom filter: 이미 센 게시물(shortcode)을 다시 세지 않도록 하는 비트 배열
+
+상태는 파일 하나에 저장하고, 다음 실행에서는 결과 저장소에 그 뒤로 추가된
+게시물만 읽어 이어서 집계한다.
+"""
+
+import hashlib
+import heapq
+import math
+import os
+import pickle
+import tempfile
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .caption import default_processor
+
+if TYPE_CHECKING:
+    from .store import ResultStore
+
+DEFAULT_STATS_PATH = "outputs/stats.pkl"
+
+# 쌍을 만들 때 게시물당 사용할 최대 해시태그 수 (쌍 수는 제곱으로 늘어남)
+MAX_PAIR_TAGS = 10
+
+_STATE_VERSION = 1
+# 작성자/해시태그와 월을 묶은 키의 구분자
+_SEPARATOR = "\x1f"
+
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    """키의 64비트 해시를 두 개의 32비트 해시로 (double hashing용, 두 번째는 홀수)"""
+    value = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+    return value & 0xFFFFFFFF, (value >> 32) | 1
+
+
+def _row_hashes(key: str, depth: int) -> array:
+    """행마다 독립인 32비트 해시 depth개 (blake2b 다이제스트 한 번을 나눠 씀)"""
+    return array("I", hashlib.blake2b(key.encode("utf-8"), digest_size=4 * depth).digest())
+
+
+class CountMinSketch:
+    """Count-Min Sketch (보수적 갱신)
+
+    depth개 행마다 width개 카운터를 두고, 키마다 행별로 한 칸씩 센다. 추정값은
+    행별 카운터의 최솟값이라 실제 빈도보다 작지 않으며, 전체 합이 N일 때 높은
+    확률로 실제 + 2N/width 이하이다.
+    """
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4):
+        """
+        초기화
+
+        Args:
+            width (int): 행당 카운터 수
+            depth (int): 행 수 (해시 함수 수)
+        """
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._counters = array("I", bytes(4 * width * depth))
+
+    def _cells(self, key: str) -> List[int]:
+        width = self.width
+        return [row * width + value % width for row, value in enumerate(_row_hashes(key, self.depth))]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """키 빈도 증가 (최솟값 칸만 올리는 보수적 갱신)
+
+        Args:
+            key (str): 키
+            count (int): 증가량
+
+        Returns:
+            int: 갱신 후 추정 빈도
+        """
+        counters = self._counters
+        cells = self._cells(key)
+        estimate = min(counters[cell] for cell in cells) + count
+        for cell in cells:
+            if counters[cell] < estimate:
+                counters[cell] = estimate
+        self.total += count
+        return estimate
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        """키마다 빈도 1 증가 (add를 반복하는 것과 같고 호출 비용만 줄임)"""
+        counters = self._counters
+        width = self.width
+        offsets = [row * width for row in range(self.depth)]
+        size = 4 * self.depth
+        blake2b = hashlib.blake2b
+        added = 0
+        for key in keys:
+            hashes = array("I", blake2b(key.encode("utf-8"), digest_size=size).digest())
+            cells = [offset + value % width for offset, value in zip(offsets, hashes)]
+            values = [counters[cell] for cell in cells]
+            estimate = min(values) + 1
+            for cell, value in zip(cells, values):
+                if value < estimate:
+                    counters[cell] = estimate
+            added += 1
+        self.total += added
+
+    def estimate(self, key: str) -> int:
+        """키의 추정 빈도 (실제 빈도 이상)"""
+        counters = self._counters
+        return min(counters[cell] for cell in self._cells(key))
+
+
+class SpaceSaving:
+    """Space-Saving 상위 빈도 추적기 (일괄 정리 방식)
+
+    키를 capacity의 두 배까지 받아 두었다가 넘치면 카운터가 큰 capacity개만 남기고,
+    버린 카운터의 최댓값(floor)을 기록한다. 이후 새로 들어오는 키는 floor에서 시작하고
+    floor를 오차로 가진다. 키마다 최솟값을 교체하는 원래 방식처럼 빈도가 N/capacity보다
+    큰 키는 항상 추적되고 실제 빈도는 (count - error) 이상 count 이하이며, 키당 비용은
+    dict 갱신 한 번이다.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        초기화
+
+        Args:
+            capacity (int): 정리 후 남길 키 수
+        """
+        self.capacity = capacity
+        self.floor = 0
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counts
+
+    def add(self, key: str, count: int = 1) -> None:
+        """키 빈도 증가
+
+        Args:
+            key (str): 키
+            count (int): 증가량
+        """
+        counts = self._counts
+        if key in counts:
+            counts[key] += count
+            return
+        counts[key] = self.floor + count
+        if self.floor:
+            self._errors[key] = self.floor
+        if len(counts) > 2 * self.capacity:
+            self._prune()
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        """키마다 빈도 1 증가"""
+        for key in keys:
+            counts = self._counts
+            if key in counts:
+                counts[key] += 1
+            else:
+                self.add(key)
+
+    def _prune(self) -> None:
+        counts = self._counts
+        # capacity번째로 큰 카운터보다 큰 키는 모두 남기고, 같은 키는 남은 자리만큼 남긴다
+        threshold = sorted(counts.values(), reverse=True)[self.capacity - 1]
+        kept = {key: count for key, count in counts.items() if count > threshold}
+        for key, count in counts.items():
+            if len(kept) >= self.capacity:
+                break
+            if count == threshold:
+                kept[key] = count
+        # 버린 키는 다시 들어와도 이전 빈도가 floor(threshold 이하)를 넘지 않는다
+        self.floor = max(self.floor, threshold)
+        self._errors = {key: error for key, error in self._errors.items() if key in kept}
+        self._counts = kept
+
+    def count(self, key: str) -> Tuple[int, int]:
+        """추적 중인 키의 (카운터, 오차) (추적하지 않으면 (0, 0))"""
+        return self._counts.get(key, 0), self._errors.get(key, 0)
+
+    def top(self, k: int = 10, prefix: str = "", guaranteed: bool = False) -> List[Tuple[str, int, int]]:
+        """상위 키
+
+        Args:
+            k (int): 최대 결과 수
+            prefix (str): 이 접두어로 시작하는 키만
+            guaranteed (bool): 카운터 대신 보장된 최소 빈도(count - error) 순으로 정렬
+                (키가 많아 오차가 큰 키가 상위를 차지할 때 사용)
+
+        Returns:
+            List[Tuple[str, int, int]]: (키, 카운터, 오차), 카운터 내림차순 (같으면 오차 오름차순)
+        """
+        errors = self._errors
+        items: Iterable[Tuple[str, int]] = self._counts.items()
+        if prefix:
+            items = [(key, count) for key, count in items if key.startswith(prefix)]
+        if guaranteed:
+            best = heapq.nlargest(k, items, key=lambda item: (item[1] - errors.get(item[0], 0), item[1]))
+        else:
+            best = heapq.nlargest(k, items, key=lambda item: (item[1], -errors.get(item[0], 0)))
+        return [(key, count, errors.get(key, 0)) for key, count in best]
+
+
+class BloomFilter:
+    """Bloom filter (거짓 양성은 있고 거짓 음성은 없음)"""
+
+    def __init__(self, capacity: int = 2_000_000, error_rate: float = 0.01):
+        """
+        초기화
+
+        Args:
+            capacity (int): 거짓 양성률을 error_rate 이하로 유지할 최대 원소 수
+            error_rate (float): 목표 거짓 양성률
+        """
+        bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.size = bits
+        self.hash_count = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+
+    def add(self, key: str) -> bool:
+        """원소 추가
+
+        Returns:
+            bool: 새로 추가했으면 True (이미 있었을 가능성이 높으면 False)
+        """
+        first, second = _hash_pair(key)
+        bits = self._bits
+        added = False
+        for i in range(self.hash_count):
+            position = (first + i * second) % self.size
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        return added
+
+
+@dataclass
+class TopItem:
+    """상위 빈도 항목 (실제 빈도는 count - error 이상 count 이하)"""
+    key: str
+    count: int
+    error: int = 0
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {"key": self.key, "count": self.count, "error": self.error}
+
+
+def _top_items(items: Iterable[Tuple[str, int, int]], strip: int = 0) -> List[TopItem]:
+    return [TopItem(key[strip:], count, error) for key, count, error in items]
+
+
+def post_entities(text: str) -> Tuple[List[str], List[str]]:
+    """캡션의 해시태그/멘션 (소문자, 게시물 안 중복 제거, 나온 순서)"""
+    result = default_processor.process(text or "")
+    hashtags = list(dict.fromkeys(tag.lower() for tag in result.hashtags))
+    mentions = list(dict.fromkeys(mention.lower() for mention in result.mentions))
+    return hashtags, mentions
+
+
+class HashtagStats:
+    """해시태그/멘션 스트리밍 통계"""
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        sketch_width: int = 1 << 16,
+        sketch_depth: int = 4,
+        seen_capacity: int = 2_000_000,
+    ):
+        """
+        초기화
+
+        Args:
+            capacity (int): 상위 항목마다 추적할 키 수 (쌍, 작성자별 해시태그는 5배)
+            sketch_width (int): Count-Min Sketch 행당 카운터 수
+            sketch_depth (int): Count-Min Sketch 행 수
+            seen_capacity (int): 중복 게시물 판별 Bloom filter 용량
+        """
+        self.posts = 0
+        # 이어서 집계할 결과 저장소 위치 (마지막으로 센 게시물의 행 번호)
+        self.cursor: Optional[int] = None
+        self.hashtags = SpaceSaving(capacity)
+        self.mentions = SpaceSaving(capacity)
+        self.pairs = SpaceSaving(capacity * 5)
+        self.users = SpaceSaving(capacity)
+        self.user_tags = SpaceSaving(capacity * 5)
+        # 해시태그/멘션 전체 빈도, (작성자, 월) 게시물 수, (해시태그, 월) 빈도
+        self.counts = CountMinSketch(sketch_width, sketch_depth)
+        self.user_months = CountMinSketch(sketch_width, sketch_depth)
+        self.tag_months = CountMinSketch(sketch_width, sketch_depth)
+        self.months: set = set()
+        self._seen = BloomFilter(seen_capacity)
+
+    def add(self, post_data: Mapping, key: Optional[str] = None) -> bool:
+        """게시물 하나 집계
+
+        Args:
+            post_data (Mapping): PostRecord 또는 게시물 dict
+            key (Optional[str]): 게시물 식별자 (shortcode 등, 이미 센 게시물이면 건너뜀)
+
+        Returns:
+            bool: 집계했으면 True
+        """
+        if key is not None and not self._seen.add(key):
+            return False
+        self.posts += 1
+
+        hashtags, mentions = post_entities(post_data.get("text") or "")
+        username = (post_data.get("username") or "").lower()
+        date = post_data.get("date")
+        month = date.strftime("%Y-%m") if hasattr(date, "strftime") else (date or "")[:7]
+
+        self.hashtags.add_many(hashtags)
+        self.mentions.add_many(mentions)
+        self.counts.add_many(hashtags + mentions)
+
+        paired = sorted(hashtags[:MAX_PAIR_TAGS])
+        self.pairs.add_many([f"{first} {second}" for i, first in enumerate(paired) for second in paired[i + 1:]])
+
+        if month:
+            self.months.add(month)
+            self.tag_months.add_many([f"{tag}{_SEPARATOR}{month}" for tag in hashtags])
+        if username:
+            self.users.add(username)
+            if month:
+                self.user_months.add(f"{username}{_SEPARATOR}{month}")
+            self.user_tags.add_many([f"{username}{_SEPARATOR}{tag}" for tag in hashtags])
+        return True
+
+    def update(self, records: Iterable[Mapping]) -> int:
+        """레코드 여러 개 집계 (shortcode가 같은 게시물은 한 번만)
+
+        Args:
+            records (Iterable[Mapping]): PostRecord 또는 게시물 dict 목록 (제너레이터 가능)
+
+        Returns:
+            int: 새로 집계한 게시물 수
+        """
+        from .store import shortcode_of
+
+        added = 0
+        for post_data in records:
+            try:
+                key = shortcode_of(post_data)
+            except ValueError:
+                key = None
+            if self.add(post_data, key):
+                added += 1
+        return added
+
+    def update_from_store(self, store: "ResultStore") -> int:
+        """결과 저장소에서 지난 집계 뒤에 추가된 게시물만 이어서 집계
+
+        가져오기(import)는 원래 추출 시각을 쓰므로 updated_at 대신 행 번호로 이어서 읽는다.
+        이미 센 게시물이 다시 추출되어 갱신되면 캡션은 그대로라고 보고 다시 세지 않는다.
+
+        Args:
+            store (ResultStore): 결과 저장소
+
+        Returns:
+            int: 새로 집계한 게시물 수
+        """
+        latest = store.last_id()
+        # 읽는 도중 추가된 게시물은 다음 실행에서 다시 읽히지만 Bloom filter가 건너뛴다
+        added = self.update(store.iter_records(after_id=self.cursor))
+        if latest is not None:
+            self.cursor = latest
+        return added
+
+    def estimate(self, key: str) -> int:
+        """해시태그(#...)/멘션(@...)의 추정 빈도 (상위 항목이 아니어도 조회 가능)"""
+        return self.counts.estimate(key.lower())
+
+    def top_hashtags(self, k: int = 10) -> List[TopItem]:
+        return _top_items(self.hashtags.top(k))
+
+    def top_mentions(self, k: int = 10) -> List[TopItem]:
+        return _top_items(self.mentions.top(k))
+
+    def top_pairs(self, k: int = 10, hashtag: Optional[str] = None) -> List[TopItem]:
+        """함께 쓰인 해시태그 쌍 ("#a #b", hashtag가 있으면 그 해시태그가 포함된 쌍만)"""
+        if hashtag is None:
+            return _top_items(self.pairs.top(k))
+        tag = hashtag.lower()
+        items = [item for item in self.pairs.top(len(self.pairs)) if tag in item[0].split(" ")]
+        return _top_items(items[:k])
+
+    def top_users(self, k: int = 10) -> List[TopItem]:
+        return _top_items(self.users.top(k))
+
+    def hashtag_trend(self, hashtag: str) -> List[TopItem]:
+        """해시태그의 월별 추정 빈도 (월 오름차순, 0인 달 제외)"""
+        tag = hashtag.lower()
+        trend = [TopItem(month, self.tag_months.estimate(f"{tag}{_SEPARATOR}{month}")) for month in sorted(self.months)]
+        return [item for item in trend if item.count]
+
+    def user_trend(self, username: str, k: int = 10) -> Dict[str, Any]:
+        """작성자의 월별 게시물 수와 자주 쓴 해시태그
+
+        Args:
+            username (str): 작성자 사용자명
+            k (int): 해시태그 최대 수
+
+        Returns:
+            Dict[str, Any]: {"username", "posts", "months": [TopItem], "hashtags": [TopItem]}
+        """
+        user = username.lower()
+        months = [TopItem(month, self.user_months.estimate(f"{user}{_SEPARATOR}{month}")) for month in sorted(self.months)]
+        prefix = f"{user}{_SEPARATOR}"
+        return {
+            "username": user,
+            "posts": self.users.count(user)[0],
+            "months": [item for item in months if item.count],
+            "hashtags": _top_items(self.user_tags.top(k, prefix=prefix, guaranteed=True), strip=len(prefix)),
+        }
+
+    def summary(self, k: int = 10, username: Optional[str] = None, hashtag: Optional[str] = None) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 통계 요약
+
+        Args:
+            k (int): 항목별 최대 결과 수
+            username (Optional[str]): 추이를 볼 작성자
+            hashtag (Optional[str]): 추이/함께 쓰인 쌍을 볼 해시태그 ('#' 생략 가능)
+
+        Returns:
+            Dict[str, Any]: 통계 요약
+        """
+        def items(values: List[TopItem]) -> List[Dict[str, Any]]:
+            return [value.to_json_dict() for value in values]
+
+        data: Dict[str, Any] = {
+            "posts": self.posts,
+            "hashtags": items(self.top_hashtags(k)),
+            "mentions": items(self.top_mentions(k)),
+            "pairs": items(self.top_pairs(k)),
+            "users": items(self.top_users(k)),
+        }
+        if hashtag is not None:
+            tag = hashtag.lower() if hashtag.startswith("#") else f"#{hashtag.lower()}"
+            data["hashtag"] = {
+                "hashtag": tag,
+                "count": self.estimate(tag),
+                "months": items(self.hashtag_trend(tag)),
+                "pairs": items(self.top_pairs(k, tag)),
+            }
+        if username is not None:
+            trend = self.user_trend(username, k)
+            data["user"] = {**trend, "months": items(trend["months"]), "hashtags": items(trend["hashtags"])}
+        return data
+
+    def save(self, path: str = DEFAULT_STATS_PATH) -> None:
+        """상태를 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        directory = os.path.dirname(path) or "."
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".pkl")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((_STATE_VERSION, self.__dict__), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_STATS_PATH) -> "HashtagStats":
+        """저장한 상태 불러오기
+
+        Args:
+            path (str): 상태 파일 경로
+
+        Returns:
+            HashtagStats: 불러온 통계
+
+        Raises:
+            ValueError: 상태 파일 형식이 다르거나 깨진 경우
+        """
+        try:
+            with open(path, "rb") as f:
+                version, state = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+            raise ValueError(f"통계 파일을 읽을 수 없습니다: {path} (--rebuild로 다시 만드세요)")
+        if version != _STATE_VERSION:
+            raise ValueError(f"지원하지 않는 통계 파일 형식입니다: {path} (--rebuild로 다시 만드세요)")
+        stats = cls.__new__(cls)
+        stats.__dict__.update(state)
+        return stats
+
+
+def load_or_create(path: str = DEFAULT_STATS_PATH) -> HashtagStats:
+    """상태 파일이 있으면 불러오고 없으면 빈 통계 생성"""
+    if os.path.exists(path):
+        return HashtagStats.load(path)
+    return HashtagStats()
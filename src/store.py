@@ -0,0 +1,623 @@
+"""
+게시물 결과 저장소 모듈
+
+실행마다 새 JSON 파일을 만드는 대신 SQLite 파일 하나에 결과를 누적한다.
+shortcode가 기본 키이고 username/date/title에 보조 인덱스가 있으며,
+같은 게시물을 다시 추출하면 기존 행을 갱신한다 (upsert).
+JSON/TXT 내보내기는 이 저장소를 조회해 생성한다.
+
+제목/본문/작성자는 FTS5 전문 검색 인덱스에 트리거로 함께 반영된다.
+한국어는 조사/해시태그가 단어에 붙으므로 부분 문자열을 찾는 trigram 인덱스를 쓰고,
+trigram으로 찾을 수 없는 짧은 검색어는 unicode61 단어 앞부분 인덱스로 찾는다.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .record import PostRecord
+from .url_reader import canonicalize_url
+
+
+DEFAULT_STORE_PATH = "outputs/results.db"
+
+# 레코드 필드 순서와 같은 데이터 열 (shortcode, updated_at 제외)
+COLUMNS = (
+    "title", "text", "username", "likes", "comments",
+    "date", "media_count", "is_video", "url",
+)
+
+# 정렬 가능한 열 (ORDER BY에 그대로 쓰므로 허용 목록으로 제한)
+ORDER_COLUMNS = frozenset({"shortcode", "title", "username", "likes", "date", "updated_at"})
+
+# id는 FTS 인덱스가 참조하는 고정 rowid (VACUUM 후에도 유지)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id          INTEGER PRIMARY KEY,
+    shortcode   TEXT NOT NULL UNIQUE,
+    title       TEXT NOT NULL DEFAULT '미정',
+    text        TEXT NOT NULL DEFAULT '',
+    username    TEXT NOT NULL DEFAULT '',
+    likes       INTEGER NOT NULL DEFAULT 0,
+    comments    INTEGER,
+    date        TEXT,
+    media_count INTEGER NOT NULL DEFAULT 1,
+    is_video    INTEGER NOT NULL DEFAULT 0,
+    url         TEXT NOT NULL DEFAULT '',
+    -- 레코드를 추출한 시각 (더 오래된 레코드는 기존 행을 덮어쓰지 않음)
+    updated_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posts_username ON posts(username);
+CREATE INDEX IF NOT EXISTS idx_posts_date ON posts(date);
+CREATE INDEX IF NOT EXISTS idx_posts_title ON posts(title);
+"""
+
+# 가져오기(importer)용 테이블: 이미 가져온 원본 파일, 실패한 URL 목록
+_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path        TEXT PRIMARY KEY,
+    sha256      TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime       REAL NOT NULL,
+    records     INTEGER NOT NULL,
+    ingested_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ingested_files_sha256 ON ingested_files(sha256);
+CREATE TABLE IF NOT EXISTS failed_urls (
+    shortcode   TEXT PRIMARY KEY,
+    title       TEXT NOT NULL DEFAULT '미정',
+    url         TEXT NOT NULL,
+    error       TEXT NOT NULL DEFAULT '',
+    failed_at   REAL NOT NULL
+);
+"""
+
+# posts 내용을 참조하는 외부 콘텐츠 FTS5 인덱스와 동기화 트리거 (본문을 중복 저장하지 않음)
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE {name} USING fts5(
+    title, text, username,
+    content='posts', content_rowid='id', {options}
+);
+CREATE TRIGGER {name}_insert AFTER INSERT ON posts BEGIN
+    INSERT INTO {name}(rowid, title, text, username)
+    VALUES (new.id, new.title, new.text, new.username);
+END;
+CREATE TRIGGER {name}_delete AFTER DELETE ON posts BEGIN
+    INSERT INTO {name}({name}, rowid, title, text, username)
+    VALUES ('delete', old.id, old.title, old.text, old.username);
+END;
+CREATE TRIGGER {name}_update AFTER UPDATE OF title, text, username ON posts BEGIN
+    INSERT INTO {name}({name}, rowid, title, text, username)
+    VALUES ('delete', old.id, old.title, old.text, old.username);
+    INSERT INTO {name}(rowid, title, text, username)
+    VALUES (new.id, new.title, new.text, new.username);
+END;
+INSERT INTO {name}({name}) VALUES ('rebuild');
+"""
+
+# 검색 인덱스 (이름, FTS5 옵션)
+# - posts_fts: 부분 문자열 검색용 trigram (3글자 이상 검색어, "오사카"가 "#오사카맛집"에 일치)
+# - posts_words: 단어 앞부분 검색용 unicode61 (trigram으로 찾을 수 없는 "맛집" 같은 짧은 검색어)
+_SEARCH_INDEXES = (
+    ("posts_fts", "tokenize='trigram'"),
+    ("posts_words", "tokenize='unicode61 remove_diacritics 2', prefix='1 2'"),
+)
+
+# bm25 열 가중치 (제목, 본문, 작성자)
+_BM25_WEIGHTS = (2.0, 1.0, 0.5)
+
+# trigram 토크나이저는 3글자 미만 검색어를 인덱스로 찾을 수 없음
+_TRIGRAM_MIN_LENGTH = 3
+
+SNIPPET_OPEN = "["
+SNIPPET_CLOSE = "]"
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """검색 결과 한 건"""
+    shortcode: str
+    record: PostRecord
+    # 검색어 주변 본문 (검색어는 SNIPPET_OPEN/SNIPPET_CLOSE로 표시)
+    snippet: str
+    # bm25 점수 (작을수록 관련도 높음)
+    score: float
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """API 응답용 dict"""
+        data = self.record.to_json_dict(("title", "username", "likes", "date", "url"))
+        data.update(shortcode=self.shortcode, snippet=self.snippet, score=self.score)
+        return data
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    """검색 결과 페이지"""
+    query: str
+    total: int
+    limit: int
+    offset: int
+    hits: List[SearchHit]
+
+    @property
+    def has_more(self) -> bool:
+        """다음 페이지가 있는지 여부"""
+        return self.offset + len(self.hits) < self.total
+
+
+def _upsert_sql(columns: Tuple[str, ...]) -> str:
+    """선택한 열만 갱신하는 upsert 문 생성
+
+    제목이 기본값("미정")인 레코드는 기존에 저장된 제목을 덮어쓰지 않고,
+    저장된 레코드보다 먼저 추출된 레코드는 무시한다 (가장 최신 레코드 유지).
+    """
+    names = ("shortcode",) + columns + ("updated_at",)
+    updates = []
+    for name in columns + ("updated_at",):
+        if name == "title":
+            updates.append("title = CASE WHEN excluded.title = '미정' THEN posts.title ELSE excluded.title END")
+        else:
+            updates.append(f"{name} = excluded.{name}")
+    return (
+        f"INSERT INTO posts ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)}) "
+        f"ON CONFLICT(shortcode) DO UPDATE SET {', '.join(updates)} "
+        f"WHERE excluded.updated_at >= posts.updated_at"
+    )
+
+
+def _to_row_value(name: str, value: Any) -> Any:
+    """레코드 값을 SQLite 값으로 변환"""
+    if name == "date" and isinstance(value, datetime):
+        return value.isoformat()
+    if name == "is_video":
+        return int(bool(value))
+    return value
+
+
+def _search_terms(query: str) -> List[str]:
+    """검색어를 공백 단위로 분리 (따옴표로 묶은 구문은 하나로 취급)"""
+    return [
+        quoted or plain
+        for quoted, plain in re.findall(r'"([^"]+)"|(\S+)', query)
+        if (quoted or plain).strip()
+    ]
+
+
+def _fts_phrase(term: str) -> str:
+    """FTS5 구문 문자열로 변환 (연산자/특수 문자를 일반 문자로 취급)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def shortcode_of(post_data: Mapping) -> str:
+    """레코드 URL에서 shortcode 추출
+
+    Raises:
+        ValueError: URL이 Instagram 게시물 URL이 아닌 경우
+    """
+    canonical = canonicalize_url(post_data.get("url") or "")
+    if canonical is None:
+        raise ValueError(f"게시물 URL이 아닙니다: {post_data.get('url')!r}")
+    return canonical[0]
+
+
+class ResultStore:
+    """SQLite 기반 게시물 결과 저장소"""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        """
+        초기화 (파일과 테이블이 없으면 생성)
+
+        Args:
+            path (str): SQLite 파일 경로 (":memory:"는 메모리 DB)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if path != ":memory:" and directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # API(스레드 풀)와 배치 경로가 같은 연결을 쓰므로 잠금으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate_without_rowid()
+        self._conn.executescript(_SCHEMA)
+        self._conn.executescript(_ARCHIVE_SCHEMA)
+        self.tokenizer = self._create_search_index()
+
+    def _migrate_without_rowid(self) -> None:
+        """이전 스키마(WITHOUT ROWID, FTS 없음) 파일을 id 열이 있는 테이블로 변환"""
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'posts'"
+        ).fetchone()
+        if row is None or "WITHOUT ROWID" not in row[0].upper():
+            return
+
+        names = ", ".join(("shortcode",) + COLUMNS + ("updated_at",))
+        with self._conn:
+            self._conn.execute("ALTER TABLE posts RENAME TO posts_old")
+            for index in ("username", "date", "title"):
+                self._conn.execute(f"DROP INDEX IF EXISTS idx_posts_{index}")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"INSERT INTO posts ({names}) SELECT {names} FROM posts_old")
+            self._conn.execute("DROP TABLE posts_old")
+
+    def _create_search_index(self) -> str:
+        """전문 검색 인덱스와 동기화 트리거 생성 (이미 있으면 그대로 사용)
+
+        Returns:
+            str: 3글자 이상 검색어에 쓰는 토크나이저 ("trigram" 또는 "unicode61")
+        """
+        existing = {
+            row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('posts_fts', 'posts_words')"
+            )
+        }
+        for name, options in _SEARCH_INDEXES:
+            if name in existing:
+                continue
+            try:
+                self._conn.executescript(
+                    "BEGIN;" + _SEARCH_SCHEMA.format(name=name, options=options) + "COMMIT;"
+                )
+                existing.add(name)
+            except sqlite3.OperationalError:
+                # trigram 미지원 (SQLite 3.34 미만) 시 단어 인덱스만 사용
+                self._conn.rollback()
+                if name == "posts_words":
+                    raise RuntimeError("SQLite FTS5를 사용할 수 없습니다.")
+        return "trigram" if "posts_fts" in existing else "unicode61"
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def upsert(
+        self,
+        post_data: Mapping,
+        fields: Optional[Tuple[str, ...]] = None,
+        updated_at: Optional[float] = None,
+    ) -> str:
+        """게시물 하나 저장 (이미 있으면 갱신)
+
+        Args:
+            post_data (Mapping): PostRecord 또는 게시물 dict
+            fields (Optional[Tuple[str, ...]]): 갱신할 필드 (None이면 전체,
+                필드 선택으로 조회하지 않은 값이 기존 값을 덮어쓰지 않도록 사용)
+            updated_at (Optional[float]): 레코드를 추출한 시각 (Unix 시간, None이면 현재)
+
+        Returns:
+            str: 저장한 게시물의 shortcode
+
+        Raises:
+            ValueError: URL이 Instagram 게시물 URL이 아닌 경우
+        """
+        return self.upsert_many([post_data], fields, updated_at)[0]
+
+    def upsert_many(
+        self,
+        records: Iterable[Mapping],
+        fields: Optional[Tuple[str, ...]] = None,
+        updated_at: Optional[float] = None,
+    ) -> List[str]:
+        """여러 게시물을 한 트랜잭션으로 저장 (저장된 것보다 오래된 레코드는 무시)
+
+        Args:
+            records (Iterable[Mapping]): PostRecord 또는 게시물 dict 목록
+            fields (Optional[Tuple[str, ...]]): 갱신할 필드 (None이면 전체)
+            updated_at (Optional[float]): 레코드를 추출한 시각 (Unix 시간, None이면 현재)
+
+        Returns:
+            List[str]: 저장한 게시물의 shortcode 목록
+
+        Raises:
+            ValueError: URL이 Instagram 게시물 URL이 아닌 경우 (전체 롤백)
+        """
+        columns = COLUMNS if fields is None else tuple(
+            name for name in COLUMNS if name in fields or name == "url"
+        )
+        sql = _upsert_sql(columns)
+        now = time.time() if updated_at is None else updated_at
+
+        shortcodes = []
+        rows = []
+        for post_data in records:
+            record = PostRecord.from_mapping(post_data)
+            shortcode = shortcode_of(record)
+            shortcodes.append(shortcode)
+            rows.append(
+                (shortcode,)
+                + tuple(_to_row_value(name, record[name]) for name in columns)
+                + (now,)
+            )
+
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+        return shortcodes
+
+    def get(self, shortcode: str) -> Optional[PostRecord]:
+        """shortcode로 게시물 조회
+
+        Args:
+            shortcode (str): 게시물 shortcode
+
+        Returns:
+            Optional[PostRecord]: 저장된 레코드 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM posts WHERE shortcode = ?", (shortcode,)
+            ).fetchone()
+        return self._to_record(row) if row is not None else None
+
+    def __contains__(self, shortcode: object) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM posts WHERE shortcode = ?", (shortcode,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def last_id(self) -> Optional[int]:
+        """가장 마지막에 추가된 게시물의 행 번호 (비어 있으면 None, 갱신해도 바뀌지 않음)"""
+        with self._lock:
+            return self._conn.execute("SELECT MAX(id) FROM posts").fetchone()[0]
+
+    def iter_records(
+        self,
+        username: Optional[str] = None,
+        title: Optional[str] = None,
+        since: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        order_by: str = "date",
+        descending: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[PostRecord]:
+        """조건에 맞는 게시물을 순서대로 조회 (인덱스 사용, 결과는 batch_size행씩 읽음)
+
+        Args:
+            username (Optional[str]): 작성자 필터
+            title (Optional[str]): 제목 필터
+            since (Optional[datetime]): 이 시각 이후 게시물만
+            after_id (Optional[int]): 이 행 번호(last_id()) 뒤에 추가된 게시물만
+            order_by (str): 정렬 열 (shortcode, title, username, likes, date, updated_at)
+            descending (bool): 내림차순 여부
+            batch_size (int): 한 번에 읽을 행 수
+
+        Yields:
+            PostRecord: 저장된 레코드
+
+        Raises:
+            ValueError: 정렬할 수 없는 열인 경우
+        """
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"정렬할 수 없는 열입니다: {order_by}")
+
+        conditions = []
+        params: List[Any] = []
+        if username is not None:
+            conditions.append("username = ?")
+            params.append(username)
+        if title is not None:
+            conditions.append("title = ?")
+            params.append(title)
+        if since is not None:
+            conditions.append("date >= ?")
+            params.append(since.isoformat())
+        if after_id is not None:
+            conditions.append("id > ?")
+            params.append(after_id)
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM posts"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, shortcode"
+
+        if self.path == ":memory:":
+            # 메모리 DB는 연결을 공유하므로 한 번에 읽음
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+            yield from map(self._to_record, rows)
+            return
+
+        # 파일 DB는 읽기 전용 연결로 스트리밍 (WAL이라 읽는 동안에도 쓰기 가능)
+        reader = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            cursor = reader.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from map(self._to_record, rows)
+        finally:
+            reader.close()
+
+    def optimize(self) -> None:
+        """검색 인덱스 세그먼트 병합 및 파일 정리 (대량 가져오기 후 실행)"""
+        with self._lock:
+            for name in ("posts_fts", "posts_words"):
+                if name == "posts_fts" and self.tokenizer != "trigram":
+                    continue
+                self._conn.execute(f"INSERT INTO {name}({name}) VALUES ('optimize')")
+            self._conn.commit()
+            self._conn.execute("PRAGMA optimize")
+            if self.path != ":memory:":
+                self._conn.execute("VACUUM")
+
+    def find_ingested(self, path: str, size: int, mtime: float, sha256: Optional[str] = None) -> Optional[str]:
+        """이미 가져온 원본 파일인지 확인
+
+        Args:
+            path (str): 원본 파일 경로
+            size (int): 파일 크기
+            mtime (float): 수정 시각
+            sha256 (Optional[str]): 내용 해시 (주면 이름이 다른 같은 내용의 파일도 확인)
+
+        Returns:
+            Optional[str]: 같은 파일로 기록된 경로 (처음 보는 파일이면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path FROM ingested_files WHERE path = ? AND size = ? AND mtime = ?",
+                (path, size, mtime),
+            ).fetchone()
+            if row is None and sha256 is not None:
+                row = self._conn.execute(
+                    "SELECT path FROM ingested_files WHERE sha256 = ? LIMIT 1", (sha256,)
+                ).fetchone()
+        return row[0] if row is not None else None
+
+    def mark_ingested(self, path: str, sha256: str, size: int, mtime: float, records: int) -> None:
+        """원본 파일을 가져온 것으로 기록
+
+        Args:
+            path (str): 원본 파일 경로
+            sha256 (str): 내용 해시
+            size (int): 파일 크기
+            mtime (float): 수정 시각
+            records (int): 가져온 레코드 수
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?, ?, ?)",
+                (path, sha256, size, mtime, records, time.time()),
+            )
+
+    def record_failures(self, failures: Iterable[Tuple[str, str, str]], failed_at: float) -> int:
+        """실패한 URL 기록 (shortcode당 가장 최근 실패만 유지)
+
+        Args:
+            failures (Iterable[Tuple[str, str, str]]): (제목, URL, 오류 메시지) 목록
+            failed_at (float): 실패 시각 (Unix 시간)
+
+        Returns:
+            int: 기록한 URL 수 (게시물 URL이 아닌 항목 제외)
+        """
+        rows = []
+        for title, url, error in failures:
+            canonical = canonicalize_url(url)
+            if canonical is not None:
+                rows.append((canonical[0], title or "미정", canonical[1], error, failed_at))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO failed_urls VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(shortcode) DO UPDATE SET title = excluded.title, url = excluded.url, "
+                "error = excluded.error, failed_at = excluded.failed_at "
+                "WHERE excluded.failed_at >= failed_urls.failed_at",
+                rows,
+            )
+        return len(rows)
+
+    def iter_unresolved_failures(self) -> Iterator[Tuple[str, str, str]]:
+        """아직 한 번도 성공하지 못한 실패 URL (재시도 대상)
+
+        Yields:
+            Tuple[str, str, str]: (제목, URL, 마지막 오류 메시지)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT title, url, error FROM failed_urls f "
+                "WHERE NOT EXISTS (SELECT 1 FROM posts p WHERE p.shortcode = f.shortcode) "
+                "ORDER BY failed_at"
+            ).fetchall()
+        yield from rows
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        username: Optional[str] = None,
+    ) -> SearchPage:
+        """제목/본문/작성자 전문 검색 (bm25 관련도 순, 페이지 단위)
+
+        공백으로 구분한 검색어는 모두 포함해야 하고(AND), 따옴표로 묶으면 구문으로 찾는다.
+        3글자 이상 검색어는 trigram 인덱스로 부분 문자열을 찾고, 그보다 짧은 검색어
+        (예: "맛집")는 단어 인덱스에서 그 글자로 시작하는 단어를 찾는다.
+
+        Args:
+            query (str): 검색어
+            limit (int): 페이지 크기
+            offset (int): 건너뛸 결과 수
+            username (Optional[str]): 작성자 필터
+
+        Returns:
+            SearchPage: 전체 결과 수와 현재 페이지 결과
+
+        Raises:
+            ValueError: 검색어가 비어 있는 경우
+        """
+        terms = _search_terms(query)
+        if not terms:
+            raise ValueError("검색어를 입력해주세요.")
+
+        if self.tokenizer == "trigram":
+            substrings = [term for term in terms if len(term) >= _TRIGRAM_MIN_LENGTH]
+        else:
+            substrings = []
+        prefixes = [term for term in terms if term not in substrings]
+
+        matches = []
+        if substrings:
+            matches.append(("posts_fts", " AND ".join(_fts_phrase(term) for term in substrings)))
+        if prefixes:
+            matches.append(("posts_words", " AND ".join(_fts_phrase(term) + " *" for term in prefixes)))
+
+        # 첫 번째 인덱스로 순위/스니펫을 만들고 나머지 인덱스는 조건으로만 사용
+        ranked, ranked_query = matches[0]
+        conditions = [f"{ranked} MATCH ?"]
+        params: List[Any] = [ranked_query]
+        for name, match_query in matches[1:]:
+            conditions.append(f"p.id IN (SELECT rowid FROM {name} WHERE {name} MATCH ?)")
+            params.append(match_query)
+        if username is not None:
+            conditions.append("p.username = ?")
+            params.append(username)
+
+        source = f"{ranked} JOIN posts p ON p.id = {ranked}.rowid"
+        where = " AND ".join(conditions)
+        columns = ", ".join(f"p.{name}" for name in COLUMNS)
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM {source} WHERE {where}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {columns}, p.shortcode, "
+                f"bm25({ranked}, {', '.join(map(str, _BM25_WEIGHTS))}) AS score, "
+                f"snippet({ranked}, -1, '{SNIPPET_OPEN}', '{SNIPPET_CLOSE}', '…', 16) "
+                f"FROM {source} WHERE {where} "
+                f"ORDER BY score, p.date DESC LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+
+        hits = []
+        for row in rows:
+            shortcode, score, snippet = row[len(COLUMNS):]
+            hits.append(SearchHit(shortcode, self._to_record(row[:len(COLUMNS)]), snippet, score))
+        return SearchPage(query=query, total=total, limit=limit, offset=offset, hits=hits)
+
+    @staticmethod
+    def _to_record(row: Tuple[Any, ...]) -> PostRecord:
+        """SQLite 행을 레코드로 변환"""
+        values = dict(zip(COLUMNS, row))
+        values["is_video"] = bool(values["is_video"])
+        if values["date"]:
+            values["date"] = datetime.fromisoformat(values["date"])
+        return PostRecord(**values)
@@ -0,0 +1,236 @@
+"""
+HTTP 전송 계층 설정 모듈
+
+instaloader의 requests 세션에 연결 풀 크기, keep-alive, 전송 단계 재시도,
+연결/읽기 제한 시간을 적용하고 연결 재사용 통계를 제공한다.
+같은 설정으로 비동기 추출기의 httpx 클라이언트(선택적 HTTP/2)도 만든다.
+"""
+
+import threading
+from dataclasses import dataclass
+from types import FunctionType, MethodType
+from typing import Any, Dict, Optional
+
+from requests import Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """HTTP 전송 계층 설정"""
+    # 호스트별 연결 풀 수 (instagram.com, i.instagram.com 등)
+    pool_connections: int = 4
+    # 호스트 하나에 유지하는 최대 연결 수 (동시 요청 수와 맞춤)
+    pool_maxsize: int = 10
+    # 풀이 가득 찼을 때 새 연결을 만들지 않고 대기할지 여부
+    pool_block: bool = False
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    # 연결 실패에 한한 전송 단계 재시도 횟수 (요청 제한 응답은 추출기에서 처리)
+    max_retries: int = 2
+    keep_alive: bool = True
+    # HTTP/2 사용 여부 (httpx 클라이언트에만 적용, h2 패키지 필요)
+    http2: bool = False
+
+    @classmethod
+    def for_concurrency(cls, concurrency: int, **kwargs: Any) -> "TransportConfig":
+        """동시 요청 수에 맞춘 설정 생성
+
+        Args:
+            concurrency (int): 동시에 실행되는 요청 수 (스레드/작업 수)
+            **kwargs: 그 밖의 설정 값
+
+        Returns:
+            TransportConfig: 풀 크기가 concurrency 이상인 설정
+        """
+        return cls(pool_maxsize=max(1, concurrency), **kwargs)
+
+    def async_client_kwargs(self) -> Dict[str, Any]:
+        """httpx.AsyncClient 생성 인수
+
+        Returns:
+            Dict[str, Any]: limits, timeout, http2 인수
+        """
+        import httpx
+
+        http2 = self.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                print("⚠️ h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install 'httpx[http2]')")
+                http2 = False
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+            ),
+            "timeout": httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            "http2": http2,
+        }
+
+
+@dataclass(frozen=True)
+class ConnectionMetrics:
+    """연결 재사용 통계"""
+    requests: int = 0
+    # 새로 연 연결 수 (TCP/TLS 핸드셰이크 횟수)
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        """기존 연결을 재사용한 요청 수"""
+        return max(0, self.requests - self.connections)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """연결 재사용 비율 (0.0 ~ 1.0)"""
+        return self.reused / self.requests if self.requests else 0.0
+
+    def summary(self) -> str:
+        """출력용 요약 문자열"""
+        return (
+            f"요청 {self.requests}개, 새 연결 {self.connections}개, "
+            f"재사용 {self.reused}개 ({self.reuse_ratio:.0%})"
+        )
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """설정 가능한 연결 풀/제한 시간/재시도를 적용한 requests 어댑터"""
+
+    def __init__(self, config: TransportConfig):
+        """
+        초기화
+
+        Args:
+            config (TransportConfig): 전송 계층 설정
+        """
+        self.transport_config = config
+        retry = Retry(
+            total=config.max_retries,
+            connect=config.max_retries,
+            read=0,
+            status=0,
+            backoff_factor=0.3,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=retry,
+            pool_block=config.pool_block,
+        )
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        # 설정한 연결/읽기 제한 시간이 instaloader의 단일 request_timeout보다 우선
+        config = self.transport_config
+        kwargs["timeout"] = (config.connect_timeout, config.read_timeout)
+        return super().send(request, **kwargs)
+
+    def metrics(self) -> ConnectionMetrics:
+        """현재 연결 풀들의 요청/새 연결 수 합계"""
+        pools = self.poolmanager.pools
+        requests = connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests += pool.num_requests
+                connections += pool.num_connections
+        return ConnectionMetrics(requests=requests, connections=connections)
+
+
+class _BorrowedAdapter(BaseAdapter):
+    """복사된 세션용 어댑터 (원본 세션의 연결 풀을 쓰고 close()는 무시)"""
+
+    def __init__(self, adapter: PooledHTTPAdapter):
+        super().__init__()
+        self._adapter = adapter
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        return self._adapter.send(request, **kwargs)
+
+    def close(self) -> None:
+        pass
+
+
+# 세션 복사본을 만드는 InstaloaderContext 메서드 (login 중 2단계 인증, GraphQL/iPhone API 쿼리)
+_SESSION_COPYING_METHODS = ("login", "graphql_query", "doc_id_graphql_query", "get_iphone_json")
+
+_pooled_methods_lock = threading.Lock()
+_pooled_methods: Optional[Dict[str, FunctionType]] = None
+
+
+def _copy_session_sharing_pool(session: Session, request_timeout: Optional[float] = None) -> Session:
+    """instaloader의 copy_session()과 같되, 원본의 PooledHTTPAdapter를 빌려 쓰는 복사본 생성"""
+    from instaloader.instaloadercontext import copy_session
+
+    new = copy_session(session, request_timeout)
+    for prefix, adapter in session.adapters.items():
+        if isinstance(adapter, PooledHTTPAdapter):
+            new.mount(prefix, _BorrowedAdapter(adapter))
+    return new
+
+
+def _session_copying_methods() -> Dict[str, FunctionType]:
+    """copy_session 조회만 _copy_session_sharing_pool로 바꾼 InstaloaderContext 메서드 복사본
+
+    메서드 코드는 그대로 두고 전역 이름공간만 따로 만들어 쓰므로 instaloader 모듈은 바뀌지 않는다.
+    instaloader 버전이 바뀌어 메서드가 없거나 copy_session을 직접 부르지 않으면 그 메서드는
+    건너뛰고 경고를 출력한다 (하나도 바꾸지 못하면 세션 복사본은 연결 풀을 공유하지 않음).
+    """
+    global _pooled_methods
+    with _pooled_methods_lock:
+        if _pooled_methods is None:
+            from instaloader.instaloadercontext import InstaloaderContext
+
+            methods = {}
+            for name in _SESSION_COPYING_METHODS:
+                method = getattr(InstaloaderContext, name, None)
+                if not isinstance(method, FunctionType) or "copy_session" not in method.__code__.co_names:
+                    print(f"⚠️ InstaloaderContext.{name}에 연결 풀 공유를 적용할 수 없습니다 (instaloader 버전 확인)")
+                    continue
+                scoped_globals = dict(method.__globals__, copy_session=_copy_session_sharing_pool)
+                clone = FunctionType(
+                    method.__code__, scoped_globals, method.__name__, method.__defaults__, method.__closure__
+                )
+                clone.__kwdefaults__ = method.__kwdefaults__
+                clone.__doc__ = method.__doc__
+                methods[name] = clone
+            if not methods:
+                print("⚠️ 세션 복사본의 연결 풀 공유를 사용하지 않습니다 (쿼리마다 새 연결)")
+            _pooled_methods = methods
+        return _pooled_methods
+
+
+def share_pool_with_session_copies(context: Any) -> None:
+    """instaloader 컨텍스트가 쿼리마다 만드는 세션 복사본도 원본 세션의 연결 풀을 쓰도록 설정
+
+    instaloader의 copy_session()은 새 requests.Session을 만들어 매 쿼리마다
+    TLS 연결을 새로 연다. 이 컨텍스트 인스턴스의 해당 메서드만 풀을 빌려주는 복사본으로
+    바꾸므로 다른 컨텍스트와 instaloader 모듈의 동작은 그대로다.
+
+    Args:
+        context (InstaloaderContext): configure_session()으로 세션을 설정한 컨텍스트
+    """
+    for name, method in _session_copying_methods().items():
+        setattr(context, name, MethodType(method, context))
+
+
+def configure_session(session: Session, config: TransportConfig) -> PooledHTTPAdapter:
+    """requests 세션에 연결 풀 어댑터 마운트
+
+    Args:
+        session (Session): 설정할 세션 (instaloader의 context._session)
+        config (TransportConfig): 전송 계층 설정
+
+    Returns:
+        PooledHTTPAdapter: 마운트된 어댑터 (metrics()로 재사용 통계 조회)
+    """
+    adapter = PooledHTTPAdapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive" if config.keep_alive else "close"
+    return adapter
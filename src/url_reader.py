@@ -0,0 +1,249 @@
+"""
+배치 URL 입력 스트리밍 모듈
+
+URL 목록을 한 줄씩 읽어 (제목, URL) 튜플을 지연 생성한다.
+- 입력: 일반 텍스트(URL), '제목::URL', JSONL({"title": ..., "url": ...}),
+  gzip 압축 파일, 표준 입력('-')
+- URL은 shortcode 기준으로 정규화하고(추적 쿼리 제거, /p/ /reel/ 동일 취급)
+  중복을 제거한다. 중복 확인 메모리는 제한되며, 임계값을 넘으면 Bloom 필터로 전환한다.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass
+from typing import IO, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+
+INSTAGRAM_HOSTS = {"instagram.com", "www.instagram.com", "m.instagram.com"}
+
+# /p/CODE, /reel/CODE, /reels/CODE, /tv/CODE, /username/p/CODE
+_POST_PATH = re.compile(
+    r"^/(?:[A-Za-z0-9._]+/)?(?P<kind>p|reels?|tv)/(?P<shortcode>[A-Za-z0-9_-]+)/?"
+)
+
+DEFAULT_TITLE = "미정"
+
+# 정확한 set으로 중복을 확인하는 최대 shortcode 수 (초과 시 Bloom 필터로 전환)
+EXACT_DEDUP_LIMIT = 200_000
+
+# 잘못된 줄 경고를 개별 출력하는 최대 개수 (나머지는 요약만 출력)
+MAX_WARNINGS = 5
+
+
+@dataclass
+class UrlReadStats:
+    """URL 읽기 통계"""
+    lines: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    # 결과 로그에 이미 있어 건너뛴 URL 수 (--skip-archived)
+    archived: int = 0
+
+
+def canonicalize_url(url: str) -> Optional[Tuple[str, str]]:
+    """Instagram 게시물 URL을 정규화
+
+    Args:
+        url (str): 원본 URL (추적 쿼리/프래그먼트 포함 가능)
+
+    Returns:
+        Optional[Tuple[str, str]]: (shortcode, 정규화된 URL)
+            게시물 URL이 아니면 None
+    """
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return None
+
+    if parsed.scheme not in ("http", "https") or parsed.netloc.lower() not in INSTAGRAM_HOSTS:
+        return None
+
+    match = _POST_PATH.match(parsed.path)
+    if not match:
+        return None
+
+    kind = "reel" if match.group("kind") == "reels" else match.group("kind")
+    shortcode = match.group("shortcode")
+    return shortcode, f"https://www.instagram.com/{kind}/{shortcode}/"
+
+
+class BloomFilter:
+    """고정 메모리 Bloom 필터 (중복 확인용, 낮은 확률의 오탐 허용)"""
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 1e-4):
+        """
+        초기화
+
+        Args:
+            capacity (int): 예상 최대 항목 수
+            error_rate (float): 허용 오탐률
+        """
+        bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.size = bits
+        self.hash_count = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> bool:
+        """항목 추가
+
+        Args:
+            item (str): 추가할 항목
+
+        Returns:
+            bool: 이미 존재했던 것으로 판단되면 True
+        """
+        present = True
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            mask = 1 << bit
+            if not self._bits[byte] & mask:
+                present = False
+                self._bits[byte] |= mask
+        return present
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(item)
+        )
+
+
+class ShortcodeDeduplicator:
+    """메모리 제한이 있는 shortcode 중복 확인기"""
+
+    def __init__(self, exact_limit: int = EXACT_DEDUP_LIMIT, bloom_capacity: int = 10_000_000):
+        """
+        초기화
+
+        Args:
+            exact_limit (int): 정확한 set으로 관리할 최대 항목 수
+            bloom_capacity (int): Bloom 필터 전환 시 예상 최대 항목 수
+        """
+        self.exact_limit = exact_limit
+        self.bloom_capacity = bloom_capacity
+        self._seen: Optional[set] = set()
+        self._bloom: Optional[BloomFilter] = None
+
+    def seen(self, shortcode: str) -> bool:
+        """shortcode를 기록하고 이전에 본 적 있는지 반환
+
+        Args:
+            shortcode (str): 게시물 shortcode
+
+        Returns:
+            bool: 중복 여부
+        """
+        if self._bloom is not None:
+            return self._bloom.add(shortcode)
+
+        if shortcode in self._seen:
+            return True
+
+        self._seen.add(shortcode)
+        if len(self._seen) > self.exact_limit:
+            # 정확한 set을 Bloom 필터로 옮기고 메모리 해제
+            self._bloom = BloomFilter(self.bloom_capacity)
+            for item in self._seen:
+                self._bloom.add(item)
+            self._seen = None
+        return False
+
+
+def _open_source(source: str) -> IO[str]:
+    """경로/표준 입력을 텍스트 스트림으로 열기 (gzip 자동 감지)"""
+    if source == "-":
+        raw = sys.stdin.buffer
+    else:
+        raw = open(source, "rb")
+
+    head = raw.peek(2)[:2] if hasattr(raw, "peek") else b""
+    if head == b"\x1f\x8b" or source.endswith(".gz"):
+        raw = gzip.GzipFile(fileobj=raw)
+    return io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+
+
+def _parse_line(line: str) -> Optional[Tuple[str, str]]:
+    """한 줄을 (제목, URL)로 파싱 (형식이 잘못되면 None)"""
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(entry, dict):
+            return None
+        url = entry.get("url") or entry.get("link") or ""
+        title = entry.get("title") or DEFAULT_TITLE
+        return str(title).strip(), str(url).strip()
+
+    if "::" in line:
+        title, url = line.split("::", 1)
+        return title.strip() or DEFAULT_TITLE, url.strip()
+
+    return DEFAULT_TITLE, line
+
+
+def iter_urls_with_titles(
+    source: str,
+    dedup: bool = True,
+    stats: Optional[UrlReadStats] = None,
+    exact_limit: int = EXACT_DEDUP_LIMIT,
+) -> Iterator[Tuple[str, str]]:
+    """URL 목록 소스에서 (제목, URL)을 한 줄씩 지연 생성
+
+    Args:
+        source (str): 파일 경로 (gzip 가능) 또는 표준 입력('-')
+        dedup (bool): shortcode 기준 중복 제거 여부
+        stats (Optional[UrlReadStats]): 읽기 통계를 기록할 객체
+        exact_limit (int): 정확한 중복 확인에 사용할 최대 항목 수
+
+    Yields:
+        Tuple[str, str]: (제목, 정규화된 URL)
+
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+    """
+    stats = stats if stats is not None else UrlReadStats()
+    deduplicator = ShortcodeDeduplicator(exact_limit) if dedup else None
+
+    with _open_source(source) as stream:
+        for line_num, line in enumerate(stream, 1):
+            stats.lines += 1
+            line = line.strip()
+            # 빈 줄이나 주석(#으로 시작) 제외
+            if not line or line.startswith("#"):
+                continue
+
+            parsed = _parse_line(line)
+            canonical = canonicalize_url(parsed[1]) if parsed else None
+            if canonical is None:
+                stats.invalid += 1
+                if stats.invalid <= MAX_WARNINGS:
+                    print(f"⚠️ 라인 {line_num}: 유효하지 않은 형식 - {line[:100]}")
+                continue
+
+            shortcode, url = canonical
+            if deduplicator is not None and deduplicator.seen(shortcode):
+                stats.duplicates += 1
+                continue
+
+            stats.accepted += 1
+            yield parsed[0], url
+
+    if stats.invalid > MAX_WARNINGS:
+        print(f"⚠️ 유효하지 않은 줄 {stats.invalid}개 (처음 {MAX_WARNINGS}개만 표시)")
+    if stats.duplicates:
+        print(f"♻️ 중복 URL {stats.duplicates}개 제외")
@@ -4,9 +4,11 @@
 
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import os
 
+from .record import to_json_dict
+
 
 def format_text_output(post_data: Dict[str, Any], show_metadata: bool = False) -> str:
     """게시물 데이터를 포맷팅하여 출력용 문자열로 변환
@@ -62,6 +64,7 @@ def save_to_file(
     post_data: Dict[str, Any],
     filename: Optional[str] = None,
     output_format: str = "txt",
+    fields: Optional[Tuple[str, ...]] = None,
 ) -> str:
     """게시물 데이터를 파일로 저장
 
@@ -69,6 +72,7 @@ def save_to_file(
         post_data (Dict[str, any]): 게시물 데이터
         filename (Optional[str]): 저장할 파일명 (None이면 자동 생성)
         output_format (str): 출력 형식 ('txt', 'json')
+        fields (Optional[Tuple[str, ...]]): JSON에 포함할 필드 (None이면 전체)
 
     Returns:
         str: 저장된 파일 경로
@@ -98,9 +102,7 @@ def save_to_file(
             f.write(format_text_output(post_data, show_metadata=True))
         elif output_format == "json":
             # datetime 객체를 문자열로 변환
-            json_data = post_data.copy()
-            if "date" in json_data and json_data["date"]:
-                json_data["date"] = json_data["date"].isoformat()
+            json_data = to_json_dict(post_data, fields)
             f.write(json.dumps(json_data, ensure_ascii=False, indent=2))
 
     return file_path
@@ -0,0 +1,169 @@
+"""
+archive.py 테스트
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from src.archive import ResultLog, ShortcodeIndex
+from src.commands import run_command
+from src.record import SIMPLE_FIELDS, PostRecord
+
+
+def _record(code: str, **changes) -> PostRecord:
+    """테스트용 레코드"""
+    values = dict(
+        title="도쿄 여행",
+        text=f"본문 {code}\n둘째 줄",
+        username="test_user",
+        likes=10,
+        date=datetime(2023, 6, 15, 14, 30),
+        url=f"https://www.instagram.com/p/{code}/",
+    )
+    values.update(changes)
+    return PostRecord(**values)
+
+
+class TestShortcodeIndex:
+    """ResultLog/ShortcodeIndex 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.log = None
+        self.index = None
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 정리"""
+        if self.log is not None:
+            self.log.close()
+        if self.index is not None:
+            self.index.close()
+
+    def _open(self, tmp_path):
+        path = str(tmp_path / "results.jsonl")
+        self.log = ResultLog(path)
+        self.index = ShortcodeIndex(path, refresh_interval=0)
+        return path
+
+    def test_append_and_lookup(self, tmp_path):
+        """기록한 레코드를 인덱스로 찾는지 테스트"""
+        path = self._open(tmp_path)
+        offset, length = self.log.append(_record("AAA"))
+        self.log.append(_record("BBB"))
+
+        assert "AAA" not in self.index
+        assert self.index.update() == 2
+        assert len(self.index) == 2
+        assert self.index.lookup("AAA") == (offset, length)
+        assert self.index.get("BBB") == _record("BBB")
+        assert self.index.get("CCC") is None
+        with open(path, encoding="utf-8") as f:
+            assert json.loads(f.readline())["shortcode"] == "AAA"
+
+    def test_partial_line_is_not_returned_as_complete(self, tmp_path):
+        """선택한 필드만 기록한 최신 줄은 그 필드를 요청할 때만 반환하는지 테스트"""
+        self._open(tmp_path)
+        self.log.append(_record("AAA"))
+        self.log.append(_record("AAA", title="새 제목"), SIMPLE_FIELDS)
+        self.index.update()
+
+        assert self.index.get("AAA") is None
+        assert self.index.get("AAA", SIMPLE_FIELDS).title == "새 제목"
+
+    def test_incremental_update_keeps_latest(self, tmp_path):
+        """새로 추가된 줄만 반영하고 같은 shortcode는 나중 줄을 가리키는지 테스트"""
+        self._open(tmp_path)
+        self.log.append(_record("AAA", likes=10))
+        self.log.append(_record("BBB"))
+        self.index.update()
+
+        self.log.append(_record("AAA", likes=20))
+        self.log.append(_record("CCC"))
+
+        assert self.index.update() == 2
+        assert self.index.update() == 0
+        assert len(self.index) == 3
+        assert self.index.get("AAA").likes == 20
+        assert self.index.get("BBB") == _record("BBB")
+
+    def test_iter_records_latest_in_log_order(self, tmp_path):
+        """게시물마다 최신 레코드를 로그 순서로 읽는지 테스트"""
+        self._open(tmp_path)
+        self.log.append(_record("AAA", likes=10))
+        self.log.append(_record("BBB"))
+        self.log.append(_record("AAA", likes=20))
+        self.index.update()
+        self.log.append(_record("CCC"))
+
+        records = list(self.index.iter_records())
+
+        assert [(record.url, record.likes) for record in records] == [
+            ("https://www.instagram.com/p/BBB/", 10),
+            ("https://www.instagram.com/p/AAA/", 20),
+        ]
+
+    def test_partial_and_invalid_lines(self, tmp_path):
+        """쓰는 중인 마지막 줄은 완성될 때까지 반영하지 않는지 테스트"""
+        path = self._open(tmp_path)
+        self.log.append(_record("AAA"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("깨진 줄\n")
+            f.write('{"shortcode":"BBB","url":"https://www.instagram.com/p/BBB/"')
+
+        assert self.index.update() == 2
+        assert "BBB" not in self.index
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("}\n")
+
+        assert self.index.update() == 1
+        assert self.index.get("BBB", ("url",)).url == "https://www.instagram.com/p/BBB/"
+
+    def test_reader_sees_replaced_index(self, tmp_path):
+        """다른 인스턴스(프로세스)가 교체한 인덱스를 다시 여는지 테스트"""
+        path = self._open(tmp_path)
+        reader = ShortcodeIndex(path, refresh_interval=0)
+        try:
+            self.log.append(_record("AAA"))
+            self.index.update()
+            assert reader.get("AAA") == _record("AAA")
+
+            self.log.append(_record("BBB"))
+            self.index.update()
+            assert "BBB" in reader
+            assert len(reader) == 2
+        finally:
+            reader.close()
+
+    def test_rebuild_after_truncated_log(self, tmp_path):
+        """로그가 인덱스보다 작아지면 처음부터 다시 만드는지 테스트"""
+        path = self._open(tmp_path)
+        self.log.append(_record("AAA"))
+        self.log.append(_record("BBB"))
+        self.index.update()
+
+        self.log.close()
+        os.remove(path)
+        self.log.append(_record("CCC"))
+
+        assert self.index.update() == 1
+        assert len(self.index) == 1
+        assert "AAA" not in self.index
+        assert self.index.get("CCC") == _record("CCC")
+
+    def test_corrupted_index(self, tmp_path):
+        """손상된 인덱스 파일은 오류를 내고 full 갱신으로 복구되는지 테스트"""
+        path = str(tmp_path / "results.jsonl")
+        with ResultLog(path) as log:
+            log.append(_record("AAA"))
+        with open(path + ".idx", "wb") as f:
+            f.write(b"broken")
+
+        with ShortcodeIndex(path) as index, pytest.raises(ValueError):
+            "AAA" in index
+        assert run_command(["index", "--log", path, "--full", "AAA"]) == 0
+        with ShortcodeIndex(path) as index:
+            assert "AAA" in index
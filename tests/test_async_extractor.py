@@ -0,0 +1,110 @@
+"""
+async_extractor.py 테스트 (httpx.MockTransport로 Instagram 응답 대체)
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.async_extractor import AsyncInstagramTextExtractor
+
+
+def _web_info(shortcode: str) -> dict:
+    """게시물 조회 GraphQL 응답"""
+    return {
+        "status": "ok",
+        "data": {
+            "xdt_api__v1__media__shortcode__web_info": {
+                "items": [{
+                    "code": shortcode,
+                    "caption": {"text": "  테스트   게시물 #도쿄  "},
+                    "like_count": 150,
+                    "comment_count": 3,
+                    "taken_at": 1686839400,
+                    "user": {"username": "test_user"},
+                    "media_type": 8,
+                    "carousel_media": [{}, {}],
+                }]
+            }
+        },
+    }
+
+
+class TestAsyncInstagramTextExtractor:
+    """AsyncInstagramTextExtractor 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.url = "https://www.instagram.com/p/ABC123/"
+        self.requests = []
+
+    def _extractor(self, responses):
+        """응답 목록을 차례로 돌려주는 가짜 전송 계층으로 추출기 생성"""
+        queue = list(responses)
+
+        def handler(request):
+            self.requests.append(request)
+            if request.method == "GET":
+                return httpx.Response(200, headers={"set-cookie": "csrftoken=TOKEN; Path=/"})
+            status, body = queue.pop(0)
+            return httpx.Response(status, json=body)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncInstagramTextExtractor(client=client)
+
+    def test_aget_post_text_success(self):
+        """게시물 조회 및 레코드 변환 테스트"""
+        extractor = self._extractor([(200, _web_info("ABC123"))])
+
+        async def run():
+            async with extractor:
+                return await extractor.aget_post_text(self.url, "도쿄 여행")
+
+        record = asyncio.run(run())
+
+        assert record.title == "도쿄 여행"
+        assert record.text == "테스트 게시물 #도쿄"
+        assert record.username == "test_user"
+        assert record.likes == 150
+        assert record.media_count == 2
+        assert record.is_video is False
+        post = self.requests[-1]
+        assert post.headers["x-csrftoken"] == "TOKEN"
+        assert b"doc_id=27128499623469141" in post.content
+
+    def test_rate_limit_backoff_uses_asyncio_sleep(self):
+        """요청 제한 시 asyncio.sleep으로 대기 후 재시도하는지 테스트"""
+        extractor = self._extractor([(429, {}), (200, _web_info("ABC123"))])
+
+        with patch("src.async_extractor.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            record = asyncio.run(extractor.aget_post_text(self.url, retry_delay=2))
+
+        mock_sleep.assert_awaited_once_with(2)
+        assert record.username == "test_user"
+
+    def test_rate_limit_exhausted(self):
+        """재시도 횟수 초과 시 ConnectionError 테스트"""
+        extractor = self._extractor([(429, {}), (429, {})])
+
+        with patch("src.async_extractor.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(ConnectionError):
+                asyncio.run(extractor.aget_post_text(self.url, max_retries=1))
+
+    def test_missing_or_changed_post(self):
+        """게시물이 없거나 다른 게시물로 바뀐 경우 ValueError 테스트"""
+        empty = {"data": {"xdt_api__v1__media__shortcode__web_info": {"items": []}}}
+        extractor = self._extractor([(200, empty), (200, _web_info("OTHER"))])
+
+        with pytest.raises(ValueError, match="삭제"):
+            asyncio.run(extractor.aget_post_text(self.url))
+        with pytest.raises(ValueError, match="삭제"):
+            asyncio.run(extractor.aget_post_text(self.url))
+
+    def test_invalid_url(self):
+        """유효하지 않은 URL 테스트"""
+        extractor = self._extractor([])
+
+        with pytest.raises(ValueError, match="유효하지 않은"):
+            asyncio.run(extractor.aget_post_text("https://example.com/p/ABC/"))
@@ -0,0 +1,113 @@
+"""
+api/batcher.py 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from api.batcher import MicroBatcher, TTLCache
+from src.record import PostRecord
+
+
+class TestMicroBatcher:
+    """MicroBatcher 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.fetched = []
+
+    async def _fetch(self, url):
+        """가짜 업스트림 조회"""
+        self.fetched.append(url)
+        await asyncio.sleep(0.01)
+        if "FAIL" in url:
+            raise ConnectionError("네트워크 연결 오류")
+        return PostRecord(text=f"본문 {url}", username="user", url=url)
+
+    def test_dedup_within_window(self):
+        """같은 시간 창의 중복 요청을 한 번만 조회하는지 테스트"""
+        async def run():
+            batcher = MicroBatcher(self._fetch, window=0.01)
+            urls = [
+                "https://www.instagram.com/p/AAA/",
+                "https://www.instagram.com/p/AAA/?igsh=xyz",
+                "https://www.instagram.com/reel/BBB/",
+            ]
+            results = await asyncio.gather(*(batcher.submit(url) for url in urls))
+            return batcher, urls, results
+
+        batcher, urls, results = asyncio.run(run())
+
+        assert len(self.fetched) == 2
+        assert [r.url for r in results] == urls
+        assert results[0].text == results[1].text
+        assert batcher.stats.batches == 1
+        assert batcher.stats.deduplicated == 1
+
+    def test_cache_hits_skip_fetch(self):
+        """캐시에 있는 게시물은 조회하지 않는지 테스트"""
+        async def run():
+            batcher = MicroBatcher(self._fetch, window=0.005, cache=TTLCache(ttl=60))
+            first = await batcher.submit("https://www.instagram.com/p/AAA/")
+            second = await batcher.submit("https://www.instagram.com/p/AAA/")
+            return batcher, first, second
+
+        batcher, first, second = asyncio.run(run())
+
+        assert len(self.fetched) == 1
+        assert second == first
+        assert batcher.stats.cache_hits == 1
+
+    def test_joins_inflight_fetch_and_propagates_errors(self):
+        """진행 중인 조회에 합류하고 오류를 모든 요청에 전달하는지 테스트"""
+        async def run():
+            batcher = MicroBatcher(self._fetch, window=0.001)
+            first = asyncio.ensure_future(batcher.submit("https://www.instagram.com/p/FAIL/"))
+            await asyncio.sleep(0.005)
+            second = asyncio.ensure_future(batcher.submit("https://www.instagram.com/p/FAIL/"))
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert len(self.fetched) == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_min_interval_paces_fetches(self):
+        """업스트림 조회 시작 간격 제한 테스트"""
+        async def run():
+            batcher = MicroBatcher(self._fetch, window=0.001, min_interval=0.02)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*(
+                batcher.submit(f"https://www.instagram.com/p/CODE{i}/") for i in range(3)
+            ))
+            return loop.time() - start
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed >= 0.04
+
+    def test_invalid_url(self):
+        """유효하지 않은 URL은 바로 ValueError를 발생시키는지 테스트"""
+        batcher = MicroBatcher(self._fetch)
+
+        with pytest.raises(ValueError):
+            asyncio.run(batcher.submit("https://example.com/p/AAA/"))
+
+
+class TestTTLCache:
+    """TTLCache 클래스 테스트"""
+
+    def test_expiry_and_max_size(self):
+        """만료 및 최대 크기 제한 테스트"""
+        cache = TTLCache(ttl=0, max_size=2)
+        cache.set("A", PostRecord(text="a"))
+        assert cache.get_many(["A"]) == {}
+
+        cache = TTLCache(ttl=60, max_size=2)
+        for key in "ABC":
+            cache.set(key, PostRecord(text=key))
+
+        assert len(cache) == 2
+        assert set(cache.get_many("ABC")) == {"B", "C"}
@@ -0,0 +1,159 @@
+"""
+caption.py 테스트
+"""
+
+from datetime import datetime
+
+from src.caption import (
+    CaptionProcessor,
+    CaptionResult,
+    VIDEO_PLACEHOLDER,
+    normalize_caption,
+    parse_count,
+    parse_og_description,
+    process_caption,
+    process_captions,
+)
+
+
+class TestCaptionProcessor:
+    """CaptionProcessor 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.processor = CaptionProcessor()
+        self.browser_processor = CaptionProcessor(strip_boilerplate=True)
+
+    def test_clean_whitespace(self):
+        """공백 정규화 테스트"""
+        test_cases = [
+            ("  Hello   World  ", "Hello World"),
+            ("Text\n\nwith\n\nmultiple\n\nspaces", "Text with multiple spaces"),
+            ("", ""),
+            ("   ", ""),
+        ]
+
+        for input_text, expected_output in test_cases:
+            assert self.processor.clean(input_text) == expected_output
+            assert self.processor.process(input_text).text == expected_output
+
+    def test_process_extracts_entities(self):
+        """해시태그/멘션/URL/이모지 동시 추출 테스트"""
+        text = "도쿄 맛집 🍣 @user1 추천 #도쿄여행 #sushi\n자세히: https://example.com/a?b=1 👍🏻"
+
+        result = self.processor.process(text)
+
+        assert result.hashtags == ("#도쿄여행", "#sushi")
+        assert result.mentions == ("@user1",)
+        assert result.urls == ("https://example.com/a?b=1",)
+        assert result.emojis == ("🍣", "👍🏻")
+        assert "\n" not in result.text
+
+    def test_url_fragment_is_not_hashtag(self):
+        """URL 안의 #은 해시태그로 취급하지 않음"""
+        result = self.processor.process("링크 https://example.com/page#section")
+
+        assert result.urls == ("https://example.com/page#section",)
+        assert result.hashtags == ()
+
+    def test_zwj_emoji_sequence(self):
+        """ZWJ 이모지 시퀀스는 하나의 이모지로 추출"""
+        family = "\U0001F468‍\U0001F469‍\U0001F467"
+        result = self.processor.process(f"가족 {family} 여행")
+
+        assert result.emojis == (family,)
+
+    def test_default_processor_keeps_boilerplate_words(self):
+        """기본 처리기는 본문의 Follow 등 단어를 유지"""
+        result = self.processor.process("Follow me for more likes")
+        assert result.text == "Follow me for more likes"
+
+    def test_browser_processor_strips_boilerplate(self):
+        """브라우저 처리기의 불필요 문구 제거 테스트"""
+        text = "16K likes, 177 comments   Instagram에서 이 게시물 보기 본문 FOLLOW"
+
+        assert self.browser_processor.clean(text) == "16K , 177 comments 본문"
+        assert self.browser_processor.process(text).text == "16K , 177 comments 본문"
+
+    def test_process_batch_preserves_order(self):
+        """배치 처리 순서 보존 테스트"""
+        captions = (f"캡션 {i} #tag{i}" for i in range(5))
+
+        results = list(self.processor.process_batch(captions))
+
+        assert [r.hashtags for r in results] == [(f"#tag{i}",) for i in range(5)]
+        assert list(self.processor.clean_batch(["a  b", " c "])) == ["a b", "c"]
+
+    def test_module_level_helpers(self):
+        """모듈 수준 헬퍼 함수 테스트"""
+        assert process_caption("") == CaptionResult(text="")
+        assert [r.text for r in process_captions([" x ", "y  z"])] == ["x", "y z"]
+        assert VIDEO_PLACEHOLDER == "동영상콘텐츠"
+
+
+class TestOgDescription:
+    """og:description 파싱 테스트"""
+
+    def test_parse_raw_english_prefix(self):
+        """원본 영어 og:description 접두어 파싱 테스트"""
+        content = '16K likes, 177 comments - nuun.0_ on March 28, 2025: "도쿄여행 𝗗𝗔𝗬 𝟭 총정리".'
+
+        result = parse_og_description(content)
+
+        assert result.username == "nuun.0_"
+        assert result.likes == 16000
+        assert result.comments == 177
+        assert result.date == datetime(2025, 3, 28)
+        assert result.text == "도쿄여행 DAY 1 총정리"
+
+    def test_parse_previously_cleaned_prefix(self):
+        """기존 정제 결과('likes' 제거됨) 접두어 파싱 테스트"""
+        content = '2,616 , 3,283 comments - dadahe_b - June 26, 2025: "본문입니다".'
+
+        result = parse_og_description(content)
+
+        assert result.username == "dadahe_b"
+        assert result.likes == 2616
+        assert result.comments == 3283
+        assert result.date == datetime(2025, 6, 26)
+        assert result.text == "본문입니다"
+
+    def test_parse_prefix_without_counts(self):
+        """좋아요/댓글 수가 없는 접두어 파싱 테스트"""
+        result = parse_og_description('qk0501 - July 21, 2025: "ベーカリー"')
+
+        assert result.username == "qk0501"
+        assert result.likes is None
+        assert result.comments is None
+        assert result.date == datetime(2025, 7, 21)
+
+    def test_parse_korean_prefix(self):
+        """한국어 og:description 접두어 파싱 테스트"""
+        content = '좋아요 1,234개, 댓글 56개 - travel_jp님, 2025년 3월 28일: "본문"'
+
+        result = parse_og_description(content)
+
+        assert result.username == "travel_jp"
+        assert result.likes == 1234
+        assert result.comments == 56
+        assert result.date == datetime(2025, 3, 28)
+
+    def test_parse_without_prefix(self):
+        """접두어가 없는 캡션은 본문만 반환"""
+        result = parse_og_description("  일본여행 치트키 앱 3가지 #일본  ")
+
+        assert result.text == "일본여행 치트키 앱 3가지 #일본"
+        assert result.username is None
+        assert result.date is None
+
+    def test_parse_count(self):
+        """축약 숫자 변환 테스트"""
+        assert parse_count("16K") == 16000
+        assert parse_count("1.2M") == 1200000
+        assert parse_count("3,283") == 3283
+        assert parse_count("") is None
+        assert parse_count("abc") is None
+
+    def test_normalize_keeps_korean_jamo_and_emoji(self):
+        """NFKC 정규화가 한글 자모와 이모지를 보존하는지 테스트"""
+        assert normalize_caption("ㅋㅋ ㄴ숙소 ‼️ （税込） 𝗗𝗔𝗬") == "ㅋㅋ ㄴ숙소 ‼️ (税込) DAY"
@@ -0,0 +1,86 @@
+"""
+chromedriver.py 테스트
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+
+import src.chromedriver as chromedriver
+from src.chromedriver import invalidate_driver_cache, resolve_driver_path
+
+
+class TestResolveDriverPath:
+    """ChromeDriver 경로 확인 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 프로세스 캐시 초기화"""
+        chromedriver._resolved_path = None
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 프로세스 캐시 초기화"""
+        chromedriver._resolved_path = None
+
+    def _make_driver(self, tmp_path, name="chromedriver"):
+        """실행 가능한 가짜 드라이버 파일 생성"""
+        path = tmp_path / name
+        path.write_text("#!/bin/sh\n")
+        path.chmod(0o755)
+        return str(path)
+
+    def test_explicit_path(self, tmp_path):
+        """명시 경로 우선 사용 테스트"""
+        driver = self._make_driver(tmp_path)
+        cache_file = str(tmp_path / "cache.json")
+
+        assert resolve_driver_path(driver, cache_file=cache_file) == driver
+
+        with pytest.raises(RuntimeError):
+            resolve_driver_path(str(tmp_path / "missing"), cache_file=cache_file)
+
+    def test_env_path_is_cached_on_disk_and_in_process(self, tmp_path, monkeypatch):
+        """환경 변수 경로의 디스크/프로세스 캐시 테스트"""
+        driver = self._make_driver(tmp_path)
+        cache_file = str(tmp_path / "cache" / "chromedriver.json")
+        monkeypatch.setenv(chromedriver.DRIVER_PATH_ENV, driver)
+
+        assert resolve_driver_path(cache_file=cache_file) == driver
+        with open(cache_file, encoding="utf-8") as f:
+            assert json.load(f) == {"driver_path": driver}
+
+        # 프로세스 캐시가 있으면 환경 변수가 사라져도 같은 경로 사용
+        monkeypatch.delenv(chromedriver.DRIVER_PATH_ENV)
+        assert resolve_driver_path(cache_file=cache_file) == driver
+
+    def test_disk_cache_used_before_download(self, tmp_path, monkeypatch):
+        """디스크 캐시가 있으면 다운로드하지 않는지 테스트"""
+        driver = self._make_driver(tmp_path)
+        cache_file = str(tmp_path / "chromedriver.json")
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"driver_path": driver}, f)
+        monkeypatch.delenv(chromedriver.DRIVER_PATH_ENV, raising=False)
+
+        with patch("src.chromedriver.shutil.which", return_value=None):
+            assert resolve_driver_path(offline=True, cache_file=cache_file) == driver
+
+    def test_offline_without_driver_raises(self, tmp_path, monkeypatch):
+        """오프라인 모드에서 드라이버가 없으면 예외 발생 테스트"""
+        monkeypatch.delenv(chromedriver.DRIVER_PATH_ENV, raising=False)
+        cache_file = str(tmp_path / "chromedriver.json")
+
+        with patch("src.chromedriver.shutil.which", return_value=None):
+            with pytest.raises(RuntimeError, match="오프라인 모드"):
+                resolve_driver_path(offline=True, cache_file=cache_file)
+
+    def test_invalidate_driver_cache(self, tmp_path, monkeypatch):
+        """캐시 무효화 테스트"""
+        driver = self._make_driver(tmp_path)
+        cache_file = str(tmp_path / "chromedriver.json")
+        monkeypatch.setenv(chromedriver.DRIVER_PATH_ENV, driver)
+        resolve_driver_path(cache_file=cache_file)
+
+        invalidate_driver_cache(cache_file)
+
+        assert chromedriver._resolved_path is None
+        assert not os.path.exists(cache_file)
@@ -0,0 +1,101 @@
+"""
+columnar.py 테스트
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+import pyarrow.parquet as pq
+
+from src.archive import ResultLog
+from src.columnar import ColumnarWriter, export_columnar
+from src.commands import run_command
+from src.record import PostRecord
+
+
+def _record(i: int) -> PostRecord:
+    """테스트용 레코드"""
+    return PostRecord(
+        title=f"제목 {i}",
+        text=f"본문 {i}",
+        username=f"user{i % 3}",
+        likes=i * 10,
+        comments=None if i % 2 else i,
+        date=datetime(2025, 1, 1) + timedelta(days=i),
+        is_video=i % 2 == 1,
+        url=f"https://www.instagram.com/p/C{i}/",
+    )
+
+
+class TestColumnarWriter:
+    """Parquet/Arrow IPC 작성기 테스트"""
+
+    def test_parquet_row_groups_and_types(self, tmp_path):
+        """행 그룹 단위로 쓰고 열 타입을 지정한 대로 저장하는지 테스트"""
+        path = str(tmp_path / "posts.parquet")
+
+        count = export_columnar((_record(i) for i in range(7)), path, "parquet", row_group_size=3)
+
+        table = pq.read_table(path)
+        assert count == 7
+        assert pq.ParquetFile(path).num_row_groups == 3
+        assert table.schema.field("date").type == pa.timestamp("us")
+        assert table.schema.field("likes").type == pa.int64()
+        assert table.schema.field("is_video").type == pa.bool_()
+        assert pa.types.is_dictionary(table.schema.field("username").type)
+        assert table.column("username").to_pylist()[:4] == ["user0", "user1", "user2", "user0"]
+        assert table.column("comments").to_pylist()[:2] == [0, None]
+        assert table.column("date")[1].as_py() == datetime(2025, 1, 2)
+
+    def test_arrow_file_with_growing_dictionary(self, tmp_path):
+        """배치마다 새 작성자가 나와도 Arrow IPC 파일을 memory map으로 읽을 수 있는지 테스트"""
+        path = str(tmp_path / "posts.arrow")
+        records = [_record(i) for i in range(5)]
+        records.append({"title": "dict", "username": "new_user", "date": "2025-03-01T09:00:00+09:00", "url": "x"})
+
+        with ColumnarWriter(path, "arrow", fields=("username", "likes", "date"), row_group_size=2) as writer:
+            writer.write_many(records)
+
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        assert writer.row_groups == 3
+        assert table.column_names == ["username", "likes", "date"]
+        assert table.column("username").to_pylist() == ["user0", "user1", "user2", "user0", "user1", "new_user"]
+        assert table.column("likes").to_pylist()[-1] is None
+        assert table.column("date")[-1].as_py() == datetime(2025, 3, 1, 0, 0)
+
+    def test_failure_leaves_no_file(self, tmp_path):
+        """쓰는 도중 실패하면 임시 파일을 지우고 결과 파일을 만들지 않는지 테스트"""
+        path = tmp_path / "posts.parquet"
+
+        with pytest.raises(pa.ArrowInvalid):
+            with ColumnarWriter(str(path), row_group_size=1) as writer:
+                writer.write(_record(1))
+                writer.write({"likes": "많음"})
+
+        assert os.listdir(tmp_path) == []
+        with pytest.raises(ValueError):
+            ColumnarWriter(str(path), "csv")
+
+
+class TestExportColumnar:
+    """export 명령의 열 형식 내보내기 테스트"""
+
+    def test_export_archive_to_parquet(self, tmp_path):
+        """결과 로그의 게시물별 최신 레코드를 Parquet로 내보내는지 테스트"""
+        log_path = str(tmp_path / "results.jsonl")
+        output = str(tmp_path / "posts.parquet")
+        with ResultLog(log_path) as log:
+            for i in range(3):
+                log.append(_record(i))
+            log.append(_record(0).replace(likes=99, date=datetime(2025, 1, 1, tzinfo=timezone.utc)))
+
+        exit_code = run_command(["export", "--archive", log_path, "-f", "parquet", "-o", output, "--fields", "username,likes,url"])
+
+        table = pq.read_table(output)
+        assert exit_code == 0
+        assert table.column_names == ["username", "likes", "url"]
+        assert table.column("likes").to_pylist() == [10, 20, 99]
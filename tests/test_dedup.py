@@ -0,0 +1,138 @@
+"""
+dedup.py 테스트
+"""
+
+import json
+
+import pytest
+
+from src.commands import run_command
+from src.dedup import (
+    MinHasher,
+    NearDuplicateIndex,
+    dedup_text,
+    find_near_duplicates,
+    lsh_bands,
+    shingles,
+    similarity,
+)
+from src.record import PostRecord
+
+ITINERARY = (
+    "오사카 3박4일 여행 코스 🍜 1일차: 도톤보리 → 신사이바시 → 우메다 공중정원 야경 "
+    "2일차: 유니버설 스튜디오 재팬 3일차: 교토 당일치기 기요미즈데라 #오사카 #여행"
+)
+REPOST = (
+    "오사카 3박4일 여행 코스 🍣 1일차: 도톤보리 → 신사이바시 → 우메다 공중정원 야경! "
+    "2일차: 유니버설 스튜디오 재팬 3일차: 교토 당일치기 기요미즈데라 #오사카여행 @friend"
+)
+OTHER = "도쿄 긴자 스시 오마카세 예약 방법과 가격 정리, 런치 코스는 1만 엔부터 시작합니다"
+
+
+def _post(code: str, text: str) -> PostRecord:
+    """테스트용 레코드"""
+    return PostRecord(title=f"제목 {code}", text=text, username="user", url=f"https://www.instagram.com/p/{code}/")
+
+
+class TestMinHash:
+    """MinHash 서명 및 LSH 설정 테스트"""
+
+    def test_dedup_text(self):
+        """og:description 접두어, 멘션, 이모지, URL, 기호를 제거하는지 테스트"""
+        text = '95 , 3 comments - travel_jp - August 10, 2025: "60년 전통, 장인 #스시 @abc 🍣 https://x.com/a".'
+
+        assert dedup_text(text) == "60년전통장인스시"
+        assert shingles("가나다", 4) == {"가나다"}
+        assert shingles("", 4) == set()
+
+    def test_signature_estimates_jaccard(self):
+        """서명 일치율이 n-gram Jaccard 유사도에 가까운지 테스트"""
+        hasher = MinHasher()
+        a = shingles(dedup_text(ITINERARY))
+        b = shingles(dedup_text(REPOST))
+        jaccard = len(a & b) / len(a | b)
+
+        estimate = similarity(hasher.signature(ITINERARY), hasher.signature(REPOST))
+
+        assert abs(estimate - jaccard) < 0.1
+        assert similarity(hasher.signature(ITINERARY), hasher.signature(OTHER)) < 0.2
+        assert hasher.signature(ITINERARY) == MinHasher().signature(ITINERARY)
+        assert hasher.signature("🍜 @user") is None
+
+    def test_short_text_fills_empty_bins(self):
+        """n-gram이 적어 빈 칸이 생겨도 서명 길이가 유지되는지 테스트"""
+        signature = MinHasher(num_perm=64).signature("오사카 맛집")
+
+        assert len(signature) == 64
+        assert None not in signature
+
+    def test_lsh_bands(self):
+        """후보 경계가 기준 이하인 band 조합을 고르는지 테스트"""
+        assert lsh_bands(128, 0.8) == (16, 8)
+        assert lsh_bands(128, 0.5) == (32, 4)
+
+
+class TestNearDuplicateIndex:
+    """NearDuplicateIndex 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.index = NearDuplicateIndex(threshold=0.7)
+
+    def test_add_returns_previous_matches(self):
+        """추가 전에 있던 유사 게시물을 반환하는지 테스트"""
+        assert self.index.add("AAA", ITINERARY) == []
+        assert self.index.add("BBB", OTHER) == []
+
+        matches = self.index.add("CCC", REPOST)
+
+        assert [key for key, _ in matches] == ["AAA"]
+        assert matches[0][1] >= 0.7
+        assert self.index.add("AAA", OTHER) == []
+        assert len(self.index) == 3
+        assert [key for key, _ in self.index.query(ITINERARY)][0] == "AAA"
+
+    def test_invalid_threshold(self):
+        """유사도 기준 범위 검증 테스트"""
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(threshold=1.5)
+
+
+class TestFindNearDuplicates:
+    """find_near_duplicates 함수 및 dedup 명령 테스트"""
+
+    def test_groups_in_input_order(self):
+        """처음 나온 게시물을 대표로 묶고 같은 shortcode는 건너뛰는지 테스트"""
+        posts = [
+            _post("AAA", ITINERARY),
+            _post("BBB", OTHER),
+            _post("CCC", REPOST),
+            _post("AAA", ITINERARY),
+            _post("DDD", ITINERARY + " 4일차: 귀국"),
+        ]
+
+        result = find_near_duplicates(posts, threshold=0.7)
+
+        assert [post.url for post in result.unique] == [posts[0].url, posts[1].url]
+        assert result.same_post == 1
+        assert result.duplicate_count == 2
+        assert len(result.groups) == 1
+        assert result.groups[0].representative is posts[0]
+        assert [post for post, _ in result.groups[0].duplicates] == [posts[2], posts[4]]
+
+    def test_dedup_command_filter(self, tmp_path, monkeypatch):
+        """dedup 명령이 중복을 뺀 통합 파일을 저장하는지 테스트"""
+        source = tmp_path / "instagram_batch_combined_20250915_100108.json"
+        posts = [_post("AAA", ITINERARY), _post("BBB", REPOST), _post("CCC", OTHER)]
+        source.write_text(
+            json.dumps({"results": [post.to_json_dict() for post in posts]}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert run_command(["dedup", str(source), "--threshold", "0.7", "--filter"]) == 0
+
+        saved = list((tmp_path / "outputs").glob("instagram_batch_combined_*.json"))
+        assert len(saved) == 1
+        data = json.loads(saved[0].read_text(encoding="utf-8"))
+        assert [item["url"] for item in data["results"]] == [posts[0].url, posts[2].url]
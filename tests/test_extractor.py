@@ -24,6 +24,9 @@ class TestInstagramTextExtractor:
             "http://www.instagram.com/p/DEF456/",
             "https://www.instagram.com/reel/GHI789/",
             "https://instagram.com/tv/JKL012/",
+            "https://www.instagram.com/reels/MNO345/",
+            "https://m.instagram.com/p/PQR678/",
+            "https://www.instagram.com/someone/p/STU901/",
         ]
 
         for url in valid_urls:
@@ -50,6 +53,8 @@ class TestInstagramTextExtractor:
             ("https://www.instagram.com/p/ABC123/", "ABC123"),
             ("https://instagram.com/reel/XYZ789/", "XYZ789"),
             ("https://www.instagram.com/tv/DEF456/", "DEF456"),
+            ("https://www.instagram.com/reels/GHI789/?igsh=abc", "GHI789"),
+            ("https://www.instagram.com/someone/p/JKL012/", "JKL012"),
         ]
 
         for url, expected_shortcode in test_cases:
@@ -182,3 +187,23 @@ class TestInstagramTextExtractor:
 
         with pytest.raises(ConnectionError, match="네트워크 연결 오류"):
             self.extractor.get_post_text(url)
+
+    @patch("src.extractor.instaloader.Post.from_shortcode")
+    def test_get_post_text_with_fields(self, mock_from_shortcode):
+        """선택하지 않은 메타데이터 속성은 조회하지 않는지 테스트"""
+
+        class CaptionOnlyPost:
+            caption = "  캡션만   필요  "
+
+            def __getattr__(self, name):
+                raise AssertionError(f"{name} 속성을 조회하면 안 됩니다")
+
+        mock_from_shortcode.return_value = CaptionOnlyPost()
+
+        url = "https://www.instagram.com/p/ABC123/"
+        result = self.extractor.get_post_text(url, "제목", fields=("title", "text", "url"))
+
+        assert result.text == "캡션만 필요"
+        assert result.title == "제목"
+        assert result.url == url
+        assert result.username == ""
@@ -0,0 +1,84 @@
+"""
+generate_google_maps_csv.py 테스트
+"""
+
+import csv
+import json
+
+from generate_google_maps_csv import HEADERS, LocationMerger, iter_locations, write_layers
+
+
+def _read_csv(path):
+    """헤더를 뺀 CSV 행 목록"""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == HEADERS
+    return rows[1:]
+
+
+class TestLocationMerger:
+    """장소 스트리밍/중복 합치기/레이어 분할 테스트"""
+
+    def setup_method(self):
+        """테스트 설정"""
+        self.merger = LocationMerger()
+
+    def teardown_method(self):
+        """테스트 정리"""
+        self.merger.close()
+
+    def _write_input(self, tmp_path, locations):
+        path = tmp_path / "locations.json"
+        path.write_text(json.dumps({"generated_at": "x", "locations": locations}, ensure_ascii=False), encoding="utf-8")
+        return str(path)
+
+    def test_merges_duplicates_and_links_sources(self, tmp_path):
+        """이름과 주소가 같은 장소를 합치고 게시물별 좋아요를 한 번씩 더하는지 테스트"""
+        path = self._write_input(tmp_path, [
+            {"name": "센소지", "address": "東京都台東区浅草2-3-1", "category": "", "website": "https://a/1", "likes": 10},
+            {"name": "신주쿠", "address": "東京都新宿区", "category": "지역", "website": "https://a/2", "likes": 5},
+            {"name": " 센소지", "address": "東京都台東区浅草2-3-1 ", "category": "관광지", "description": "절",
+             "posts": [{"url": "https://a/3", "likes": 30}, {"url": "https://a/1", "likes": 12}]},
+        ])
+
+        for location in iter_locations(path):
+            self.merger.add(location)
+        layers = write_layers(self.merger, str(tmp_path / "out.csv"))
+
+        assert self.merger.read_count == 3
+        assert layers == [(str(tmp_path / "out.csv"), None, 2)]
+        rows = _read_csv(layers[0][0])
+        assert rows[0] == [
+            "센소지", "東京都台東区浅草2-3-1", "절", "관광지", "https://a/3", "42", "", "", "https://a/3\nhttps://a/1",
+        ]
+        assert rows[1][0] == "신주쿠"
+
+    def test_writes_layer_sized_shards_by_category(self, tmp_path):
+        """레이어 크기를 넘으면 카테고리별로 번호 붙은 파일로 나누는지 테스트"""
+        for i in range(5):
+            self.merger.add({"name": f"맛집 {i}", "category": "맛집", "likes": i})
+        self.merger.add({"name": "공원", "category": "관광지"})
+
+        layers = write_layers(self.merger, str(tmp_path / "out.csv"), layer_size=2, by_category=True)
+
+        assert [(path.rsplit("/", 1)[-1], category, count) for path, category, count in layers] == [
+            ("out_관광지.csv", "관광지", 1),
+            ("out_맛집_01.csv", "맛집", 2),
+            ("out_맛집_02.csv", "맛집", 2),
+            ("out_맛집_03.csv", "맛집", 1),
+        ]
+        assert [row[0] for row in _read_csv(layers[3][0])] == ["맛집 4"]
+
+    def test_colliding_category_names_do_not_overwrite(self, tmp_path):
+        """파일 이름이 같아지는 카테고리는 접미사를 붙여 따로 저장하는지 테스트"""
+        self.merger.add({"name": "케이크집", "category": "카페/디저트"})
+        self.merger.add({"name": "빵집", "category": "카페 디저트"})
+
+        layers = write_layers(self.merger, str(tmp_path / "out.csv"), by_category=True)
+
+        assert [(path.rsplit("/", 1)[-1], category) for path, category, _ in layers] == [
+            ("out_카페_디저트.csv", "카페 디저트"),
+            ("out_카페_디저트~2.csv", "카페/디저트"),
+        ]
+        assert [row[0] for row in _read_csv(layers[0][0])] == ["빵집"]
+        assert [row[0] for row in _read_csv(layers[1][0])] == ["케이크집"]
@@ -0,0 +1,181 @@
+"""
+importer.py 테스트
+"""
+
+import io
+import json
+
+import pytest
+
+from src.commands import run_command
+from src.importer import ArchiveImporter, iter_failed_urls, iter_json_results, source_timestamp
+from src.store import ResultStore
+
+
+def _post(code: str, text: str, **extra) -> dict:
+    """테스트용 게시물 dict"""
+    data = {
+        "title": "제목",
+        "text": text,
+        "username": "test_user",
+        "url": f"https://www.instagram.com/p/{code}/",
+        "likes": 12345,
+        "date": "2025-09-15T10:00:00",
+        "media_count": 1,
+        "is_video": False,
+    }
+    data.update(extra)
+    return data
+
+
+def _combined(processed_at: str, posts: list) -> str:
+    """save_combined_results 형식 JSON"""
+    return json.dumps(
+        {"processed_at": processed_at, "total_count": len(posts), "results": posts},
+        ensure_ascii=False,
+        indent=2,
+    )
+
+
+class TestStreamingParsers:
+    """스트리밍 파서 테스트"""
+
+    def test_combined_file_in_small_chunks(self):
+        """작은 청크로 나누어 읽어도 같은 결과를 얻는지 테스트"""
+        posts = [_post(f"CODE{i}", f"본문 {i} \"따옴표\" \\ 역슬래시") for i in range(5)]
+        content = _combined("2025-09-15T10:01:08", posts)
+
+        items = list(iter_json_results(io.StringIO(content), chunk_size=7))
+
+        assert [item for _, item in items] == posts
+        assert items[0][0]["processed_at"] == "2025-09-15T10:01:08"
+        assert items[0][0]["total_count"] == 5
+
+    def test_other_shapes(self):
+        """최상위 배열 및 개별 게시물 파일 테스트"""
+        posts = [_post("AAA", "a"), _post("BBB", "b")]
+
+        array_items = list(iter_json_results(io.StringIO(json.dumps(posts)), chunk_size=5))
+        single_items = list(iter_json_results(io.StringIO(json.dumps(posts[0])), chunk_size=5))
+        empty_items = list(iter_json_results(io.StringIO('{"results": []}')))
+
+        assert [item for _, item in array_items] == posts
+        assert single_items == [({}, posts[0])]
+        assert empty_items == []
+
+    def test_truncated_file(self):
+        """잘린 파일은 ValueError를 발생시키는지 테스트"""
+        content = _combined("2025-09-15T10:01:08", [_post("AAA", "a")])[:-40]
+
+        with pytest.raises(ValueError):
+            list(iter_json_results(io.StringIO(content), chunk_size=16))
+
+    def test_failed_urls_with_literal_newlines(self):
+        """줄바꿈이 "\\n" 문자열로 저장된 실패 목록 테스트"""
+        content = (
+            "# 실패한 Instagram URL 목록 (제목 포함)\\n# 처리일시: 2025-09-15 10:00:00\\n\\n"
+            "도쿄::https://www.instagram.com/p/AAA/  # 오류: 401 Unauthorized\\n"
+            "https://www.instagram.com/reel/BBB/  # 오류: 네트워크 오류\\n"
+        )
+
+        assert list(iter_failed_urls(io.StringIO(content))) == [
+            ("도쿄", "https://www.instagram.com/p/AAA/", "401 Unauthorized"),
+            ("미정", "https://www.instagram.com/reel/BBB/", "네트워크 오류"),
+        ]
+
+    def test_source_timestamp(self, tmp_path):
+        """파일명에서 추출 시각을 읽는지 테스트"""
+        stamped = tmp_path / "instagram_batch_combined_20250915_100108.json"
+        epoch = tmp_path / "failed_urls_1700000000.txt"
+
+        assert source_timestamp(str(stamped)) < source_timestamp(
+            str(stamped), {"processed_at": "2025-09-16T00:00:00"}
+        )
+        assert source_timestamp(str(epoch)) == 1700000000.0
+
+
+class TestArchiveImporter:
+    """ArchiveImporter 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.store = ResultStore(":memory:")
+        self.importer = ArchiveImporter(self.store, batch_size=2, chunk_size=32)
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 정리"""
+        self.store.close()
+
+    def _write(self, directory, name: str, content: str) -> str:
+        path = directory / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def test_keeps_freshest_record(self, tmp_path):
+        """파일을 가져오는 순서와 관계없이 가장 최근 레코드를 유지하는지 테스트"""
+        newer = self._write(tmp_path, "instagram_batch_combined_20250921_154151.json", _combined(
+            "2025-09-21T15:41:51", [_post("AAA", "새 본문", likes=20), _post("BBB", "b")]
+        ))
+        older = self._write(tmp_path, "instagram_batch_combined_20250915_100108.json", _combined(
+            "2025-09-15T10:01:08", [_post("AAA", "옛 본문", likes=10), _post("CCC", "c"), {"text": "URL 없음"}]
+        ))
+
+        stats = self.importer.import_paths([newer, older])
+
+        assert stats.files == 2
+        assert stats.records == 4
+        assert stats.invalid_records == 1
+        assert len(self.store) == 3
+        assert self.store.get("AAA").text == "새 본문"
+        assert self.store.get("AAA").likes == 20
+
+    def test_simple_file_keeps_metadata(self, tmp_path):
+        """나중에 가져온 간단한 통합 파일(title, text, url)이 기존 메타데이터를 지우지 않는지 테스트"""
+        full = self._write(tmp_path, "instagram_batch_combined_20250915_100108.json", _combined(
+            "2025-09-15T10:01:08", [_post("AAA", "옛 본문", likes=10, comments=3, is_video=True)]
+        ))
+        simple = self._write(tmp_path, "instagram_batch_combined_simple_20250921_154151.json", _combined(
+            "2025-09-21T15:41:51",
+            [{"title": "새 제목", "text": "새 본문", "url": "https://www.instagram.com/p/AAA/"}],
+        ))
+
+        self.importer.import_paths([full, simple])
+
+        record = self.store.get("AAA")
+        assert (record.title, record.text) == ("새 제목", "새 본문")
+        assert record.username == "test_user"
+        assert (record.likes, record.comments, record.is_video) == (10, 3, True)
+        assert record.date is not None
+
+    def test_rerun_only_imports_new_files(self, tmp_path):
+        """다시 실행하면 새 파일과 내용이 다른 파일만 가져오는지 테스트"""
+        content = _combined("2025-09-15T10:01:08", [_post("AAA", "a")])
+        first = self._write(tmp_path, "instagram_batch_combined_20250915_100108.json", content)
+        copy = self._write(tmp_path, "instagram_batch_combined_20250915_101553.json", content)
+        self.importer.import_paths([first])
+
+        stats = self.importer.import_paths(ArchiveImporter.discover(str(tmp_path)))
+        assert (stats.files, stats.skipped_files) == (0, 2)
+
+        self._write(tmp_path, "batch_01_test_user_1758000000.json", json.dumps(_post("DDD", "d")))
+        stats = self.importer.import_paths(ArchiveImporter.discover(str(tmp_path)))
+        assert (stats.files, stats.skipped_files) == (1, 2)
+        assert "DDD" in self.store
+        assert copy in ArchiveImporter.discover(str(tmp_path))
+
+    def test_failed_urls_and_retry_file(self, tmp_path):
+        """실패 목록을 가져오고 성공하지 못한 URL만 재시도 목록에 남기는 테스트"""
+        source = tmp_path / "outputs"
+        source.mkdir()
+        self._write(source, "failed_urls_with_titles_1700000000.txt", (
+            "# 실패 목록\\n도쿄::https://www.instagram.com/p/AAA/  # 오류: 403\\n"
+            "오사카::https://www.instagram.com/p/BBB/  # 오류: 403\\n"
+        ))
+        self._write(source, "instagram_batch_combined_20250921_154151.json", _combined(
+            "2025-09-21T15:41:51", [_post("AAA", "나중에 성공")]
+        ))
+        db = str(tmp_path / "results.db")
+        retry = tmp_path / "retry.txt"
+
+        assert run_command(["import", str(source), "--store", db, "--retry-file", str(retry)]) == 0
+        assert retry.read_text(encoding="utf-8") == "오사카::https://www.instagram.com/p/BBB/\n"
@@ -3,10 +3,13 @@ main.py 테스트
 """
 
 import argparse
+import os
 from unittest.mock import Mock, patch
 from io import StringIO
 
-from src.main import parse_arguments, process_single_url
+import pytest
+
+from src.main import main, parse_arguments, process_single_url
 
 
 class TestMain:
@@ -184,3 +187,51 @@ class TestMain:
         assert "테스트 본문입니다" in output
         # quiet 모드에서는 포맷팅된 출력이 없어야 함
         assert "Instagram 게시물 본문" not in output
+
+    def test_batch_all_archived_exits_zero(self, tmp_path):
+        """--skip-archived로 모든 URL을 건너뛰면 실패 없이 정상 종료하는지 테스트"""
+        from src.archive import ResultLog
+        from src.record import PostRecord
+
+        log_path = str(tmp_path / "results.jsonl")
+        batch_file = tmp_path / "urls.txt"
+        urls = [f"https://www.instagram.com/p/CODE{i}/" for i in range(3)]
+        batch_file.write_text("\n".join(urls) + "\n", encoding="utf-8")
+        with ResultLog(log_path) as log:
+            for url in urls:
+                log.append(PostRecord(title="보관됨", text="본문입니다", username="user", url=url))
+
+        argv = ["main.py", "--batch-file", str(batch_file), "--skip-archived", "--archive", log_path]
+        with patch("sys.argv", argv), patch("src.extractor.InstagramTextExtractor") as mock_extractor_class, \
+                patch("sys.stdout", StringIO()), pytest.raises(SystemExit) as exit_info:
+            main()
+
+        assert exit_info.value.code == 0
+        mock_extractor_class.return_value.get_post_text.assert_not_called()
+
+    def test_batch_interrupt_cleans_up_outputs(self, tmp_path, monkeypatch):
+        """배치 도중 중단되어도 열 형식 임시 파일을 지우고 결과 로그 인덱스를 갱신하는지 테스트"""
+        pytest.importorskip("pyarrow")
+        from src.archive import ShortcodeIndex
+        from src.record import PostRecord
+
+        monkeypatch.chdir(tmp_path)
+        batch_file = tmp_path / "urls.txt"
+        batch_file.write_text("https://www.instagram.com/p/CODE1/\n", encoding="utf-8")
+        log_path = str(tmp_path / "results.jsonl")
+
+        def interrupted(extractor, urls_with_titles, args, store, archive, columnar):
+            record = PostRecord(title="글", text="본문입니다", username="user", url="https://www.instagram.com/p/CODE1/")
+            archive.append(record)
+            columnar.write(record)
+            raise KeyboardInterrupt
+
+        argv = ["main.py", "--batch", str(batch_file), "--save", "parquet", "--archive", log_path]
+        with patch("sys.argv", argv), patch("src.extractor.InstagramTextExtractor"), \
+                patch("src.main.process_batch_urls_with_titles", side_effect=interrupted), \
+                patch("sys.stdout", StringIO()), pytest.raises(KeyboardInterrupt):
+            main()
+
+        assert os.listdir(tmp_path / "outputs") == []
+        with ShortcodeIndex(log_path) as index:
+            assert "CODE1" in index
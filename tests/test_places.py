@@ -0,0 +1,132 @@
+"""
+places.py 테스트
+"""
+
+import json
+
+from src.commands import run_command
+from src.places import Gazetteer, PlaceAutomaton, extract_locations, normalize_place
+from src.record import PostRecord
+
+PLACES = [
+    {"name": "시부야", "name_en": "Shibuya", "aliases": ["渋谷"], "address": "東京都渋谷区", "category": "지역"},
+    {
+        "name": "시부야 스크램블 교차로",
+        "name_en": "Shibuya Scramble Crossing",
+        "aliases": ["스크램블 교차로"],
+        "address": "東京都渋谷区道玄坂2-2-1",
+        "category": "관광지",
+    },
+    {"name": "기요미즈데라", "name_en": "Kiyomizu-dera", "aliases": ["청수사", "清水寺"], "category": "관광지"},
+    {"name": "우에노", "name_en": "Ueno", "aliases": ["上野"], "category": "지역", "rating": 4.5},
+]
+
+
+def _post(code: str, text: str, likes: int = 0) -> PostRecord:
+    """테스트용 레코드"""
+    return PostRecord(title=f"제목 {code}", text=text, likes=likes, url=f"https://www.instagram.com/p/{code}/")
+
+
+class TestPlaceAutomaton:
+    """Aho-Corasick 오토마톤 테스트"""
+
+    def test_finds_overlapping_patterns(self):
+        """겹치는 패턴과 실패 링크로 이어지는 패턴을 모두 찾는지 테스트"""
+        automaton = PlaceAutomaton(["he", "she", "his", "hers"])
+
+        assert sorted(automaton.iter_matches("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+        assert list(automaton.iter_matches("xyz")) == []
+
+    def test_skips_whitespace_inside_pattern(self):
+        """패턴 중간의 공백을 건너뛰되 같은 출현을 반복하지 않는지 테스트"""
+        automaton = PlaceAutomaton([normalize_place("시부야 스크램블"), "시부야"])
+
+        matches = sorted(automaton.iter_matches("오늘 시부야  스크램블"))
+
+        assert matches == [(3, 6, 1), (3, 12, 0)]
+
+
+class TestGazetteer:
+    """지명 사전 매칭 및 캐시 테스트"""
+
+    def setup_method(self):
+        """테스트 설정"""
+        self.gazetteer = Gazetteer(PLACES)
+
+    def _names(self, text):
+        return [self.gazetteer.places[mention.place]["name"] for mention in self.gazetteer.find(text)]
+
+    def test_find_prefers_longest_match(self):
+        """겹치면 더 긴 장소명을 남기고 해시태그/줄바꿈 안의 장소도 찾는지 테스트"""
+        text = "첫날은 시부야\n스크램블 교차로, 다음 날은 #시부야맛집 그리고 ＫＩＹＯＭＩＺＵ-ＤＥＲＡ"
+
+        mentions = self.gazetteer.find(text)
+
+        assert self._names(text) == ["시부야 스크램블 교차로", "시부야", "기요미즈데라"]
+        assert text[mentions[0].start:mentions[0].end] == "시부야\n스크램블 교차로"
+        assert "\n" not in mentions[0].snippet
+
+    def test_ascii_names_need_word_boundary(self):
+        """영문 장소명이 다른 단어의 일부이면 제외하는지 테스트"""
+        assert self._names("Blue note in Ueno") == ["우에노"]
+        assert self._names("bluenote, uenoyama") == []
+
+    def test_cached_automaton_reused_until_gazetteer_changes(self, tmp_path):
+        """캐시된 오토마톤을 재사용하고 사전이 바뀌면 다시 만드는지 테스트"""
+        path = tmp_path / "gazetteer.json"
+        cache = tmp_path / "gazetteer.automaton"
+        path.write_text(json.dumps({"places": PLACES}, ensure_ascii=False), encoding="utf-8")
+
+        Gazetteer.load(str(path), str(cache))
+        built = cache.stat().st_mtime_ns
+        cached = Gazetteer.load(str(path), str(cache))
+
+        assert cache.stat().st_mtime_ns == built
+        assert [cached.places[mention.place]["name"] for mention in cached.find("上野 공원")] == ["우에노"]
+
+        path.write_text(json.dumps({"locations": PLACES[:1]}, ensure_ascii=False), encoding="utf-8")
+        rebuilt = Gazetteer.load(str(path), str(cache))
+
+        assert rebuilt.find("上野") == []
+        assert len(rebuilt.find("渋谷")) == 1
+
+
+class TestExtractLocations:
+    """장소 집계 및 places 명령 테스트"""
+
+    def test_aggregates_posts_per_place(self):
+        """장소별로 게시물을 묶고 좋아요가 가장 많은 게시물을 대표로 쓰는지 테스트"""
+        posts = [
+            _post("AAA", "우에노 공원 산책 후 시부야로 이동", likes=10),
+            _post("BBB", "上野 아메요코 시장", likes=300),
+            _post("AAA", "우에노 공원 산책 후 시부야로 이동", likes=12),
+            _post("CCC", "장소 없는 캡션"),
+        ]
+
+        summaries = extract_locations(posts, Gazetteer(PLACES))
+        locations = [summary.to_location() for summary in summaries]
+
+        assert [location["name"] for location in locations] == ["우에노", "시부야"]
+        assert locations[0]["website"] == posts[1].url
+        assert locations[0]["likes"] == 300
+        assert locations[0]["mentions"] == 2
+        assert locations[0]["rating"] == 4.5
+        assert [post["likes"] for post in locations[0]["posts"]] == [300, 12]
+        assert "上野" in locations[0]["description"]
+
+    def test_places_command_writes_locations(self, tmp_path, monkeypatch):
+        """places 명령이 generate_google_maps_csv.py 형식의 JSON을 저장하는지 테스트"""
+        (tmp_path / "gazetteer.json").write_text(json.dumps({"places": PLACES}, ensure_ascii=False), encoding="utf-8")
+        source = tmp_path / "instagram_batch_combined_20250915_100108.json"
+        posts = [_post("AAA", "교토 청수사 야경", likes=5), _post("BBB", "시부야 스크램블 교차로 라이브캠")]
+        source.write_text(
+            json.dumps({"results": [post.to_json_dict() for post in posts]}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert run_command(["places", str(source)]) == 0
+
+        data = json.loads((tmp_path / "outputs" / "locations.json").read_text(encoding="utf-8"))
+        assert sorted(location["name"] for location in data["locations"]) == ["기요미즈데라", "시부야 스크램블 교차로"]
+        assert (tmp_path / "outputs" / "gazetteer.automaton").exists()
@@ -0,0 +1,180 @@
+"""
+playwright_extractor.py 테스트 (실제 브라우저 대신 가짜 Playwright 객체 사용)
+"""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.playwright_extractor import PlaywrightInstagramExtractor
+
+
+HTML = (
+    '<html><head><meta property="og:description" '
+    'content="user on June 15, 2023: &quot;맛집 탐방 기록입니다&quot;" /></head></html>'
+)
+
+
+class FakePage:
+    """가짜 페이지 (URL에 따라 지연/오류 발생)"""
+
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.browser.loads.append(url)
+        if "SLOW" in url:
+            await asyncio.sleep(1)
+        if "CRASH" in url:
+            self.browser.connected = False
+            raise Exception("Target page, context or browser has been closed")
+
+    async def content(self):
+        return HTML
+
+
+class FakeContext:
+    """가짜 브라우저 컨텍스트"""
+
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        return FakePage(self.browser)
+
+    async def close(self):
+        self.browser.open_contexts -= 1
+
+
+class FakeBrowser:
+    """가짜 브라우저 프로세스"""
+
+    def __init__(self):
+        self.connected = True
+        self.loads = []
+        self.open_contexts = 0
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        self.open_contexts += 1
+        return FakeContext(self)
+
+    async def close(self):
+        self.connected = False
+
+
+def _start(extractor):
+    """playwright 없이 추출기를 시작 상태로 만들고 브라우저 실행 함수를 반환"""
+    launch = AsyncMock(side_effect=lambda **kwargs: FakeBrowser())
+    extractor._playwright = Mock()
+    extractor._playwright.chromium.launch = launch
+    extractor._playwright.stop = AsyncMock()
+    extractor._launch_lock = asyncio.Lock()
+    extractor._slots = asyncio.Semaphore(extractor.max_contexts)
+    return launch
+
+
+class TestPlaywrightInstagramExtractor:
+    """PlaywrightInstagramExtractor 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.extractor = PlaywrightInstagramExtractor(max_contexts=3, url_timeout=0.1)
+
+    def test_extract_single_url(self):
+        """페이지 로드 후 og:description 파싱 테스트"""
+        async def run():
+            _start(self.extractor)
+            return await self.extractor.extract_single_url(
+                "https://www.instagram.com/p/ABC123/", "맛집"
+            )
+
+        result = asyncio.run(run())
+
+        assert result.success is True
+        assert result.username == "user"
+        assert result.text == "맛집 탐방 기록입니다"
+        assert self.extractor._browser.open_contexts == 0
+
+    def test_url_timeout_is_retryable(self):
+        """URL 처리 시간 초과 시 재시도 가능한 실패 및 컨텍스트 정리 테스트"""
+        async def run():
+            _start(self.extractor)
+            return await self.extractor.extract_single_url(
+                "https://www.instagram.com/p/SLOW/", "느린 글"
+            )
+
+        result = asyncio.run(run())
+
+        assert result.success is False
+        assert result.retryable is True
+        assert "URL 처리 시간 초과" in result.error_message
+        assert self.extractor._browser.open_contexts == 0
+
+    def test_crashed_browser_relaunched(self):
+        """브라우저가 중단되면 재시도 가능한 실패로 분류하고 다시 실행하는지 테스트"""
+        async def run():
+            launch = _start(self.extractor)
+            crashed = await self.extractor.extract_single_url(
+                "https://www.instagram.com/p/CRASH/", "중단"
+            )
+            recovered = await self.extractor.extract_single_url(
+                "https://www.instagram.com/p/ABC123/", "정상"
+            )
+            return crashed, recovered, launch.await_count
+
+        crashed, recovered, launches = asyncio.run(run())
+
+        assert crashed.retryable is True
+        assert "브라우저 중단" in crashed.error_message
+        assert recovered.success is True
+        assert launches == 2
+
+    def test_aiter_extract_ordered_with_requeue(self):
+        """입력 순서 복원 및 시간 초과 URL 1회 재시도 테스트"""
+        url_data = [
+            ("느린 글", "https://www.instagram.com/p/SLOW/"),
+            ("글 1", "https://www.instagram.com/p/CODE1/"),
+            ("글 2", "https://www.instagram.com/p/CODE2/"),
+        ]
+
+        async def run():
+            _start(self.extractor)
+            results = [r async for r in self.extractor.aiter_extract(url_data, ordered=True)]
+            return results, self.extractor._browser.loads
+
+        results, loads = asyncio.run(run())
+
+        assert [r.title for r in results] == ["느린 글", "글 1", "글 2"]
+        assert results[0].success is False
+        assert loads.count("https://www.instagram.com/p/SLOW/") == 2
+
+    def test_requeued_url_runs_at_tail(self):
+        """재시도 URL이 남은 입력을 모두 실행한 뒤에 다시 로드되는지 테스트"""
+        extractor = PlaywrightInstagramExtractor(max_contexts=1, url_timeout=0.1)
+        url_data = [("느린 글", "https://www.instagram.com/p/SLOW/")] + [
+            (f"글 {i}", f"https://www.instagram.com/p/CODE{i}/") for i in range(3)
+        ]
+
+        async def run():
+            _start(extractor)
+            results = [r async for r in extractor.aiter_extract(url_data)]
+            return results, extractor._browser.loads
+
+        results, loads = asyncio.run(run())
+
+        assert len(results) == 4
+        assert loads == [url for _, url in url_data] + ["https://www.instagram.com/p/SLOW/"]
+
+    def test_iter_extract_requires_playwright(self):
+        """playwright 미설치 시 설치 안내 오류 테스트"""
+        with patch.dict(sys.modules, {"playwright": None, "playwright.async_api": None}):
+            with pytest.raises(RuntimeError, match="playwright"):
+                list(self.extractor.iter_extract([("글", "https://www.instagram.com/p/A/")]))
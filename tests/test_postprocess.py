@@ -0,0 +1,174 @@
+"""
+postprocess.py 테스트
+"""
+
+import threading
+from datetime import datetime
+
+from src.postprocess import (
+    ParallelPostProcessor,
+    RawPayload,
+    parse_html_payload,
+    parse_json_payload,
+    parse_payload,
+)
+
+
+def _html(description: str, extra: str = "") -> str:
+    """og 메타 태그가 포함된 테스트용 페이지 소스"""
+    return (
+        "<html><head>"
+        f'<meta property="og:description" content="{description}" />'
+        f"{extra}"
+        "</head><body><div>본문</div></body></html>"
+    )
+
+
+class TestPayloadParsing:
+    """페이로드 파싱 함수 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.url = "https://www.instagram.com/p/ABC123/"
+        self.node = {
+            "data": {
+                "xdt_shortcode_media": {
+                    "shortcode": "ABC123",
+                    "edge_media_to_caption": {
+                        "edges": [{"node": {"text": "  도쿄   여행 #tokyo  "}}]
+                    },
+                    "edge_media_preview_like": {"count": 150},
+                    "edge_media_to_parent_comment": {"count": 7},
+                    "taken_at_timestamp": 1686839400,
+                    "owner": {"username": "test_user"},
+                    "is_video": False,
+                    "edge_sidecar_to_children": {"edges": [{}, {}, {}]},
+                }
+            }
+        }
+
+    def test_parse_html_payload_with_og_prefix(self):
+        """og:description 접두어가 있는 HTML 파싱 테스트"""
+        html = _html('1,234 likes, 5 comments - test_user on June 15, 2023: &quot;맛집 탐방 기록&quot;')
+
+        record = parse_html_payload("맛집", self.url, html)
+
+        assert record.username == "test_user"
+        assert record.text == "맛집 탐방 기록"
+        assert record.likes == 1234
+        assert record.comments == 5
+        assert record.date == datetime(2023, 6, 15)
+        assert record.url == self.url
+
+    def test_parse_html_payload_fallbacks(self):
+        """접두어가 없을 때 og:title 사용자명 및 동영상 대체 텍스트 테스트"""
+        html = _html(
+            "짧음",
+            '<meta property="og:title" content="other_user on Instagram" />'
+            '<meta property="og:video" content="https://example.com/v.mp4" />',
+        )
+
+        record = parse_html_payload("미정", self.url, html)
+
+        assert record.username == "other_user"
+        assert record.text == "동영상콘텐츠"
+        assert record.is_video is True
+
+    def test_parse_json_payload(self):
+        """GraphQL 게시물 노드 파싱 테스트"""
+        record = parse_json_payload("도쿄", self.url, self.node)
+
+        assert record.text == "도쿄 여행 #tokyo"
+        assert record.username == "test_user"
+        assert record.likes == 150
+        assert record.comments == 7
+        assert record.media_count == 3
+        assert record.date == datetime.fromtimestamp(1686839400)
+
+    def test_parse_payload_converts_errors(self):
+        """파싱 예외가 실패 결과로 변환되는지 테스트"""
+        missing = parse_payload(RawPayload("미정", self.url, "json", {"data": {}}))
+        unknown = parse_payload(RawPayload("미정", self.url, "xml", ""))
+
+        assert not missing.success
+        assert "삭제" in missing.error_message
+        assert not unknown.success
+        assert "xml" in unknown.error_message
+
+
+class TestParallelPostProcessor:
+    """ParallelPostProcessor 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.payloads = [
+            RawPayload(
+                f"게시물 {i}",
+                f"https://www.instagram.com/p/CODE{i}/",
+                "html",
+                _html(f"user{i} on June {i + 1}, 2023: &quot;본문 번호 {i}&quot;"),
+            )
+            for i in range(20)
+        ]
+
+    def test_inline_processing(self):
+        """workers <= 1일 때 현재 프로세스에서 처리하는지 테스트"""
+        processor = ParallelPostProcessor(workers=0)
+
+        results = list(processor.process(iter(self.payloads)))
+
+        assert processor._executor is None
+        assert [r.record.text for r in results] == [f"본문 번호 {i}" for i in range(20)]
+
+    def test_process_pool_preserves_order(self):
+        """프로세스 풀 처리 시 입력 순서가 유지되는지 테스트"""
+        with ParallelPostProcessor(workers=2, chunksize=3) as processor:
+            results = list(processor.process(p for p in self.payloads))
+
+        assert processor._executor is None
+        assert [r.title for r in results] == [p.title for p in self.payloads]
+        assert all(r.success for r in results)
+        assert results[5].record.username == "user5"
+
+    def test_stalled_source_flushes_partial_chunk(self):
+        """입력이 멈춰도 덜 찬 청크를 보내 앞쪽 결과를 먼저 반환하는지 테스트"""
+        release = threading.Event()
+
+        def stalled():
+            yield ("a", self.payloads[0])
+            yield ("b", self.payloads[1])
+            # 소비자가 앞쪽 결과를 받기 전까지 입력이 끝나지 않음
+            release.wait(timeout=10)
+            yield ("c", self.payloads[2])
+
+        with ParallelPostProcessor(workers=2, chunksize=8, flush_interval=0.01) as processor:
+            stream = processor.process_tagged(stalled())
+            first = [next(stream), next(stream)]
+            early = not release.is_set()
+            release.set()
+            rest = list(stream)
+
+        assert early
+        assert [tag for tag, _ in first + rest] == ["a", "b", "c"]
+        assert first[1][1].record.username == "user1"
+
+    def test_non_payloads_pass_through_immediately(self):
+        """페이로드가 아닌 값은 앞선 파싱 결과를 기다리지 않고 바로 전달되는지 테스트"""
+        release = threading.Event()
+
+        def source():
+            yield (0, self.payloads[0])
+            yield (1, "수집 실패")
+            release.wait(timeout=10)
+            yield (2, self.payloads[1])
+
+        with ParallelPostProcessor(workers=2, chunksize=8, flush_interval=10) as processor:
+            stream = processor.process_tagged(source())
+            failure = next(stream)
+            early = not release.is_set()
+            release.set()
+            rest = list(stream)
+
+        assert early
+        assert failure == (1, "수집 실패")
+        assert [tag for tag, _ in rest] == [0, 2]
@@ -0,0 +1,94 @@
+"""
+record.py 테스트
+"""
+
+import json
+import pytest
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+
+from src.record import SIMPLE_FIELDS, PostRecord, parse_fields, to_json_dict
+
+
+class TestPostRecord:
+    """PostRecord 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.record = PostRecord(
+            title="도쿄 여행",
+            text="테스트 본문",
+            username="test_user",
+            likes=150,
+            date=datetime(2023, 6, 15, 14, 30, 0),
+            url="https://www.instagram.com/p/ABC123/",
+        )
+
+    def test_slots_and_immutability(self):
+        """__slots__ 및 불변성 테스트"""
+        assert not hasattr(self.record, "__dict__")
+
+        with pytest.raises(FrozenInstanceError):
+            self.record.likes = 0
+
+    def test_mapping_interface(self):
+        """dict 호환 조회 인터페이스 테스트"""
+        assert self.record["text"] == "테스트 본문"
+        assert self.record.get("username") == "test_user"
+        assert self.record.get("unknown", "기본값") == "기본값"
+        assert "likes" in self.record
+
+        with pytest.raises(KeyError):
+            self.record["unknown"]
+
+    def test_to_json_dict(self):
+        """JSON 변환 테스트"""
+        data = self.record.to_json_dict()
+
+        assert data["date"] == "2023-06-15T14:30:00"
+        assert list(data)[:3] == ["title", "text", "username"]
+        assert json.loads(self.record.to_json())["likes"] == 150
+
+    def test_from_mapping_roundtrip(self):
+        """dict <-> 레코드 왕복 변환 테스트"""
+        restored = PostRecord.from_mapping(self.record.to_json_dict())
+
+        assert restored == self.record
+        assert PostRecord.from_mapping(self.record) is self.record
+        assert PostRecord.from_mapping({"text": "x", "extra": 1}).text == "x"
+
+    def test_replace(self):
+        """필드 교체 테스트"""
+        changed = self.record.replace(title="새 제목")
+
+        assert changed.title == "새 제목"
+        assert self.record.title == "도쿄 여행"
+
+    def test_to_json_dict_helper_accepts_dict(self):
+        """dict 입력도 처리하는 to_json_dict 헬퍼 테스트"""
+        post_data = {"text": "본문", "date": datetime(2023, 1, 1)}
+
+        assert to_json_dict(post_data) == {"text": "본문", "date": "2023-01-01T00:00:00"}
+        assert post_data["date"] == datetime(2023, 1, 1)
+
+    def test_parse_fields(self):
+        """필드 선택 값 파싱 테스트 (레코드 필드 순서로 정렬)"""
+        assert parse_fields(None) is None
+        assert parse_fields(" ") is None
+        assert parse_fields("url, text,title") == SIMPLE_FIELDS
+        assert parse_fields(["likes", "date"]) == ("likes", "date")
+
+        with pytest.raises(ValueError, match="알 수 없는 필드: caption"):
+            parse_fields("text,caption")
+
+    def test_to_json_dict_with_fields(self):
+        """선택한 필드만 직렬화하는지 테스트"""
+        assert self.record.to_json_dict(("text", "date")) == {
+            "text": self.record.text,
+            "date": "2023-06-15T14:30:00",
+        }
+        assert to_json_dict({"text": "본문", "likes": 3}, SIMPLE_FIELDS) == {
+            "title": None,
+            "text": "본문",
+            "url": None,
+        }
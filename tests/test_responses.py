@@ -0,0 +1,105 @@
+"""
+api/responses.py 테스트
+"""
+
+import json
+import warnings
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from api.responses import CompressionMiddleware, FastJSONResponse, _accepted_encodings
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from starlette.testclient import TestClient
+
+
+def _app(minimum_size: int = 100) -> Starlette:
+    """테스트용 ASGI 앱"""
+    async def large(request):
+        return FastJSONResponse({"success": True, "data": {"text": "도쿄 여행 일정 " * 100}})
+
+    async def small(request):
+        return FastJSONResponse({"success": True})
+
+    async def stream(request):
+        return StreamingResponse(iter([b"a" * 500, b"b" * 500]), media_type="text/plain")
+
+    async def encoded(request):
+        return PlainTextResponse("x" * 500, headers={"Content-Encoding": "identity"})
+
+    app = Starlette(routes=[
+        Route("/large", large),
+        Route("/small", small),
+        Route("/stream", stream),
+        Route("/encoded", encoded),
+    ])
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+    return app
+
+
+class TestFastJSONResponse:
+    """FastJSONResponse 클래스 테스트"""
+
+    def test_render(self):
+        """한글을 이스케이프하지 않고 공백 없이 직렬화하는지 테스트"""
+        body = FastJSONResponse({"text": "본문", "likes": 3}).body
+
+        assert json.loads(body) == {"text": "본문", "likes": 3}
+        assert "본문".encode("utf-8") in body
+        assert b" " not in body
+
+
+class TestCompressionMiddleware:
+    """CompressionMiddleware 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.client = TestClient(_app())
+
+    def test_gzip_negotiation(self):
+        """gzip 허용 시 큰 응답을 압축하는지 테스트"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json()["data"]["text"].startswith("도쿄 여행")
+
+    def test_uncompressed_cases(self):
+        """작은 응답, identity 요청, 스트리밍/인코딩된 응답은 그대로 전달하는지 테스트"""
+        gzip_only = {"Accept-Encoding": "gzip"}
+
+        assert "content-encoding" not in self.client.get("/small", headers=gzip_only).headers
+        assert "content-encoding" not in self.client.get(
+            "/large", headers={"Accept-Encoding": "identity"}
+        ).headers
+        assert "content-encoding" not in self.client.get(
+            "/large", headers={"Accept-Encoding": "gzip;q=0"}
+        ).headers
+
+        streamed = self.client.get("/stream", headers=gzip_only)
+        assert "content-encoding" not in streamed.headers
+        assert streamed.text == "a" * 500 + "b" * 500
+
+        encoded = self.client.get("/encoded", headers=gzip_only)
+        assert encoded.headers["content-encoding"] == "identity"
+
+    def test_brotli_preferred_when_available(self):
+        """brotli 사용 가능 시 br을 gzip보다 우선하는지 테스트"""
+        middleware = CompressionMiddleware(app=None)
+        middleware.encoders.insert(0, ("br", lambda body: b"br:" + body))
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip, br")]}
+
+        name, encoder = middleware._negotiate(scope)
+
+        assert name == "br"
+        assert encoder(b"x") == b"br:x"
+
+    def test_accepted_encodings(self):
+        """Accept-Encoding 헤더 파싱 테스트"""
+        accepted = _accepted_encodings("gzip;q=0.5, br, *;q=0, bad;q=x")
+
+        assert accepted == {"gzip": 0.5, "br": 1.0, "*": 0.0, "bad": 0.0}
@@ -0,0 +1,274 @@
+"""
+selenium_extractor.py 테스트
+"""
+
+import asyncio
+import signal
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from src.postprocess import parse_payload
+from src.selenium_extractor import ExtractResult, SeleniumInstagramExtractor
+
+
+def _live_driver() -> Mock:
+    """프로세스가 실행 중인 것으로 보이는 가짜 드라이버"""
+    driver = Mock()
+    driver.service.process.poll.return_value = None
+    return driver
+
+
+class TestSeleniumDriverPool:
+    """브라우저 풀(warm start) 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.extractor = SeleniumInstagramExtractor(max_workers=2)
+
+    @patch("src.selenium_extractor.resolve_driver_path", return_value="/usr/bin/chromedriver")
+    def test_warm_up_fills_pool(self, mock_resolve):
+        """사전 실행한 브라우저가 풀에 보관되는지 테스트"""
+        with patch.object(self.extractor, "_create_driver", side_effect=lambda: Mock()):
+            launched = self.extractor.warm_up()
+
+        assert launched == 2
+        assert self.extractor.reuse_drivers is True
+        assert self.extractor._idle_drivers.qsize() == 2
+
+    def test_acquire_reuses_idle_driver(self):
+        """풀에 있는 브라우저를 재사용하는지 테스트"""
+        driver = _live_driver()
+        self.extractor.reuse_drivers = True
+        self.extractor._release_driver(driver)
+
+        with patch.object(self.extractor, "_create_driver") as mock_create:
+            assert self.extractor._acquire_driver() is driver
+            mock_create.assert_not_called()
+
+    def test_release_unhealthy_driver_quits(self):
+        """비정상 브라우저는 풀에 넣지 않고 종료하는지 테스트"""
+        driver = Mock()
+        self.extractor.reuse_drivers = True
+
+        self.extractor._release_driver(driver, healthy=False)
+
+        driver.quit.assert_called_once()
+        assert self.extractor._idle_drivers.empty()
+
+    def test_close_quits_idle_drivers(self):
+        """close() 시 풀의 브라우저가 모두 종료되는지 테스트"""
+        drivers = [Mock(), Mock()]
+        self.extractor.reuse_drivers = True
+        for driver in drivers:
+            self.extractor._release_driver(driver)
+
+        with self.extractor:
+            pass
+
+        for driver in drivers:
+            driver.quit.assert_called_once()
+        assert self.extractor._idle_drivers.empty()
+
+    def test_acquire_replaces_dead_driver(self):
+        """풀에서 중단된 브라우저를 발견하면 종료하고 새로 생성하는지 테스트"""
+        dead = Mock()
+        dead.service.process.poll.return_value = -9
+        self.extractor.reuse_drivers = True
+        self.extractor._release_driver(dead)
+
+        with patch.object(self.extractor, "_create_driver", return_value="new") as mock_create:
+            assert self.extractor._acquire_driver() == "new"
+
+        mock_create.assert_called_once()
+        dead.quit.assert_called_once()
+
+
+@patch("src.selenium_extractor.time.sleep")
+class TestSeleniumTimeouts:
+    """URL별 시간 제한, 브라우저 중단 감지, 재시도 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.extractor = SeleniumInstagramExtractor(max_workers=2, url_timeout=0.2)
+        self.url = "https://www.instagram.com/p/ABC123/"
+
+    def test_page_load_timeout_is_retryable(self, mock_sleep):
+        """페이지 로드 시간 초과가 재시도 가능한 실패로 분류되는지 테스트"""
+        driver = _live_driver()
+        driver.get.side_effect = TimeoutException()
+
+        with patch.object(self.extractor, "_acquire_driver", return_value=driver):
+            result = self.extractor.extract_single_url(self.url, "테스트")
+
+        assert result.success is False
+        assert result.retryable is True
+        assert "페이지 로드 시간 초과" in result.error_message
+        driver.quit.assert_called_once()
+
+    def test_watchdog_kills_hung_driver(self, mock_sleep):
+        """처리 시간이 url_timeout을 넘기면 드라이버 프로세스 그룹을 종료하는지 테스트"""
+        driver = _live_driver()
+        driver.service.process.pid = 4242
+        killed = threading.Event()
+
+        def hang(url):
+            # 프로세스가 종료되면 대기 중인 WebDriver 호출이 실패함
+            assert killed.wait(5)
+            raise WebDriverException("connection refused")
+
+        driver.get.side_effect = hang
+
+        with patch.object(self.extractor, "_acquire_driver", return_value=driver), \
+                patch("src.selenium_extractor.os.getpgid", return_value=4242), \
+                patch("src.selenium_extractor.os.killpg", side_effect=lambda pid, sig: killed.set()) as mock_killpg:
+            result = self.extractor.extract_single_url(self.url, "테스트")
+
+        assert result.retryable is True
+        assert "URL 처리 시간 초과" in result.error_message
+        mock_killpg.assert_called_once_with(4242, signal.SIGKILL)
+        driver.service.process.kill.assert_not_called()
+
+    def test_kill_driver_without_own_group(self, mock_sleep):
+        """드라이버가 자기 프로세스 그룹을 이끌지 않으면 드라이버 프로세스만 종료하는지 테스트"""
+        driver = _live_driver()
+        driver.service.process.pid = 4242
+
+        with patch("src.selenium_extractor.os.getpgid", return_value=1), \
+                patch("src.selenium_extractor.os.killpg") as mock_killpg:
+            self.extractor._kill_driver(driver)
+
+        mock_killpg.assert_not_called()
+        driver.service.process.kill.assert_called_once()
+
+    def test_crashed_driver_detected(self, mock_sleep):
+        """브라우저가 중단된 경우 재시도 가능한 실패로 분류되는지 테스트"""
+        driver = _live_driver()
+        driver.get.side_effect = WebDriverException("tab crashed")
+        type(driver).window_handles = property(
+            lambda self: (_ for _ in ()).throw(WebDriverException("disconnected"))
+        )
+
+        with patch.object(self.extractor, "_acquire_driver", return_value=driver):
+            result = self.extractor.extract_single_url(self.url, "테스트")
+
+        assert result.retryable is True
+        assert "브라우저 중단" in result.error_message
+
+    def test_extract_uses_shared_html_parser(self, mock_sleep):
+        """직접 추출과 프로세스 풀 파싱이 같은 파서로 같은 결과를 내는지 테스트"""
+        driver = _live_driver()
+        driver.page_source = (
+            "<html><head>"
+            '<meta property="og:title" content="someone on Instagram" />'
+            '<meta property="og:description" content="짧음" />'
+            '<meta property="og:video" content="https://example.com/v.mp4" />'
+            "</head></html>"
+        )
+
+        with patch.object(self.extractor, "_acquire_driver", return_value=driver):
+            direct = self.extractor.extract_single_url(self.url, "테스트")
+            payload = self.extractor.fetch_single_url(self.url, "테스트")
+
+        parsed = ExtractResult.from_parsed(parse_payload(payload))
+        assert direct.success is True
+        assert direct.username == "someone"
+        assert direct.is_video is True
+        assert direct.to_record() == parsed.to_record()
+
+    def test_batch_requeues_timed_out_url_once(self, mock_sleep):
+        """시간 초과 URL을 한 번만 재시도하는지 테스트"""
+        calls = []
+
+        def fake_extract(url, title):
+            calls.append(url)
+            if url.endswith("SLOW/"):
+                return ExtractResult.failure(title, url, "페이지 로드 시간 초과", retryable=True)
+            return ExtractResult(title, url, "본문입니다", "user", True)
+
+        url_data = [
+            ("느린 글", "https://www.instagram.com/p/SLOW/"),
+            ("빠른 글", "https://www.instagram.com/p/FAST/"),
+        ]
+        with patch.object(self.extractor, "extract_single_url", side_effect=fake_extract):
+            results = self.extractor.batch_extract(url_data)
+
+        assert len(results) == 2
+        assert calls.count("https://www.instagram.com/p/SLOW/") == 2
+        assert calls.count("https://www.instagram.com/p/FAST/") == 1
+        assert sum(r.success for r in results) == 1
+
+    def test_requeued_url_runs_at_tail(self, mock_sleep):
+        """재시도 URL이 남은 입력을 모두 제출한 뒤에 다시 실행되는지 테스트"""
+        extractor = SeleniumInstagramExtractor(max_workers=1)
+        calls = []
+
+        def fake_extract(url, title):
+            calls.append(title)
+            if title == "느린 글" and calls.count(title) == 1:
+                return ExtractResult.failure(title, url, "페이지 로드 시간 초과", retryable=True)
+            return ExtractResult(title, url, "본문입니다", "user", True)
+
+        url_data = [("느린 글", "https://www.instagram.com/p/SLOW/")] + [
+            (f"게시물 {i}", f"https://www.instagram.com/p/CODE{i}/") for i in range(3)
+        ]
+        with patch.object(extractor, "extract_single_url", side_effect=fake_extract):
+            results = list(extractor.iter_extract(url_data))
+
+        assert calls == ["느린 글", "게시물 0", "게시물 1", "게시물 2", "느린 글"]
+        assert all(r.success for r in results)
+
+
+class TestSeleniumStreaming:
+    """스트리밍 결과 반복자 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.extractor = SeleniumInstagramExtractor(max_workers=2)
+        self.url_data = [
+            (f"게시물 {i}", f"https://www.instagram.com/p/CODE{i}/") for i in range(10)
+        ]
+
+    @staticmethod
+    def _fake_extract(url, title):
+        """앞선 URL일수록 늦게 끝나는 가짜 추출 함수"""
+        index = int(url.rstrip("/").rsplit("CODE", 1)[1])
+        time.sleep(0.005 * (10 - index))
+        return ExtractResult(title, url, "본문입니다", "user", True)
+
+    def test_iter_extract_ordered(self):
+        """ordered=True면 입력 순서대로 반환하는지 테스트"""
+        with patch.object(self.extractor, "extract_single_url", side_effect=self._fake_extract):
+            results = list(self.extractor.iter_extract(self.url_data, ordered=True, reorder_window=3))
+
+        assert [r.title for r in results] == [title for title, _ in self.url_data]
+
+    def test_iter_extract_consumes_input_lazily(self):
+        """입력을 필요한 만큼만 읽는지 테스트 (동시 제출 수 제한)"""
+        consumed = []
+
+        def source():
+            for item in self.url_data:
+                consumed.append(item)
+                yield item
+
+        with patch.object(self.extractor, "extract_single_url", side_effect=self._fake_extract):
+            stream = self.extractor.iter_extract(source())
+            first = next(stream)
+            stream.close()
+
+        assert first.success
+        assert len(consumed) <= self.extractor.max_workers * 2 + 1
+
+    def test_aiter_extract(self):
+        """비동기 반복자 테스트"""
+        async def collect():
+            return [r async for r in self.extractor.aiter_extract(self.url_data, ordered=True)]
+
+        with patch.object(self.extractor, "extract_single_url", side_effect=self._fake_extract):
+            results = asyncio.run(collect())
+
+        assert len(results) == 10
+        assert results[0].title == "게시물 0"
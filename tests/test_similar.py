@@ -0,0 +1,137 @@
+"""
+similar.py 테스트
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from src.commands import run_command
+from src.record import PostRecord
+from src.similar import MAX_TERMS_PER_DOCUMENT, SimilarityIndex, caption_tokens, update_index
+from src.store import ResultStore
+
+CAPTIONS = {
+    "OSAKA1": "오사카 도톤보리 맛집 타코야키 오코노미야키 쿠시카츠 먹방 코스",
+    "OSAKA2": "도톤보리 타코야키 맛집 추천, 오사카 여행 먹방 필수 코스",
+    "KYOTO": "교토 기요미즈데라 후시미이나리 아라시야마 대나무숲 산책",
+    "TOKYO": "도쿄 시부야 스카이 전망대 야경 예약 방법",
+}
+
+
+def _record(code: str) -> PostRecord:
+    """테스트용 레코드"""
+    return PostRecord(title=code, text=CAPTIONS[code], username="user", url=f"https://www.instagram.com/p/{code}/")
+
+
+class TestSimilarityIndex:
+    """SimilarityIndex 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.index = SimilarityIndex()
+        self.index.add(CAPTIONS.items())
+
+    def test_caption_tokens(self):
+        """단어와 한글 2-gram을 만들고 멘션/URL/숫자는 제외하는지 테스트"""
+        tokens = caption_tokens("오사카여행 @user https://x.com 2025 Osaka")
+
+        assert "오사카여행" in tokens
+        assert "osaka" in tokens
+        assert "사카" in tokens
+        assert "user" not in tokens
+        assert "2025" not in tokens
+
+    def test_similar_to(self):
+        """비슷한 캡션이 가장 먼저 나오고 자기 자신은 제외되는지 테스트"""
+        hits = self.index.similar_to("OSAKA1", k=3)
+
+        assert hits[0].shortcode == "OSAKA2"
+        assert "OSAKA1" not in [hit.shortcode for hit in hits]
+        assert all(a.score >= b.score for a, b in zip(hits, hits[1:]))
+        with pytest.raises(KeyError):
+            self.index.similar_to("NONE")
+
+    def test_query_text(self):
+        """임의 텍스트로 검색하는 테스트"""
+        hits = self.index.query("아라시야마 대나무숲", k=2)
+
+        assert hits[0].shortcode == "KYOTO"
+        assert 0 < hits[0].score <= 1
+        assert SimilarityIndex().query("교토") == []
+
+    def test_incremental_add(self):
+        """이미 있는 문서는 건너뛰고 새 문서만 추가하는지 테스트"""
+        added = self.index.add([("OSAKA1", "무시됨"), ("OSAKA3", "오사카 타코야키 도톤보리 맛집")])
+
+        assert added == 1
+        assert len(self.index) == 5
+        assert self.index.similar_to("OSAKA3", k=1)[0].shortcode in ("OSAKA1", "OSAKA2")
+
+    def test_save_and_load(self, tmp_path):
+        """저장한 색인을 불러와 같은 결과를 얻는지 테스트"""
+        path = str(tmp_path / "similar.npz")
+        self.index.save(path)
+
+        loaded = SimilarityIndex.load(path)
+
+        assert loaded.keys == self.index.keys
+        assert loaded.fitted_documents == 4
+        assert loaded.similar_to("OSAKA1") == self.index.similar_to("OSAKA1")
+        assert loaded.query("시부야 야경") == self.index.query("시부야 야경")
+
+    def test_update_index_refits_when_stale(self):
+        """문서 수가 IDF 고정 시점의 두 배가 되면 다시 만드는지 테스트"""
+        index = SimilarityIndex()
+        index, added = update_index(index, lambda: [_record("OSAKA1"), _record("OSAKA2")])
+        assert (added, index.fitted_documents) == (2, 2)
+
+        index, added = update_index(index, lambda: [_record(code) for code in CAPTIONS])
+
+        assert added == 4
+        assert index.fitted_documents == 4
+        assert not index.stale
+
+    def test_update_index_streams_new_documents(self):
+        """증분 추가는 레코드를 한 번만 읽고 새 문서만 추가하는지 테스트"""
+        reads = []
+
+        def records():
+            reads.append(1)
+            return (_record(code) for code in CAPTIONS)
+
+        self.index.add([("OSAKA9", "오사카 맛집")])
+        index, added = update_index(self.index, records)
+
+        assert index is self.index
+        assert added == 0
+        assert len(reads) == 1
+
+    def test_long_caption_is_pruned(self):
+        """긴 캡션도 가중치가 큰 특성만 남기고 정규화하는지 테스트"""
+        index = SimilarityIndex()
+        index.add([("LONG", " ".join(f"단어{i}번" for i in range(200)))])
+
+        row = index._matrix[0]
+        assert row.nnz == MAX_TERMS_PER_DOCUMENT
+        assert abs(row.multiply(row).sum() - 1) < 1e-2
+
+
+class TestSimilarCommand:
+    """similar 명령 테스트"""
+
+    def test_builds_index_and_queries(self, tmp_path, capsys):
+        """색인이 없으면 저장소로 만들고 기준 게시물과 비슷한 게시물을 출력하는지 테스트"""
+        db = str(tmp_path / "results.db")
+        index_path = str(tmp_path / "similar.npz")
+        with ResultStore(db) as store:
+            store.upsert_many([_record(code) for code in CAPTIONS])
+
+        exit_code = run_command(["similar", "--store", db, "--index", index_path, "-k", "1", "https://www.instagram.com/p/OSAKA1/"])
+
+        output = capsys.readouterr().out
+        assert exit_code == 0
+        assert "게시물 4개" in output
+        assert "https://www.instagram.com/p/OSAKA2/" in output
+        assert run_command(["similar", "--store", db, "--index", index_path, "--update"]) == 0
@@ -0,0 +1,61 @@
+"""
+CLI/API 시작 시간(import 비용) 테스트
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 무거운 추출 백엔드 모듈 (선택되기 전에는 로드되면 안 됨)
+HEAVY_MODULES = ["instaloader", "selenium", "webdriver_manager", "bs4", "playwright"]
+
+# src.main import 허용 시간 (초) - 백엔드 로드 시 수백 ms가 걸림
+CLI_IMPORT_BUDGET = 0.25
+
+
+def _import_in_subprocess(module: str) -> dict:
+    """새 인터프리터에서 모듈을 import하고 소요 시간과 로드된 모듈을 반환"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestStartup:
+    """지연 import 및 시작 시간 테스트"""
+
+    def test_cli_import_skips_heavy_backends(self):
+        """src.main import 시 추출 백엔드가 로드되지 않는지 테스트"""
+        result = _import_in_subprocess("src.main")
+
+        assert result["heavy"] == []
+        assert result["elapsed"] < CLI_IMPORT_BUDGET
+
+    def test_api_import_skips_heavy_backends(self):
+        """api.main import 시 instaloader가 로드되지 않는지 테스트"""
+        result = _import_in_subprocess("api.main")
+
+        assert result["heavy"] == []
+
+    def test_lazy_backend_attribute(self):
+        """src.main의 백엔드 클래스 지연 접근 테스트"""
+        import src.main
+        from src.extractor import InstagramTextExtractor
+
+        assert src.main.InstagramTextExtractor is InstagramTextExtractor
@@ -0,0 +1,172 @@
+"""
+stats.py 테스트
+"""
+
+import asyncio
+import json
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from src.commands import run_command
+from src.record import PostRecord
+from src.stats import BloomFilter, CountMinSketch, HashtagStats, SpaceSaving
+from src.store import ResultStore
+
+
+def _post(code: str, text: str, username: str = "tester", month: int = 1) -> PostRecord:
+    """테스트용 레코드"""
+    return PostRecord(
+        title=f"제목 {code}",
+        text=text,
+        username=username,
+        date=datetime(2025, month, 1),
+        url=f"https://www.instagram.com/p/{code}/",
+    )
+
+
+class TestSketches:
+    """Count-Min Sketch / Space-Saving / Bloom filter 테스트"""
+
+    def test_count_min_never_underestimates(self):
+        """작은 스케치에서도 추정값이 실제 빈도 이상인지 테스트"""
+        sketch = CountMinSketch(width=64, depth=3)
+        keys = [f"key{i % 50}" for i in range(1000)] + ["hot"] * 300
+        sketch.add_many(keys)
+
+        counts = Counter(keys)
+        assert all(sketch.estimate(key) >= count for key, count in counts.items())
+        assert sketch.estimate("hot") < 300 + 2 * len(keys) / 64
+        assert sketch.add("hot", 5) == sketch.estimate("hot")
+        assert sketch.total == len(keys) + 5
+
+    def test_space_saving_keeps_heavy_hitters(self):
+        """용량보다 키가 많아도 빈도가 큰 키를 오차 한계와 함께 유지하는지 테스트"""
+        tracker = SpaceSaving(capacity=5)
+        keys = []
+        for i in range(200):
+            keys += ["a", "b"] if i % 3 else ["a", "c"]
+            keys.append(f"rare{i}")
+        tracker.add_many(keys)
+
+        counts = Counter(keys)
+        top = tracker.top(3)
+        assert [key for key, _, _ in top[:2]] == ["a", "b"]
+        for key, count, error in top:
+            assert count - error <= counts[key] <= count
+        assert len(tracker) <= 10
+        assert tracker.top(1, prefix="rare")[0][2] > 0
+
+    def test_bloom_filter_add(self):
+        """처음 추가한 원소만 True를 반환하는지 테스트"""
+        seen = BloomFilter(capacity=1000)
+
+        assert all(seen.add(f"post{i}") for i in range(100))
+        assert not any(seen.add(f"post{i}") for i in range(100))
+
+
+class TestHashtagStats:
+    """해시태그 통계 집계 테스트"""
+
+    def setup_method(self):
+        """테스트 설정"""
+        self.stats = HashtagStats(capacity=10, sketch_width=256)
+        self.posts = [
+            _post("AAA", "도쿄 #Tokyo #여행 @friend", "alice", 1),
+            _post("BBB", "#tokyo #맛집 #여행 #tokyo", "alice", 2),
+            _post("CCC", "#오사카 #맛집 @Friend @shop", "bob", 2),
+        ]
+
+    def test_top_items_and_trends(self):
+        """상위 해시태그/멘션/쌍과 작성자·해시태그별 월 추이를 집계하는지 테스트"""
+        assert self.stats.update(self.posts) == 3
+
+        assert [(item.key, item.count) for item in self.stats.top_hashtags(2)] == [("#tokyo", 2), ("#여행", 2)]
+        assert self.stats.top_mentions(1)[0].key == "@friend"
+        assert self.stats.top_pairs(1)[0].key == "#tokyo #여행"
+        assert sorted(item.key for item in self.stats.top_pairs(5, "#맛집")) == ["#tokyo #맛집", "#맛집 #여행", "#맛집 #오사카"]
+        assert self.stats.estimate("#TOKYO") >= 2
+        assert [(item.key, item.count) for item in self.stats.hashtag_trend("#맛집")] == [("2025-02", 2)]
+
+        trend = self.stats.user_trend("Alice")
+        assert trend["posts"] == 2
+        assert [(item.key, item.count) for item in trend["months"]] == [("2025-01", 1), ("2025-02", 1)]
+        assert trend["hashtags"][0].key == "#tokyo"
+
+    def test_skips_posts_already_counted(self):
+        """같은 shortcode의 게시물은 다시 세지 않는지 테스트"""
+        self.stats.update(self.posts)
+
+        assert self.stats.update(self.posts[:2]) == 0
+        assert self.stats.posts == 3
+
+    def test_incremental_update_from_store(self, tmp_path):
+        """저장소에 새로 추가된 게시물만 이어서 집계하고 상태를 저장/불러오는지 테스트"""
+        path = str(tmp_path / "stats.pkl")
+        with ResultStore(str(tmp_path / "results.db")) as store:
+            store.upsert_many(self.posts[:2])
+            assert self.stats.update_from_store(store) == 2
+            self.stats.save(path)
+
+            # 예전 추출 시각으로 가져온 게시물과 다시 추출한 게시물
+            store.upsert_many(self.posts[2:], updated_at=1.0)
+            store.upsert(self.posts[0])
+            loaded = HashtagStats.load(path)
+
+            assert loaded.update_from_store(store) == 1
+            assert loaded.update_from_store(store) == 0
+        assert loaded.posts == 3
+        assert {"key": "#맛집", "count": 2, "error": 0} in loaded.summary(k=3)["hashtags"]
+
+
+class TestStatsCommand:
+    """stats 명령 테스트"""
+
+    def test_stats_command(self, tmp_path, capsys):
+        """상태 파일을 만들고 다음 실행에서는 새 게시물만 집계하는지 테스트"""
+        db = str(tmp_path / "results.db")
+        state = str(tmp_path / "stats.pkl")
+        posts = [_post("AAA", "#tokyo #여행"), _post("BBB", "#tokyo @friend")]
+        with ResultStore(db) as store:
+            store.upsert_many(posts[:1])
+
+        assert run_command(["stats", "--store", db, "--state", state, "--hashtag", "tokyo"]) == 0
+        output = capsys.readouterr().out
+        assert "새로 집계 1개" in output
+        assert "#tokyo (추정 1회)" in output
+
+        with ResultStore(db) as store:
+            store.upsert_many(posts[1:])
+        assert run_command(["stats", "--store", db, "--state", state, "--json", "--username", "tester"]) == 0
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["posts"] == 2
+        assert summary["hashtags"][0] == {"key": "#tokyo", "count": 2, "error": 0}
+        assert summary["user"]["posts"] == 2
+
+
+class TestStatsService:
+    """API 서비스의 /stats 통계 로드 테스트"""
+
+    def test_requires_state_file(self, tmp_path):
+        """상태 파일 없이 저장소 전체를 요청 안에서 집계하지 않고, 상태 파일 이후의 새 게시물만 이어서 집계하는지 테스트"""
+        from api.services import InstagramService
+
+        db = str(tmp_path / "results.db")
+        state = str(tmp_path / "stats.pkl")
+        with ResultStore(db) as store:
+            store.upsert_many([_post("AAA", "#tokyo")])
+
+        with pytest.raises(RuntimeError, match="STATS_PATH"):
+            InstagramService(store_path=db)._stats_summary(10, None, None)
+        with pytest.raises(RuntimeError, match="python -m src stats"):
+            InstagramService(store_path=db, stats_path=state)._stats_summary(10, None, None)
+
+        assert run_command(["stats", "--store", db, "--state", state]) == 0
+        with ResultStore(db) as store:
+            store.upsert_many([_post("BBB", "#tokyo")])
+        service = InstagramService(store_path=db, stats_path=state)
+        summary = service._stats_summary(10, None, None)
+        asyncio.run(service.aclose())
+        assert summary["posts"] == 2
+        assert summary["hashtags"][0] == {"key": "#tokyo", "count": 2, "error": 0}
@@ -0,0 +1,222 @@
+"""
+store.py 테스트
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.commands import run_command
+from src.record import PostRecord
+from src.store import ResultStore, SearchPage
+
+
+def _record(code: str, **changes) -> PostRecord:
+    """테스트용 레코드"""
+    values = dict(
+        title="도쿄 여행",
+        text=f"본문 {code}",
+        username="test_user",
+        likes=10,
+        date=datetime(2023, 6, 15, 14, 30),
+        url=f"https://www.instagram.com/p/{code}/?igsh=abc",
+    )
+    values.update(changes)
+    return PostRecord(**values)
+
+
+class TestResultStore:
+    """ResultStore 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.store = ResultStore(":memory:")
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 정리"""
+        self.store.close()
+
+    def test_upsert_and_get(self):
+        """저장 후 shortcode로 조회하는 테스트"""
+        shortcode = self.store.upsert(_record("AAA", is_video=True))
+
+        assert shortcode == "AAA"
+        assert "AAA" in self.store
+        assert "BBB" not in self.store
+        assert self.store.get("AAA") == _record("AAA", is_video=True)
+        assert self.store.get("BBB") is None
+
+    def test_upsert_updates_existing_row(self):
+        """같은 shortcode는 새 행을 만들지 않고 갱신하는지 테스트"""
+        self.store.upsert(_record("AAA", likes=10))
+        self.store.upsert(_record("AAA", likes=20, title="미정"))
+
+        record = self.store.get("AAA")
+        assert len(self.store) == 1
+        assert record.likes == 20
+        # 기본 제목은 기존 제목을 덮어쓰지 않음
+        assert record.title == "도쿄 여행"
+
+    def test_upsert_with_fields_keeps_other_columns(self):
+        """필드 선택 결과가 조회하지 않은 값을 덮어쓰지 않는지 테스트"""
+        self.store.upsert(_record("AAA", likes=10, username="owner"))
+        self.store.upsert(
+            PostRecord(title="새 제목", text="새 본문", url="https://www.instagram.com/p/AAA/"),
+            fields=("title", "text", "url"),
+        )
+
+        record = self.store.get("AAA")
+        assert record.text == "새 본문"
+        assert record.title == "새 제목"
+        assert record.likes == 10
+        assert record.username == "owner"
+
+    def test_upsert_many_rejects_invalid_url(self):
+        """게시물 URL이 아니면 전체를 저장하지 않는지 테스트"""
+        with pytest.raises(ValueError):
+            self.store.upsert_many([_record("AAA"), _record("BBB", url="https://example.com")])
+
+        assert len(self.store) == 0
+
+    def test_iter_records_filters_and_order(self):
+        """인덱스 열 필터 및 정렬 테스트"""
+        self.store.upsert_many([
+            _record("AAA", likes=5, date=datetime(2023, 1, 1)),
+            _record("BBB", likes=50, date=datetime(2023, 3, 1), username="other"),
+            _record("CCC", likes=20, date=datetime(2023, 2, 1)),
+        ])
+
+        by_date = [r.text for r in self.store.iter_records()]
+        by_likes = [r.likes for r in self.store.iter_records(order_by="likes", descending=True)]
+        mine = [r.text for r in self.store.iter_records(username="test_user", since=datetime(2023, 1, 15))]
+
+        assert by_date == ["본문 AAA", "본문 CCC", "본문 BBB"]
+        assert by_likes == [50, 20, 5]
+        assert mine == ["본문 CCC"]
+        with pytest.raises(ValueError):
+            list(self.store.iter_records(order_by="text; DROP TABLE posts"))
+
+    def test_file_store_streams_records(self, tmp_path):
+        """파일 저장소에서 읽기 전용 연결로 나누어 읽는지 테스트"""
+        path = str(tmp_path / "db" / "results.db")
+        with ResultStore(path) as store:
+            store.upsert_many(_record(f"CODE{i:02d}") for i in range(7))
+            records = list(store.iter_records(order_by="shortcode", batch_size=3))
+
+        assert len(records) == 7
+        assert records[0].text == "본문 CODE00"
+        with ResultStore(path) as reopened:
+            assert len(reopened) == 7
+
+    def test_migrates_without_rowid_store(self, tmp_path):
+        """이전 스키마(WITHOUT ROWID) 파일을 변환하고 검색 인덱스를 만드는지 테스트"""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE posts (shortcode TEXT PRIMARY KEY, title TEXT, text TEXT, "
+            "username TEXT, likes INTEGER, comments INTEGER, date TEXT, media_count INTEGER, "
+            "is_video INTEGER, url TEXT, updated_at REAL) WITHOUT ROWID"
+        )
+        conn.execute(
+            "INSERT INTO posts VALUES ('AAA', '제목', '오사카 여행 기록', 'u', 1, NULL, NULL, 1, 0, "
+            "'https://www.instagram.com/p/AAA/', 0)"
+        )
+        conn.commit()
+        conn.close()
+
+        with ResultStore(path) as store:
+            assert store.get("AAA").text == "오사카 여행 기록"
+            assert store.search("오사카").total == 1
+
+
+class TestSearch:
+    """ResultStore 전문 검색 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.store = ResultStore(":memory:")
+        self.store.upsert_many([
+            _record("AAA", text="오사카 도톤보리 맛집 #오사카맛집 라멘 1,000엔", date=datetime(2023, 1, 1)),
+            _record("BBB", text="도쿄 긴자 스시야 오마카세", date=datetime(2023, 2, 1), username="tokyo_eats"),
+            _record("CCC", title="오사카 여행", text="교토에서 오사카로 이동하는 일정", date=datetime(2023, 3, 1)),
+            _record("DDD", text="후쿠오카 야타이 맛집 투어", date=datetime(2023, 4, 1)),
+        ])
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 정리"""
+        self.store.close()
+
+    def test_substring_search_in_korean_text(self):
+        """조사/해시태그가 붙은 한국어 부분 문자열 검색 테스트"""
+        page = self.store.search("오사카")
+
+        assert isinstance(page, SearchPage)
+        assert page.total == 2
+        # 제목에도 일치하는 게시물이 먼저 (제목 가중치)
+        assert [hit.shortcode for hit in page.hits] == ["CCC", "AAA"]
+        assert "[오사카]" in page.hits[1].snippet
+        assert page.hits[0].score <= page.hits[1].score
+
+    def test_short_terms_and_combined_terms(self):
+        """3글자 미만 검색어 및 여러 검색어(AND) 테스트"""
+        assert {h.shortcode for h in self.store.search("맛집").hits} == {"AAA", "DDD"}
+        assert [h.shortcode for h in self.store.search("맛집 후쿠오카").hits] == ["DDD"]
+        assert [h.shortcode for h in self.store.search('"긴자 스시야"').hits] == ["BBB"]
+        assert self.store.search("도쿄", username="tokyo_eats").total == 1
+        assert self.store.search('1,000엔 "OR"').total == 0
+
+    def test_pagination(self):
+        """페이지 단위 조회 테스트"""
+        first = self.store.search("오사카", limit=1)
+        second = self.store.search("오사카", limit=1, offset=1)
+
+        assert first.has_more
+        assert not second.has_more
+        assert first.hits[0].shortcode != second.hits[0].shortcode
+
+    def test_index_follows_updates(self):
+        """게시물 갱신 시 검색 인덱스도 갱신되는지 테스트"""
+        self.store.upsert(_record("DDD", text="삿포로 수프카레"))
+
+        assert self.store.search("후쿠오카").total == 0
+        assert [h.shortcode for h in self.store.search("수프카레").hits] == ["DDD"]
+
+    def test_empty_query(self):
+        """빈 검색어 테스트"""
+        with pytest.raises(ValueError):
+            self.store.search("  ")
+
+
+class TestCommands:
+    """저장소 하위 명령 테스트"""
+
+    def test_run_command_ignores_non_commands(self):
+        """명령 이름이 아니면 None을 반환하는지 테스트"""
+        assert run_command([]) is None
+        assert run_command(["https://www.instagram.com/p/AAA/"]) is None
+
+    def test_export_and_lookup(self, tmp_path, monkeypatch, capsys):
+        """저장소에서 JSON 내보내기 및 조회 테스트"""
+        monkeypatch.chdir(tmp_path)
+        path = str(tmp_path / "results.db")
+        with ResultStore(path) as store:
+            store.upsert_many([_record("AAA"), _record("BBB")])
+
+        assert run_command(["export", "--store", path, "--simple"]) == 0
+        exported = os.listdir(tmp_path / "outputs")
+        with open(tmp_path / "outputs" / exported[0], encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["total_count"] == 2
+        assert set(data["results"][0]) == {"title", "text", "url"}
+
+        assert run_command(["lookup", "--store", path, "https://www.instagram.com/p/AAA/"]) == 0
+        assert run_command(["lookup", "--store", path, "ZZZ"]) == 1
+        assert "저장된 게시물 없음" in capsys.readouterr().out
+
+        assert run_command(["search", "--store", path, "본문", "--limit", "1"]) == 0
+        output = capsys.readouterr().out
+        assert "검색 결과: 2개" in output
+        assert "--page 2" in output
@@ -0,0 +1,135 @@
+"""
+transport.py 테스트
+"""
+
+from unittest.mock import Mock, patch
+
+import instaloader.instaloadercontext as instaloadercontext
+import requests
+
+import src.transport as transport
+from src.transport import (
+    ConnectionMetrics,
+    PooledHTTPAdapter,
+    TransportConfig,
+    configure_session,
+    share_pool_with_session_copies,
+)
+
+
+class TestTransportConfig:
+    """TransportConfig 및 ConnectionMetrics 테스트"""
+
+    def test_for_concurrency(self):
+        """동시 요청 수에 맞춘 풀 크기 테스트"""
+        config = TransportConfig.for_concurrency(32, read_timeout=10.0)
+
+        assert config.pool_maxsize == 32
+        assert config.read_timeout == 10.0
+
+    def test_async_client_kwargs_without_h2(self):
+        """h2 패키지가 없으면 HTTP/1.1로 대체하는지 테스트"""
+        with patch.dict("sys.modules", {"h2": None}):
+            kwargs = TransportConfig(http2=True, pool_maxsize=7).async_client_kwargs()
+
+        assert kwargs["http2"] is False
+        assert kwargs["limits"].max_connections == 7
+        assert kwargs["timeout"].connect == 5.0
+
+    def test_metrics_summary(self):
+        """재사용 비율 계산 테스트"""
+        metrics = ConnectionMetrics(requests=10, connections=2)
+
+        assert metrics.reused == 8
+        assert metrics.reuse_ratio == 0.8
+        assert "80%" in metrics.summary()
+        assert ConnectionMetrics().reuse_ratio == 0.0
+
+
+class TestConfigureSession:
+    """세션 어댑터 설정 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정"""
+        self.session = requests.Session()
+        self.config = TransportConfig(pool_maxsize=16, connect_timeout=1.5, read_timeout=9.0)
+        self.adapter = configure_session(self.session, self.config)
+
+    def test_adapter_mounted(self):
+        """연결 풀 어댑터 마운트 및 설정 테스트"""
+        assert self.session.get_adapter("https://www.instagram.com/") is self.adapter
+        assert self.adapter._pool_maxsize == 16
+        assert self.adapter.max_retries.connect == self.config.max_retries
+        assert self.session.headers["Connection"] == "keep-alive"
+
+    def test_send_applies_timeouts(self):
+        """연결/읽기 제한 시간이 요청에 적용되는지 테스트"""
+        with patch("requests.adapters.HTTPAdapter.send", return_value="응답") as mock_send:
+            self.adapter.send(Mock(), timeout=300)
+
+        assert mock_send.call_args.kwargs["timeout"] == (1.5, 9.0)
+
+    @staticmethod
+    def _query_adapter(context):
+        """컨텍스트의 iPhone API 쿼리가 쓰는 세션 복사본의 어댑터"""
+        def get_json(path, params, host, session, **kwargs):
+            return session.get_adapter(f"https://{host}/")
+
+        with patch.object(context, "get_json", side_effect=get_json):
+            return context.get_iphone_json("api/v1/test/", {})
+
+    def test_session_copies_share_pool(self):
+        """설정한 컨텍스트의 세션 복사본만 같은 연결 풀을 쓰고 닫아도 풀이 유지되는지 테스트"""
+        original_copy_session = instaloadercontext.copy_session
+        context = instaloadercontext.InstaloaderContext(sleep=False, quiet=True)
+        adapter = configure_session(context._session, self.config)
+        share_pool_with_session_copies(context)
+
+        borrowed = self._query_adapter(context)
+        with patch.object(adapter, "send", return_value="응답") as mock_send:
+            assert borrowed.send(Mock()) == "응답"
+        mock_send.assert_called_once()
+
+        # 복사본이 닫혀도 원본 어댑터의 풀은 그대로
+        assert context._session.get_adapter("https://www.instagram.com/") is adapter
+        assert isinstance(adapter, PooledHTTPAdapter)
+
+        # instaloader 모듈과 다른 컨텍스트는 바뀌지 않음
+        other = instaloadercontext.InstaloaderContext(sleep=False, quiet=True)
+        configure_session(other._session, self.config)
+        assert type(self._query_adapter(other)) is requests.adapters.HTTPAdapter
+        assert instaloadercontext.copy_session is original_copy_session
+
+    def test_patch_applies_to_installed_instaloader(self):
+        """설치된 instaloader의 세션 복사 메서드를 모두 바꿀 수 있는지 테스트 (메서드 이름/구조가 바뀌면 실패)"""
+        methods = transport._session_copying_methods()
+
+        assert sorted(methods) == sorted(transport._SESSION_COPYING_METHODS)
+        for method in methods.values():
+            assert method.__globals__["copy_session"] is transport._copy_session_sharing_pool
+
+    def test_warns_when_patch_does_not_apply(self, capsys):
+        """바꿀 메서드가 없으면 건너뛰고 경고를 출력하는지 테스트"""
+        with patch.object(transport, "_SESSION_COPYING_METHODS", ("no_such_method", "get_json")), patch.object(
+            transport, "_pooled_methods", None
+        ):
+            context = instaloadercontext.InstaloaderContext(sleep=False, quiet=True)
+            share_pool_with_session_copies(context)
+
+            assert transport._pooled_methods == {}
+        output = capsys.readouterr().out
+        assert "InstaloaderContext.no_such_method" in output
+        assert "InstaloaderContext.get_json" in output
+        assert "연결 풀 공유를 사용하지 않습니다" in output
+        assert "get_json" not in vars(context)
+
+    def test_metrics_from_pools(self):
+        """연결 풀 카운터에서 통계를 집계하는지 테스트"""
+        pool = self.adapter.poolmanager.connection_from_url("https://www.instagram.com/")
+        pool.num_requests = 5
+        pool.num_connections = 1
+
+        metrics = self.adapter.metrics()
+
+        assert metrics.requests == 5
+        assert metrics.reused == 4
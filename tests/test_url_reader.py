@@ -0,0 +1,118 @@
+"""
+url_reader.py 테스트
+"""
+
+import gzip
+import io
+import json
+import pytest
+from unittest.mock import patch
+
+from src.url_reader import (
+    BloomFilter,
+    ShortcodeDeduplicator,
+    UrlReadStats,
+    canonicalize_url,
+    iter_urls_with_titles,
+)
+
+
+class TestCanonicalizeUrl:
+    """URL 정규화 테스트"""
+
+    def test_canonical_forms(self):
+        """다양한 게시물 URL 정규화 테스트"""
+        test_cases = [
+            ("https://www.instagram.com/p/ABC123/", ("ABC123", "https://www.instagram.com/p/ABC123/")),
+            ("https://instagram.com/reel/ABC123?igsh=xyz&utm_source=ig", ("ABC123", "https://www.instagram.com/reel/ABC123/")),
+            ("http://m.instagram.com/reels/ABC123/#comments", ("ABC123", "https://www.instagram.com/reel/ABC123/")),
+            ("https://www.instagram.com/some.user/p/ABC123/", ("ABC123", "https://www.instagram.com/p/ABC123/")),
+        ]
+
+        for url, expected in test_cases:
+            assert canonicalize_url(url) == expected
+
+    def test_invalid_urls(self):
+        """게시물 URL이 아닌 경우 None 반환 테스트"""
+        for url in ["https://facebook.com/p/ABC/", "https://www.instagram.com/user/", "not_a_url", ""]:
+            assert canonicalize_url(url) is None
+
+
+class TestIterUrlsWithTitles:
+    """스트리밍 URL 읽기 테스트"""
+
+    def test_mixed_formats_and_dedup(self, tmp_path):
+        """텍스트/제목::URL/JSONL 혼합 및 중복 제거 테스트"""
+        path = tmp_path / "urls.txt"
+        path.write_text(
+            "# 주석\n"
+            "\n"
+            "도쿄 맛집::https://www.instagram.com/reel/AAA/?igsh=1\n"
+            "https://www.instagram.com/p/AAA/\n"
+            + json.dumps({"title": "오사카", "url": "https://www.instagram.com/p/BBB/"}, ensure_ascii=False)
+            + "\n"
+            "잘못된 줄\n"
+            "https://www.instagram.com/p/CCC/\n",
+            encoding="utf-8",
+        )
+        stats = UrlReadStats()
+
+        with patch("builtins.print"):
+            result = list(iter_urls_with_titles(str(path), stats=stats))
+
+        assert result == [
+            ("도쿄 맛집", "https://www.instagram.com/reel/AAA/"),
+            ("오사카", "https://www.instagram.com/p/BBB/"),
+            ("미정", "https://www.instagram.com/p/CCC/"),
+        ]
+        assert stats.accepted == 3
+        assert stats.duplicates == 1
+        assert stats.invalid == 1
+
+    def test_gzip_input(self, tmp_path):
+        """gzip 압축 입력 테스트"""
+        path = tmp_path / "urls.txt.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write("제목::https://www.instagram.com/p/GZ1/\n")
+
+        assert list(iter_urls_with_titles(str(path))) == [
+            ("제목", "https://www.instagram.com/p/GZ1/")
+        ]
+
+    def test_stdin_input(self):
+        """표준 입력 테스트"""
+        stdin = io.TextIOWrapper(io.BufferedReader(io.BytesIO(b"https://www.instagram.com/p/IN1/\n")))
+
+        with patch("sys.stdin", stdin):
+            result = list(iter_urls_with_titles("-"))
+
+        assert result == [("미정", "https://www.instagram.com/p/IN1/")]
+
+    def test_missing_file(self, tmp_path):
+        """파일이 없을 때 예외 발생 테스트"""
+        with pytest.raises(FileNotFoundError):
+            list(iter_urls_with_titles(str(tmp_path / "missing.txt")))
+
+
+class TestDeduplication:
+    """중복 확인 자료구조 테스트"""
+
+    def test_bloom_filter(self):
+        """Bloom 필터 기본 동작 테스트"""
+        bloom = BloomFilter(capacity=1000, error_rate=1e-3)
+
+        assert bloom.add("ABC") is False
+        assert bloom.add("ABC") is True
+        assert "ABC" in bloom
+        assert "XYZ" not in bloom
+
+    def test_switches_to_bloom_after_limit(self):
+        """임계값 초과 시 Bloom 필터로 전환 테스트"""
+        deduplicator = ShortcodeDeduplicator(exact_limit=3, bloom_capacity=1000)
+
+        for code in ["A", "B", "C", "D"]:
+            assert deduplicator.seen(code) is False
+
+        assert deduplicator._seen is None
+        assert deduplicator.seen("A") is True
+        assert deduplicator.seen("E") is False